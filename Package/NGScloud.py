@@ -26,10 +26,6 @@ This source start NGScloud both console mode and gui mode.
 import optparse
 import sys
 
-import ccloud
-import clib
-import cmenu
-import gmain
 import xlib
 
 #-------------------------------------------------------------------------------
@@ -107,15 +103,16 @@ def main(argv):
             print('Please, review how to set up PIL.ImageTk in the manual.')
             sys.exit(1)
 
-    # import required application libraries
-    import ccloud
-    import cmenu
-    import gmain
-    import xlib
+    # import the application libraries of the mode; the rest of modules are imported when they are first used
+    if options.mode == 'gui' or options.mode is None:
+        import gmain
+    else:
+        import ccloud
+        import cmenu
 
     # verify if StarCluster is set up
     command = '{0} --version'.format(xlib.get_starcluster())
-    devstdout = xlib.DevStdOut('starcluster_version', print_stdout=False)
+    devstdout = xlib.DevStdOut('starcluster_version', print_stdout=False, catalog=False)
     rc = xlib.run_command(command, devstdout)
     if rc != 0:
         print('*** ERROR: The cluster-computing toolkit StarCluster 0.95.6 is not installed or excecution permissions have not set.')
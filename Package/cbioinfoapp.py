@@ -30,26 +30,30 @@ import sys
 
 import cinputs
 import clib
-import xbioinfoapp
-import xbusco
-import xcdhit
 import xconfiguration
-import xdetonate
 import xec2
-import xfastqc
-import xgmap
 import xlib
-import xngshelper
-import xquast
-import xrnaquast
-import xsoapdenovotrans
-import xstar
-import xtransabyss
-import xtransrate
-import xtrimmomatic
-import xtrinity
+import xmetrics
+import xresult
 import xssh
 
+# application modules imported when they are first used
+xbioinfoapp = xlib.import_lazy_module('xbioinfoapp')
+xbusco = xlib.import_lazy_module('xbusco')
+xcdhit = xlib.import_lazy_module('xcdhit')
+xdetonate = xlib.import_lazy_module('xdetonate')
+xfastqc = xlib.import_lazy_module('xfastqc')
+xgmap = xlib.import_lazy_module('xgmap')
+xngshelper = xlib.import_lazy_module('xngshelper')
+xquast = xlib.import_lazy_module('xquast')
+xrnaquast = xlib.import_lazy_module('xrnaquast')
+xsoapdenovotrans = xlib.import_lazy_module('xsoapdenovotrans')
+xstar = xlib.import_lazy_module('xstar')
+xtransabyss = xlib.import_lazy_module('xtransabyss')
+xtransrate = xlib.import_lazy_module('xtransrate')
+xtrimmomatic = xlib.import_lazy_module('xtrimmomatic')
+xtrinity = xlib.import_lazy_module('xtrinity')
+
 #-------------------------------------------------------------------------------
 
 def form_setup_bioinfo_app(app_code):
@@ -136,128 +140,128 @@ def form_setup_bioinfo_app(app_code):
         # set up the BEDtools software
         if app_code == xlib.get_bedtools_code():
             package_code_list = [xlib.get_bedtools_bioconda_code()]
-            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__)
+            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=cluster_name)
             OK = xbioinfoapp.setup_bioconda_package_list(app_code, app_name, package_code_list, cluster_name, devstdout, function=None)
 
         # set up the BLAST+ software
         elif app_code == xlib.get_blastplus_code():
             package_code_list = [xlib.get_blastplus_bioconda_code()]
-            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__)
+            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=cluster_name)
             OK = xbioinfoapp.setup_bioconda_package_list(app_code, app_name, package_code_list, cluster_name, devstdout, function=None)
 
         # set up the Bowtie2 software
         elif app_code == xlib.get_bowtie2_code():
             package_code_list = [xlib.get_bowtie2_bioconda_code()]
-            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__)
+            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=cluster_name)
             OK = xbioinfoapp.setup_bioconda_package_list(app_code, app_name, package_code_list, cluster_name, devstdout, function=None)
 
         # set up the BUSCO software
         elif app_code == xlib.get_busco_code():
             package_code_list = [xlib.get_busco_bioconda_code()]
-            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__)
+            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=cluster_name)
             OK = xbioinfoapp.setup_bioconda_package_list(app_code, app_name, package_code_list, cluster_name, devstdout, function=None)
 
         # set up the CD-HIT software
         elif app_code == xlib.get_cd_hit_code():
             package_code_list = [xlib.get_cd_hit_bioconda_code()]
-            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__)
+            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=cluster_name)
             OK = xbioinfoapp.setup_bioconda_package_list(app_code, app_name, package_code_list, cluster_name, devstdout, function=None)
 
         # set up the DETONATE software
         elif app_code == xlib.get_detonate_code():
             package_code_list = [xlib.get_detonate_bioconda_code(), xlib.get_bowtie2_bioconda_code(), xlib.get_rsem_bioconda_code()]
-            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__)
+            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=cluster_name)
             OK = xbioinfoapp.setup_bioconda_package_list(app_code, app_name, package_code_list, cluster_name, devstdout, function=None)
 
         # set up the EMBOSS software
         elif app_code == xlib.get_emboss_code():
             package_code_list = [xlib.get_emboss_bioconda_code()]
-            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__)
+            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=cluster_name)
             OK = xbioinfoapp.setup_bioconda_package_list(app_code, app_name, package_code_list, cluster_name, devstdout, function=None)
 
         # set up the FastQC software
         elif app_code == xlib.get_fastqc_code():
             package_code_list = [xlib.get_fastqc_bioconda_code()]
-            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__)
+            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=cluster_name)
             OK = xbioinfoapp.setup_bioconda_package_list(app_code, app_name, package_code_list, cluster_name, devstdout, function=None)
 
         # set up the GMAP-GSNAP software
         elif app_code == xlib.get_gmap_gsnap_code():
             package_code_list = [xlib.get_gmap_gsnap_bioconda_code()]
-            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__)
+            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=cluster_name)
             OK = xbioinfoapp.setup_bioconda_package_list(app_code, app_name, package_code_list, cluster_name, devstdout, function=None)
 
         # set up the Miniconda3 software
         elif app_code == xlib.get_miniconda3_code():
-            devstdout = xlib.DevStdOut(xbioinfoapp.setup_miniconda3.__name__)
+            devstdout = xlib.DevStdOut(xbioinfoapp.setup_miniconda3.__name__, cluster_name=cluster_name)
             OK = xbioinfoapp.setup_miniconda3(cluster_name, devstdout, function=None)
 
         # set up the NGShelper software
         elif app_code == xlib.get_ngshelper_code():
-            devstdout = xlib.DevStdOut(xngshelper.setup_ngshelper.__name__)
+            devstdout = xlib.DevStdOut(xngshelper.setup_ngshelper.__name__, cluster_name=cluster_name)
             OK = xngshelper.setup_ngshelper(cluster_name, devstdout, function=None)
 
         # set up the QUAST software
         elif app_code == xlib.get_quast_code():
             package_code_list = [xlib.get_quast_bioconda_code()]
-            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__)
+            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=cluster_name)
             OK = xbioinfoapp.setup_bioconda_package_list(app_code, app_name, package_code_list, cluster_name, devstdout, function=None)
 
         # set up R and analysis packages
         elif app_code == xlib.get_r_code():
-            devstdout = xlib.DevStdOut(xbioinfoapp.setup_r.__name__)
+            devstdout = xlib.DevStdOut(xbioinfoapp.setup_r.__name__, cluster_name=cluster_name)
             OK = xbioinfoapp.setup_r(cluster_name, devstdout, function=None)
 
         # set up the rnaQUAST software
         elif app_code == xlib.get_rnaquast_code():
-            devstdout = xlib.DevStdOut(xrnaquast.setup_rnaquast.__name__)
+            devstdout = xlib.DevStdOut(xrnaquast.setup_rnaquast.__name__, cluster_name=cluster_name)
             OK = xrnaquast.setup_rnaquast(cluster_name, devstdout, function=None)
 
         # set up the RSEM software
         elif app_code == xlib.get_rsem_code():
             package_code_list = [xlib.get_rsem_bioconda_code()]
-            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__)
+            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=cluster_name)
             OK = xbioinfoapp.setup_bioconda_package_list(app_code, app_name, package_code_list, cluster_name, devstdout, function=None)
 
         # set up the SAMtools software
         if app_code == xlib.get_samtools_code():
             package_code_list = [xlib.get_samtools_bioconda_code()]
-            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__)
+            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=cluster_name)
             OK = xbioinfoapp.setup_bioconda_package_list(app_code, app_name, package_code_list, cluster_name, devstdout, function=None)
 
         # set up the SOAPdenovo-Trans software
         elif app_code == xlib.get_soapdenovotrans_code():
             package_code_list = [xlib.get_soapdenovotrans_bioconda_code()]
-            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__)
+            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=cluster_name)
             OK = xbioinfoapp.setup_bioconda_package_list(app_code, app_name, package_code_list, cluster_name, devstdout, function=None)
 
         # set up the STAR software
         elif app_code == xlib.get_star_code():
             package_code_list = [xlib.get_star_bioconda_code(), xlib.get_trinity_bioconda_code(), xlib.get_bowtie2_bioconda_code()]
-            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__)
+            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=cluster_name)
             OK = xbioinfoapp.setup_bioconda_package_list(app_code, app_name, package_code_list, cluster_name, devstdout, function=None)
 
         # set up the Trans-ABySS software
         elif app_code == xlib.get_transabyss_code():
             package_code_list = [xlib.get_transabyss_bioconda_code()]
-            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__)
+            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=cluster_name)
             OK = xbioinfoapp.setup_bioconda_package_list(app_code, app_name, package_code_list, cluster_name, devstdout, function=None)
 
         # set up the Transrate software
         elif app_code == xlib.get_transrate_code():
-            devstdout = xlib.DevStdOut(xtransrate.setup_transrate.__name__)
+            devstdout = xlib.DevStdOut(xtransrate.setup_transrate.__name__, cluster_name=cluster_name)
             OK = xtransrate.setup_transrate(cluster_name, devstdout, function=None)
 
         # set up the Trimmomatic software
         elif app_code == xlib.get_trimmomatic_code():
             package_code_list = [xlib.get_trimmomatic_bioconda_code()]
-            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__)
+            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=cluster_name)
             OK = xbioinfoapp.setup_bioconda_package_list(app_code, app_name, package_code_list, cluster_name, devstdout, function=None)
 
         # set up the Trinity software
         elif app_code == xlib.get_trinity_code():
             package_code_list = [xlib.get_trinity_bioconda_code(), xlib.get_bowtie2_bioconda_code()]
-            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__)
+            devstdout = xlib.DevStdOut(xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=cluster_name)
             OK = xbioinfoapp.setup_bioconda_package_list(app_code, app_name, package_code_list, cluster_name, devstdout, function=None)
 
     # show continuation message 
@@ -667,7 +671,7 @@ def form_recreate_insilico_read_normalization_config_file():
         if read_type == 'PE':
             (file_1_list, file_2_list, unpaired_file_list) = xlib.pair_files(selected_file_list, specific_chars_1, specific_chars_2)
             if unpaired_file_list != []:
-                print('ERROR: There are unpaired files.')
+                print('ERROR: There are unpaired files: {0}.'.format(', '.join(unpaired_file_list)))
                 OK = False
 
     # recreate the insilico_read_normalization config file
@@ -883,7 +887,7 @@ def form_recreate_ref_eval_config_file():
         if read_type == 'PE':
             (file_1_list, file_2_list, unpaired_file_list) = xlib.pair_files(selected_file_list, specific_chars_1, specific_chars_2)
             if unpaired_file_list != []:
-                print('ERROR: There are unpaired files.')
+                print('ERROR: There are unpaired files: {0}.'.format(', '.join(unpaired_file_list)))
                 OK = False
 
     # get the assembly dataset identification
@@ -1026,7 +1030,7 @@ def form_recreate_rnaquast_config_file():
         if read_type == 'PE':
             (file_1_list, file_2_list, unpaired_file_list) = xlib.pair_files(selected_file_list, specific_chars_1, specific_chars_2)
             if unpaired_file_list != []:
-                print('ERROR: There are unpaired files.')
+                print('ERROR: There are unpaired files: {0}.'.format(', '.join(unpaired_file_list)))
                 OK = False
 
     # get the assembly dataset identification
@@ -1152,7 +1156,7 @@ def form_recreate_rsem_eval_config_file():
         if read_type == 'PE':
             (file_1_list, file_2_list, unpaired_file_list) = xlib.pair_files(selected_file_list, specific_chars_1, specific_chars_2)
             if unpaired_file_list != []:
-                print('ERROR: There are unpaired files.')
+                print('ERROR: There are unpaired files: {0}.'.format(', '.join(unpaired_file_list)))
                 OK = False
 
     # get the assembly dataset identification
@@ -1278,9 +1282,18 @@ def form_recreate_soapdenovotrans_config_file():
         if read_type == 'PE':
             (file_1_list, file_2_list, unpaired_file_list) = xlib.pair_files(selected_file_list, specific_chars_1, specific_chars_2)
             if unpaired_file_list != []:
-                print('ERROR: There are unpaired files.')
+                print('ERROR: There are unpaired files: {0}.'.format(', '.join(unpaired_file_list)))
                 OK = False
 
+    # get the resources recommended from the metrics of past runs
+    if OK:
+        if read_type == 'SE':
+            recommendation = xsoapdenovotrans.recommend_soapdenovotrans_resources(ssh_client, experiment_id, read_dataset_id, selected_file_list)
+        elif read_type == 'PE':
+            recommendation = xsoapdenovotrans.recommend_soapdenovotrans_resources(ssh_client, experiment_id, read_dataset_id, file_1_list + file_2_list)
+        print(xlib.get_separator())
+        print(xmetrics.get_recommendation_text(recommendation))
+
     # recreate the SOAPdenovo-Trans config file
     if OK:
 
@@ -1291,9 +1304,9 @@ def form_recreate_soapdenovotrans_config_file():
         # recreate the config file
         if OK:
             if read_type == 'SE':
-                (OK, error_list) = xsoapdenovotrans.create_soapdenovotrans_config_file(experiment_id, read_dataset_id, read_type, selected_file_list, None)
+                (OK, error_list) = xsoapdenovotrans.create_soapdenovotrans_config_file(experiment_id, read_dataset_id, read_type, selected_file_list, None, recommendation)
             elif read_type == 'PE':
-                (OK, error_list) = xsoapdenovotrans.create_soapdenovotrans_config_file(experiment_id, read_dataset_id, read_type, file_1_list, file_2_list)
+                (OK, error_list) = xsoapdenovotrans.create_soapdenovotrans_config_file(experiment_id, read_dataset_id, read_type, file_1_list, file_2_list, recommendation)
             if OK:
                 print('The file is recreated.')
             else:
@@ -1411,7 +1424,7 @@ def form_recreate_star_config_file():
         if read_type == 'PE':
             (file_1_list, file_2_list, unpaired_file_list) = xlib.pair_files(selected_file_list, specific_chars_1, specific_chars_2)
             if unpaired_file_list != []:
-                print('ERROR: There are unpaired files.')
+                print('ERROR: There are unpaired files: {0}.'.format(', '.join(unpaired_file_list)))
                 OK = False
 
     # verify there is only one library
@@ -1420,6 +1433,15 @@ def form_recreate_star_config_file():
             print('ERROR: Two or more libraries are selected and only one is allowed.')
             OK = False
 
+    # get the resources recommended from the metrics of past runs
+    if OK:
+        if read_type == 'SE':
+            recommendation = xstar.recommend_star_resources(ssh_client, experiment_id, read_dataset_id, selected_file_list)
+        elif read_type == 'PE':
+            recommendation = xstar.recommend_star_resources(ssh_client, experiment_id, read_dataset_id, file_1_list + file_2_list)
+        print(xlib.get_separator())
+        print(xmetrics.get_recommendation_text(recommendation))
+
     # recreate the STAR config file
     if OK:
 
@@ -1430,9 +1452,9 @@ def form_recreate_star_config_file():
         # recreate the config file
         if OK:
             if read_type == 'SE':
-                (OK, error_list) = xstar.create_star_config_file(experiment_id, reference_dataset_id, reference_file, gtf_file, read_dataset_id, read_type, selected_file_list[0], None)
+                (OK, error_list) = xstar.create_star_config_file(experiment_id, reference_dataset_id, reference_file, gtf_file, read_dataset_id, read_type, selected_file_list[0], None, recommendation)
             elif read_type == 'PE':
-                (OK, error_list) = xstar.create_star_config_file(experiment_id, reference_dataset_id, reference_file, gtf_file, read_dataset_id, read_type, file_1_list[0], file_2_list[0])
+                (OK, error_list) = xstar.create_star_config_file(experiment_id, reference_dataset_id, reference_file, gtf_file, read_dataset_id, read_type, file_1_list[0], file_2_list[0], recommendation)
             if OK:
                 print('The file is recreated.')
             else:
@@ -1529,9 +1551,18 @@ def form_recreate_transabyss_config_file():
         if read_type == 'PE':
             (file_1_list, file_2_list, unpaired_file_list) = xlib.pair_files(selected_file_list, specific_chars_1, specific_chars_2)
             if unpaired_file_list != []:
-                print('ERROR: There are unpaired files.')
+                print('ERROR: There are unpaired files: {0}.'.format(', '.join(unpaired_file_list)))
                 OK = False
 
+    # get the resources recommended from the metrics of past runs
+    if OK:
+        if read_type == 'SE':
+            recommendation = xtransabyss.recommend_transabyss_resources(ssh_client, experiment_id, read_dataset_id, selected_file_list)
+        elif read_type == 'PE':
+            recommendation = xtransabyss.recommend_transabyss_resources(ssh_client, experiment_id, read_dataset_id, file_1_list + file_2_list)
+        print(xlib.get_separator())
+        print(xmetrics.get_recommendation_text(recommendation))
+
     # recreate the Trans-ABySS config file
     if OK:
 
@@ -1542,9 +1573,9 @@ def form_recreate_transabyss_config_file():
         # recreate the config file
         if OK:
             if read_type == 'SE':
-                (OK, error_list) = xtransabyss.create_transabyss_config_file(experiment_id, read_dataset_id, read_type, selected_file_list, None)
+                (OK, error_list) = xtransabyss.create_transabyss_config_file(experiment_id, read_dataset_id, read_type, selected_file_list, None, recommendation)
             elif read_type == 'PE':
-                (OK, error_list) = xtransabyss.create_transabyss_config_file(experiment_id, read_dataset_id, read_type, file_1_list, file_2_list)
+                (OK, error_list) = xtransabyss.create_transabyss_config_file(experiment_id, read_dataset_id, read_type, file_1_list, file_2_list, recommendation)
             if OK:
                 print('The file is recreated.')
             else:
@@ -1811,7 +1842,7 @@ def form_recreate_transrate_config_file():
         if read_type == 'PE':
             (file_1_list, file_2_list, unpaired_file_list) = xlib.pair_files(selected_file_list, specific_chars_1, specific_chars_2)
             if unpaired_file_list != []:
-                print('ERROR: There are unpaired files.')
+                print('ERROR: There are unpaired files: {0}.'.format(', '.join(unpaired_file_list)))
                 OK = False
 
     # get the assembly dataset identification
@@ -1937,7 +1968,7 @@ def form_recreate_trimmomatic_config_file():
         if read_type == 'PE':
             (file_1_list, file_2_list, unpaired_file_list) = xlib.pair_files(selected_file_list, specific_chars_1, specific_chars_2)
             if unpaired_file_list != []:
-                print('ERROR: There are unpaired files.')
+                print('ERROR: There are unpaired files: {0}.'.format(', '.join(unpaired_file_list)))
                 OK = False
 
     # recreate the Trimmomatic config file
@@ -2049,9 +2080,18 @@ def form_recreate_trinity_config_file():
         if read_type == 'PE':
             (file_1_list, file_2_list, unpaired_file_list) = xlib.pair_files(selected_file_list, specific_chars_1, specific_chars_2)
             if unpaired_file_list != []:
-                print('ERROR: There are unpaired files.')
+                print('ERROR: There are unpaired files: {0}.'.format(', '.join(unpaired_file_list)))
                 OK = False
 
+    # get the resources recommended from the metrics of past runs
+    if OK:
+        if read_type == 'SE':
+            recommendation = xtrinity.recommend_trinity_resources(ssh_client, experiment_id, read_dataset_id, selected_file_list)
+        elif read_type == 'PE':
+            recommendation = xtrinity.recommend_trinity_resources(ssh_client, experiment_id, read_dataset_id, file_1_list + file_2_list)
+        print(xlib.get_separator())
+        print(xmetrics.get_recommendation_text(recommendation))
+
     # recreate the Trinity config file
     if OK:
 
@@ -2062,9 +2102,9 @@ def form_recreate_trinity_config_file():
         # recreate the config file
         if OK:
             if read_type == 'SE':
-                (OK, error_list) = xtrinity.create_trinity_config_file(experiment_id, read_dataset_id, read_type, selected_file_list, None)
+                (OK, error_list) = xtrinity.create_trinity_config_file(experiment_id, read_dataset_id, read_type, selected_file_list, None, recommendation)
             elif read_type == 'PE':
-                (OK, error_list) = xtrinity.create_trinity_config_file(experiment_id, read_dataset_id, read_type, file_1_list, file_2_list)
+                (OK, error_list) = xtrinity.create_trinity_config_file(experiment_id, read_dataset_id, read_type, file_1_list, file_2_list, recommendation)
             if OK:
                 print('The file is recreated.')
             else:
@@ -2233,41 +2273,9 @@ def form_run_bioinfo_process(app):
     # initialize the control variable
     OK = True
 
-    # set the bioinfo application name
-    if app == xlib.get_busco_code():
-        name = xlib.get_busco_name()
-    elif app == xlib.get_cd_hit_est_code():
-        name = xlib.get_cd_hit_est_name()
-    elif app == xlib.get_fastqc_code():
-        name = xlib.get_fastqc_name()
-    elif app == xlib.get_gmap_code():
-        name = xlib.get_gmap_name()
-    elif app == xlib.get_insilico_read_normalization_code():
-        name = xlib.get_insilico_read_normalization_name()
-    elif app == xlib.get_quast_code():
-        name = xlib.get_quast_name()
-    elif app == xlib.get_ref_eval_code():
-        name = xlib.get_ref_eval_name()
-    elif app == xlib.get_rnaquast_code():
-        name = xlib.get_rnaquast_name()
-    elif app == xlib.get_rsem_eval_code():
-        name = xlib.get_rsem_eval_name()
-    elif app == xlib.get_soapdenovotrans_code():
-        name = xlib.get_soapdenovotrans_name()
-    elif app == xlib.get_star_code():
-        name = xlib.get_star_name()
-    elif app == xlib.get_transabyss_code():
-        name = xlib.get_transabyss_name()
-    elif app == xlib.get_transcript_filter_code():
-        name = xlib.get_transcript_filter_name()
-    elif app == xlib.get_transcriptome_blastx_code():
-        name = xlib.get_transcriptome_blastx_name()
-    elif app == xlib.get_transrate_code():
-        name = xlib.get_transrate_name()
-    elif app == xlib.get_trimmomatic_code():
-        name = xlib.get_trimmomatic_name()
-    elif app == xlib.get_trinity_code():
-        name = xlib.get_trinity_name()
+    # set the bioinfo application name and config file
+    name = xlib.get_app_data(app)['name']
+    config_file = xlib.get_app_config_file(app)
 
     # print the header
     clib.clear_screen()
@@ -2281,6 +2289,23 @@ def form_run_bioinfo_process(app):
     else:
         cluster_name = cinputs.input_cluster_name(volume_creator_included=False, help=True)
 
+    # search result datasets run with identical inputs and options
+    if OK:
+        print(xlib.get_separator())
+        print('Searching result datasets run with identical inputs and options ...')
+        (OK, error_list, result_dataset_id_list) = xresult.search_identical_result_dataset_list(cluster_name, app, config_file)
+        if OK:
+            if result_dataset_id_list == []:
+                print('There is not any result dataset run with identical inputs and options.')
+            else:
+                print('The result dataset(s) {0} ended OK with identical inputs, options and {1} version.'.format(', '.join(result_dataset_id_list), name))
+                OK = not clib.confirm_action('The existing result dataset is going to be reused instead of running the process again.')
+                if not OK:
+                    print('The existing result dataset is reused.')
+        else:
+            for error in error_list:
+                print(error)
+
     # confirm the process run
     if OK:
         print(xlib.get_separator())
@@ -2289,90 +2314,94 @@ def form_run_bioinfo_process(app):
     # run the process
     if OK:
 
-        # execute the process when it is a BUSCO process
-        if app == xlib.get_busco_code():
-            devstdout = xlib.DevStdOut(xbusco.run_busco_process.__name__)
-            OK = xbusco.run_busco_process(cluster_name, devstdout, function=None)
+        # execute the process with the run function of the application
+        run_function = xlib.get_app_run_function(app)
+        devstdout = xlib.DevStdOut(run_function.__name__, cluster_name=cluster_name)
+        OK = run_function(cluster_name, devstdout, function=None)
 
-        # execute the process when it is a CD-HIT-EST process
-        elif app == xlib.get_cd_hit_est_code():
-            devstdout = xlib.DevStdOut(xcdhit.run_cd_hit_est_process.__name__)
-            OK = xcdhit.run_cd_hit_est_process(cluster_name, devstdout, function=None)
+    # show continuation message 
+    print(xlib.get_separator())
+    input('Press [Intro] to continue ...')
 
-        # execute the process when it is a FastQC process
-        elif app == xlib.get_fastqc_code():
-            devstdout = xlib.DevStdOut(xfastqc.run_fastqc_process.__name__)
-            OK = xfastqc.run_fastqc_process(cluster_name, devstdout, function=None)
+#-------------------------------------------------------------------------------
 
-        # execute the process when it is a GMAP process
-        elif app == xlib.get_gmap_code():
-            devstdout = xlib.DevStdOut(xgmap.run_gmap_process.__name__)
-            OK = xgmap.run_gmap_process(cluster_name, devstdout, function=None)
+def form_resume_bioinfo_process(app):
+    '''
+    Resume a failed assembly process of a bioinfo application in its run directory.
+    '''
 
-        # execute the process when it is a insilico_read_normalization process
-        elif app == xlib.get_insilico_read_normalization_code():
-            devstdout = xlib.DevStdOut(xtrinity.run_insilico_read_normalization_process.__name__)
-            OK = xtrinity.run_insilico_read_normalization_process(cluster_name, devstdout, function=None)
+    # initialize the control variable
+    OK = True
 
-        # execute the process when it is a QUAST process
-        elif app == xlib.get_quast_code():
-            devstdout = xlib.DevStdOut(xquast.run_quast_process.__name__)
-            OK = xquast.run_quast_process(cluster_name, devstdout, function=None)
+    # set the bioinfo application name
+    if app == xlib.get_soapdenovotrans_code():
+        name = xlib.get_soapdenovotrans_name()
+    elif app == xlib.get_transabyss_code():
+        name = xlib.get_transabyss_name()
+    elif app == xlib.get_trinity_code():
+        name = xlib.get_trinity_name()
 
-        # execute the process when it is a REF-EVAL process
-        elif app == xlib.get_ref_eval_code():
-            devstdout = xlib.DevStdOut(xdetonate.run_ref_eval_process.__name__)
-            OK = xdetonate.run_ref_eval_process(cluster_name, devstdout, function=None)
+    # print the header
+    clib.clear_screen()
+    clib.print_headers_with_environment('{0} - Resume process'.format(name))
 
-        # execute the process when it is a rnaQUAST process
-        elif app == xlib.get_rnaquast_code():
-            devstdout = xlib.DevStdOut(xrnaquast.run_rnaquast_process.__name__)
-            OK = xrnaquast.run_rnaquast_process(cluster_name, devstdout, function=None)
+    # get the cluster name
+    print(xlib.get_separator())
+    if xec2.get_running_cluster_list(volume_creator_included=False) == []:
+        print('WARNING: There is not any running cluster.')
+        OK = False
+    else:
+        cluster_name = cinputs.input_cluster_name(volume_creator_included=False, help=True)
 
-        # execute the process when it is a RSEM-EVAL process
-        elif app == xlib.get_rsem_eval_code():
-            devstdout = xlib.DevStdOut(xdetonate.run_rsem_eval_process.__name__)
-            OK = xdetonate.run_rsem_eval_process(cluster_name, devstdout, function=None)
+    # create the SSH client connection
+    if OK:
+        (OK, error_list, ssh_client) = xssh.create_ssh_client_connection(cluster_name, 'master')
+        for error in error_list:
+            print(error)
 
-        # execute the process when it is a SOAPdenovo-Trans process
-        elif app == xlib.get_soapdenovotrans_code():
-            devstdout = xlib.DevStdOut(xsoapdenovotrans.run_soapdenovotrans_process.__name__)
-            OK = xsoapdenovotrans.run_soapdenovotrans_process(cluster_name, devstdout, function=None)
+    # get the experiment identification
+    if OK:
+        experiment_id = cinputs.input_experiment_id(ssh_client, help=True)
+        if experiment_id == '':
+            print('WARNING: The cluster {0} has not experiment data.'.format(cluster_name))
+            OK = False
 
-        # execute the process when it is a STAR process
-        elif app == xlib.get_star_code():
-            devstdout = xlib.DevStdOut(xstar.run_star_process.__name__)
-            OK = xstar.run_star_process(cluster_name, devstdout, function=None)
+    # get the result dataset identification
+    if OK:
+        result_dataset_id = cinputs.input_result_dataset_id('uncompressed', ssh_client, experiment_id, help=True)
+        if result_dataset_id == '':
+            print('WARNING: The experiment {0} has not result datasets.'.format(experiment_id))
+            OK = False
+        elif not result_dataset_id.startswith(app):
+            print('*** ERROR: The result dataset {0} is not a {1} run.'.format(result_dataset_id, name))
+            OK = False
 
-        # execute the process when it is a Trans-ABySS process
-        elif app == xlib.get_transabyss_code():
-            devstdout = xlib.DevStdOut(xtransabyss.run_transabyss_process.__name__)
-            OK = xtransabyss.run_transabyss_process(cluster_name, devstdout, function=None)
+    # close the SSH client connection
+    if OK:
+        xssh.close_ssh_client_connection(ssh_client)
 
-        # execute the process when it is a transcripts-filter process
-        elif app == xlib.get_transcript_filter_code():
-            devstdout = xlib.DevStdOut(xngshelper.run_transcript_filter_process.__name__)
-            OK = xngshelper.run_transcript_filter_process(cluster_name, devstdout, function=None)
+    # confirm the process resumption
+    if OK:
+        print(xlib.get_separator())
+        OK = clib.confirm_action('The {0} process of {1} is going to be resumed.'.format(name, result_dataset_id))
 
-        # execute the process when it is a transcriptome-blastx process
-        elif app == xlib.get_transcriptome_blastx_code():
-            devstdout = xlib.DevStdOut(xngshelper.run_transcriptome_blastx_process.__name__)
-            OK = xngshelper.run_transcriptome_blastx_process(cluster_name, devstdout, function=None)
+    # resume the process
+    if OK:
 
-        # execute the process when it is a Transrate process
-        elif app == xlib.get_transrate_code():
-            devstdout = xlib.DevStdOut(xtransrate.run_transrate_process.__name__)
-            OK = xtransrate.run_transrate_process(cluster_name, devstdout, function=None)
+        # execute the resumption when it is a SOAPdenovo-Trans process
+        if app == xlib.get_soapdenovotrans_code():
+            devstdout = xlib.DevStdOut(xsoapdenovotrans.resume_soapdenovotrans_process.__name__, cluster_name=cluster_name)
+            OK = xsoapdenovotrans.resume_soapdenovotrans_process(cluster_name, experiment_id, result_dataset_id, devstdout, function=None)
 
-        # execute the process when it is a Trimmomatic process
-        elif app == xlib.get_trimmomatic_code():
-            devstdout = xlib.DevStdOut(xtrimmomatic.run_trimmomatic_process.__name__)
-            OK = xtrimmomatic.run_trimmomatic_process(cluster_name, devstdout, function=None)
+        # execute the resumption when it is a Trans-ABySS process
+        elif app == xlib.get_transabyss_code():
+            devstdout = xlib.DevStdOut(xtransabyss.resume_transabyss_process.__name__, cluster_name=cluster_name)
+            OK = xtransabyss.resume_transabyss_process(cluster_name, experiment_id, result_dataset_id, devstdout, function=None)
 
-        # execute the process when it is a Trinity process
+        # execute the resumption when it is a Trinity process
         elif app == xlib.get_trinity_code():
-            devstdout = xlib.DevStdOut(xtrinity.run_trinity_process.__name__)
-            OK = xtrinity.run_trinity_process(cluster_name, devstdout, function=None)
+            devstdout = xlib.DevStdOut(xtrinity.resume_trinity_process.__name__, cluster_name=cluster_name)
+            OK = xtrinity.resume_trinity_process(cluster_name, experiment_id, result_dataset_id, devstdout, function=None)
 
     # show continuation message 
     print(xlib.get_separator())
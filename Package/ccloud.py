@@ -25,37 +25,42 @@ menu items in console mode.
 
 #-------------------------------------------------------------------------------
 
+import datetime
 import os
 import sys
+import time
 
 import cinputs
 import clib
-import xbusco
-import xcdhit
 import xcluster
 import xconfiguration
 import xdatabase
-import xdetonate
 import xec2
-import xfastqc
-import xgmap
 import xgzip
 import xlib
-import xngshelper
 import xnode
-import xquast
 import xread
 import xreference
 import xresult
-import xrnaquast
-import xsoapdenovotrans
 import xssh
-import xstar
-import xtransabyss
-import xtransrate
-import xtrimmomatic
-import xtrinity
 import xvolume
+import xwatcher
+
+# application modules imported when they are first used
+xbusco = xlib.import_lazy_module('xbusco')
+xcdhit = xlib.import_lazy_module('xcdhit')
+xdetonate = xlib.import_lazy_module('xdetonate')
+xfastqc = xlib.import_lazy_module('xfastqc')
+xgmap = xlib.import_lazy_module('xgmap')
+xngshelper = xlib.import_lazy_module('xngshelper')
+xquast = xlib.import_lazy_module('xquast')
+xrnaquast = xlib.import_lazy_module('xrnaquast')
+xsoapdenovotrans = xlib.import_lazy_module('xsoapdenovotrans')
+xstar = xlib.import_lazy_module('xstar')
+xtransabyss = xlib.import_lazy_module('xtransabyss')
+xtransrate = xlib.import_lazy_module('xtransrate')
+xtrimmomatic = xlib.import_lazy_module('xtrimmomatic')
+xtrinity = xlib.import_lazy_module('xtrinity')
 
 #-------------------------------------------------------------------------------
 
@@ -701,7 +706,7 @@ def form_create_cluster():
 
     # create the cluster
     if OK:
-        devstdout = xlib.DevStdOut(xcluster.create_cluster.__name__)
+        devstdout = xlib.DevStdOut(xcluster.create_cluster.__name__, cluster_name=cluster_name)
         (OK, master_state_code, master_state_name) = xcluster.create_cluster(template_name, cluster_name, devstdout, function=None, is_menu_call=True)
 
     # show continuation message 
@@ -737,7 +742,7 @@ def form_stop_cluster():
 
     # stop the cluster
     if OK:
-        devstdout = xlib.DevStdOut(xcluster.stop_cluster.__name__)
+        devstdout = xlib.DevStdOut(xcluster.stop_cluster.__name__, cluster_name=cluster_name)
         OK = xcluster.stop_cluster(cluster_name, devstdout, function=None)
 
     # show continuation message 
@@ -773,7 +778,7 @@ def form_restart_cluster():
 
     # stop the cluster
     if OK:
-        devstdout = xlib.DevStdOut(xcluster.restart_cluster.__name__)
+        devstdout = xlib.DevStdOut(xcluster.restart_cluster.__name__, cluster_name=cluster_name)
         OK = xcluster.restart_cluster(cluster_name, devstdout, function=None)
 
     # show continuation message 
@@ -818,7 +823,7 @@ def form_terminate_cluster(force):
 
     # terminate the cluster
     if OK:
-        devstdout = xlib.DevStdOut(xcluster.terminate_cluster.__name__)
+        devstdout = xlib.DevStdOut(xcluster.terminate_cluster.__name__, cluster_name=cluster_name)
         OK = xcluster.terminate_cluster(cluster_name, force, devstdout, function=None)
 
     # show continuation message 
@@ -849,7 +854,7 @@ def form_show_cluster_composing():
 
     # show the status of batch jobs
     if OK:
-        devstdout = xlib.DevStdOut(xcluster.show_cluster_composing.__name__)
+        devstdout = xlib.DevStdOut(xcluster.show_cluster_composing.__name__, cluster_name=cluster_name)
         xcluster.show_cluster_composing(cluster_name, devstdout, function=None)
 
     # show continuation message
@@ -933,6 +938,40 @@ def form_show_status_batch_jobs():
 
 #-------------------------------------------------------------------------------
 
+def form_watch_batch_jobs():
+    '''
+    Watch the batch jobs of the running clusters until the user stops it.
+    '''
+
+    # print the header
+    clib.clear_screen()
+    clib.print_headers_with_environment('Cluster operation - Watch batch jobs')
+
+    # print the watcher events as they are published
+    def print_event(event):
+        print('{0}  {1}'.format(datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'), xwatcher.get_event_text(event)))
+
+    # watch the batch jobs
+    print(xlib.get_separator())
+    print('The batch jobs of the running clusters are polled every {0} seconds. Press [Ctrl+C] to stop.'.format(xconfiguration.get_job_watcher_interval()))
+    print(xlib.get_separator())
+    xwatcher.subscribe(print_event)
+    xwatcher.start_watcher()
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    xwatcher.unsubscribe(print_event)
+    xwatcher.stop_watcher()
+
+    # show continuation message 
+    print()
+    print(xlib.get_separator())
+    input('Press [Intro] to continue ...')
+
+#-------------------------------------------------------------------------------
+
 def form_kill_batch_job():
     '''
     Kill a batch job in the cluster.
@@ -973,7 +1012,7 @@ def form_kill_batch_job():
 
     # kill the batch job
     if OK:
-        devstdout = xlib.DevStdOut(xcluster.kill_batch_job.__name__)
+        devstdout = xlib.DevStdOut(xcluster.kill_batch_job.__name__, cluster_name=cluster_name)
         xcluster.kill_batch_job(cluster_name, batch_job_id, devstdout, function=None)
 
     # close the SSH client connection
@@ -1062,7 +1101,7 @@ def form_add_node():
 
     # add node in cluster
     if OK:
-        devstdout = xlib.DevStdOut(xnode.add_node.__name__)
+        devstdout = xlib.DevStdOut(xnode.add_node.__name__, cluster_name=cluster_name)
         xnode.add_node(cluster_name, node_name, devstdout, function=None)
 
     # show continuation message 
@@ -1102,7 +1141,7 @@ def form_remove_node():
 
     # remove node
     if OK:
-        devstdout = xlib.DevStdOut(xnode.remove_node.__name__)
+        devstdout = xlib.DevStdOut(xnode.remove_node.__name__, cluster_name=cluster_name)
         xnode.remove_node(cluster_name, node_name, devstdout, function=None)
 
     # show continuation message 
@@ -1254,7 +1293,7 @@ def form_terminate_volume_creator():
 
     # terminate the volume creator
     if OK:
-        devstdout = xlib.DevStdOut(xcluster.terminate_cluster.__name__)
+        devstdout = xlib.DevStdOut(xcluster.terminate_cluster.__name__, cluster_name=xlib.get_volume_creator_name())
         xcluster.terminate_cluster(xlib.get_volume_creator_name(), True, devstdout, function=None, is_menu_call=False)
 
     # show continuation message 
@@ -1300,7 +1339,7 @@ def form_mount_volume():
 
     # mount the volume in the node
     if OK:
-        devstdout = xlib.DevStdOut(xvolume.mount_volume.__name__)
+        devstdout = xlib.DevStdOut(xvolume.mount_volume.__name__, cluster_name=cluster_name)
         xvolume.mount_volume(cluster_name, node_name, volume_name, aws_device_file, mounting_path, devstdout, function=None, is_menu_call=True)
 
     # show continuation message 
@@ -1344,7 +1383,7 @@ def form_unmount_volume():
 
     # unmount the volume in the node
     if OK:
-        devstdout = xlib.DevStdOut(xvolume.unmount_volume.__name__)
+        devstdout = xlib.DevStdOut(xvolume.unmount_volume.__name__, cluster_name=cluster_name)
         xvolume.unmount_volume(cluster_name, node_name, volume_name, devstdout, function=None, is_menu_call=True)
 
     # show continuation message 
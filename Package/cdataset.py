@@ -32,11 +32,13 @@ import sys
 
 import cinputs
 import clib
+import xassessment
 import xconfiguration
 import xdatabase
 import xec2
 import xgzip
 import xlib
+import xmanifest
 import xread
 import xreference
 import xresult
@@ -166,7 +168,7 @@ def form_upload_reference_dataset():
 
     # upload the reference dataset to the cluster
     if OK:
-        devstdout = xlib.DevStdOut(xreference.upload_reference_dataset.__name__)
+        devstdout = xlib.DevStdOut(xreference.upload_reference_dataset.__name__, cluster_name=cluster_name)
         OK = xreference.upload_reference_dataset(cluster_name, devstdout, function=None)
 
     # show continuation message 
@@ -226,18 +228,18 @@ def form_recreate_reference_gzip_config_file():
         print('Building the selected file list ...')
         reference_dataset_dir = xlib.get_cluster_reference_dataset_dir(reference_dataset_id)
         selected_file_list = []
-        command = 'cd {0}; find . -type f -regex "./{1}"'.format(reference_dataset_dir, file_pattern)
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+        (OK, error_list, entry_list) = xssh.list_cluster_dir(ssh_client, reference_dataset_dir, max_depth=None, entry_type='f', regex=file_pattern)
         if OK:
-            for line in stdout:
-                selected_file_list.append(line.rstrip('\n'))
+            for entry in entry_list:
+                selected_file_list.append('./{0}'.format(entry['path']))
             if selected_file_list != []:
                 print('The selected file list is built: {0}'.format(str(selected_file_list).strip('[]').replace('\'','')))
             else:
                 print('*** ERROR: There are not files in the directory {0} with the pattern {1}'.format(reference_dataset_dir, file_pattern))
                 OK = False
         else:
-            print('*** ERROR: Wrong command ---> {0}'.format(command))
+            for error in error_list:
+                print(error)
 
     # confirm the creation of the config file
     if OK:
@@ -334,7 +336,7 @@ def form_run_reference_gzip_process():
 
     # compress/decompress reference dataset files in the cluster
     if OK:
-        devstdout = xlib.DevStdOut(xgzip.run_gzip_process.__name__)
+        devstdout = xlib.DevStdOut(xgzip.run_gzip_process.__name__, cluster_name=cluster_name)
         OK = xgzip.run_gzip_process(cluster_name, 'reference', devstdout, function=None)
 
     # show continuation message 
@@ -383,7 +385,7 @@ def form_remove_reference_dataset():
 
     # removal the reference dataset in the cluster
     if OK:
-        command = 'rm -fr {0}/{1}'.format(xlib.get_cluster_reference_dir(), reference_dataset_id)
+        command = xmanifest.get_removal_command('reference', '{0}/{1}'.format(xlib.get_cluster_reference_dir(), reference_dataset_id))
         (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
         if OK:
             print('The dataset {0} is removed.'.format(reference_dataset_id))
@@ -520,7 +522,7 @@ def form_upload_database_dataset():
 
     # upload the database dataset to the cluster
     if OK:
-        devstdout = xlib.DevStdOut(xdatabase.upload_database_dataset.__name__)
+        devstdout = xlib.DevStdOut(xdatabase.upload_database_dataset.__name__, cluster_name=cluster_name)
         OK = xdatabase.upload_database_dataset(cluster_name, devstdout, function=None)
 
     # show continuation message 
@@ -577,18 +579,18 @@ def form_recreate_database_gzip_config_file():
         print('Building the selected file list ...')
         database_dataset_dir = xlib.get_cluster_database_dataset_dir(database_dataset_id)
         selected_file_list = []
-        command = 'cd {0}; find . -type f -regex "./{1}"'.format(database_dataset_dir, file_pattern)
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+        (OK, error_list, entry_list) = xssh.list_cluster_dir(ssh_client, database_dataset_dir, max_depth=None, entry_type='f', regex=file_pattern)
         if OK:
-            for line in stdout:
-                selected_file_list.append(line.rstrip('\n'))
+            for entry in entry_list:
+                selected_file_list.append('./{0}'.format(entry['path']))
             if selected_file_list != []:
                 print('The selected file list is built: {0}'.format(str(selected_file_list).strip('[]').replace('\'','')))
             else:
                 print('*** ERROR: There are not files in the directory {0} with the pattern {1}'.format(database_dataset_dir, file_pattern))
                 OK = False
         else:
-            print('*** ERROR: Wrong command ---> {0}'.format(command))
+            for error in error_list:
+                print(error)
 
     # confirm the creation of the config file
     if OK:
@@ -682,7 +684,7 @@ def form_run_database_gzip_process():
 
     # compress/decompress database dataset files in the cluster
     if OK:
-        devstdout = xlib.DevStdOut(xgzip.run_gzip_process.__name__)
+        devstdout = xlib.DevStdOut(xgzip.run_gzip_process.__name__, cluster_name=cluster_name)
         OK = xgzip.run_gzip_process(cluster_name, 'database', devstdout, function=None)
 
     # show continuation message 
@@ -731,7 +733,7 @@ def form_remove_database_dataset():
 
     # removal the database dataset in the cluster
     if OK:
-        command = 'rm -fr {0}/{1}'.format(xlib.get_cluster_database_dir(), database_dataset_id)
+        command = xmanifest.get_removal_command('database', '{0}/{1}'.format(xlib.get_cluster_database_dir(), database_dataset_id))
         (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
         if OK:
             print('The dataset {0} is removed.'.format(database_dataset_id))
@@ -871,7 +873,7 @@ def form_upload_read_dataset():
 
     # upload the read dataset to the cluster
     if OK:
-        devstdout = xlib.DevStdOut(xread.upload_read_dataset.__name__)
+        devstdout = xlib.DevStdOut(xread.upload_read_dataset.__name__, cluster_name=cluster_name)
         OK = xread.upload_read_dataset(cluster_name, devstdout, function=None)
 
     # show continuation message 
@@ -938,18 +940,18 @@ def form_recreate_read_gzip_config_file():
         print('Building the selected file list ...')
         read_dataset_dir = xlib.get_cluster_experiment_read_dataset_dir(experiment_id, read_dataset_id)
         selected_file_list = []
-        command = 'cd {0}; find . -type f -regex "./{1}"'.format(read_dataset_dir, file_pattern)
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+        (OK, error_list, entry_list) = xssh.list_cluster_dir(ssh_client, read_dataset_dir, max_depth=None, entry_type='f', regex=file_pattern)
         if OK:
-            for line in stdout:
-                selected_file_list.append(line.rstrip('\n'))
+            for entry in entry_list:
+                selected_file_list.append('./{0}'.format(entry['path']))
             if selected_file_list != []:
                 print('The selected file list is built: {0}'.format(str(selected_file_list).strip('[]').replace('\'','')))
             else:
                 print('*** ERROR: There are not files in the directory {0} with the pattern {1}'.format(read_dataset_dir, file_pattern))
                 OK = False
         else:
-            print('*** ERROR: Wrong command ---> {0}'.format(command))
+            for error in error_list:
+                print(error)
 
     # confirm the creation of the config file
     if OK:
@@ -1046,7 +1048,7 @@ def form_run_read_gzip_process():
 
     # compress/decompress read dataset files in the cluster
     if OK:
-        devstdout = xlib.DevStdOut(xgzip.run_gzip_process.__name__)
+        devstdout = xlib.DevStdOut(xgzip.run_gzip_process.__name__, cluster_name=cluster_name)
         OK = xgzip.run_gzip_process(cluster_name, 'read', devstdout, function=None)
 
     # show continuation message 
@@ -1102,7 +1104,7 @@ def form_remove_read_dataset():
 
     # removal the read dataset in the cluster
     if OK:
-        command = 'rm -fr {0}/{1}/{2}'.format(xlib.get_cluster_read_dir(), experiment_id, read_dataset_id)
+        command = xmanifest.get_removal_command('read', '{0}/{1}/{2}'.format(xlib.get_cluster_read_dir(), experiment_id, read_dataset_id))
         (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
         if OK:
             print('The dataset {0} is removed.'.format(read_dataset_id))
@@ -1181,13 +1183,13 @@ def form_recreate_result_transfer_config_file():
             print('Building the selected file list ...')
             selected_file_list = []
             cluster_result_dir = '{0}/{1}/{2}'.format(xlib.get_cluster_result_dir(), experiment_id, result_dataset_id)
-            command = 'cd {0}; find . -type f -regex "./{1}"'.format(cluster_result_dir, file_pattern)
-            (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+            (OK, error_list, entry_list) = xssh.list_cluster_dir(ssh_client, cluster_result_dir, max_depth=None, entry_type='f', regex=file_pattern)
             if OK:
-                for line in stdout:
-                    selected_file_list.append(line.rstrip('\n'))
+                for entry in entry_list:
+                    selected_file_list.append('./{0}'.format(entry['path']))
             else:
-                print('*** ERROR: Wrong command ---> {0}'.format(command))
+                for error in error_list:
+                    print(error)
                 OK = False
             if OK:
                 if selected_file_list != []:
@@ -1293,7 +1295,7 @@ def form_download_result_dataset():
 
     # download the run result dataset from the cluster
     if OK:
-        devstdout = xlib.DevStdOut(xresult.download_result_dataset.__name__)
+        devstdout = xlib.DevStdOut(xresult.download_result_dataset.__name__, cluster_name=cluster_name)
         OK = xresult.download_result_dataset(cluster_name, devstdout, function=None)
 
     # show continuation message 
@@ -1302,6 +1304,70 @@ def form_download_result_dataset():
 
 #-------------------------------------------------------------------------------
 
+def form_compare_assessment_metrics():
+    '''
+    Compare the assessment metrics of the downloaded run result datasets.
+    '''
+
+    # initialize the control variable
+    OK = True
+
+    # print the header
+    clib.clear_screen()
+    clib.print_headers_with_environment('Run result dataset transfer - Compare assessment metrics')
+
+    # get the experiment identification
+    print(xlib.get_separator())
+    experiment_id_list = xassessment.get_experiment_id_list()
+    if experiment_id_list != []:
+        print('Experiment ids existing in the assessment store: {0} ...'.format(str(experiment_id_list).strip('[]').replace('\'','')))
+        experiment_id = ''
+        while experiment_id == '':
+            experiment_id = input('... Enter the experiment id (or all): ')
+            if experiment_id == 'all':
+                experiment_id = None
+                break
+            elif experiment_id not in experiment_id_list:
+                print('*** ERROR: {0} does not exist.'.format(experiment_id))
+                experiment_id = ''
+    else:
+        print('WARNING: There are not any assessment metrics. They are stored when the result datasets are downloaded.')
+        OK = False
+
+    # print the result datasets ranked by the mean rank of their metrics
+    if OK:
+        comparison_list = xassessment.get_assessment_comparison(experiment_id)
+        print(xlib.get_separator())
+        # set line template
+        line_template = '{0:40}   {1:>9}   {2:>8}   {3:>10}   {4:>14}   {5:>9}'
+        # print header
+        print(line_template.format('Assembly dataset', 'Mean rank', 'BUSCO C', 'QUAST N50', 'RSEM-eval', 'Transrate'))
+        print(line_template.format('=' * 40, '=' * 9, '=' * 8, '=' * 10, '=' * 14, '=' * 9))
+        # print detail lines
+        for comparison in comparison_list:
+            value_list = []
+            for (tool, metric, higher_is_better) in xassessment.RANKING_METRIC_LIST:
+                value = comparison['{0} {1}'.format(tool, metric)]
+                value_list.append('-' if value is None else '{0:g}'.format(value))
+            mean_rank = '-' if comparison['mean_rank'] is None else '{0:.2f}'.format(comparison['mean_rank'])
+            print(line_template.format(comparison['result_dataset_id'], mean_rank, *value_list))
+
+    # export the comparison with all the metrics
+    if OK:
+        print(xlib.get_separator())
+        (OK, error_list) = xassessment.export_assessment_comparison(experiment_id)
+        if OK:
+            print('The comparison with all the metrics has been exported to {0}.'.format(xassessment.get_assessment_comparison_file()))
+        else:
+            for error in error_list:
+                print(error)
+
+    # show continuation message 
+    print(xlib.get_separator())
+    input('Press [Intro] to continue ...')
+
+#-------------------------------------------------------------------------------
+
 def form_recreate_result_gzip_config_file():
     '''
     Recreate result file compression/decompression config file.
@@ -1370,18 +1436,18 @@ def form_recreate_result_gzip_config_file():
             print('Building the selected file list ...')
             selected_file_list = []
             result_dataset_dir = xlib.get_cluster_experiment_result_dataset_dir(experiment_id, result_dataset_id)
-            command = 'cd {0}; find . -type f -regex "./{1}"'.format(result_dataset_dir, file_pattern)
-            (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+            (OK, error_list, entry_list) = xssh.list_cluster_dir(ssh_client, result_dataset_dir, max_depth=None, entry_type='f', regex=file_pattern)
             if OK:
-                for line in stdout:
-                    selected_file_list.append(line.rstrip('\n'))
+                for entry in entry_list:
+                    selected_file_list.append('./{0}'.format(entry['path']))
                 if selected_file_list != []:
                     print('The selected file list is built: {0}'.format(str(selected_file_list).strip('[]').replace('\'','')))
                 else:
                     print('*** ERROR: There are not files in the directory {0} with the pattern {1}'.format(result_dataset_dir, file_pattern))
                     OK = False
             else:
-                print('*** ERROR: Wrong command ---> {0}'.format(command))
+                for error in error_list:
+                    print(error)
         elif whole == 'y':
             selected_file_list = [None]
 
@@ -1481,7 +1547,7 @@ def form_run_result_gzip_process():
 
     # compress/decompress result dataset files in the cluster
     if OK:
-        devstdout = xlib.DevStdOut(xgzip.run_gzip_process.__name__)
+        devstdout = xlib.DevStdOut(xgzip.run_gzip_process.__name__, cluster_name=cluster_name)
         OK = xgzip.run_gzip_process(cluster_name, 'result', devstdout, function=None)
 
     # show continuation message 
@@ -1537,7 +1603,7 @@ def form_remove_result_dataset():
 
     # removal the result dataset in the cluster
     if OK:
-        command = 'rm -fr {0}/{1}/{2}'.format(xlib.get_cluster_result_dir(), experiment_id, result_dataset_id)
+        command = xmanifest.get_removal_command('result', '{0}/{1}/{2}'.format(xlib.get_cluster_result_dir(), experiment_id, result_dataset_id))
         (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
         if OK:
             print('The dataset {0} is removed.'.format(result_dataset_id))
@@ -1595,10 +1661,10 @@ def form_remove_experiment():
 
     # removal every read and result dataset in the cluster
     if OK:
-        command = 'rm -fr {0}/{1}'.format(xlib.get_cluster_result_dir(), experiment_id)
+        command = '{0}\nrm -fr {1}/{2}'.format(xmanifest.get_removal_command('result', '{0}/{1}/*'.format(xlib.get_cluster_result_dir(), experiment_id)), xlib.get_cluster_result_dir(), experiment_id)
         (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
         if OK:
-            command = 'rm -fr {0}/{1}'.format(xlib.get_cluster_read_dir(), experiment_id)
+            command = '{0}\nrm -fr {1}/{2}'.format(xmanifest.get_removal_command('read', '{0}/{1}/*'.format(xlib.get_cluster_read_dir(), experiment_id)), xlib.get_cluster_read_dir(), experiment_id)
             (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
         if OK:
             print('The datasets of experiment {0} are removed.'.format(experiment_id))
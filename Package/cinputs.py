@@ -1065,14 +1065,11 @@ def input_result_dataset_id(status, ssh_client, experiment_id, help):
 
     # get the result dataset identifications of the experiment
     if help:
-        if status == 'uncompressed':
-            command = 'cd {0}/{1}; for list in `ls`; do ls -ld $list | grep -v ^- > /dev/null && echo $list; done;'.format(xlib.get_cluster_result_dir(), experiment_id)
-        elif status == 'compressed':
-            command = 'cd {0}/{1}; for list in `ls`; do ls -ld $list | grep -v ^d > /dev/null && echo $list; done;'.format(xlib.get_cluster_result_dir(), experiment_id)
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+        entry_type = 'd' if status == 'uncompressed' else 'f'
+        (OK, error_list, entry_list) = xssh.list_cluster_dir(ssh_client, xlib.get_cluster_experiment_result_dir(experiment_id), entry_type=entry_type)
         if OK:
-            for line in stdout:
-                result_dataset_id_list.append(line.rstrip('\n'))
+            for entry in entry_list:
+                result_dataset_id_list.append(entry['name'])
 
     # print the result dataset identifications in the clusters
     if OK and help:
@@ -1113,12 +1110,10 @@ def input_rsem_eval_dataset_id(ssh_client, experiment_id, help):
 
     # get the RSEM-EVAL dataset identifications of the experiment
     if help:
-        command = 'cd {0}/{1}; for list in `ls`; do ls -ld $list | grep -v ^- > /dev/null && echo $list; done;'.format(xlib.get_cluster_result_dir(), experiment_id)
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+        (OK, error_list, entry_list) = xssh.list_cluster_dir(ssh_client, xlib.get_cluster_experiment_result_dir(experiment_id), entry_type='d', regex='{0}-.*'.format(xlib.get_rsem_eval_code()))
         if OK:
-            for line in stdout:
-                if line.startswith(xlib.get_rsem_eval_code()):
-                    rsem_eval_dataset_id_list.append(line.rstrip('\n'))
+            for entry in entry_list:
+                rsem_eval_dataset_id_list.append(entry['name'])
 
     # print the RSEM-EVAL dataset identifications in the clusters
     if OK and help:
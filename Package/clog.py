@@ -32,6 +32,7 @@ import cinputs
 import clib
 import xec2
 import xlib
+import xmetrics
 import xssh
 
 #-------------------------------------------------------------------------------
@@ -71,14 +72,14 @@ def form_list_cluster_experiment_processes():
 
     # get the result dataset list of the experiment
     if OK:
-        command = 'cd  {0}/{1}; for list in `ls`; do ls -ld $list | grep -v ^- > /dev/null && echo $list; done;'.format(xlib.get_cluster_result_dir(), experiment_id)
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+        (OK, error_list, entry_list) = xssh.list_cluster_dir(ssh_client, xlib.get_cluster_experiment_result_dir(experiment_id), entry_type='d')
         if OK:
-            result_dataset_id_list = []
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    result_dataset_id_list.append(line)
+            result_dataset_id_list = [entry['name'] for entry in entry_list]
+
+    # collect the metrics of the experiment runs
+    if OK:
+        (OK, error_list, record_count) = xmetrics.collect_metrics_files(cluster_name, experiment_id, passed_connection=True, ssh_client=ssh_client)
+        run_metrics_dict = xmetrics.get_run_metrics_dict(experiment_id)
 
     # print the result dataset identification list of the experiment
     if OK:
@@ -90,76 +91,21 @@ def form_list_cluster_experiment_processes():
             # set data width
             result_dataset_width = 25
             bioinfo_app_width = 25
+            wall_time_width = 10
+            max_rss_width = 10
             # set line template
-            line_template = '{0:' + str(result_dataset_width) + '}   {1:' + str(bioinfo_app_width) + '}'
+            line_template = '{0:' + str(result_dataset_width) + '}   {1:' + str(bioinfo_app_width) + '}   {2:>' + str(wall_time_width) + '}   {3:>' + str(max_rss_width) + '}'
             # print header
-            print(line_template.format('Result dataset', 'Bioinfo app / Utility'))
-            print(line_template.format('=' * result_dataset_width, '=' * bioinfo_app_width))
+            print(line_template.format('Result dataset', 'Bioinfo app / Utility', 'Wall time', 'Max RSS'))
+            print(line_template.format('=' * result_dataset_width, '=' * bioinfo_app_width, '=' * wall_time_width, '=' * max_rss_width))
             # print detail lines
             for result_dataset_id in result_dataset_id_list:
-                if result_dataset_id.startswith(xlib.get_bedtools_code()+'-'):
-                    bioinfo_app_name = xlib.get_bedtools_name()
-                elif result_dataset_id.startswith(xlib.get_blastplus_code()+'-'):
-                    bioinfo_app_name = xlib.get_blastplus_name()
-                elif result_dataset_id.startswith(xlib.get_bowtie2_code()+'-'):
-                    bioinfo_app_name = xlib.get_bowtie2_name()
-                elif result_dataset_id.startswith(xlib.get_busco_code()+'-'):
-                    bioinfo_app_name = xlib.get_busco_name()
-                elif result_dataset_id.startswith(xlib.get_cd_hit_code()+'-'):
-                    bioinfo_app_name = xlib.get_cd_hit_est_name()
-                elif result_dataset_id.startswith(xlib.get_cd_hit_code()+'-'):
-                    bioinfo_app_name = xlib.get_cd_hit_est_name()
-                elif result_dataset_id.startswith(xlib.get_detonate_code()+'-'):
-                    bioinfo_app_name = xlib.get_detonate_name()
-                elif result_dataset_id.startswith(xlib.get_emboss_code()+'-'):
-                    bioinfo_app_name = xlib.get_emboss_name()
-                elif result_dataset_id.startswith(xlib.get_fastqc_code()+'-'):
-                    bioinfo_app_name = xlib.get_fastqc_name()
-                elif result_dataset_id.startswith(xlib.get_gmap_code()+'-'):
-                    bioinfo_app_name = xlib.get_gmap_name()
-                elif result_dataset_id.startswith(xlib.get_gmap_gsnap_code()+'-'):
-                    bioinfo_app_name = xlib.get_gmap_gsnap_name()
-                elif result_dataset_id.startswith(xlib.get_gzip_code()+'-'):
-                    bioinfo_app_name = xlib.get_gzip_name()
-                elif result_dataset_id.startswith(xlib.get_insilico_read_normalization_code()+'-'):
-                    bioinfo_app_name = xlib.get_insilico_read_normalization_name()
-                elif result_dataset_id.startswith(xlib.get_miniconda3_code()+'-'):
-                    bioinfo_app_name = xlib.get_miniconda3_name()
-                elif result_dataset_id.startswith(xlib.get_ngshelper_code()+'-'):
-                    bioinfo_app_name = xlib.get_ngshelper_name()
-                elif result_dataset_id.startswith(xlib.get_quast_code()+'-'):
-                    bioinfo_app_name = xlib.get_quast_name()
-                elif result_dataset_id.startswith(xlib.get_r_code()+'-'):
-                    bioinfo_app_name = xlib.get_r_name()
-                elif result_dataset_id.startswith(xlib.get_ref_eval_code()+'-'):
-                    bioinfo_app_name = xlib.get_ref_eval_name()
-                elif result_dataset_id.startswith(xlib.get_rnaquast_code()+'-'):
-                    bioinfo_app_name = xlib.get_rnaquast_name()
-                elif result_dataset_id.startswith(xlib.get_rsem_code()+'-'):
-                    bioinfo_app_name = xlib.get_rsem_name()
-                elif result_dataset_id.startswith(xlib.get_rsem_eval_code()+'-'):
-                    bioinfo_app_name = xlib.get_rsem_eval_name()
-                elif result_dataset_id.startswith(xlib.get_samtools_code()+'-'):
-                    bioinfo_app_name = xlib.get_samtools_name()
-                elif result_dataset_id.startswith(xlib.get_soapdenovotrans_code()+'-'):
-                    bioinfo_app_name = xlib.get_soapdenovotrans_name()
-                elif result_dataset_id.startswith(xlib.get_star_code()+'-'):
-                    bioinfo_app_name = xlib.get_star_name()
-                elif result_dataset_id.startswith(xlib.get_transabyss_code()+'-'):
-                    bioinfo_app_name = xlib.get_transabyss_name()
-                elif result_dataset_id.startswith(xlib.get_transcript_filter_code()+'-'):
-                    bioinfo_app_name = xlib.get_transcript_filter_name()
-                elif result_dataset_id.startswith(xlib.get_transcriptome_blastx_code()+'-'):
-                    bioinfo_app_name = xlib.get_transcriptome_blastx_name()
-                elif result_dataset_id.startswith(xlib.get_transrate_code()+'-'):
-                    bioinfo_app_name = xlib.get_transrate_name()
-                elif result_dataset_id.startswith(xlib.get_trimmomatic_code()+'-'):
-                    bioinfo_app_name = xlib.get_trimmomatic_name()
-                elif result_dataset_id.startswith(xlib.get_trinity_code()+'-'):
-                    bioinfo_app_name = xlib.get_trinity_name()
-                else:
-                    bioinfo_app_name = 'xxx'
-                print(line_template.format(result_dataset_id, bioinfo_app_name))
+                (app_data, app_date, app_time) = xlib.parse_dataset_id(result_dataset_id)
+                bioinfo_app_name = app_data['name'] if app_data is not None else 'xxx'
+                run_metrics = run_metrics_dict.get(result_dataset_id, {})
+                wall_time = xmetrics.format_wall_time(run_metrics.get('wall_time'))
+                max_rss = xmetrics.format_memory(run_metrics.get('max_rss_kb'))
+                print(line_template.format(result_dataset_id, bioinfo_app_name, wall_time, max_rss))
 
     # close the SSH client connection
     if OK:
@@ -259,6 +205,53 @@ def form_view_cluster_experiment_process_log():
 
 #-------------------------------------------------------------------------------
 
+def form_summarize_run_metrics():
+    '''
+    Summarize the resource metrics of the process steps run in the cluster.
+    '''
+
+    # initialize the control variable
+    OK = True
+
+    # print the header
+    clib.clear_screen()
+    clib.print_headers_with_environment('Logs - Summarize resource metrics of the process steps')
+
+    # get the cluster name
+    print(xlib.get_separator())
+    if xec2.get_running_cluster_list(volume_creator_included=False) != []:
+        cluster_name = cinputs.input_cluster_name(volume_creator_included=False, help=True)
+    else:
+        print('WARNING: There is not any running cluster.')
+        OK = False
+
+    # collect the metrics of the cluster runs
+    if OK:
+        devstdout = xlib.DevStdOut(xmetrics.collect_metrics.__name__, cluster_name=cluster_name)
+        OK = xmetrics.collect_metrics(cluster_name, devstdout, function=None)
+
+    # print the summary of the metrics by tool and node type
+    if OK:
+        summary_list = xmetrics.get_metrics_summary()
+        print(xlib.get_separator())
+        if summary_list == []:
+            print('*** WARNING: There are not any metrics.')
+        else:
+            # set line template
+            line_template = '{0:20}   {1:12}   {2:>5}   {3:>10}   {4:>10}   {5:>10}   {6:>10}   {7:>6}'
+            # print header
+            print(line_template.format('Tool', 'Node type', 'Steps', 'Avg. wall', 'Max. wall', 'Avg. RSS', 'Max. RSS', 'Errors'))
+            print(line_template.format('=' * 20, '=' * 12, '=' * 5, '=' * 10, '=' * 10, '=' * 10, '=' * 10, '=' * 6))
+            # print detail lines
+            for summary in summary_list:
+                print(line_template.format(str(summary['tool']), str(summary['node_type']), summary['step_count'], xmetrics.format_wall_time(summary['avg_wall_time']), xmetrics.format_wall_time(summary['max_wall_time']), xmetrics.format_memory(summary['avg_max_rss_kb']), xmetrics.format_memory(summary['max_rss_kb']), summary['error_count']))
+
+    # show continuation message 
+    print(xlib.get_separator())
+    input('Press [Intro] to continue ...')
+
+#-------------------------------------------------------------------------------
+
 if __name__ == '__main__':
      print('This file contains the functions related to forms corresponding to dataset menu items in mode console.')
      sys.exit(0)
@@ -25,13 +25,15 @@ This file contains the functions related to the SOAPdenovo-Trans menus in consol
 
 import sys
 
-import cbioinfoapp
 import ccloud
-import cdataset
 import clib
-import clog
 import xlib
 
+# modules of the menus imported when they are first used
+cbioinfoapp = xlib.import_lazy_module('cbioinfoapp')
+cdataset = xlib.import_lazy_module('cdataset')
+clog = xlib.import_lazy_module('clog')
+
 #-------------------------------------------------------------------------------
 
 def build_menu_main():
@@ -255,6 +257,7 @@ def build_menu_cluster_operation():
         print()
         print('    8. Show status of batch jobs')
         print('    9. Kill batch job')
+        print('   10. Watch batch jobs')
         print()
         print('    X. Return to menu Cloud Control')
         print()
@@ -281,6 +284,8 @@ def build_menu_cluster_operation():
             ccloud.form_show_status_batch_jobs()
         elif option == '9':
             ccloud.form_kill_batch_job()
+        elif option == '10':
+            ccloud.form_watch_batch_jobs()
         elif option == 'X':
             break
 
@@ -764,6 +769,7 @@ def build_menu_soapdenovotrans():
         print()
         print('    3. Run assembly process')
         print('       (CAUTION: before running a process, the config file should be updated)')
+        print('    4. Resume a failed assembly process')
         print()
         print('    X. Return to menu De novo assembly')
         print()
@@ -778,6 +784,8 @@ def build_menu_soapdenovotrans():
             cbioinfoapp.form_edit_bioinfo_config_file(xlib.get_soapdenovotrans_code())
         elif option == '3':
             cbioinfoapp.form_run_bioinfo_process(xlib.get_soapdenovotrans_code())
+        elif option == '4':
+            cbioinfoapp.form_resume_bioinfo_process(xlib.get_soapdenovotrans_code())
         elif option == 'X':
             break
 
@@ -802,6 +810,7 @@ def build_menu_transabyss():
         print()
         print('    3. Run assembly process')
         print('       (CAUTION: before running a process, the config file should be updated)')
+        print('    4. Resume a failed assembly process')
         print()
         print('    X. Return to menu De novo assembly')
         print()
@@ -816,6 +825,8 @@ def build_menu_transabyss():
             cbioinfoapp.form_edit_bioinfo_config_file(xlib.get_transabyss_code())
         elif option == '3':
             cbioinfoapp.form_run_bioinfo_process(xlib.get_transabyss_code())
+        elif option == '4':
+            cbioinfoapp.form_resume_bioinfo_process(xlib.get_transabyss_code())
         elif option == 'X':
             break
 
@@ -840,6 +851,7 @@ def build_menu_trinity():
         print()
         print('    3. Run assembly process')
         print('       (CAUTION: before running a process, the config file should be updated)')
+        print('    4. Resume a failed assembly process')
         print()
         print('    X. Return to menu De novo assembly')
         print()
@@ -854,6 +866,8 @@ def build_menu_trinity():
             cbioinfoapp.form_edit_bioinfo_config_file(xlib.get_trinity_code())
         elif option == '3':
             cbioinfoapp.form_run_bioinfo_process(xlib.get_trinity_code())
+        elif option == '4':
+            cbioinfoapp.form_resume_bioinfo_process(xlib.get_trinity_code())
         elif option == 'X':
             break
 
@@ -1740,6 +1754,8 @@ def build_menu_result_file_transfer():
         print('    3. Download dataset from a cluster')
         print('       (CAUTION: before running a download process, the corresponding config file should be updated)')
         print()
+        print('    4. Compare assessment metrics of the downloaded datasets')
+        print()
         print('    X. Return to menu Datasets')
         print()
 
@@ -1753,6 +1769,8 @@ def build_menu_result_file_transfer():
             cdataset.form_edit_result_transfer_config_file()
         elif option == '3':
             cdataset.form_download_result_dataset()
+        elif option == '4':
+            cdataset.form_compare_assessment_metrics()
         elif option == 'X':
             break
 
@@ -1817,6 +1835,8 @@ def build_menu_logs():
         print('    3. List result logs in the cluster')
         print('    4. View a result log in the cluster')
         print()
+        print('    5. Summarize resource metrics of the process steps')
+        print()
         print('    X. Return to menu Logs')
         print()
 
@@ -1832,6 +1852,8 @@ def build_menu_logs():
             clog.form_list_cluster_experiment_processes()
         elif option == '4':
             clog.form_view_cluster_experiment_process_log()
+        elif option == '5':
+            clog.form_summarize_run_metrics()
         elif option == 'X':
             break
 
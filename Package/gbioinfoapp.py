@@ -34,28 +34,31 @@ import tkinter
 import tkinter.ttk
 
 import gdialogs
-import xbioinfoapp
-import xbusco
-import xcdhit
+import gloader
 import xdatabase
-import xdetonate
-import xec2
-import xfastqc
-import xgmap
 import xlib
-import xngshelper
-import xquast
+import xmetrics
 import xread
 import xreference
 import xresult
-import xrnaquast
-import xsoapdenovotrans
 import xssh
-import xstar
-import xtransabyss
-import xtransrate
-import xtrimmomatic
-import xtrinity
+
+# application modules imported when they are first used
+xbioinfoapp = xlib.import_lazy_module('xbioinfoapp')
+xbusco = xlib.import_lazy_module('xbusco')
+xcdhit = xlib.import_lazy_module('xcdhit')
+xdetonate = xlib.import_lazy_module('xdetonate')
+xfastqc = xlib.import_lazy_module('xfastqc')
+xgmap = xlib.import_lazy_module('xgmap')
+xngshelper = xlib.import_lazy_module('xngshelper')
+xquast = xlib.import_lazy_module('xquast')
+xrnaquast = xlib.import_lazy_module('xrnaquast')
+xsoapdenovotrans = xlib.import_lazy_module('xsoapdenovotrans')
+xstar = xlib.import_lazy_module('xstar')
+xtransabyss = xlib.import_lazy_module('xtransabyss')
+xtransrate = xlib.import_lazy_module('xtransrate')
+xtrimmomatic = xlib.import_lazy_module('xtrimmomatic')
+xtrinity = xlib.import_lazy_module('xtrinity')
 
 #-------------------------------------------------------------------------------
 
@@ -216,149 +219,149 @@ class FormSetupBioinfoApp(tkinter.Frame):
             # set up the BEDTools software
             if self.app_code == xlib.get_bedtools_code():
                 package_code_list = [xlib.get_bedtools_bioconda_code()]
-                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__)
+                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=self.wrapper_cluster_name.get())
                 threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
                 threading.Thread(target=xbioinfoapp.setup_bioconda_package_list, args=(self.app_code, self.app_name, package_code_list, self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
             # set up the BLAST+ software
             elif self.app_code == xlib.get_blastplus_code():
                 package_code_list = [xlib.get_blastplus_bioconda_code()]
-                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__)
+                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=self.wrapper_cluster_name.get())
                 threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
                 threading.Thread(target=xbioinfoapp.setup_bioconda_package_list, args=(self.app_code, self.app_name, package_code_list, self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
             # set up the Bowtie2 software
             elif self.app_code == xlib.get_bowtie2_code():
                 package_code_list = [xlib.get_bowtie2_bioconda_code()]
-                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__)
+                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=self.wrapper_cluster_name.get())
                 threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
                 threading.Thread(target=xbioinfoapp.setup_bioconda_package_list, args=(self.app_code, self.app_name, package_code_list, self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
             # set up the BUSCO software
             elif self.app_code == xlib.get_busco_code():
                 package_code_list = [xlib.get_busco_bioconda_code()]
-                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__)
+                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=self.wrapper_cluster_name.get())
                 threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
                 threading.Thread(target=xbioinfoapp.setup_bioconda_package_list, args=(self.app_code, self.app_name, package_code_list, self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
             # set up the CD-HIT software
             elif self.app_code == xlib.get_cd_hit_code():
                 package_code_list = [xlib.get_cd_hit_bioconda_code()]
-                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__)
+                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=self.wrapper_cluster_name.get())
                 threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
                 threading.Thread(target=xbioinfoapp.setup_bioconda_package_list, args=(self.app_code, self.app_name, package_code_list, self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
             # set up the DETONATE software
             elif self.app_code == xlib.get_detonate_code():
                 package_code_list = [xlib.get_detonate_bioconda_code(), xlib.get_bowtie2_bioconda_code(), xlib.get_rsem_bioconda_code()]
-                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__)
+                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=self.wrapper_cluster_name.get())
                 threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
                 threading.Thread(target=xbioinfoapp.setup_bioconda_package_list, args=(self.app_code, self.app_name, package_code_list, self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
             # set up the EMBOSS software
             elif self.app_code == xlib.get_emboss_code():
                 package_code_list = [xlib.get_emboss_bioconda_code()]
-                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__)
+                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=self.wrapper_cluster_name.get())
                 threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
                 threading.Thread(target=xbioinfoapp.setup_bioconda_package_list, args=(self.app_code, self.app_name, package_code_list, self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
             # set up the FastQC software
             elif self.app_code == xlib.get_fastqc_code():
                 package_code_list = [xlib.get_fastqc_bioconda_code()]
-                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__)
+                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=self.wrapper_cluster_name.get())
                 threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
                 threading.Thread(target=xbioinfoapp.setup_bioconda_package_list, args=(self.app_code, self.app_name, package_code_list, self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
             # set up the GMAP-GSNAP software
             elif self.app_code == xlib.get_gmap_gsnap_code():
                 package_code_list = [xlib.get_gmap_gsnap_bioconda_code()]
-                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__)
+                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=self.wrapper_cluster_name.get())
                 threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
                 threading.Thread(target=xbioinfoapp.setup_bioconda_package_list, args=(self.app_code, self.app_name, package_code_list, self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
             # set up the Miniconda3 software
             elif self.app_code == xlib.get_miniconda3_code():
-                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_miniconda3.__name__)
+                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_miniconda3.__name__, cluster_name=self.wrapper_cluster_name.get())
                 threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
                 threading.Thread(target=xbioinfoapp.setup_miniconda3, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
             # set up the NGShelper software
             elif self.app_code == xlib.get_ngshelper_code():
-                dialog_log = gdialogs.DialogLog(self, self.head, xngshelper.setup_ngshelper.__name__)
+                dialog_log = gdialogs.DialogLog(self, self.head, xngshelper.setup_ngshelper.__name__, cluster_name=self.wrapper_cluster_name.get())
                 threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
                 threading.Thread(target=xngshelper.setup_ngshelper, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
             # set up the QUAST software
             elif self.app_code == xlib.get_quast_code():
                 package_code_list = [xlib.get_quast_bioconda_code()]
-                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__)
+                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=self.wrapper_cluster_name.get())
                 threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
                 threading.Thread(target=xbioinfoapp.setup_bioconda_package_list, args=(self.app_code, self.app_name, package_code_list, self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
             # set up R and analysis packages
             elif self.app_code == xlib.get_r_code():
-                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_r.__name__)
+                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_r.__name__, cluster_name=self.wrapper_cluster_name.get())
                 threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
                 threading.Thread(target=xbioinfoapp.setup_r, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
             # set up the rnaQUAST software
             elif self.app_code == xlib.get_rnaquast_code():
-                dialog_log = gdialogs.DialogLog(self, self.head, xrnaquast.setup_rnaquast.__name__)
+                dialog_log = gdialogs.DialogLog(self, self.head, xrnaquast.setup_rnaquast.__name__, cluster_name=self.wrapper_cluster_name.get())
                 threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
                 threading.Thread(target=xrnaquast.setup_rnaquast, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
             # set up the RSEM software
             elif self.app_code == xlib.get_rsem_code():
                 package_code_list = [xlib.get_rsem_bioconda_code()]
-                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__)
+                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=self.wrapper_cluster_name.get())
                 threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
                 threading.Thread(target=xbioinfoapp.setup_bioconda_package_list, args=(self.app_code, self.app_name, package_code_list, self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
             # set up the SAMtools software
             if self.app_code == xlib.get_samtools_code():
                 package_code_list = [xlib.get_samtools_bioconda_code()]
-                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__)
+                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=self.wrapper_cluster_name.get())
                 threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
                 threading.Thread(target=xbioinfoapp.setup_bioconda_package_list, args=(self.app_code, self.app_name, package_code_list, self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
             # set up the SOAPdenovo-Trans software
             elif self.app_code == xlib.get_soapdenovotrans_code():
                 package_code_list = [xlib.get_soapdenovotrans_bioconda_code()]
-                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__)
+                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=self.wrapper_cluster_name.get())
                 threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
                 threading.Thread(target=xbioinfoapp.setup_bioconda_package_list, args=(self.app_code, self.app_name, package_code_list, self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
             # set up the STAR software
             elif self.app_code == xlib.get_star_code():
                 package_code_list = [xlib.get_star_bioconda_code(), xlib.get_trinity_bioconda_code(), xlib.get_bowtie2_bioconda_code()]
-                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__)
+                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=self.wrapper_cluster_name.get())
                 threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
                 threading.Thread(target=xbioinfoapp.setup_bioconda_package_list, args=(self.app_code, self.app_name, package_code_list, self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
             # set up the Trans-ABySS software
             elif self.app_code == xlib.get_transabyss_code():
                 package_code_list = [xlib.get_transabyss_bioconda_code()]
-                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__)
+                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=self.wrapper_cluster_name.get())
                 threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
                 threading.Thread(target=xbioinfoapp.setup_bioconda_package_list, args=(self.app_code, self.app_name, package_code_list, self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
             # set up the Transrate software
             elif self.app_code == xlib.get_transrate_code():
-                dialog_log = gdialogs.DialogLog(self, self.head, xtransrate.setup_transrate.__name__)
+                dialog_log = gdialogs.DialogLog(self, self.head, xtransrate.setup_transrate.__name__, cluster_name=self.wrapper_cluster_name.get())
                 threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
                 threading.Thread(target=xtransrate.setup_transrate, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
             # set up the Trimmomatic software
             elif self.app_code == xlib.get_trimmomatic_code():
                 package_code_list = [xlib.get_trimmomatic_bioconda_code()]
-                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__)
+                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=self.wrapper_cluster_name.get())
                 threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
                 threading.Thread(target=xbioinfoapp.setup_bioconda_package_list, args=(self.app_code, self.app_name, package_code_list, self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
             # set up the Trinity software
             elif self.app_code == xlib.get_trinity_code():
                 package_code_list = [xlib.get_trinity_bioconda_code(), xlib.get_bowtie2_bioconda_code()]
-                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__)
+                dialog_log = gdialogs.DialogLog(self, self.head, xbioinfoapp.setup_bioconda_package_list.__name__, cluster_name=self.wrapper_cluster_name.get())
                 threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
                 threading.Thread(target=xbioinfoapp.setup_bioconda_package_list, args=(self.app_code, self.app_name, package_code_list, self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
@@ -399,16 +402,8 @@ class FormSetupBioinfoApp(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            self.combobox_cluster_name['values'] = []
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -546,28 +541,15 @@ class FormRecreateBuscoConfigFile(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
-
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
+    #---------------
 
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_experiment_id"
         self.populate_combobox_experiment_id()
@@ -576,10 +558,6 @@ class FormRecreateBuscoConfigFile(tkinter.Frame):
         self.combobox_assembly_dataset['values'] = []
         self.wrapper_assembly_dataset.set('')
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_experiment_id_selected_item(self, event=None):
@@ -719,15 +697,8 @@ class FormRecreateBuscoConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -739,26 +710,18 @@ class FormRecreateBuscoConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_experiment_id.set('')
 
-        # initialize the experiment identification list
-        experiment_id_list = []
-
-        # get the experiment identifications
-        command = 'ls {0}'.format(xlib.get_cluster_read_dir())
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
-
-        # verify if there are any experimment identifications
-        if experiment_id_list == []:
-            message = 'The cluster {0} has not experiment data.'.format(self.wrapper_cluster_name.get())
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster {0} has not experiment data.'.format(cluster_name)
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
 
-        # load the experiment identifications in the combobox
-        self.combobox_experiment_id['values'] = sorted(experiment_id_list)
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = xlib.get_cluster_read_dir()
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
 
     #---------------
 
@@ -913,28 +876,15 @@ class FormRecreateCdHitEstConfigFile(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
-
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
+    #---------------
 
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_experiment_id"
         self.populate_combobox_experiment_id()
@@ -943,10 +893,6 @@ class FormRecreateCdHitEstConfigFile(tkinter.Frame):
         self.combobox_assembly_dataset['values'] = []
         self.wrapper_assembly_dataset.set('')
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_experiment_id_selected_item(self, event=None):
@@ -1086,15 +1032,8 @@ class FormRecreateCdHitEstConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -1106,26 +1045,18 @@ class FormRecreateCdHitEstConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_experiment_id.set('')
 
-        # initialize the experiment identification list
-        experiment_id_list = []
-
-        # get the experiment identifications
-        command = 'ls {0}'.format(xlib.get_cluster_result_dir())
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
-
-        # verify if there are any experimment identifications
-        if experiment_id_list == []:
-            message = 'The cluster {0} has not experiment data.'.format(self.wrapper_cluster_name.get())
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster {0} has not experiment data.'.format(cluster_name)
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
 
-        # load the experiment identifications in the combobox
-        self.combobox_experiment_id['values'] = sorted(experiment_id_list)
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = xlib.get_cluster_result_dir()
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
 
     #---------------
 
@@ -1284,28 +1215,15 @@ class FormRecreateFastQCConfigFile(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
-
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
+    #---------------
 
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_experiment_id"
         self.populate_combobox_experiment_id()
@@ -1314,10 +1232,6 @@ class FormRecreateFastQCConfigFile(tkinter.Frame):
         self.combobox_read_dataset['values'] = []
         self.wrapper_read_dataset.set('')
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_experiment_id_selected_item(self, event=None):
@@ -1455,15 +1369,8 @@ class FormRecreateFastQCConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -1475,26 +1382,18 @@ class FormRecreateFastQCConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_experiment_id.set('')
 
-        # initialize the experiment identifications list
-        experiment_ids_list = []
-
-        # get the experiment identifications
-        command = 'ls {0}'.format(xlib.get_cluster_read_dir())
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_ids_list.append(line)
-
-        # verify if there are any experimment identifications
-        if experiment_ids_list == []:
-            message = 'The cluster {0} has not experiment data.'.format(self.wrapper_cluster_name.get())
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster {0} has not experiment data.'.format(cluster_name)
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
 
-        # load the experiment identifications in the combobox
-        self.combobox_experiment_id['values'] = sorted(experiment_ids_list)
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = xlib.get_cluster_read_dir()
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
 
     #---------------
 
@@ -1698,28 +1597,15 @@ class FormRecreateGmapConfigFile(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
-
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
+    #---------------
 
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_reference_dataset"
         self.populate_combobox_reference_dataset()
@@ -1735,10 +1621,6 @@ class FormRecreateGmapConfigFile(tkinter.Frame):
         self.combobox_assembly_dataset['values'] = []
         self.wrapper_assembly_dataset.set('')
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_reference_dataset_selected_item(self, event=None):
@@ -1901,15 +1783,8 @@ class FormRecreateGmapConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -1953,26 +1828,18 @@ class FormRecreateGmapConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_experiment_id.set('')
 
-        # initialize the experiment identification list
-        experiment_id_list = []
-
-        # get the experiment identifications
-        command = 'ls {0}'.format(xlib.get_cluster_result_dir())
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
-
-        # verify if there are any experimment identifications
-        if experiment_id_list == []:
-            message = 'The cluster {0} has not experiment data.'.format(self.wrapper_cluster_name.get())
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster {0} has not experiment data.'.format(cluster_name)
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
 
-        # load the experiment identifications in the combobox
-        self.combobox_experiment_id['values'] = sorted(experiment_id_list)
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = xlib.get_cluster_result_dir()
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
 
     #---------------
 
@@ -2161,28 +2028,15 @@ class FormRecreateInsilicoReadNormalizationConfigFile(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
-
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
+    #---------------
 
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_experiment_id"
         self.populate_combobox_experiment_id()
@@ -2191,10 +2045,6 @@ class FormRecreateInsilicoReadNormalizationConfigFile(tkinter.Frame):
         self.combobox_read_dataset['values'] = []
         self.wrapper_read_dataset.set('')
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_experiment_id_selected_item(self, event=None):
@@ -2285,7 +2135,7 @@ class FormRecreateInsilicoReadNormalizationConfigFile(tkinter.Frame):
             if self.read_type == 'PE':
                 (file_1_list, file_2_list, unpaired_file_list) = xlib.pair_files(selected_file_list, self.wrapper_specific_chars_1.get(), self.wrapper_specific_chars_2.get())
                 if unpaired_file_list != []:
-                    message = 'ERROR: There are unpaired files.'
+                    message = 'ERROR: There are unpaired files: {0}.'.format(', '.join(unpaired_file_list))
                     tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
                     OK = False
 
@@ -2375,15 +2225,8 @@ class FormRecreateInsilicoReadNormalizationConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -2395,26 +2238,18 @@ class FormRecreateInsilicoReadNormalizationConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_experiment_id.set('')
 
-        # initialize the experiment identifications list
-        experiment_ids_list = []
-
-        # get the experiment identifications
-        command = 'ls {0}'.format(xlib.get_cluster_read_dir())
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_ids_list.append(line)
-
-        # verify if there are any experimment identifications
-        if experiment_ids_list == []:
-            message = 'The cluster {0} has not experiment data.'.format(self.wrapper_cluster_name.get())
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster {0} has not experiment data.'.format(cluster_name)
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
 
-        # load the experiment identifications in the combobox
-        self.combobox_experiment_id['values'] = sorted(experiment_ids_list)
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = xlib.get_cluster_read_dir()
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
 
     #---------------
 
@@ -2631,28 +2466,15 @@ class FormRecreateQuastConfigFile(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
-
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
+    #---------------
 
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_reference_dataset"
         self.populate_combobox_reference_dataset()
@@ -2668,10 +2490,6 @@ class FormRecreateQuastConfigFile(tkinter.Frame):
         self.combobox_assembly_dataset['values'] = []
         self.wrapper_assembly_dataset.set('')
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_reference_dataset_selected_item(self, event=None):
@@ -2838,15 +2656,8 @@ class FormRecreateQuastConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -2891,26 +2702,18 @@ class FormRecreateQuastConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_experiment_id.set('')
 
-        # initialize the experiment identification list
-        experiment_id_list = []
-
-        # get the experiment identifications
-        command = 'ls {0}'.format(xlib.get_cluster_result_dir())
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
-
-        # verify if there are any experimment identifications
-        if experiment_id_list == []:
-            message = 'The cluster {0} has not experiment data.'.format(self.wrapper_cluster_name.get())
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster {0} has not experiment data.'.format(cluster_name)
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
 
-        # load the experiment identifications in the combobox
-        self.combobox_experiment_id['values'] = sorted(experiment_id_list)
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = xlib.get_cluster_result_dir()
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
 
     #---------------
 
@@ -3143,28 +2946,15 @@ class FormRecreateRefEvalConfigFile(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
-
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
+    #---------------
 
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_reference_dataset"
         self.populate_combobox_reference_dataset()
@@ -3184,10 +2974,6 @@ class FormRecreateRefEvalConfigFile(tkinter.Frame):
         self.combobox_assembly_dataset['values'] = []
         self.wrapper_assembly_dataset.set('')
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_reference_dataset_selected_item(self, event=None):
@@ -3341,7 +3127,7 @@ class FormRecreateRefEvalConfigFile(tkinter.Frame):
             if self.read_type == 'PE':
                 (file_1_list, file_2_list, unpaired_file_list) = xlib.pair_files(selected_file_list, self.wrapper_specific_chars_1.get(), self.wrapper_specific_chars_2.get())
                 if unpaired_file_list != []:
-                    message = 'ERROR: There are unpaired files.'
+                    message = 'ERROR: There are unpaired files: {0}.'.format(', '.join(unpaired_file_list))
                     tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
                     OK = False
 
@@ -3441,15 +3227,8 @@ class FormRecreateRefEvalConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -3494,26 +3273,18 @@ class FormRecreateRefEvalConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_experiment_id.set('')
 
-        # initialize the experiment identification list
-        experiment_id_list = []
-
-        # get the experiment identifications
-        command = 'ls {0}'.format(xlib.get_cluster_read_dir())
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
-
-        # verify if there are any experimment identifications
-        if experiment_id_list == []:
-            message = 'The cluster {0} has not experiment data.'.format(self.wrapper_cluster_name.get())
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster {0} has not experiment data.'.format(cluster_name)
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
 
-        # load the experiment identifications in the combobox
-        self.combobox_experiment_id['values'] = sorted(experiment_id_list)
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = xlib.get_cluster_read_dir()
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
 
     #---------------
 
@@ -3803,28 +3574,15 @@ class FormRecreateRnaQuastConfigFile(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
-
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
+    #---------------
 
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_reference_dataset"
         self.populate_combobox_reference_dataset()
@@ -3844,10 +3602,6 @@ class FormRecreateRnaQuastConfigFile(tkinter.Frame):
         self.combobox_assembly_dataset['values'] = []
         self.wrapper_assembly_dataset.set('')
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_reference_dataset_selected_item(self, event=None):
@@ -4001,7 +3755,7 @@ class FormRecreateRnaQuastConfigFile(tkinter.Frame):
             if self.read_type == 'PE':
                 (file_1_list, file_2_list, unpaired_file_list) = xlib.pair_files(selected_file_list, self.wrapper_specific_chars_1.get(), self.wrapper_specific_chars_2.get())
                 if unpaired_file_list != []:
-                    message = 'ERROR: There are unpaired files.'
+                    message = 'ERROR: There are unpaired files: {0}.'.format(', '.join(unpaired_file_list))
                     tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
                     OK = False
 
@@ -4101,15 +3855,8 @@ class FormRecreateRnaQuastConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -4154,26 +3901,18 @@ class FormRecreateRnaQuastConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_experiment_id.set('')
 
-        # initialize the experiment identification list
-        experiment_id_list = []
-
-        # get the experiment identifications
-        command = 'ls {0}'.format(xlib.get_cluster_read_dir())
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
-
-        # verify if there are any experimment identifications
-        if experiment_id_list == []:
-            message = 'The cluster {0} has not experiment data.'.format(self.wrapper_cluster_name.get())
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster {0} has not experiment data.'.format(cluster_name)
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
 
-        # load the experiment identifications in the combobox
-        self.combobox_experiment_id['values'] = sorted(experiment_id_list)
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = xlib.get_cluster_read_dir()
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
 
     #---------------
 
@@ -4441,28 +4180,15 @@ class FormRecreateRsemEvalConfigFile(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
-
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
+    #---------------
 
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_experiment_id"
         self.populate_combobox_experiment_id()
@@ -4475,10 +4201,6 @@ class FormRecreateRsemEvalConfigFile(tkinter.Frame):
         self.combobox_assembly_dataset['values'] = []
         self.wrapper_assembly_dataset.set('')
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_experiment_id_selected_item(self, event=None):
@@ -4601,7 +4323,7 @@ class FormRecreateRsemEvalConfigFile(tkinter.Frame):
             if self.read_type == 'PE':
                 (file_1_list, file_2_list, unpaired_file_list) = xlib.pair_files(selected_file_list, self.wrapper_specific_chars_1.get(), self.wrapper_specific_chars_2.get())
                 if unpaired_file_list != []:
-                    message = 'ERROR: There are unpaired files.'
+                    message = 'ERROR: There are unpaired files: {0}.'.format(', '.join(unpaired_file_list))
                     tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
                     OK = False
 
@@ -4697,15 +4419,8 @@ class FormRecreateRsemEvalConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -4717,26 +4432,18 @@ class FormRecreateRsemEvalConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_experiment_id.set('')
 
-        # initialize the experiment identification list
-        experiment_id_list = []
-
-        # get the experiment identifications
-        command = 'ls {0}'.format(xlib.get_cluster_read_dir())
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
-
-        # verify if there are any experimment identifications
-        if experiment_id_list == []:
-            message = 'The cluster {0} has not experiment data.'.format(self.wrapper_cluster_name.get())
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster {0} has not experiment data.'.format(cluster_name)
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
 
-        # load the experiment identifications in the combobox
-        self.combobox_experiment_id['values'] = sorted(experiment_id_list)
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = xlib.get_cluster_read_dir()
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
 
     #---------------
 
@@ -4982,28 +4689,15 @@ class FormRecreateSoapdenovoTransConfigFile(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
-
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
+    #---------------
 
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_experiment_id"
         self.populate_combobox_experiment_id()
@@ -5012,10 +4706,6 @@ class FormRecreateSoapdenovoTransConfigFile(tkinter.Frame):
         self.combobox_read_dataset['values'] = []
         self.wrapper_read_dataset.set('')
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_experiment_id_selected_item(self, event=None):
@@ -5106,21 +4796,28 @@ class FormRecreateSoapdenovoTransConfigFile(tkinter.Frame):
             if self.read_type == 'PE':
                 (file_1_list, file_2_list, unpaired_file_list) = xlib.pair_files(selected_file_list, self.wrapper_specific_chars_1.get(), self.wrapper_specific_chars_2.get())
                 if unpaired_file_list != []:
-                    message = 'ERROR: There are unpaired files.'
+                    message = 'ERROR: There are unpaired files: {0}.'.format(', '.join(unpaired_file_list))
                     tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
                     OK = False
 
+        # get the resources recommended from the metrics of past runs
+        if OK:
+            if self.read_type == 'SE':
+                recommendation = xsoapdenovotrans.recommend_soapdenovotrans_resources(self.ssh_client, self.wrapper_experiment_id.get(), self.read_dataset_id, selected_file_list)
+            elif self.read_type == 'PE':
+                recommendation = xsoapdenovotrans.recommend_soapdenovotrans_resources(self.ssh_client, self.wrapper_experiment_id.get(), self.read_dataset_id, file_1_list + file_2_list)
+
         # confirm the creation of the SOAPdenovo-Trans config file
         if OK:
-            message = 'The file {0} is going to be recreated. The previous file will be lost.\n\nAre you sure to continue?'.format(xsoapdenovotrans.get_soapdenovotrans_config_file())
+            message = 'The file {0} is going to be recreated. The previous file will be lost.\n\n{1}\n\nAre you sure to continue?'.format(xsoapdenovotrans.get_soapdenovotrans_config_file(), xmetrics.get_recommendation_text(recommendation))
             OK = tkinter.messagebox.askyesno('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
 
         # recreate the SOAPdenovo-Trans config file
         if OK:
             if self.read_type == 'SE':
-                (OK, error_list) = xsoapdenovotrans.create_soapdenovotrans_config_file(self.wrapper_experiment_id.get(), self.read_dataset_id, self.read_type, selected_file_list, None)
+                (OK, error_list) = xsoapdenovotrans.create_soapdenovotrans_config_file(self.wrapper_experiment_id.get(), self.read_dataset_id, self.read_type, selected_file_list, None, recommendation)
             elif self.read_type == 'PE':
-                (OK, error_list) = xsoapdenovotrans.create_soapdenovotrans_config_file(self.wrapper_experiment_id.get(), self.read_dataset_id, self.read_type, file_1_list, file_2_list)
+                (OK, error_list) = xsoapdenovotrans.create_soapdenovotrans_config_file(self.wrapper_experiment_id.get(), self.read_dataset_id, self.read_type, file_1_list, file_2_list, recommendation)
             if not OK:
                 message = ''
                 for error in error_list:
@@ -5196,15 +4893,8 @@ class FormRecreateSoapdenovoTransConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -5216,26 +4906,18 @@ class FormRecreateSoapdenovoTransConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_experiment_id.set('')
 
-        # initialize the experiment identifications list
-        experiment_ids_list = []
-
-        # get the experiment identifications
-        command = 'ls {0}'.format(xlib.get_cluster_read_dir())
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_ids_list.append(line)
-
-        # verify if there are any experimment identifications
-        if experiment_ids_list == []:
-            message = 'The cluster {0} has not experiment data.'.format(self.wrapper_cluster_name.get())
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster {0} has not experiment data.'.format(cluster_name)
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
 
-        # load the experiment identifications in the combobox
-        self.combobox_experiment_id['values'] = sorted(experiment_ids_list)
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = xlib.get_cluster_read_dir()
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
 
     #---------------
 
@@ -5497,28 +5179,15 @@ class FormRecreateSTARConfigFile(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
-
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
+    #---------------
 
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_reference_dataset"
         self.populate_combobox_reference_dataset()
@@ -5538,10 +5207,6 @@ class FormRecreateSTARConfigFile(tkinter.Frame):
         self.combobox_read_dataset['values'] = []
         self.wrapper_read_dataset.set('')
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_reference_dataset_selected_item(self, event=None):
@@ -5671,7 +5336,7 @@ class FormRecreateSTARConfigFile(tkinter.Frame):
             if self.read_type == 'PE':
                 (file_1_list, file_2_list, unpaired_file_list) = xlib.pair_files(selected_file_list, self.wrapper_specific_chars_1.get(), self.wrapper_specific_chars_2.get())
                 if unpaired_file_list != []:
-                    message = 'ERROR: There are unpaired files.'
+                    message = 'ERROR: There are unpaired files: {0}.'.format(', '.join(unpaired_file_list))
                     tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
                     OK = False
 
@@ -5682,17 +5347,24 @@ class FormRecreateSTARConfigFile(tkinter.Frame):
                 tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
                 OK = False
 
+        # get the resources recommended from the metrics of past runs
+        if OK:
+            if self.read_type == 'SE':
+                recommendation = xstar.recommend_star_resources(self.ssh_client, self.wrapper_experiment_id.get(), self.read_dataset_id, selected_file_list)
+            elif self.read_type == 'PE':
+                recommendation = xstar.recommend_star_resources(self.ssh_client, self.wrapper_experiment_id.get(), self.read_dataset_id, file_1_list + file_2_list)
+
         # confirm the creation of the STAR config file
         if OK:
-            message = 'The file {0} is going to be recreated. The previous file will be lost.\n\nAre you sure to continue?'.format(xstar.get_star_config_file())
+            message = 'The file {0} is going to be recreated. The previous file will be lost.\n\n{1}\n\nAre you sure to continue?'.format(xstar.get_star_config_file(), xmetrics.get_recommendation_text(recommendation))
             OK = tkinter.messagebox.askyesno('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
 
         # recreate the STAR config file
         if OK:
             if self.read_type == 'SE':
-                (OK, error_list) = xstar.create_star_config_file(self.wrapper_experiment_id.get(), self.wrapper_reference_dataset.get(), self.wrapper_reference_file.get(), self.wrapper_gtf_file.get(), self.read_dataset_id, self.read_type, selected_file_list[0], None)
+                (OK, error_list) = xstar.create_star_config_file(self.wrapper_experiment_id.get(), self.wrapper_reference_dataset.get(), self.wrapper_reference_file.get(), self.wrapper_gtf_file.get(), self.read_dataset_id, self.read_type, selected_file_list[0], None, recommendation)
             elif self.read_type == 'PE':
-                (OK, error_list) = xstar.create_star_config_file(self.wrapper_experiment_id.get(), self.wrapper_reference_dataset.get(), self.wrapper_reference_file.get(), self.wrapper_gtf_file.get(), self.read_dataset_id, self.read_type, file_1_list[0], file_2_list[0])
+                (OK, error_list) = xstar.create_star_config_file(self.wrapper_experiment_id.get(), self.wrapper_reference_dataset.get(), self.wrapper_reference_file.get(), self.wrapper_gtf_file.get(), self.read_dataset_id, self.read_type, file_1_list[0], file_2_list[0], recommendation)
             if not OK:
                 message = ''
                 for error in error_list:
@@ -5774,15 +5446,8 @@ class FormRecreateSTARConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -5842,26 +5507,18 @@ class FormRecreateSTARConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_experiment_id.set('')
 
-        # initialize the experiment identification list
-        experiment_id_list = []
-
-        # get the experiment identifications
-        command = 'ls {0}'.format(xlib.get_cluster_read_dir())
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
-
-        # verify if there are any experimment identifications
-        if experiment_id_list == []:
-            message = 'The cluster {0} has not experiment data.'.format(self.wrapper_cluster_name.get())
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster {0} has not experiment data.'.format(cluster_name)
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
 
-        # load the experiment identifications in the combobox
-        self.combobox_experiment_id['values'] = sorted(experiment_id_list)
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = xlib.get_cluster_read_dir()
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
 
     #---------------
 
@@ -6090,28 +5747,15 @@ class FormRecreateTransAbyssConfigFile(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
+    #---------------
 
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
-
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
-
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_experiment_id"
         self.populate_combobox_experiment_id()
@@ -6120,10 +5764,6 @@ class FormRecreateTransAbyssConfigFile(tkinter.Frame):
         self.combobox_read_dataset['values'] = []
         self.wrapper_read_dataset.set('')
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_experiment_id_selected_item(self, event=None):
@@ -6214,21 +5854,28 @@ class FormRecreateTransAbyssConfigFile(tkinter.Frame):
             if self.read_type == 'PE':
                 (file_1_list, file_2_list, unpaired_file_list) = xlib.pair_files(selected_file_list, self.wrapper_specific_chars_1.get(), self.wrapper_specific_chars_2.get())
                 if unpaired_file_list != []:
-                    message = 'ERROR: There are unpaired files.'
+                    message = 'ERROR: There are unpaired files: {0}.'.format(', '.join(unpaired_file_list))
                     tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
                     OK = False
 
+        # get the resources recommended from the metrics of past runs
+        if OK:
+            if self.read_type == 'SE':
+                recommendation = xtransabyss.recommend_transabyss_resources(self.ssh_client, self.wrapper_experiment_id.get(), self.read_dataset_id, selected_file_list)
+            elif self.read_type == 'PE':
+                recommendation = xtransabyss.recommend_transabyss_resources(self.ssh_client, self.wrapper_experiment_id.get(), self.read_dataset_id, file_1_list + file_2_list)
+
         # confirm the creation of the Trans-ABySS config file
         if OK:
-            message = 'The file {0} is going to be recreated. The previous file will be lost.\n\nAre you sure to continue?'.format(xtransabyss.get_transabyss_config_file())
+            message = 'The file {0} is going to be recreated. The previous file will be lost.\n\n{1}\n\nAre you sure to continue?'.format(xtransabyss.get_transabyss_config_file(), xmetrics.get_recommendation_text(recommendation))
             OK = tkinter.messagebox.askyesno('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
 
         # recreate the Trans-ABySS config file
         if OK:
             if self.read_type == 'SE':
-                (OK, error_list) = xtransabyss.create_transabyss_config_file(self.wrapper_experiment_id.get(), self.read_dataset_id, self.read_type, selected_file_list, None)
+                (OK, error_list) = xtransabyss.create_transabyss_config_file(self.wrapper_experiment_id.get(), self.read_dataset_id, self.read_type, selected_file_list, None, recommendation)
             elif self.read_type == 'PE':
-                (OK, error_list) = xtransabyss.create_transabyss_config_file(self.wrapper_experiment_id.get(), self.read_dataset_id, self.read_type, file_1_list, file_2_list)
+                (OK, error_list) = xtransabyss.create_transabyss_config_file(self.wrapper_experiment_id.get(), self.read_dataset_id, self.read_type, file_1_list, file_2_list, recommendation)
             if not OK:
                 message = ''
                 for error in error_list:
@@ -6304,15 +5951,8 @@ class FormRecreateTransAbyssConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -6324,26 +5964,18 @@ class FormRecreateTransAbyssConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_experiment_id.set('')
 
-        # initialize the experiment identifications list
-        experiment_ids_list = []
-
-        # get the experiment identifications
-        command = 'ls {0}'.format(xlib.get_cluster_read_dir())
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_ids_list.append(line)
-
-        # verify if there are any experimment identifications
-        if experiment_ids_list == []:
-            message = 'The cluster {0} has not experiment data.'.format(self.wrapper_cluster_name.get())
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster {0} has not experiment data.'.format(cluster_name)
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
 
-        # load the experiment identifications in the combobox
-        self.combobox_experiment_id['values'] = sorted(experiment_ids_list)
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = xlib.get_cluster_read_dir()
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
 
     #---------------
 
@@ -6527,28 +6159,15 @@ class FormRecreateTranscriptFilterConfigFile(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
-
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
-
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
+    #---------------
 
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_experiment_id"
         self.populate_combobox_experiment_id()
@@ -6557,10 +6176,6 @@ class FormRecreateTranscriptFilterConfigFile(tkinter.Frame):
         self.combobox_rsem_eval_dataset['values'] = []
         self.wrapper_rsem_eval_dataset.set('')
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_experiment_id_selected_item(self, event=None):
@@ -6678,15 +6293,8 @@ class FormRecreateTranscriptFilterConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -6698,26 +6306,18 @@ class FormRecreateTranscriptFilterConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_experiment_id.set('')
 
-        # initialize the experiment identification list
-        experiment_id_list = []
-
-        # get the experiment identifications
-        command = 'ls {0}'.format(xlib.get_cluster_result_dir())
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
-
-        # verify if there are any experimment identifications
-        if experiment_id_list == []:
-            message = 'The cluster {0} has not experiment data.'.format(self.wrapper_cluster_name.get())
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster {0} has not experiment data.'.format(cluster_name)
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
 
-        # load the experiment identifications in the combobox
-        self.combobox_experiment_id['values'] = sorted(experiment_id_list)
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = xlib.get_cluster_result_dir()
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
 
     #---------------
 
@@ -6894,28 +6494,15 @@ class FormRecreateTranscriptomeBlastxConfigFile(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
-
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
+    #---------------
 
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_database_dataset"
         self.populate_combobox_database_dataset()
@@ -6931,10 +6518,6 @@ class FormRecreateTranscriptomeBlastxConfigFile(tkinter.Frame):
         self.combobox_assembly_dataset['values'] = []
         self.wrapper_assembly_dataset.set('')
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_database_dataset_selected_item(self, event=None):
@@ -7097,15 +6680,8 @@ class FormRecreateTranscriptomeBlastxConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -7161,26 +6737,18 @@ class FormRecreateTranscriptomeBlastxConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_experiment_id.set('')
 
-        # initialize the experiment identification list
-        experiment_id_list = []
-
-        # get the experiment identifications
-        command = 'ls {0}'.format(xlib.get_cluster_result_dir())
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
-
-        # verify if there are any experimment identifications
-        if experiment_id_list == []:
-            message = 'The cluster {0} has not experiment data.'.format(self.wrapper_cluster_name.get())
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster {0} has not experiment data.'.format(cluster_name)
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
 
-        # load the experiment identifications in the combobox
-        self.combobox_experiment_id['values'] = sorted(experiment_id_list)
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = xlib.get_cluster_result_dir()
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
 
     #---------------
 
@@ -7413,28 +6981,15 @@ class FormRecreateTransrateConfigFile(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
-
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
+    #---------------
 
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_reference_dataset"
         self.populate_combobox_reference_dataset()
@@ -7454,10 +7009,6 @@ class FormRecreateTransrateConfigFile(tkinter.Frame):
         self.combobox_assembly_dataset['values'] = []
         self.wrapper_assembly_dataset.set('')
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_reference_dataset_selected_item(self, event=None):
@@ -7611,7 +7162,7 @@ class FormRecreateTransrateConfigFile(tkinter.Frame):
             if self.read_type == 'PE':
                 (file_1_list, file_2_list, unpaired_file_list) = xlib.pair_files(selected_file_list, self.wrapper_specific_chars_1.get(), self.wrapper_specific_chars_2.get())
                 if unpaired_file_list != []:
-                    message = 'ERROR: There are unpaired files.'
+                    message = 'ERROR: There are unpaired files: {0}.'.format(', '.join(unpaired_file_list))
                     tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
                     OK = False
 
@@ -7711,15 +7262,8 @@ class FormRecreateTransrateConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -7764,26 +7308,18 @@ class FormRecreateTransrateConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_experiment_id.set('')
 
-        # initialize the experiment identification list
-        experiment_id_list = []
-
-        # get the experiment identifications
-        command = 'ls {0}'.format(xlib.get_cluster_read_dir())
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
-
-        # verify if there are any experimment identifications
-        if experiment_id_list == []:
-            message = 'The cluster {0} has not experiment data.'.format(self.wrapper_cluster_name.get())
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster {0} has not experiment data.'.format(cluster_name)
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
 
-        # load the experiment identifications in the combobox
-        self.combobox_experiment_id['values'] = sorted(experiment_id_list)
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = xlib.get_cluster_read_dir()
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
 
     #---------------
 
@@ -8029,28 +7565,15 @@ class FormRecreateTrimmomaticConfigFile(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
-
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
+    #---------------
 
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_experiment_id"
         self.populate_combobox_experiment_id()
@@ -8059,10 +7582,6 @@ class FormRecreateTrimmomaticConfigFile(tkinter.Frame):
         self.combobox_read_dataset['values'] = []
         self.wrapper_read_dataset.set('')
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_experiment_id_selected_item(self, event=None):
@@ -8153,7 +7672,7 @@ class FormRecreateTrimmomaticConfigFile(tkinter.Frame):
             if self.read_type == 'PE':
                 (file_1_list, file_2_list, unpaired_file_list) = xlib.pair_files(selected_file_list, self.wrapper_specific_chars_1.get(), self.wrapper_specific_chars_2.get())
                 if unpaired_file_list != []:
-                    message = 'ERROR: There are unpaired files.'
+                    message = 'ERROR: There are unpaired files: {0}.'.format(', '.join(unpaired_file_list))
                     tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
                     OK = False
 
@@ -8243,15 +7762,8 @@ class FormRecreateTrimmomaticConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -8263,26 +7775,18 @@ class FormRecreateTrimmomaticConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_experiment_id.set('')
 
-        # initialize the experiment identifications list
-        experiment_ids_list = []
-
-        # get the experiment identifications
-        command = 'ls {0}'.format(xlib.get_cluster_read_dir())
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_ids_list.append(line)
-
-        # verify if there are any experimment identifications
-        if experiment_ids_list == []:
-            message = 'The cluster {0} has not experiment data.'.format(self.wrapper_cluster_name.get())
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster {0} has not experiment data.'.format(cluster_name)
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
 
-        # load the experiment identifications in the combobox
-        self.combobox_experiment_id['values'] = sorted(experiment_ids_list)
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = xlib.get_cluster_read_dir()
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
 
     #---------------
 
@@ -8511,28 +8015,15 @@ class FormRecreateTrinityConfigFile(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
-
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
+    #---------------
 
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_experiment_id"
         self.populate_combobox_experiment_id()
@@ -8541,10 +8032,6 @@ class FormRecreateTrinityConfigFile(tkinter.Frame):
         self.combobox_read_dataset['values'] = []
         self.wrapper_read_dataset.set('')
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_experiment_id_selected_item(self, event=None):
@@ -8635,21 +8122,28 @@ class FormRecreateTrinityConfigFile(tkinter.Frame):
             if self.read_type == 'PE':
                 (file_1_list, file_2_list, unpaired_file_list) = xlib.pair_files(selected_file_list, self.wrapper_specific_chars_1.get(), self.wrapper_specific_chars_2.get())
                 if unpaired_file_list != []:
-                    message = 'ERROR: There are unpaired files.'
+                    message = 'ERROR: There are unpaired files: {0}.'.format(', '.join(unpaired_file_list))
                     tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
                     OK = False
 
+        # get the resources recommended from the metrics of past runs
+        if OK:
+            if self.read_type == 'SE':
+                recommendation = xtrinity.recommend_trinity_resources(self.ssh_client, self.wrapper_experiment_id.get(), self.read_dataset_id, selected_file_list)
+            elif self.read_type == 'PE':
+                recommendation = xtrinity.recommend_trinity_resources(self.ssh_client, self.wrapper_experiment_id.get(), self.read_dataset_id, file_1_list + file_2_list)
+
         # confirm the creation of the Trinity config file
         if OK:
-            message = 'The file {0} is going to be recreated. The previous file will be lost.\n\nAre you sure to continue?'.format(xtrinity.get_trinity_config_file())
+            message = 'The file {0} is going to be recreated. The previous file will be lost.\n\n{1}\n\nAre you sure to continue?'.format(xtrinity.get_trinity_config_file(), xmetrics.get_recommendation_text(recommendation))
             OK = tkinter.messagebox.askyesno('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
 
         # recreate the Trinity config file
         if OK:
             if self.read_type == 'SE':
-                (OK, error_list) = xtrinity.create_trinity_config_file(self.wrapper_experiment_id.get(), self.read_dataset_id, self.read_type, selected_file_list, None)
+                (OK, error_list) = xtrinity.create_trinity_config_file(self.wrapper_experiment_id.get(), self.read_dataset_id, self.read_type, selected_file_list, None, recommendation)
             elif self.read_type == 'PE':
-                (OK, error_list) = xtrinity.create_trinity_config_file(self.wrapper_experiment_id.get(), self.read_dataset_id, self.read_type, file_1_list, file_2_list)
+                (OK, error_list) = xtrinity.create_trinity_config_file(self.wrapper_experiment_id.get(), self.read_dataset_id, self.read_type, file_1_list, file_2_list, recommendation)
             if not OK:
                 message = ''
                 for error in error_list:
@@ -8725,15 +8219,8 @@ class FormRecreateTrinityConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -8745,26 +8232,18 @@ class FormRecreateTrinityConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_experiment_id.set('')
 
-        # initialize the experiment identifications list
-        experiment_ids_list = []
-
-        # get the experiment identifications
-        command = 'ls {0}'.format(xlib.get_cluster_read_dir())
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_ids_list.append(line)
-
-        # verify if there are any experimment identifications
-        if experiment_ids_list == []:
-            message = 'The cluster {0} has not experiment data.'.format(self.wrapper_cluster_name.get())
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster {0} has not experiment data.'.format(cluster_name)
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
 
-        # load the experiment identifications in the combobox
-        self.combobox_experiment_id['values'] = sorted(experiment_ids_list)
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = xlib.get_cluster_read_dir()
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
 
     #---------------
 
@@ -8860,41 +8339,9 @@ class FormRunBioinfoProcess(tkinter.Frame):
         self.main = main
         self.app = app
 
-        # set the name
-        if self.app == xlib.get_busco_code():
-            self.name = xlib.get_busco_name()
-        elif self.app == xlib.get_cd_hit_est_code():
-            self.name = xlib.get_cd_hit_est_name()
-        elif self.app == xlib.get_fastqc_code():
-            self.name = xlib.get_fastqc_name()
-        elif self.app == xlib.get_gmap_code():
-            self.name = xlib.get_gmap_name()
-        elif self.app == xlib.get_insilico_read_normalization_code():
-            self.name = xlib.get_insilico_read_normalization_name()
-        elif self.app == xlib.get_quast_code():
-            self.name = xlib.get_quast_name()
-        elif self.app == xlib.get_ref_eval_code():
-            self.name = xlib.get_ref_eval_name()
-        elif self.app == xlib.get_rnaquast_code():
-            self.name = xlib.get_rnaquast_name()
-        elif self.app == xlib.get_rsem_eval_code():
-            self.name = xlib.get_rsem_eval_name()
-        elif self.app == xlib.get_soapdenovotrans_code():
-            self.name = xlib.get_soapdenovotrans_name()
-        elif self.app == xlib.get_star_code():
-            self.name = xlib.get_star_name()
-        elif self.app == xlib.get_transabyss_code():
-            self.name = xlib.get_transabyss_name()
-        elif self.app == xlib.get_transcript_filter_code():
-            self.name = xlib.get_transcript_filter_name()
-        elif self.app == xlib.get_transcriptome_blastx_code():
-            self.name = xlib.get_transcriptome_blastx_name()
-        elif self.app == xlib.get_transrate_code():
-            self.name = xlib.get_transrate_name()
-        elif self.app == xlib.get_trimmomatic_code():
-            self.name = xlib.get_trimmomatic_name()
-        elif self.app == xlib.get_trinity_code():
-            self.name = xlib.get_trinity_name()
+        # set the name and the config file
+        self.name = xlib.get_app_data(self.app)['name']
+        self.config_file = xlib.get_app_config_file(self.app)
 
         # set cursor to show busy status
         self.main.config(cursor='watch')
@@ -8975,6 +8422,51 @@ class FormRunBioinfoProcess(tkinter.Frame):
             message = 'Some input values are not OK.'
             tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
 
+        # search result datasets run with identical inputs and options in the thread pool of the loader
+        # showing the busy status until they are got; the search is not kept in the cache
+        if OK:
+            cluster_name = self.wrapper_cluster_name.get()
+            self.main.config(cursor='watch')
+            self.button_execute['state'] = 'disabled'
+            gloader.request(self, 'identical_result_dataset_list', ('identical_result_dataset_list', cluster_name, self.app, self.config_file), xresult.search_identical_result_dataset_list, self.run_process, args=(cluster_name, self.app, self.config_file), ttl=0, error_callback=self.show_search_error)
+
+    #---------------
+
+    def show_search_error(self, exception):
+        '''
+        Show the error raised searching result datasets run with identical inputs and options.
+        '''
+
+        self.main.config(cursor='')
+        self.validate_inputs()
+        tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), 'The result datasets run with identical inputs and options can not be searched: {0}'.format(exception))
+
+    #---------------
+
+    def run_process(self, result):
+        '''
+        Offer the reuse of the result datasets run with identical inputs and options,
+        if there are any, and run bioinfo process.
+        '''
+
+        # set cursor to show normal status
+        self.main.config(cursor='')
+        self.validate_inputs()
+
+        # offer the reuse of the result datasets run with identical inputs and options
+        (OK, error_list, result_dataset_id_list) = result
+        if OK:
+            if result_dataset_id_list != []:
+                message = 'The result dataset(s) {0} ended OK with identical inputs, options and {1} version.\n\nDo you want to reuse the existing result dataset instead of running the process again?'.format(', '.join(result_dataset_id_list), self.name)
+                OK = not tkinter.messagebox.askyesno('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                if not OK:
+                    self.close()
+        else:
+            message = ''
+            for error in error_list:
+                message = '{0}{1}\n'.format(message, error)
+            tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+
         # confirm the process run
         if OK:
             message = 'The {0} process is going to be run.\n\nAre you sure to continue?'.format(self.name)
@@ -8983,107 +8475,270 @@ class FormRunBioinfoProcess(tkinter.Frame):
         # execute the process
         if OK:
 
-            # execute the process when it is a BUSCO process
-            if self.app == xlib.get_busco_code():
-                dialog_log = gdialogs.DialogLog(self, self.head, xbusco.run_busco_process.__name__)
-                threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
-                threading.Thread(target=xbusco.run_busco_process, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
+            # execute the process with the run function of the application
+            run_function = xlib.get_app_run_function(self.app)
+            dialog_log = gdialogs.DialogLog(self, self.head, run_function.__name__, cluster_name=self.wrapper_cluster_name.get())
+            threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
+            threading.Thread(target=run_function, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
-            # execute the process when it is a CD-HIT-EST process
-            elif self.app == xlib.get_cd_hit_est_code():
-                dialog_log = gdialogs.DialogLog(self, self.head, xcdhit.run_cd_hit_est_process.__name__)
-                threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
-                threading.Thread(target=xcdhit.run_cd_hit_est_process, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
+        # close the form
+        if OK:
+            self.close()
 
-            # execute the process when it is a FastQC process
-            elif self.app == xlib.get_fastqc_code():
-                dialog_log = gdialogs.DialogLog(self, self.head, xfastqc.run_fastqc_process.__name__)
-                threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
-                threading.Thread(target=xfastqc.run_fastqc_process, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
+    #---------------
 
-            # execute the process when it is a GMAP process
-            elif self.app == xlib.get_gmap_code():
-                dialog_log = gdialogs.DialogLog(self, self.head, xgmap.run_gmap_process.__name__)
-                threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
-                threading.Thread(target=xgmap.run_gmap_process, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
+    def close(self, event=None):
+        '''
+        Close "FormRunProcess".
+        '''
 
-            # execute the process when it is a insilico_read_normalization process
-            elif self.app == xlib.get_insilico_read_normalization_code():
-                dialog_log = gdialogs.DialogLog(self, self.head, xtrinity.run_insilico_read_normalization_process.__name__)
-                threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
-                threading.Thread(target=xtrinity.run_insilico_read_normalization_process, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
+        # clear the label of the current process name
+        self.main.label_process['text'] = ''
 
-            # execute the process when it is a QUAST process
-            elif self.app == xlib.get_quast_code():
-                dialog_log = gdialogs.DialogLog(self, self.head, xquast.run_quast_process.__name__)
-                threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
-                threading.Thread(target=xquast.run_quast_process, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
+        # close the current form
+        self.main.close_current_form()
 
-            # execute the process when it is a REF-EVAL process
-            elif self.app == xlib.get_ref_eval_code():
-                dialog_log = gdialogs.DialogLog(self, self.head, xdetonate.run_ref_eval_process.__name__)
-                threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
-                threading.Thread(target=xdetonate.run_ref_eval_process, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
+    #---------------
 
-            # execute the process when it is a rnaQUAST process
-            elif self.app == xlib.get_rnaquast_code():
-                dialog_log = gdialogs.DialogLog(self, self.head, xrnaquast.run_rnaquast_process.__name__)
-                threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
-                threading.Thread(target=xrnaquast.run_rnaquast_process, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
+    def initialize_inputs(self):
+        '''
+        Load initial data in inputs.
+        '''
 
-            # execute the process when it is a RSEM-EVAL process
-            elif self.app == xlib.get_rsem_eval_code():
-                dialog_log = gdialogs.DialogLog(self, self.head, xdetonate.run_rsem_eval_process.__name__)
-                threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
-                threading.Thread(target=xdetonate.run_rsem_eval_process, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
+        # load initial data in inputs
+        self.populate_combobox_cluster_name()
 
-            # execute the process when it is a SOAPdenovo-Trans process
-            elif self.app == xlib.get_soapdenovotrans_code():
-                dialog_log = gdialogs.DialogLog(self, self.head, xsoapdenovotrans.run_soapdenovotrans_process.__name__)
-                threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
-                threading.Thread(target=xsoapdenovotrans.run_soapdenovotrans_process, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
+    #---------------
 
-            # execute the process when it is a STAR process
-            elif self.app == xlib.get_star_code():
-                dialog_log = gdialogs.DialogLog(self, self.head, xstar.run_star_process.__name__)
-                threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
-                threading.Thread(target=xstar.run_star_process, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
+    def populate_combobox_cluster_name(self):
+        '''
+        Populate data in "combobox_cluster_name".
+        '''
 
-            # execute the process when it is a Trans-ABySS process
-            elif self.app == xlib.get_transabyss_code():
-                dialog_log = gdialogs.DialogLog(self, self.head, xtransabyss.run_transabyss_process.__name__)
-                threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
-                threading.Thread(target=xtransabyss.run_transabyss_process, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
+        # clear the value selected in the combobox
+        self.wrapper_cluster_name.set('')
 
-            # execute the process when it is a transcript-filter process
-            elif self.app == xlib.get_transcript_filter_code():
-                dialog_log = gdialogs.DialogLog(self, self.head, xngshelper.run_transcript_filter_process.__name__)
-                threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
-                threading.Thread(target=xngshelper.run_transcript_filter_process, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
-            # execute the process when it is a transcriptome_blastx process
-            elif self.app == xlib.get_transcriptome_blastx_code():
-                dialog_log = gdialogs.DialogLog(self, self.head, xngshelper.run_transcriptome_blastx_process.__name__)
-                threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
-                threading.Thread(target=xngshelper.run_transcriptome_blastx_process, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
+    #---------------
+
+    def validate_inputs(self, *args):
+        '''
+        Validate the content of each input of "FormRunBioinfoProcess" and do the actions linked to its value
+        '''
+
+        # initialize the control variable
+        OK = True
+
+        # verify if "button_execute" has to be enabled or disabled
+        if self.wrapper_cluster_name.get() != '':
+            self.button_execute['state'] = 'enable'
+        else:
+            self.button_execute['state'] = 'disabled'
+
+        # return the control variable
+        return OK
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+class FormResumeBioinfoProcess(tkinter.Frame):
+
+    #---------------
+
+    def __init__(self, parent, main, app):
+        '''
+        Execute actions correspending to the creation of a "FormResumeBioinfoProcess" instance.
+        '''
+
+        # save initial parameters in instance variables
+        self.parent = parent
+        self.main = main
+        self.app = app
+
+        # set the name
+        if self.app == xlib.get_soapdenovotrans_code():
+            self.name = xlib.get_soapdenovotrans_name()
+        elif self.app == xlib.get_transabyss_code():
+            self.name = xlib.get_transabyss_name()
+        elif self.app == xlib.get_trinity_code():
+            self.name = xlib.get_trinity_name()
+
+        # initialize the cluster name previously selected
+        self.cluster_name_ant = None
+
+        # set cursor to show busy status
+        self.main.config(cursor='watch')
+        self.main.update()
+
+        # call the init method of the parent class
+        tkinter.Frame.__init__(self, self.parent)
+
+        # assign the text of the "head"
+        self.head = '{0} - Resume process'.format(self.name)
+
+        # create the wrappers to track changes in the inputs
+        self.wrapper_cluster_name = tkinter.StringVar()
+        self.wrapper_cluster_name.trace('w', self.validate_inputs)
+        self.wrapper_experiment_id = tkinter.StringVar()
+        self.wrapper_experiment_id.trace('w', self.validate_inputs)
+        self.wrapper_result_dataset = tkinter.StringVar()
+        self.wrapper_result_dataset.trace('w', self.validate_inputs)
+
+        # build the graphical user interface
+        self.build_gui()
+
+        # load initial data in inputs
+        self.initialize_inputs()
+
+        # set cursor to show normal status
+        self.main.config(cursor='')
+        self.main.update()
+
+    #---------------
+
+    def build_gui(self):
+        '''
+        Build the graphical user interface of "FormResumeBioinfoProcess".
+        '''
+
+        # assign the text to the label of the current process name
+        self.main.label_process['text'] = self.head
+
+        # create "label_cluster_name" and register it with the grid geometry manager
+        self.label_cluster_name = tkinter.Label(self, text='Cluster name')
+        self.label_cluster_name.grid(row=0, column=0, padx=(15,5), pady=(75,5), sticky='e')
+
+        # create "combobox_cluster_name" and register it with the grid geometry manager
+        self.combobox_cluster_name = tkinter.ttk.Combobox(self, width=20, height=4, state='readonly', textvariable=self.wrapper_cluster_name)
+        self.combobox_cluster_name.grid(row=0, column=1, padx=(5,5), pady=(75,5), sticky='w')
+
+        # create "label_experiment_id" and register it with the grid geometry manager
+        self.label_experiment_id = tkinter.Label(self, text='Experiment id.')
+        self.label_experiment_id.grid(row=1, column=0, padx=(15,5), pady=(25,5), sticky='e')
+
+        # create "combobox_experiment_id" and register it with the grid geometry manager
+        self.combobox_experiment_id = tkinter.ttk.Combobox(self, width=30, height=4, state='readonly', textvariable=self.wrapper_experiment_id)
+        self.combobox_experiment_id.grid(row=1, column=1, padx=(5,5), pady=(25,5), sticky='w')
+
+        # create "label_result_dataset" and register it with the grid geometry manager
+        self.label_result_dataset = tkinter.Label(self, text='Result dataset')
+        self.label_result_dataset.grid(row=2, column=0, padx=(15,5), pady=(25,5), sticky='e')
+
+        # create "combobox_result_dataset" and register it with the grid geometry manager
+        self.combobox_result_dataset = tkinter.ttk.Combobox(self, width=45, height=4, state='readonly', textvariable=self.wrapper_result_dataset)
+        self.combobox_result_dataset.grid(row=2, column=1, padx=(5,5), pady=(25,5), sticky='w')
+
+        # create "label_fit" and register it with the grid geometry manager
+        self.label_fit = tkinter.Label(self, text=' '*15)
+        self.label_fit.grid(row=3, column=2, padx=(0,0), pady=(25,5), sticky='e')
+
+        # create "button_execute" and register it with the grid geometry manager
+        self.button_execute = tkinter.ttk.Button(self, text='Execute', command=self.execute, state='disabled')
+        self.button_execute.grid(row=3, column=3, padx=(5,5), pady=(25,5), sticky='e')
 
-            # execute the process when it is a Transrate process
-            elif self.app == xlib.get_transrate_code():
-                dialog_log = gdialogs.DialogLog(self, self.head, xtransrate.run_transrate_process.__name__)
+        # create "button_close" and register it with the grid geometry manager
+        self.button_close = tkinter.ttk.Button(self, text='Close', command=self.close)
+        self.button_close.grid(row=3, column=4, padx=(5,5), pady=(25,5), sticky='w')
+
+        # link a handler to events
+        self.combobox_cluster_name.bind('<<ComboboxSelected>>', self.combobox_cluster_name_selected_item)
+        self.combobox_experiment_id.bind('<<ComboboxSelected>>', self.combobox_experiment_id_selected_item)
+        self.combobox_result_dataset.bind('<<ComboboxSelected>>', self.combobox_result_dataset_selected_item)
+
+    #---------------
+
+    def combobox_cluster_name_selected_item(self, event=None):
+        '''
+        Process the event when an item of "combobox_cluster_name" has been selected
+        '''
+
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
+
+    #---------------
+
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
+
+        # load data in "combobox_experiment_id"
+        self.populate_combobox_experiment_id()
+
+        # clear data in "combobox_result_dataset"
+        self.combobox_result_dataset['values'] = []
+        self.wrapper_result_dataset.set('')
+        self.result_dataset_id = None
+
+    #---------------
+
+    def combobox_experiment_id_selected_item(self, event=None):
+        '''
+        Process the event when an item of "combobox_experiment_id" has been selected
+        '''
+
+        # set cursor to show busy status
+        self.main.config(cursor='watch')
+        self.main.update()
+
+        # load data in "combobox_result_dataset"
+        self.populate_combobox_result_dataset()
+
+        # set cursor to show normal status
+        self.main.config(cursor='')
+        self.main.update()
+
+    #---------------
+
+    def combobox_result_dataset_selected_item(self, event=None):
+        '''
+        Process the event when an item of "combobox_result_dataset" has been selected
+        '''
+
+        # get the result dataset identification
+        (OK, error_list, self.result_dataset_id) = xresult.get_result_dataset_id(self.wrapper_cluster_name.get(), self.wrapper_experiment_id.get(), self.wrapper_result_dataset.get(), status='uncompressed', passed_connection=True, ssh_client=self.ssh_client)
+
+    #---------------
+
+    def execute(self, event=None):
+        '''
+        Resume the bioinfo process.
+        '''
+
+        # validate inputs
+        OK = self.validate_inputs()
+        if not OK:
+            message = 'Some input values are not OK.'
+            tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+
+        # confirm the process resumption
+        if OK:
+            message = 'The {0} process of {1} is going to be resumed.\n\nAre you sure to continue?'.format(self.name, self.result_dataset_id)
+            OK = tkinter.messagebox.askyesno('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+
+        # resume the process
+        if OK:
+
+            # execute the resumption when it is a SOAPdenovo-Trans process
+            if self.app == xlib.get_soapdenovotrans_code():
+                dialog_log = gdialogs.DialogLog(self, self.head, xsoapdenovotrans.resume_soapdenovotrans_process.__name__, cluster_name=self.wrapper_cluster_name.get())
                 threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
-                threading.Thread(target=xtransrate.run_transrate_process, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
+                threading.Thread(target=xsoapdenovotrans.resume_soapdenovotrans_process, args=(self.wrapper_cluster_name.get(), self.wrapper_experiment_id.get(), self.result_dataset_id, dialog_log, lambda: dialog_log.enable_button_close())).start()
 
-            # execute the process when it is a Trimmomatic process
-            elif self.app == xlib.get_trimmomatic_code():
-                dialog_log = gdialogs.DialogLog(self, self.head, xtrimmomatic.run_trimmomatic_process.__name__)
+            # execute the resumption when it is a Trans-ABySS process
+            elif self.app == xlib.get_transabyss_code():
+                dialog_log = gdialogs.DialogLog(self, self.head, xtransabyss.resume_transabyss_process.__name__, cluster_name=self.wrapper_cluster_name.get())
                 threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
-                threading.Thread(target=xtrimmomatic.run_trimmomatic_process, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
+                threading.Thread(target=xtransabyss.resume_transabyss_process, args=(self.wrapper_cluster_name.get(), self.wrapper_experiment_id.get(), self.result_dataset_id, dialog_log, lambda: dialog_log.enable_button_close())).start()
 
-            # execute the process when it is a Trinity process
+            # execute the resumption when it is a Trinity process
             elif self.app == xlib.get_trinity_code():
-                dialog_log = gdialogs.DialogLog(self, self.head, xtrinity.run_trinity_process.__name__)
+                dialog_log = gdialogs.DialogLog(self, self.head, xtrinity.resume_trinity_process.__name__, cluster_name=self.wrapper_cluster_name.get())
                 threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
-                threading.Thread(target=xtrinity.run_trinity_process, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
+                threading.Thread(target=xtrinity.resume_trinity_process, args=(self.wrapper_cluster_name.get(), self.wrapper_experiment_id.get(), self.result_dataset_id, dialog_log, lambda: dialog_log.enable_button_close())).start()
 
         # close the form
         if OK:
@@ -9093,9 +8748,13 @@ class FormRunBioinfoProcess(tkinter.Frame):
 
     def close(self, event=None):
         '''
-        Close "FormRunProcess".
+        Close "FormResumeBioinfoProcess".
         '''
 
+        # close SSH client connection
+        if self.cluster_name_ant is not None:
+            xssh.close_ssh_client_connection(self.ssh_client)
+
         # clear the label of the current process name
         self.main.label_process['text'] = ''
 
@@ -9111,6 +8770,11 @@ class FormRunBioinfoProcess(tkinter.Frame):
 
         # load initial data in inputs
         self.populate_combobox_cluster_name()
+        self.combobox_experiment_id['values'] = []
+        self.wrapper_experiment_id.set('')
+        self.combobox_result_dataset['values'] = []
+        self.wrapper_result_dataset.set('')
+        self.result_dataset_id = None
 
     #---------------
 
@@ -9122,29 +8786,60 @@ class FormRunBioinfoProcess(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            self.combobox_cluster_name['values'] = []
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
+
+    #---------------
+
+    def populate_combobox_experiment_id(self):
+        '''
+        Populate data in "combobox_experiment_id".
+        '''
+
+        # clear the value selected in the combobox
+        self.wrapper_experiment_id.set('')
 
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster {0} has not experiment data.'.format(cluster_name)
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
+
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = xlib.get_cluster_result_dir()
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
+
+    #---------------
+
+    def populate_combobox_result_dataset(self):
+        '''
+        Populate data in "combobox_result_dataset".
+        '''
+
+        # clear the value selected in the combobox
+        self.wrapper_result_dataset.set('')
+
+        # get the list of the result dataset names of the application
+        (OK, error_list, result_dataset_name_list) = xresult.get_result_dataset_name_list(self.wrapper_cluster_name.get(), self.wrapper_experiment_id.get(), 'uncompressed', [self.app], passed_connection=True, ssh_client=self.ssh_client)
+
+        # load the result dataset names in the combobox
+        self.combobox_result_dataset['values'] = sorted(result_dataset_name_list)
 
     #---------------
 
     def validate_inputs(self, *args):
         '''
-        Validate the content of each input of "FormRunBioinfoProcess" and do the actions linked to its value
+        Validate the content of each input of "FormResumeBioinfoProcess" and do the actions linked to its value
         '''
 
         # initialize the control variable
         OK = True
 
         # verify if "button_execute" has to be enabled or disabled
-        if self.wrapper_cluster_name.get() != '':
+        if self.wrapper_cluster_name.get() != '' and self.wrapper_experiment_id.get() != '' and self.wrapper_result_dataset.get() != '':
             self.button_execute['state'] = 'enable'
         else:
             self.button_execute['state'] = 'disabled'
@@ -9274,32 +8969,8 @@ class FormListBioinfoRuns(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
-
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
-
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
-
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
-
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
+        # create the SSH client connection of the selected cluster in the background
+        gloader.connect_cluster(self)
 
     #---------------
 
@@ -9390,15 +9061,8 @@ class FormListBioinfoRuns(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
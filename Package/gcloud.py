@@ -28,6 +28,7 @@ menu items in gui mode.
 import os
 import PIL.Image
 import PIL.ImageTk
+import queue
 import sys
 import threading
 import tkinter
@@ -35,32 +36,36 @@ import tkinter.filedialog
 import tkinter.ttk
 
 import gdialogs
-import xbusco
-import xcdhit
+import gloader
 import xcluster
 import xconfiguration
 import xdatabase
-import xdetonate
 import xec2
-import xfastqc
-import xgmap
 import xgzip
 import xlib
-import xngshelper
 import xnode
-import xquast
-import xrnaquast
-import xsoapdenovotrans
 import xssh
-import xstar
 import xread
 import xreference
 import xresult
-import xtransabyss
-import xtransrate
-import xtrimmomatic
-import xtrinity
 import xvolume
+import xwatcher
+
+# application modules imported when they are first used
+xbusco = xlib.import_lazy_module('xbusco')
+xcdhit = xlib.import_lazy_module('xcdhit')
+xdetonate = xlib.import_lazy_module('xdetonate')
+xfastqc = xlib.import_lazy_module('xfastqc')
+xgmap = xlib.import_lazy_module('xgmap')
+xngshelper = xlib.import_lazy_module('xngshelper')
+xquast = xlib.import_lazy_module('xquast')
+xrnaquast = xlib.import_lazy_module('xrnaquast')
+xsoapdenovotrans = xlib.import_lazy_module('xsoapdenovotrans')
+xstar = xlib.import_lazy_module('xstar')
+xtransabyss = xlib.import_lazy_module('xtransabyss')
+xtransrate = xlib.import_lazy_module('xtransrate')
+xtrimmomatic = xlib.import_lazy_module('xtrimmomatic')
+xtrinity = xlib.import_lazy_module('xtrinity')
 
 #-------------------------------------------------------------------------------
 
@@ -1853,11 +1858,11 @@ class FormCreateCluster(tkinter.Frame):
             message = 'The cluster with template name {0} is going to be created.\n\nAre you sure to continue?\n\n'.format(self.wrapper_template_name.get())
             OK = tkinter.messagebox.askyesno('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
 
-        # create the cluster
+        # create the cluster and forget the cached running clusters when it ends
         if OK:
-            dialog_log = gdialogs.DialogLog(self, self.head, xcluster.create_cluster.__name__)
+            dialog_log = gdialogs.DialogLog(self, self.head, xcluster.create_cluster.__name__, cluster_name=self.wrapper_template_name.get())
             threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
-            threading.Thread(target=xcluster.create_cluster, args=(self.wrapper_template_name.get(), self.wrapper_template_name.get(), dialog_log, lambda: dialog_log.enable_button_close(), True)).start()
+            threading.Thread(target=xcluster.create_cluster, args=(self.wrapper_template_name.get(), self.wrapper_template_name.get(), dialog_log, lambda: (dialog_log.enable_button_close(), gloader.invalidate(('running_cluster_list',))), True)).start()
 
         # close the form
         if OK:
@@ -2021,9 +2026,9 @@ class FormStopCluster(tkinter.Frame):
 
         # stop the cluster and initialize inputs
         if OK:
-            dialog_log = gdialogs.DialogLog(self, self.head, xcluster.stop_cluster.__name__)
+            dialog_log = gdialogs.DialogLog(self, self.head, xcluster.stop_cluster.__name__, cluster_name=self.wrapper_cluster_name.get())
             threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
-            threading.Thread(target=xcluster.stop_cluster, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
+            threading.Thread(target=xcluster.stop_cluster, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: (dialog_log.enable_button_close(), gloader.invalidate(('running_cluster_list',))))).start()
 
         # close the form
         if OK:
@@ -2062,16 +2067,8 @@ class FormStopCluster(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            self.combobox_cluster_name['values'] = []
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -2195,9 +2192,9 @@ class FormRestartCluster(tkinter.Frame):
 
         # restart the cluster and initialize inputs
         if OK:
-            dialog_log = gdialogs.DialogLog(self, self.head, xcluster.restart_cluster.__name__)
+            dialog_log = gdialogs.DialogLog(self, self.head, xcluster.restart_cluster.__name__, cluster_name=self.wrapper_cluster_name.get())
             threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
-            threading.Thread(target=xcluster.restart_cluster, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
+            threading.Thread(target=xcluster.restart_cluster, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: (dialog_log.enable_button_close(), gloader.invalidate(('running_cluster_list',))))).start()
 
         # close the form
         if OK:
@@ -2236,16 +2233,8 @@ class FormRestartCluster(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            self.combobox_cluster_name['values'] = []
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -2368,11 +2357,11 @@ class FormTerminateCluster(tkinter.Frame):
             message = 'The cluster {0} is going to be terminated.\n\nAre you sure to continue?'.format(self.wrapper_cluster_name.get())
             OK = tkinter.messagebox.askyesno('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
 
-        # terminate the cluster and initialize inputs
+        # terminate the cluster and forget the cached running clusters when it ends
         if OK:
-            dialog_log = gdialogs.DialogLog(self, self.head, xcluster.terminate_cluster.__name__)
+            dialog_log = gdialogs.DialogLog(self, self.head, xcluster.terminate_cluster.__name__, cluster_name=self.wrapper_cluster_name.get())
             threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
-            threading.Thread(target=xcluster.terminate_cluster, args=(self.wrapper_cluster_name.get(), self.force, dialog_log, lambda: dialog_log.enable_button_close())).start()
+            threading.Thread(target=xcluster.terminate_cluster, args=(self.wrapper_cluster_name.get(), self.force, dialog_log, lambda: (dialog_log.enable_button_close(), gloader.invalidate(('running_cluster_list',))))).start()
 
         # close the form
         if OK:
@@ -2411,18 +2400,10 @@ class FormTerminateCluster(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
+        # request the names of clusters which are running and load them in the combobox when they are got,
+        # or load the template names when the termination is forced
         if not self.force:
-            running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-            if running_cluster_list == []:
-                self.combobox_cluster_name['values'] = []
-                message = 'There is not any running cluster.'
-                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                return
-
-        # load the names of clusters which are running in the combobox
-        if not self.force:
-            self.combobox_cluster_name['values'] = running_cluster_list
+            gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
         else:
             self.combobox_cluster_name['values'] = xconfiguration.get_template_name_list(volume_creator_included=False)
 
@@ -2543,7 +2524,7 @@ class FormShowClusterComposing(tkinter.Frame):
 
         # show the status of batch jobs in the cluster
         if OK:
-            dialog_log = gdialogs.DialogLog(self, self.head, xcluster.show_cluster_composing.__name__)
+            dialog_log = gdialogs.DialogLog(self, self.head, xcluster.show_cluster_composing.__name__, cluster_name=self.wrapper_cluster_name.get())
             threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
             threading.Thread(target=xcluster.show_cluster_composing, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
@@ -2584,16 +2565,8 @@ class FormShowClusterComposing(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            self.combobox_cluster_name['values'] = []
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -2698,32 +2671,8 @@ class FormShowStatusBatchJobs(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
-
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
-
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
-
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
-
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
+        # create the SSH client connection of the selected cluster in the background
+        gloader.connect_cluster(self)
 
     #---------------
 
@@ -2738,9 +2687,12 @@ class FormShowStatusBatchJobs(tkinter.Frame):
             message = 'Some input values are not OK.'
             tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
 
-        # get the batch job dictionary
+        # get the batch job dictionary from the watcher or, if it is not watched, from the cluster
         if OK:
-            (OK, error_list, batch_job_dict) = xcluster.get_batch_job_dict(self.ssh_client)
+            batch_job_dict = xwatcher.get_watched_batch_job_dict(self.wrapper_cluster_name.get())
+            is_watched = batch_job_dict is not None
+            if not is_watched:
+                (OK, error_list, batch_job_dict) = xcluster.get_batch_job_dict(self.ssh_client)
 
         # verify if there are any batch jobs
         if OK:
@@ -2762,16 +2714,54 @@ class FormShowStatusBatchJobs(tkinter.Frame):
             data_dict['start_date'] = {'text': 'Start date', 'width': 100, 'aligment': 'right'}
             data_dict['start_time'] = {'text': 'Start time', 'width': 100, 'aligment': 'right'}
 
-        # create the dialog Table to show the nodes running
+        # create the dialog Table to show the nodes running; when the cluster is watched, the table is
+        # refreshed with the events of the watcher, which are queued by its thread and read in the Tk thread
         if OK:
             dialog_table = gdialogs.DialogTable(self, self.head, 400, 900, data_list, data_dict, batch_job_dict)
+            if is_watched:
+                self.watcher_event_queue = queue.Queue()
+                xwatcher.subscribe(self.watcher_event_queue.put)
+                self.after(1000, self.refresh_dialog_table, dialog_table)
             self.wait_window(dialog_table)
+            if is_watched:
+                xwatcher.unsubscribe(self.watcher_event_queue.put)
 
         # close the form
         self.close()
 
     #---------------
 
+    def refresh_dialog_table(self, dialog_table):
+        '''
+        Refresh the batch jobs of the dialog Table when the watcher has published
+        changes of the cluster.
+        '''
+
+        # stop when the dialog Table is closed
+        if not dialog_table.winfo_exists():
+            return
+
+        # read the pending events and verify if any of them is of the cluster
+        is_changed = False
+        while True:
+            try:
+                event = self.watcher_event_queue.get_nowait()
+            except queue.Empty:
+                break
+            if event['cluster_name'] == self.wrapper_cluster_name.get():
+                is_changed = True
+
+        # update the batch jobs of the dialog Table
+        if is_changed:
+            batch_job_dict = xwatcher.get_watched_batch_job_dict(self.wrapper_cluster_name.get())
+            if batch_job_dict is not None:
+                dialog_table.update_items(batch_job_dict)
+
+        # schedule the next refresh
+        self.after(1000, self.refresh_dialog_table, dialog_table)
+
+    #---------------
+
     def close(self, event=None):
         '''
         Close "FormShowStatusBatchJobs".
@@ -2807,16 +2797,8 @@ class FormShowStatusBatchJobs(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            self.combobox_cluster_name['values'] = []
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -2932,36 +2914,19 @@ class FormKillBatchJob(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
-
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
+    #---------------
 
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_job"
         self.populate_combobox_job()
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_job_selected_item(self, event=None):
@@ -2994,7 +2959,7 @@ class FormKillBatchJob(tkinter.Frame):
 
         # remove the volume and initialize inputs
         if OK:
-            dialog_log = gdialogs.DialogLog(self, self.head, xcluster.kill_batch_job.__name__)
+            dialog_log = gdialogs.DialogLog(self, self.head, xcluster.kill_batch_job.__name__, cluster_name=self.wrapper_cluster_name.get())
             threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
             threading.Thread(target=xcluster.kill_batch_job, args=(self.wrapper_cluster_name.get(), self.job_id, dialog_log, lambda: dialog_log.enable_button_close())).start()
 
@@ -3041,16 +3006,8 @@ class FormKillBatchJob(tkinter.Frame):
         # clear the value selected in the combobox_cluster_name
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            self.combobox_cluster_name['values'] = []
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -3222,7 +3179,7 @@ class FormAddNode(tkinter.Frame):
 
         # add the node
         if OK:
-            dialog_log = gdialogs.DialogLog(self, self.head, xnode.add_node.__name__)
+            dialog_log = gdialogs.DialogLog(self, self.head, xnode.add_node.__name__, cluster_name=self.wrapper_cluster_name.get())
             threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
             threading.Thread(target=xnode.add_node, args=(self.wrapper_cluster_name.get(), self.wrapper_node_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
@@ -3264,16 +3221,8 @@ class FormAddNode(tkinter.Frame):
         # clear the value selected in the combobox_node_name
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            self.combobox_cluster_name['values'] = []
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -3490,7 +3439,7 @@ class FormRemoveNode(tkinter.Frame):
 
         # remove the volume and initialize inputs
         if OK:
-            dialog_log = gdialogs.DialogLog(self, self.head, xnode.remove_node.__name__)
+            dialog_log = gdialogs.DialogLog(self, self.head, xnode.remove_node.__name__, cluster_name=self.wrapper_cluster_name.get())
             threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
             threading.Thread(target=xnode.remove_node, args=(self.wrapper_cluster_name.get(), self.wrapper_node_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
@@ -3533,16 +3482,8 @@ class FormRemoveNode(tkinter.Frame):
         # clear the value selected in the combobox_cluster_name
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            self.combobox_cluster_name['values'] = []
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -4203,7 +4144,7 @@ class FormMountVolume(tkinter.Frame):
 
         # terminate the cluster and initialize inputs
         if OK:
-            dialog_log = gdialogs.DialogLog(self, self.head, xvolume.mount_volume.__name__)
+            dialog_log = gdialogs.DialogLog(self, self.head, xvolume.mount_volume.__name__, cluster_name=self.wrapper_cluster_name.get())
             threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
             threading.Thread(target=xvolume.mount_volume, args=(self.wrapper_cluster_name.get(), self.wrapper_node_name.get(), self.wrapper_volume_name.get(), self.wrapper_aws_device_file.get(), self.entry_mounting_path.get(), dialog_log, lambda: dialog_log.enable_button_close(), True)).start()
 
@@ -4249,16 +4190,8 @@ class FormMountVolume(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            self.combobox_cluster_name['values'] = []
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -4521,7 +4454,7 @@ class FormUnmountVolume(tkinter.Frame):
 
         # terminate the cluster and initialize inputs
         if OK:
-            dialog_log = gdialogs.DialogLog(self, self.head, xvolume.unmount_volume.__name__)
+            dialog_log = gdialogs.DialogLog(self, self.head, xvolume.unmount_volume.__name__, cluster_name=self.wrapper_cluster_name.get())
             threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
             threading.Thread(target=xvolume.unmount_volume, args=(self.wrapper_cluster_name.get(), self.wrapper_node_name.get(), self.wrapper_volume_name.get(), dialog_log, lambda: dialog_log.enable_button_close(), True)).start()
 
@@ -4565,16 +4498,8 @@ class FormUnmountVolume(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            self.combobox_cluster_name['values'] = []
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -4803,16 +4728,8 @@ class FormOpenTerminal(tkinter.Frame):
         # clear the value selected in the combobox_node_name
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            self.combobox_cluster_name['values'] = []
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
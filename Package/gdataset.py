@@ -34,10 +34,12 @@ import tkinter
 import tkinter.ttk
 
 import gdialogs
+import gloader
+import xassessment
 import xdatabase
-import xec2
 import xgzip
 import xlib
+import xmanifest
 import xread
 import xreference
 import xresult
@@ -77,9 +79,6 @@ class FormListDataset(tkinter.Frame):
         # build the graphical user interface
         self.build_gui()
 
-        # initialize the cluster name previously selected
-        self.cluster_name_ant = None
-
         # load initial data in inputs
         self.initialize_inputs()
 
@@ -136,36 +135,9 @@ class FormListDataset(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
-
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
-
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
-
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
-
         # load data in "combobox_volume"
         self.populate_combobox_volume()
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_volume_selected_item(self, event=None):
@@ -188,50 +160,10 @@ class FormListDataset(tkinter.Frame):
             message = 'Some input values are not OK.'
             tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
 
-        # get the directory dictionary of directories in the volume
-        if OK:
-            command = 'ls -la /{0}'.format(self.wrapper_volume.get())
-            (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-            if OK:
-                directory_dict = {}
-                for line in stdout:
-                    line = line.rstrip('\n')
-                    if line.startswith('d') or line.startswith('-'):
-                        directory_data_list = line.split()
-                        file_type = 'directory' if directory_data_list[0][0] == 'd' else 'file'
-                        permissions = directory_data_list[0][1:]
-                        links_number = directory_data_list[1]
-                        owner_name = directory_data_list[2]
-                        owner_group = directory_data_list[3]
-                        file_size = directory_data_list[4]
-                        modification_month = directory_data_list[5]
-                        modification_day = directory_data_list[6]
-                        modification_time = directory_data_list[7]
-                        file_name = directory_data_list[8]
-                        if file_name not in ['.', '..', 'lost+found']:
-                            key = '{0}-{1}'.format(file_type, file_name)
-                            directory_dict[key] = {'file_type': file_type, 'permissions': permissions, 'links_number': links_number, 'owner_name': owner_name, 'owner_group': owner_group, 'file_size': file_size, 'modification_month': modification_month, 'modification_day': modification_day, 'modification_time': modification_time, 'file_name': file_name}
-
-        # verify if there are any nodes running
-        if OK:
-            if directory_dict == {}:
-                message = 'There is not any file.'
-                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-
-        # build the data list
-        if OK:
-            data_list = ['file_type', 'file_name']
-
-        # build the data dictionary
-        if OK:
-            data_dict = {}
-            data_dict['file_type']= {'text': 'Type', 'width': 120, 'aligment': 'left'}
-            data_dict['file_name'] = {'text': 'Name', 'width': 400, 'aligment': 'left'}
-
-        # create the dialog Table to show the nodes running
+        # create the dialog Browser to show the directory tree of the volume
         if OK:
-            dialog_table = gdialogs.DialogTable(self, 'Directory /{0}'.format(self.wrapper_volume.get()), 400, 600, data_list, data_dict, directory_dict, 'list_directory', ['/{0}'.format(self.wrapper_volume.get()), self.ssh_client])
-            self.wait_window(dialog_table)
+            dialog_browser = gdialogs.DialogBrowser(self, 'Volume /{0}'.format(self.wrapper_volume.get()), self.wrapper_cluster_name.get(), '/{0}'.format(self.wrapper_volume.get()))
+            self.wait_window(dialog_browser)
 
         # close the form
         if OK:
@@ -244,10 +176,6 @@ class FormListDataset(tkinter.Frame):
         Close "FormListDataset".
         '''
 
-        # close SSH client connection
-        if self.cluster_name_ant is not None:
-            xssh.close_ssh_client_connection(self.ssh_client)
-
         # clear the label of the current process name
         self.main.label_process['text'] = ''
 
@@ -274,15 +202,8 @@ class FormListDataset(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -294,26 +215,18 @@ class FormListDataset(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_volume.set('')
 
-        # initialize the experiment identification list
-        volume_list = []
-
-        # get the experiment identifications
-        command = 'ls /'
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line in ['references', 'databases', 'reads', 'results']:
-                    volume_list.append(line)
-
-        # verify if there are any experimment identifications
-        if volume_list == []:
-            message = 'The cluster has not any volume attached.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the volumes in the combobox or warn when there are not any
+        def load_values(subdir_list):
+            volume_list = [subdir for subdir in subdir_list if subdir in ['references', 'databases', 'reads', 'results']]
+            if volume_list == []:
+                message = 'The cluster has not any volume attached.'
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_volume['values'] = volume_list
 
-        # load the names of clusters which are running in the combobox
-        self.combobox_volume['values'] = volume_list
+        # request the subdirectories of the root directory through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        gloader.populate_combobox(self, self.combobox_volume, ('cluster_subdir_list', cluster_name, '/'), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, '/'))
 
     #---------------
 
@@ -749,7 +662,7 @@ class FormUploadReferenceDataSet(tkinter.Frame):
 
         # upload the read files to the cluster and initialize inputs
         if OK:
-            dialog_log = gdialogs.DialogLog(self, self.head, xreference.upload_reference_dataset.__name__)
+            dialog_log = gdialogs.DialogLog(self, self.head, xreference.upload_reference_dataset.__name__, cluster_name=self.wrapper_cluster_name.get())
             threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
             threading.Thread(target=xreference.upload_reference_dataset, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
@@ -790,16 +703,8 @@ class FormUploadReferenceDataSet(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            self.combobox_cluster_name['values'] = []
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -1232,7 +1137,7 @@ class FormUploadDatabaseDataSet(tkinter.Frame):
 
         # upload the read files to the cluster and initialize inputs
         if OK:
-            dialog_log = gdialogs.DialogLog(self, self.head, xdatabase.upload_database_dataset.__name__)
+            dialog_log = gdialogs.DialogLog(self, self.head, xdatabase.upload_database_dataset.__name__, cluster_name=self.wrapper_cluster_name.get())
             threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
             threading.Thread(target=xdatabase.upload_database_dataset, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
@@ -1273,16 +1178,8 @@ class FormUploadDatabaseDataSet(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            self.combobox_cluster_name['values'] = []
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -1715,7 +1612,7 @@ class FormUploadReadDataSet(tkinter.Frame):
 
         # upload the read files to the cluster and initialize inputs
         if OK:
-            dialog_log = gdialogs.DialogLog(self, self.head, xread.upload_read_dataset.__name__)
+            dialog_log = gdialogs.DialogLog(self, self.head, xread.upload_read_dataset.__name__, cluster_name=self.wrapper_cluster_name.get())
             threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
             threading.Thread(target=xread.upload_read_dataset, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
@@ -1756,16 +1653,8 @@ class FormUploadReadDataSet(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            self.combobox_cluster_name['values'] = []
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -1824,6 +1713,10 @@ class FormRecreateResultTransferConfigFile(tkinter.Frame):
         self.wrapper_result_dataset.trace('w', self.validate_inputs)
         self.wrapper_file_pattern = tkinter.StringVar()
         self.wrapper_file_pattern.trace('w', self.validate_inputs)
+        self.wrapper_file_pattern.trace('w', self.clear_browsed_files)
+
+        # initialize the files selected in the browser
+        self.browsed_file_list = []
         self.wrapper_local_dir = tkinter.StringVar()
         self.wrapper_local_dir.trace('w', self.validate_inputs)
 
@@ -1894,6 +1787,10 @@ class FormRecreateResultTransferConfigFile(tkinter.Frame):
         self.entry_file_pattern = tkinter.Entry(self, textvariable=self.wrapper_file_pattern, width=30, validatecommand=self.validate_inputs)
         self.entry_file_pattern.grid(row=4, column=1, padx=(5,5), pady=(35,5), sticky='w')
 
+        # create "button_browse_files" and register it with the grid geometry manager
+        self.button_browse_files = tkinter.ttk.Button(self, text='Browse', command=self.browse_files)
+        self.button_browse_files.grid(row=4, column=2, padx=(5,0), pady=(35,5), sticky='w')
+
         # create "label_file_pattern_warning" and register it with the grid geometry manager
         self.label_file_pattern_warning = tkinter.Label(self, text='')
         self.label_file_pattern_warning.grid(row=5, column=1, padx=(5,5), pady=(5,5), sticky='w')
@@ -1940,28 +1837,15 @@ class FormRecreateResultTransferConfigFile(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
-
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
+    #---------------
 
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_experiment_id"
         self.populate_combobox_experiment_id()
@@ -1974,10 +1858,6 @@ class FormRecreateResultTransferConfigFile(tkinter.Frame):
         self.wrapper_file_pattern.set(' ')
         self.entry_file_pattern['state'] = 'disabled'
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_experiment_id_selected_item(self, event=None):
@@ -2019,7 +1899,8 @@ class FormRecreateResultTransferConfigFile(tkinter.Frame):
         Process the event when an item of "combobox_result_dataset" has been selected
         '''
 
-        pass
+        # forget the files selected in the browser
+        self.clear_browsed_files()
 
     #---------------
 
@@ -2050,16 +1931,19 @@ class FormRecreateResultTransferConfigFile(tkinter.Frame):
 
         # get the selected file list
         if OK:
-            if self.wrapper_status.get() == 'uncompressed':
+            if self.wrapper_status.get() == 'uncompressed' and self.browsed_file_list != []:
+                selected_file_list = self.browsed_file_list
+            elif self.wrapper_status.get() == 'uncompressed':
                 selected_file_list = []
                 cluster_result_dir = '{0}/{1}/{2}'.format(xlib.get_cluster_result_dir(), self.wrapper_experiment_id.get(), self.wrapper_result_dataset.get())
-                command = 'cd {0}; find . -type f -regex "./{1}"'.format(cluster_result_dir, self.wrapper_file_pattern.get())
-                (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
+                (OK, error_list, entry_list) = xssh.list_cluster_dir(self.ssh_client, cluster_result_dir, max_depth=None, entry_type='f', regex=self.wrapper_file_pattern.get())
                 if OK:
-                    for line in stdout:
-                        selected_file_list.append(line.rstrip('\n'))
+                    for entry in entry_list:
+                        selected_file_list.append('./{0}'.format(entry['path']))
                 else:
-                    message = '*** ERROR: Wrong command ---> {0}'.format(command)
+                    message = ''
+                    for error in error_list:
+                        message = '{0}{1}\n'.format(message, error)
                     tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
                     return
                 if selected_file_list == []:
@@ -2105,6 +1989,40 @@ class FormRecreateResultTransferConfigFile(tkinter.Frame):
 
     #---------------
 
+    def browse_files(self, event=None):
+        '''
+        Select the files of the result dataset in a directory tree browser instead
+        of searching them with the file pattern.
+        '''
+
+        # verify that the result dataset is selected
+        if self.wrapper_experiment_id.get() == '' or self.wrapper_result_dataset.get() == '' or self.wrapper_status.get() != 'uncompressed':
+            message = 'Select an experiment, the status uncompressed and a result dataset.'
+            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+            return
+
+        # select the files in the dialog Browser
+        dataset_dir = '{0}/{1}/{2}'.format(xlib.get_cluster_result_dir(), self.wrapper_experiment_id.get(), self.wrapper_result_dataset.get())
+        dialog_browser = gdialogs.DialogBrowser(self, 'Result dataset {0}'.format(dataset_dir), self.wrapper_cluster_name.get(), dataset_dir, file_selection=True)
+        self.wait_window(dialog_browser)
+
+        # save the selected files with the format of the file list of the config file
+        if dialog_browser.selected_path_list != []:
+            self.browsed_file_list = ['./{0}'.format(path) for path in dialog_browser.selected_path_list]
+            self.validate_inputs()
+
+    #---------------
+
+    def clear_browsed_files(self, *args):
+        '''
+        Forget the files selected in the browser when the file pattern changes.
+        '''
+
+        self.browsed_file_list = []
+        self.validate_entry_file_pattern()
+
+    #---------------
+
     def close(self, event=None):
         '''
         Close "FormRecreateResultTransferConfigFile".
@@ -2148,15 +2066,8 @@ class FormRecreateResultTransferConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -2168,26 +2079,18 @@ class FormRecreateResultTransferConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_experiment_id.set('')
 
-        # initialize the experiment identifications list
-        experiment_ids_list = []
-
-        # get the experiment identifications
-        command = 'ls {0}'.format(xlib.get_cluster_result_dir())
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_ids_list.append(line)
-
-        # verify if there are any experimment identifications
-        if experiment_ids_list == []:
-            message = 'The cluster {0} has not experiment data.'.format(self.wrapper_cluster_name.get())
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster {0} has not experiment data.'.format(cluster_name)
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
 
-        # load the experiment identifications in the combobox
-        self.combobox_experiment_id['values'] = sorted(experiment_ids_list)
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = xlib.get_cluster_result_dir()
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
 
     #---------------
 
@@ -2216,14 +2119,11 @@ class FormRecreateResultTransferConfigFile(tkinter.Frame):
         result_dataset_list = []
 
         # get the result dataset list of the experiments
-        if self.wrapper_status.get() == 'uncompressed':
-            command = 'cd  {0}/{1}; for list in `ls`; do ls -ld $list | grep -v ^- > /dev/null && echo $list; done;'.format(xlib.get_cluster_result_dir(), self.wrapper_experiment_id.get())
-        elif self.wrapper_status.get() == 'compressed':
-            command = 'cd {0}/{1}; for list in `ls`; do ls -ld $list | grep -v ^d > /dev/null && echo $list; done;'.format(xlib.get_cluster_result_dir(), self.wrapper_experiment_id.get())
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
+        entry_type = 'd' if self.wrapper_status.get() == 'uncompressed' else 'f'
+        (OK, error_list, entry_list) = xssh.list_cluster_dir(self.ssh_client, xlib.get_cluster_experiment_result_dir(self.wrapper_experiment_id.get()), entry_type=entry_type)
         if OK:
-            for line in stdout:
-                result_dataset_list.append(line.rstrip('\n'))
+            for entry in entry_list:
+                result_dataset_list.append(entry['name'])
 
         # verify if there are any experimment identifications
         if result_dataset_list == []:
@@ -2279,7 +2179,10 @@ class FormRecreateResultTransferConfigFile(tkinter.Frame):
             self.label_file_pattern_warning['foreground'] = 'red'
             OK = False
         else:
-            self.label_file_pattern_warning['text'] = 'It is a pattern of regular expression.'
+            if self.browsed_file_list != []:
+                self.label_file_pattern_warning['text'] = '{0} files selected in the browser (the pattern is not used).'.format(len(self.browsed_file_list))
+            else:
+                self.label_file_pattern_warning['text'] = 'It is a pattern of regular expression.'
             self.label_file_pattern_warning['foreground'] = 'black'
 
         # return the control variable
@@ -2412,7 +2315,7 @@ class FormDownloadResultDataSet(tkinter.Frame):
 
         # download the result files from the cluster and initialize inputs
         if OK:
-            dialog_log = gdialogs.DialogLog(self, self.head, xresult.download_result_dataset.__name__)
+            dialog_log = gdialogs.DialogLog(self, self.head, xresult.download_result_dataset.__name__, cluster_name=self.wrapper_cluster_name.get())
             threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
             threading.Thread(target=xresult.download_result_dataset, args=(self.wrapper_cluster_name.get(), dialog_log, lambda: dialog_log.enable_button_close())).start()
 
@@ -2453,16 +2356,8 @@ class FormDownloadResultDataSet(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            self.combobox_cluster_name['values'] = []
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -2487,6 +2382,198 @@ class FormDownloadResultDataSet(tkinter.Frame):
 
 #-------------------------------------------------------------------------------
 
+class FormCompareAssessmentMetrics(tkinter.Frame):
+
+    #---------------
+
+    def __init__(self, parent, main):
+        '''
+        Execute actions correspending to the creation of a "FormCompareAssessmentMetrics" instance.
+        '''
+
+        # save initial parameters in instance variables
+        self.parent = parent
+        self.main = main
+
+        # set cursor to show busy status
+        self.main.config(cursor='watch')
+        self.main.update()
+
+        # call the init method of the parent class
+        tkinter.Frame.__init__(self, self.parent)
+
+        # assign the text of the "head"
+        self.head = 'Result dataset file transfer - Compare assessment metrics'
+
+        # create the wrappers to track changes in the inputs
+        self.wrapper_experiment_id = tkinter.StringVar()
+        self.wrapper_experiment_id.trace('w', self.validate_inputs)
+
+        # build the graphical user interface
+        self.build_gui()
+
+        # load initial data in inputs
+        self.initialize_inputs()
+
+        # set cursor to show normal status
+        self.main.config(cursor='')
+        self.main.update()
+
+    #---------------
+
+    def build_gui(self):
+        '''
+        Build the graphical user interface of "FormCompareAssessmentMetrics".
+        '''
+
+        # assign the text to the label of the current process name
+        self.main.label_process['text'] = self.head
+
+        # create "label_experiment_id" and register it with the grid geometry manager
+        self.label_experiment_id = tkinter.Label(self, text='Experiment/process')
+        self.label_experiment_id.grid(row=0, column=0, padx=(15,5), pady=(75,5), sticky='e')
+
+        # create "combobox_experiment_id" and register it with the grid geometry manager
+        self.combobox_experiment_id = tkinter.ttk.Combobox(self, width=30, height=4, state='readonly', textvariable=self.wrapper_experiment_id)
+        self.combobox_experiment_id.grid(row=0, column=1, padx=(5,5), pady=(75,5), sticky='w')
+
+        # create "label_fit" and register it with the grid geometry manager
+        self.label_fit = tkinter.Label(self, text=' '*25)
+        self.label_fit.grid(row=1, column=2, padx=(0,0), pady=(25,5), sticky='e')
+
+        # create "button_execute" and register it with the grid geometry manager
+        self.button_execute = tkinter.ttk.Button(self, text='Execute', command=self.execute, state='disabled')
+        self.button_execute.grid(row=1, column=3, padx=(5,5), pady=(55,5), sticky='e')
+
+        # create "button_close" and register it with the grid geometry manager
+        self.button_close = tkinter.ttk.Button(self, text='Close', command=self.close)
+        self.button_close.grid(row=1, column=4, padx=(5,5), pady=(55,5), sticky='w')
+
+    #---------------
+
+    def execute(self, event=None):
+        '''
+        Show the assembly datasets ranked by their assessment metrics and export
+        the comparison with all the metrics.
+        '''
+
+        # validate inputs
+        OK = self.validate_inputs()
+        if not OK:
+            message = 'Some input values are not OK.'
+            tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+
+        # get the assembly datasets ranked by the mean rank of their metrics
+        if OK:
+            experiment_id = None if self.wrapper_experiment_id.get() == 'all' else self.wrapper_experiment_id.get()
+            comparison_list = xassessment.get_assessment_comparison(experiment_id)
+            if comparison_list == []:
+                message = 'There are not any assessment metrics.'
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                OK = False
+
+        # build the data list
+        if OK:
+            data_list = ['experiment_id', 'result_dataset_id', 'mean_rank'] + ['{0}_{1}'.format(tool, metric) for (tool, metric, higher_is_better) in xassessment.RANKING_METRIC_LIST]
+
+        # build the data dictionary
+        if OK:
+            data_dict = {}
+            data_dict['experiment_id'] = {'text': 'Experiment id.', 'width': 120, 'aligment': 'left'}
+            data_dict['result_dataset_id'] = {'text': 'Assembly dataset', 'width': 200, 'aligment': 'left'}
+            data_dict['mean_rank'] = {'text': 'Mean rank', 'width': 80, 'aligment': 'right'}
+            for (tool, metric, higher_is_better) in xassessment.RANKING_METRIC_LIST:
+                data_dict['{0}_{1}'.format(tool, metric)] = {'text': '{0} {1}'.format(tool, metric), 'width': 140, 'aligment': 'right'}
+
+        # build the item dictionary keeping the order of the ranking
+        if OK:
+            comparison_dict = {}
+            for (i, comparison) in enumerate(comparison_list):
+                item = {'experiment_id': comparison['experiment_id'], 'result_dataset_id': comparison['result_dataset_id']}
+                item['mean_rank'] = '-' if comparison['mean_rank'] is None else '{0:.2f}'.format(comparison['mean_rank'])
+                for (tool, metric, higher_is_better) in xassessment.RANKING_METRIC_LIST:
+                    value = comparison['{0} {1}'.format(tool, metric)]
+                    item['{0}_{1}'.format(tool, metric)] = '-' if value is None else '{0:g}'.format(value)
+                comparison_dict['{0:06d}'.format(i)] = item
+
+        # export the comparison with all the metrics
+        if OK:
+            (OK, error_list) = xassessment.export_assessment_comparison(experiment_id)
+            if not OK:
+                message = ''
+                for error in error_list:
+                    message = '{0}{1}\n'.format(message, error) 
+                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+
+        # create the dialog Table to show the ranked assembly datasets
+        if OK:
+            dialog_table = gdialogs.DialogTable(self, 'Assembly datasets ranked by their assessment metrics (exported to {0})'.format(xassessment.get_assessment_comparison_file()), 400, 1060, data_list, data_dict, comparison_dict)
+            self.wait_window(dialog_table)
+
+        # close the form
+        if OK:
+            self.close()
+
+    #---------------
+
+    def close(self, event=None):
+        '''
+        Close "FormCompareAssessmentMetrics".
+        '''
+
+        # clear the label of the current process name
+        self.main.label_process['text'] = ''
+
+        # close the current form
+        self.main.close_current_form()
+
+    #---------------
+
+    def initialize_inputs(self):
+        '''
+        Load initial data in inputs.
+        '''
+
+        # load initial data in inputs
+        self.populate_combobox_experiment_id()
+
+    #---------------
+
+    def populate_combobox_experiment_id(self):
+        '''
+        Populate data in "combobox_experiment_id".
+        '''
+
+        # clear the value selected in the combobox
+        self.wrapper_experiment_id.set('')
+
+        # load the experiment identifications of the local assessment store
+        experiment_id_list = xassessment.get_experiment_id_list()
+        self.combobox_experiment_id['values'] = ['all'] + experiment_id_list if experiment_id_list != [] else []
+
+    #---------------
+
+    def validate_inputs(self, *args):
+        '''
+        Validate the content of each input of "FormCompareAssessmentMetrics" and do the actions linked to its value
+        '''
+
+        # initialize the control variable
+        OK = True
+
+        # verify if "button_execute" has to be enabled or disabled
+        if self.wrapper_experiment_id.get() != '':
+            self.button_execute['state'] = 'enable'
+        else:
+            self.button_execute['state'] = 'disabled'
+
+        # return the control variable
+        return OK
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
 class FormRecreateReferenceGzipConfigFile(tkinter.Frame):
 
     #---------------
@@ -2610,36 +2697,19 @@ class FormRecreateReferenceGzipConfigFile(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
-
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
+    #---------------
 
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_reference_dataset"
         self.populate_combobox_reference_dataset()
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_action_selected_item(self, event=None):
@@ -2685,13 +2755,14 @@ class FormRecreateReferenceGzipConfigFile(tkinter.Frame):
         # get the selected file list
         if OK:
             selected_file_list = []
-            command = 'cd {0}; find . -type f -regex "./{1}"'.format(dataset_dir, self.wrapper_file_pattern.get())
-            (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
+            (OK, error_list, entry_list) = xssh.list_cluster_dir(self.ssh_client, dataset_dir, max_depth=None, entry_type='f', regex=self.wrapper_file_pattern.get())
             if OK:
-                for line in stdout:
-                    selected_file_list.append(line.rstrip('\n'))
+                for entry in entry_list:
+                    selected_file_list.append('./{0}'.format(entry['path']))
             else:
-                message = '*** ERROR: Wrong command ---> {0}'.format(command)
+                message = ''
+                for error in error_list:
+                    message = '{0}{1}\n'.format(message, error)
                 tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
             if selected_file_list == []:
                 message = 'WARNING: There are not files in the dataset directory {0} with the pattern {1}'.format(dataset_dir, self.wrapper_file_pattern.get())
@@ -2774,15 +2845,8 @@ class FormRecreateReferenceGzipConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -2807,26 +2871,18 @@ class FormRecreateReferenceGzipConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_experiment_id.set('')
 
-        # initialize the experiment identification list
-        experiment_id_list = []
-
-        # get the experiment identifications
-        command = 'ls {0}'.format(self.cluster_read_dir)
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
-
-        # verify if there are any experimment identifications
-        if experiment_id_list == []:
-            message = 'The cluster {0} has not experiment data.'.format(self.wrapper_cluster_name.get())
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster {0} has not experiment data.'.format(cluster_name)
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
 
-        # load the experiment identifications in the combobox
-        self.combobox_experiment_id['values'] = sorted(experiment_id_list)
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = self.cluster_read_dir
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
 
     #---------------
 
@@ -3021,36 +3077,19 @@ class FormRecreateDatabaseGzipConfigFile(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
-
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
+    #---------------
 
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_database_dataset"
         self.populate_combobox_database_dataset()
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_action_selected_item(self, event=None):
@@ -3096,13 +3135,14 @@ class FormRecreateDatabaseGzipConfigFile(tkinter.Frame):
         # get the selected file list
         if OK:
             selected_file_list = []
-            command = 'cd {0}; find . -type f -regex "./{1}"'.format(dataset_dir, self.wrapper_file_pattern.get())
-            (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
+            (OK, error_list, entry_list) = xssh.list_cluster_dir(self.ssh_client, dataset_dir, max_depth=None, entry_type='f', regex=self.wrapper_file_pattern.get())
             if OK:
-                for line in stdout:
-                    selected_file_list.append(line.rstrip('\n'))
+                for entry in entry_list:
+                    selected_file_list.append('./{0}'.format(entry['path']))
             else:
-                message = '*** ERROR: Wrong command ---> {0}'.format(command)
+                message = ''
+                for error in error_list:
+                    message = '{0}{1}\n'.format(message, error)
                 tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
             if selected_file_list == []:
                 message = 'WARNING: There are not files in the dataset directory {0} with the pattern {1}'.format(dataset_dir, self.wrapper_file_pattern.get())
@@ -3185,15 +3225,8 @@ class FormRecreateDatabaseGzipConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -3218,26 +3251,18 @@ class FormRecreateDatabaseGzipConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_experiment_id.set('')
 
-        # initialize the experiment identification list
-        experiment_id_list = []
-
-        # get the experiment identifications
-        command = 'ls {0}'.format(self.cluster_read_dir)
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
-
-        # verify if there are any experimment identifications
-        if experiment_id_list == []:
-            message = 'The cluster {0} has not experiment data.'.format(self.wrapper_cluster_name.get())
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster {0} has not experiment data.'.format(cluster_name)
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
 
-        # load the experiment identifications in the combobox
-        self.combobox_experiment_id['values'] = sorted(experiment_id_list)
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = self.cluster_read_dir
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
 
     #---------------
 
@@ -3443,36 +3468,19 @@ class FormRecreateReadGzipConfigFile(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
-
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
+    #---------------
 
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_experiment_id"
         self.populate_combobox_experiment_id()
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_action_selected_item(self, event=None):
@@ -3536,13 +3544,14 @@ class FormRecreateReadGzipConfigFile(tkinter.Frame):
         # get the selected file list
         if OK:
             selected_file_list = []
-            command = 'cd {0}; find . -type f -regex "./{1}"'.format(dataset_dir, self.wrapper_file_pattern.get())
-            (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
+            (OK, error_list, entry_list) = xssh.list_cluster_dir(self.ssh_client, dataset_dir, max_depth=None, entry_type='f', regex=self.wrapper_file_pattern.get())
             if OK:
-                for line in stdout:
-                    selected_file_list.append(line.rstrip('\n'))
+                for entry in entry_list:
+                    selected_file_list.append('./{0}'.format(entry['path']))
             else:
-                message = '*** ERROR: Wrong command ---> {0}'.format(command)
+                message = ''
+                for error in error_list:
+                    message = '{0}{1}\n'.format(message, error)
                 tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
             if selected_file_list == []:
                 message = 'WARNING: There are not files in the dataset directory {0} with the pattern {1}'.format(dataset_dir, self.wrapper_file_pattern.get())
@@ -3627,15 +3636,8 @@ class FormRecreateReadGzipConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -3660,26 +3662,18 @@ class FormRecreateReadGzipConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_experiment_id.set('')
 
-        # initialize the experiment identification list
-        experiment_id_list = []
-
-        # get the experiment identifications
-        command = 'ls {0}'.format(self.cluster_read_dir)
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
-
-        # verify if there are any experimment identifications
-        if experiment_id_list == []:
-            message = 'The cluster {0} has not experiment data.'.format(self.wrapper_cluster_name.get())
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster {0} has not experiment data.'.format(cluster_name)
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
 
-        # load the experiment identifications in the combobox
-        self.combobox_experiment_id['values'] = sorted(experiment_id_list)
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = self.cluster_read_dir
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
 
     #---------------
 
@@ -3792,6 +3786,10 @@ class FormRecreateResultGzipConfigFile(tkinter.Frame):
         self.wrapper_result_dataset.trace('w', self.validate_inputs)
         self.wrapper_file_pattern = tkinter.StringVar()
         self.wrapper_file_pattern.trace('w', self.validate_inputs)
+        self.wrapper_file_pattern.trace('w', self.clear_browsed_files)
+
+        # initialize the files selected in the browser
+        self.browsed_file_list = []
 
         # build the graphical user interface
         self.build_gui()
@@ -3864,6 +3862,10 @@ class FormRecreateResultGzipConfigFile(tkinter.Frame):
         self.entry_file_pattern = tkinter.Entry(self, textvariable=self.wrapper_file_pattern, width=30, validatecommand=self.validate_inputs)
         self.entry_file_pattern.grid(row=5, column=1, padx=(5,5), pady=(45,5), sticky='w')
 
+        # create "button_browse_files" and register it with the grid geometry manager
+        self.button_browse_files = tkinter.ttk.Button(self, text='Browse', command=self.browse_files)
+        self.button_browse_files.grid(row=5, column=2, padx=(5,0), pady=(45,5), sticky='w')
+
         # create "label_file_pattern_warning" and register it with the grid geometry manager
         self.label_file_pattern_warning = tkinter.Label(self, text='')
         self.label_file_pattern_warning.grid(row=6, column=1, padx=(5,5), pady=(5,5), sticky='w')
@@ -3894,28 +3896,15 @@ class FormRecreateResultGzipConfigFile(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
-
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
+    #---------------
 
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_whole"
         self.populate_combobox_whole()
@@ -3931,10 +3920,6 @@ class FormRecreateResultGzipConfigFile(tkinter.Frame):
         self.wrapper_file_pattern.set(' ')
         self.entry_file_pattern['state'] = 'disabled'
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_whole_selected_item(self, event=None):
@@ -4009,6 +3994,9 @@ class FormRecreateResultGzipConfigFile(tkinter.Frame):
         Process the event when an item of "combobox_result_dataset" has been selected
         '''
 
+        # forget the files selected in the browser
+        self.clear_browsed_files()
+
         # get the result dataset identification
         (OK, error_list, self.result_dataset_id) = xresult.get_result_dataset_id(self.wrapper_cluster_name.get(), self.wrapper_experiment_id.get(), self.wrapper_result_dataset.get(), self.status, passed_connection=True, ssh_client=self.ssh_client)
 
@@ -4034,15 +4022,18 @@ class FormRecreateResultGzipConfigFile(tkinter.Frame):
 
         # get the selected file list
         if OK:
-            if self.combobox_whole.get() == 'selected files':
+            if self.combobox_whole.get() == 'selected files' and self.browsed_file_list != []:
+                selected_file_list = self.browsed_file_list
+            elif self.combobox_whole.get() == 'selected files':
                 selected_file_list = []
-                command = 'cd {0}; find . -type f -regex "./{1}"'.format(dataset_dir, self.wrapper_file_pattern.get())
-                (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
+                (OK, error_list, entry_list) = xssh.list_cluster_dir(self.ssh_client, dataset_dir, max_depth=None, entry_type='f', regex=self.wrapper_file_pattern.get())
                 if OK:
-                    for line in stdout:
-                        selected_file_list.append(line.rstrip('\n'))
+                    for entry in entry_list:
+                        selected_file_list.append('./{0}'.format(entry['path']))
                 else:
-                    message = '*** ERROR: Wrong command ---> {0}'.format(command)
+                    message = ''
+                    for error in error_list:
+                        message = '{0}{1}\n'.format(message, error)
                     tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
                 if selected_file_list == []:
                     message = 'WARNING: There are not files in the dataset directory {0} with the pattern {1}'.format(dataset_dir, self.wrapper_file_pattern.get())
@@ -4089,6 +4080,40 @@ class FormRecreateResultGzipConfigFile(tkinter.Frame):
 
     #---------------
 
+    def browse_files(self, event=None):
+        '''
+        Select the files of the result dataset in a directory tree browser instead
+        of searching them with the file pattern.
+        '''
+
+        # verify that the result dataset is selected
+        if self.combobox_whole.get() != 'selected files' or self.result_dataset_id is None:
+            message = 'Select selected files and a result dataset.'
+            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+            return
+
+        # select the files in the dialog Browser
+        dataset_dir = xlib.get_cluster_experiment_result_dataset_dir(self.wrapper_experiment_id.get(), self.result_dataset_id)
+        dialog_browser = gdialogs.DialogBrowser(self, 'Result dataset {0}'.format(dataset_dir), self.wrapper_cluster_name.get(), dataset_dir, file_selection=True)
+        self.wait_window(dialog_browser)
+
+        # save the selected files with the format of the file list of the config file
+        if dialog_browser.selected_path_list != []:
+            self.browsed_file_list = ['./{0}'.format(path) for path in dialog_browser.selected_path_list]
+            self.validate_inputs()
+
+    #---------------
+
+    def clear_browsed_files(self, *args):
+        '''
+        Forget the files selected in the browser when the file pattern changes.
+        '''
+
+        self.browsed_file_list = []
+        self.validate_entry_file_pattern()
+
+    #---------------
+
     def close(self, event=None):
         '''
         Close "FormRecreateResultGzipConfigFile".
@@ -4134,15 +4159,8 @@ class FormRecreateResultGzipConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -4180,26 +4198,18 @@ class FormRecreateResultGzipConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_experiment_id.set('')
 
-        # initialize the experiment identification list
-        experiment_id_list = []
-
-        # get the experiment identifications
-        command = 'ls {0}'.format(self.cluster_result_dir)
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
-
-        # verify if there are any experimment identifications
-        if experiment_id_list == []:
-            message = 'The cluster {0} has not experiment data.'.format(self.wrapper_cluster_name.get())
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster {0} has not experiment data.'.format(cluster_name)
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
 
-        # load the experiment identifications in the combobox
-        self.combobox_experiment_id['values'] = sorted(experiment_id_list)
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = self.cluster_result_dir
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
 
     #---------------
 
@@ -4262,7 +4272,10 @@ class FormRecreateResultGzipConfigFile(tkinter.Frame):
             self.label_file_pattern_warning['foreground'] = 'red'
             OK = False
         else:
-            self.label_file_pattern_warning['text'] = 'It is a pattern of regular expression.'
+            if self.browsed_file_list != []:
+                self.label_file_pattern_warning['text'] = '{0} files selected in the browser (the pattern is not used).'.format(len(self.browsed_file_list))
+            else:
+                self.label_file_pattern_warning['text'] = 'It is a pattern of regular expression.'
             self.label_file_pattern_warning['foreground'] = 'black'
 
         # return the control variable
@@ -4390,28 +4403,15 @@ class FormRecreateWholeResultGzipConfigFile(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
-
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
+    #---------------
 
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_action"
         self.populate_combobox_action()
@@ -4423,10 +4423,6 @@ class FormRecreateWholeResultGzipConfigFile(tkinter.Frame):
         self.wrapper_result_dataset.set('')
         self.result_dataset_id = None
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_action_selected_item(self, event=None):
@@ -4582,15 +4578,8 @@ class FormRecreateWholeResultGzipConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -4615,26 +4604,18 @@ class FormRecreateWholeResultGzipConfigFile(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_experiment_id.set('')
 
-        # initialize the experiment identification list
-        experiment_id_list = []
-
-        # get the experiment identifications
-        command = 'ls {0}'.format(self.cluster_result_dir)
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
-
-        # verify if there are any experimment identifications
-        if experiment_id_list == []:
-            message = 'The cluster {0} has not experiment data.'.format(self.wrapper_cluster_name.get())
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster {0} has not experiment data.'.format(cluster_name)
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
 
-        # load the experiment identifications in the combobox
-        self.combobox_experiment_id['values'] = sorted(experiment_id_list)
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = self.cluster_result_dir
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
 
     #---------------
 
@@ -4788,7 +4769,7 @@ class FormRunGzipProcess(tkinter.Frame):
 
         # download the result files from the cluster and initialize inputs
         if OK:
-            dialog_log = gdialogs.DialogLog(self, self.head, xgzip.run_gzip_process.__name__)
+            dialog_log = gdialogs.DialogLog(self, self.head, xgzip.run_gzip_process.__name__, cluster_name=self.wrapper_cluster_name.get())
             threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
             threading.Thread(target=xgzip.run_gzip_process, args=(self.wrapper_cluster_name.get(), self.dataset_type, dialog_log, lambda: dialog_log.enable_button_close())).start()
 
@@ -4829,16 +4810,8 @@ class FormRunGzipProcess(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            self.combobox_cluster_name['values'] = []
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -4984,28 +4957,15 @@ class FormRemoveDataSet(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
-
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
+    #---------------
 
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_experiment_id" or "combobox_dataset"
         if self.dataset_type == 'reference':
@@ -5013,10 +4973,6 @@ class FormRemoveDataSet(tkinter.Frame):
         elif self.dataset_type  == 'read' or self.dataset_type  == 'result' or self.dataset_type  == 'experiment':
             self.populate_combobox_experiment_id()
 
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
-
     #---------------
 
     def combobox_experiment_id_selected_item(self, event=None):
@@ -5075,7 +5031,7 @@ class FormRemoveDataSet(tkinter.Frame):
         # remove the dataset
         if OK:
             if self.dataset_type == 'reference':
-                command = 'rm -fr {0}/{1}'.format(self.cluster_reference_dir, self.dataset_id)
+                command = xmanifest.get_removal_command('reference', '{0}/{1}'.format(self.cluster_reference_dir, self.dataset_id))
                 (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
                 if OK:
                     message = 'The dataset {0} is removed.'.format(self.wrapper_dataset.get())
@@ -5085,7 +5041,7 @@ class FormRemoveDataSet(tkinter.Frame):
                     tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
                     self.close()
             elif self.dataset_type == 'read':
-                command = 'rm -fr {0}/{1}/{2}'.format(self.cluster_read_dir, self.wrapper_experiment_id.get(), self.dataset_id)
+                command = xmanifest.get_removal_command('read', '{0}/{1}/{2}'.format(self.cluster_read_dir, self.wrapper_experiment_id.get(), self.dataset_id))
                 (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
                 if OK:
                     message = 'The dataset {0} is removed.'.format(self.wrapper_dataset.get())
@@ -5095,7 +5051,7 @@ class FormRemoveDataSet(tkinter.Frame):
                     tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
                     self.close()
             elif self.dataset_type == 'result':
-                command = 'rm -fr {0}/{1}/{2}'.format(self.cluster_result_dir, self.wrapper_experiment_id.get(), self.dataset_id)
+                command = xmanifest.get_removal_command('result', '{0}/{1}/{2}'.format(self.cluster_result_dir, self.wrapper_experiment_id.get(), self.dataset_id))
                 (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
                 if OK:
                     message = 'The dataset {0} is removed.'.format(self.wrapper_dataset.get())
@@ -5105,10 +5061,10 @@ class FormRemoveDataSet(tkinter.Frame):
                     tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
                     self.close()
             elif self.dataset_type == 'experiment':
-                command = 'rm -fr {0}/{1}'.format(self.cluster_result_dir, self.wrapper_experiment_id.get())
+                command = '{0}\nrm -fr {1}/{2}'.format(xmanifest.get_removal_command('result', '{0}/{1}/*'.format(self.cluster_result_dir, self.wrapper_experiment_id.get())), self.cluster_result_dir, self.wrapper_experiment_id.get())
                 (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
                 if OK:
-                    command = 'rm -fr {0}/{1}'.format(self.cluster_read_dir, self.wrapper_experiment_id.get())
+                    command = '{0}\nrm -fr {1}/{2}'.format(xmanifest.get_removal_command('read', '{0}/{1}/*'.format(self.cluster_read_dir, self.wrapper_experiment_id.get())), self.cluster_read_dir, self.wrapper_experiment_id.get())
                     (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
                 if OK:
                     message = 'The datasets of experiment {0} are removed.'.format(self.wrapper_experiment_id.get())
@@ -5166,15 +5122,8 @@ class FormRemoveDataSet(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -5186,31 +5135,18 @@ class FormRemoveDataSet(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_experiment_id.set('')
 
-        # initialize the experiment identification list
-        experiment_id_list = []
-
-        # get the experiment identifications
-        if self.dataset_type == 'read':
-            command = 'ls {0}'.format(self.cluster_read_dir)
-        elif self.dataset_type == 'result':
-            command = 'ls {0}'.format(self.cluster_result_dir)
-        elif self.dataset_type == 'experiment':
-            command = 'ls {0}'.format(self.cluster_read_dir)
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
-
-        # verify if there are any experimment identifications
-        if experiment_id_list == []:
-            message = 'The cluster {0} has not experiment data.'.format(self.wrapper_cluster_name.get())
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster {0} has not experiment data.'.format(cluster_name)
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
 
-        # load the experiment identifications in the combobox
-        self.combobox_experiment_id['values'] = sorted(experiment_id_list)
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = self.cluster_result_dir if self.dataset_type == 'result' else self.cluster_read_dir
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
 
     #---------------
 
@@ -5362,35 +5298,18 @@ class FormRemoveDatabaseDataSet(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
-        if self.wrapper_cluster_name.get() != self.cluster_name_ant:
-
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
+        # create the SSH client connection of the selected cluster in the background and then load the inputs that depend on it
+        gloader.connect_cluster(self, self.load_cluster_inputs)
 
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
+    #---------------
 
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
+    def load_cluster_inputs(self):
+        '''
+        Load the inputs that depend on the cluster once the SSH client connection is created.
+        '''
 
         # load data in "combobox_database_dataset"
-            self.populate_combobox_database_dataset()
-
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
+        self.populate_combobox_database_dataset()
 
     #---------------
 
@@ -5422,7 +5341,7 @@ class FormRemoveDatabaseDataSet(tkinter.Frame):
 
         # remove the database dataset
         if OK:
-            command = 'rm -fr {0}/{1}'.format(xlib.get_cluster_database_dir(), self.database_dataset_id)
+            command = xmanifest.get_removal_command('database', '{0}/{1}'.format(xlib.get_cluster_database_dir(), self.database_dataset_id))
             (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
             if OK:
                 message = 'The database {0} is removed.'.format(self.wrapper_database_dataset.get())
@@ -5476,15 +5395,8 @@ class FormRemoveDatabaseDataSet(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -25,18 +25,28 @@ the NGScloud software package.
 
 #-------------------------------------------------------------------------------
 
+import atexit
 import os
 import PIL.Image
 import PIL.ImageTk
+import queue
+import re
+import threading
+import time
 import tkinter
 import tkinter.font
+import tkinter.messagebox
 import tkinter.ttk
 import sys
 
 import datetime
 import os
+import gloader
+import xfasta
 import xlib
+import xlogcatalog
 import xssh
+import xviewer
 
 #-------------------------------------------------------------------------------
 
@@ -44,6 +54,11 @@ class DialogTable(tkinter.Toplevel):
 
     #---------------
 
+    ROW_HEIGHT = 20         # height in pixels of a row when the style does not define it
+    FILTER_DELAY = 200      # milliseconds between the last key typed in the filter and the filtering
+
+    #---------------
+
     def __init__(self, parent, title_text, window_height, window_width, data_list, data_dict, item_dict, action=None, params=[]):
         '''
         Execute actions correspending to the creation of a "DialogTable" instance.
@@ -60,6 +75,20 @@ class DialogTable(tkinter.Toplevel):
         self.action = action
         self.params = params
 
+        # the rows are kept in a columnar store and only the rows in view are inserted in the Treeview
+        # widget: "row_list" has the store rows in the sort order and "view_list" those passing the filter
+        self.column_dict = {}
+        self.item_key_list = []
+        self.search_text_list = []
+        self.row_list = []
+        self.view_list = []
+        self.first_view_row = 0
+        self.visible_row_count = 1
+        self.sort_datum = None
+        self.sort_reverse = False
+        self.filter_text = ''
+        self.filter_after_id = None
+
         # call the parent init method
         tkinter.Toplevel.__init__(self)
 
@@ -117,8 +146,20 @@ class DialogTable(tkinter.Toplevel):
         self.button_close.image = imagetk_close
         self.button_close.pack(side='left', padx=2, pady=5)
 
+        # create "entry_filter" and its label and register them with the pack geometry manager
+        self.wrapper_filter = tkinter.StringVar()
+        self.wrapper_filter.trace('w', self.schedule_filter)
+        self.entry_filter = tkinter.Entry(self.frame_toolbar, textvariable=self.wrapper_filter, width=30)
+        self.entry_filter.pack(side='right', padx=5, pady=5)
+        self.label_filter = tkinter.Label(self.frame_toolbar, text='Filter')
+        self.label_filter.pack(side='right', padx=2, pady=5)
+
+        # create "label_count" and register it with the pack geometry manager
+        self.label_count = tkinter.Label(self.frame_toolbar, text='')
+        self.label_count.pack(side='left', padx=5, pady=5)
+
         # create "treeview" and register it with the pack geometry manager
-        self.treeview = tkinter.ttk.Treeview(self)
+        self.treeview = tkinter.ttk.Treeview(self, selectmode='browse')
         self.treeview.pack(side='left', fill='both', expand=True)
 
         # set columns in Treeview widget
@@ -133,20 +174,27 @@ class DialogTable(tkinter.Toplevel):
             elif self.data_dict[datum]['aligment'] == 'right':
                 aligment = tkinter.E
             self.treeview.column(datum, minwidth=self.data_dict[datum]['width'], width=self.data_dict[datum]['width'], anchor=aligment, stretch=False)
-            self.treeview.heading(datum, text=self.data_dict[datum]['text'])
+            self.treeview.heading(datum, text=self.data_dict[datum]['text'], command=lambda datum=datum: self.sort_table(datum))
 
         # create "scrollbar_x" and register it with the pack geometry manager
         self.scrollbar_x = tkinter.Scrollbar(self.treeview, orient='horizontal', command=self.treeview.xview)
         self.scrollbar_x.pack(side='bottom', fill='x')
         self.treeview.configure(xscrollcommand=self.scrollbar_x.set)
         
-        # create "scrollbar_y" and register it with the pack geometry manager
-        self.scrollbar_y = tkinter.Scrollbar(self.treeview, orient='vertical', command=self.treeview.yview)
+        # create "scrollbar_y" and register it with the pack geometry manager; it scrolls the rows in view
+        self.scrollbar_y = tkinter.Scrollbar(self.treeview, orient='vertical', command=self.scroll_table)
         self.scrollbar_y.pack(side='right', fill='y')
-        self.treeview.configure(yscrollcommand=self.scrollbar_y.set)
 
         # link a handler to events
         self.treeview.bind("<Double-1>", self.double_click)
+        self.treeview.bind('<Configure>', self.resize_table)
+        self.treeview.bind('<MouseWheel>', self.scroll_table_wheel)
+        self.treeview.bind('<Button-4>', self.scroll_table_wheel)
+        self.treeview.bind('<Button-5>', self.scroll_table_wheel)
+        self.treeview.bind('<Prior>', lambda event: self.scroll_table('scroll', -1, 'pages'))
+        self.treeview.bind('<Next>', lambda event: self.scroll_table('scroll', 1, 'pages'))
+        self.treeview.bind('<Up>', lambda event: self.move_selection(-1))
+        self.treeview.bind('<Down>', lambda event: self.move_selection(1))
 
         # link a handler to interactions between the application and the window manager
         self.protocol('WM_DELETE_WINDOW', self.close)
@@ -155,15 +203,252 @@ class DialogTable(tkinter.Toplevel):
 
     def populate_table(self):
         '''
-        Populate the Treeview widget with the data of "DialogTable".
+        Populate the columnar store with the data of "DialogTable" and show the
+        rows in view.
+        '''
+
+        # build the columns with the items in the order of their keys
+        self.item_key_list = sorted(self.item_dict.keys())
+        for datum in self.data_list:
+            self.column_dict[datum] = [str(self.item_dict[item_key][datum]) for item_key in self.item_key_list]
+
+        # build the text where the filter is searched of each row
+        self.search_text_list = ['\t'.join(row_values).lower() for row_values in zip(*[self.column_dict[datum] for datum in self.data_list])]
+
+        # show the rows in view
+        self.row_list = list(range(len(self.item_key_list)))
+        self.view_list = self.row_list
+        self.show_rows()
+
+    #---------------
+
+    def update_items(self, item_dict):
+        '''
+        Replace the data of "DialogTable" keeping the sort order, the filter,
+        the first row in view and the selected item.
         '''
 
-        # insert the items in Treeview widget
-        for item_key in sorted(self.item_dict.keys()):
-            row_values_list = []
-            for datum in self.data_list:
-                row_values_list.append(self.item_dict[item_key][datum])
-            self.treeview.insert('', 'end', values=row_values_list)
+        # get the key of the selected item
+        selected_item_list = self.treeview.selection()
+        selected_item_key = self.item_key_list[int(selected_item_list[0])] if len(selected_item_list) > 0 else None
+
+        # rebuild the columnar store and apply the sort order and the filter
+        first_view_row = self.first_view_row
+        self.item_dict = item_dict
+        self.populate_table()
+        if self.sort_datum is not None:
+            self.sort_rows()
+        self.filter_table(incremental=False)
+
+        # restore the first row in view and the selected item
+        self.first_view_row = first_view_row
+        self.treeview.selection_remove(*self.treeview.selection())
+        self.show_rows()
+        if selected_item_key in self.item_dict:
+            item = str(self.item_key_list.index(selected_item_key))
+            if self.treeview.exists(item):
+                self.treeview.selection_set(item)
+
+    #---------------
+
+    def get_row_values(self, row):
+        '''
+        Get the values of a row of the columnar store.
+        '''
+
+        return [self.column_dict[datum][row] for datum in self.data_list]
+
+    #---------------
+
+    def show_rows(self):
+        '''
+        Insert in the Treeview widget only the rows in view and update the
+        vertical scrollbar.
+        '''
+
+        # get the first row in view
+        view_row_count = len(self.view_list)
+        self.first_view_row = max(0, min(self.first_view_row, view_row_count - self.visible_row_count))
+
+        # replace the rows of the Treeview widget keeping the selected row when it is in view
+        selected_item_list = self.treeview.selection()
+        self.treeview.delete(*self.treeview.get_children())
+        for row in self.view_list[self.first_view_row:self.first_view_row + self.visible_row_count]:
+            self.treeview.insert('', 'end', iid=str(row), values=self.get_row_values(row))
+        selected_item_list = [item for item in selected_item_list if self.treeview.exists(item)]
+        if selected_item_list != []:
+            self.treeview.selection_set(selected_item_list)
+
+        # update the vertical scrollbar and the row count
+        if view_row_count == 0:
+            self.scrollbar_y.set(0, 1)
+        else:
+            self.scrollbar_y.set(self.first_view_row / view_row_count, min(1, (self.first_view_row + self.visible_row_count) / view_row_count))
+        self.label_count['text'] = '{0} of {1} rows'.format(view_row_count, len(self.row_list))
+
+    #---------------
+
+    def resize_table(self, event=None):
+        '''
+        Compute the rows that fit in the Treeview widget when it is resized.
+        '''
+
+        # get the row height
+        try:
+            row_height = int(tkinter.ttk.Style().lookup('Treeview', 'rowheight'))
+        except (ValueError, tkinter.TclError):
+            row_height = self.ROW_HEIGHT
+
+        # compute the rows that fit in the widget, except the headings and the horizontal scrollbar
+        visible_row_count = max(1, (self.treeview.winfo_height() - self.scrollbar_x.winfo_height()) // row_height - 1)
+        if visible_row_count != self.visible_row_count:
+            self.visible_row_count = visible_row_count
+            self.show_rows()
+
+    #---------------
+
+    def scroll_table(self, *args):
+        '''
+        Scroll the rows in view from the vertical scrollbar or the keyboard.
+        '''
+
+        if args[0] == 'moveto':
+            self.first_view_row = int(float(args[1]) * len(self.view_list))
+        elif args[0] == 'scroll':
+            if args[2] == 'pages':
+                self.first_view_row += int(args[1]) * self.visible_row_count
+            else:
+                self.first_view_row += int(args[1])
+        self.show_rows()
+
+    #---------------
+
+    def scroll_table_wheel(self, event):
+        '''
+        Scroll the rows in view with the mouse wheel.
+        '''
+
+        if event.num == 4 or event.delta > 0:
+            self.scroll_table('scroll', -3, 'units')
+        else:
+            self.scroll_table('scroll', 3, 'units')
+
+    #---------------
+
+    def move_selection(self, step):
+        '''
+        Move the selection to the previous or next row scrolling the rows in view
+        when it leaves them.
+        '''
+
+        # get the position of the new selected row
+        selected_item_list = self.treeview.selection()
+        if self.view_list == []:
+            return 'break'
+        if selected_item_list == []:
+            view_row = self.first_view_row
+        else:
+            try:
+                view_row = self.view_list.index(int(selected_item_list[0]), self.first_view_row) + step
+            except ValueError:
+                view_row = self.first_view_row
+        view_row = max(0, min(view_row, len(self.view_list) - 1))
+
+        # scroll the rows in view to show it and select it
+        if view_row < self.first_view_row:
+            self.first_view_row = view_row
+        elif view_row >= self.first_view_row + self.visible_row_count:
+            self.first_view_row = view_row - self.visible_row_count + 1
+        self.show_rows()
+        item = str(self.view_list[view_row])
+        self.treeview.selection_set(item)
+        self.treeview.focus(item)
+
+        # avoid the default handling of the key
+        return 'break'
+
+    #---------------
+
+    def sort_table(self, datum):
+        '''
+        Sort the rows by the values of a column; the order is reversed when the
+        column is already the sort column. The numeric values are sorted by their
+        value and before the other ones.
+        '''
+
+        # set the sort column and order
+        if self.sort_datum == datum:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_datum = datum
+            self.sort_reverse = False
+
+        # sort the rows
+        self.sort_rows()
+
+        # mark the sort column in the headings
+        for heading_datum in self.data_list:
+            text = self.data_dict[heading_datum]['text']
+            if heading_datum == datum:
+                text = '{0} {1}'.format(text, '\u25bc' if self.sort_reverse else '\u25b2')
+            self.treeview.heading(heading_datum, text=text)
+
+        # filter the sorted rows and show them from the first one
+        self.filter_table(incremental=False)
+
+    #---------------
+
+    def sort_rows(self):
+        '''
+        Sort the rows of the columnar store by the sort column and order.
+        '''
+
+        def get_sort_key(value):
+            try:
+                return (0, float(value), '')
+            except ValueError:
+                return (1, 0, value.lower())
+        key_list = [get_sort_key(value) for value in self.column_dict[self.sort_datum]]
+        self.row_list = sorted(range(len(key_list)), key=key_list.__getitem__, reverse=self.sort_reverse)
+
+    #---------------
+
+    def schedule_filter(self, *args):
+        '''
+        Schedule the filtering of the rows after the last key typed in the filter.
+        '''
+
+        if self.filter_after_id is not None:
+            self.after_cancel(self.filter_after_id)
+        self.filter_after_id = self.after(self.FILTER_DELAY, self.filter_table)
+
+    #---------------
+
+    def filter_table(self, incremental=True):
+        '''
+        Keep the rows that contain the filter text in any column. When the filter
+        text extends the previous one, only the rows in view are filtered.
+        '''
+
+        self.filter_after_id = None
+
+        # get the rows to filter
+        filter_text = self.wrapper_filter.get().strip().lower()
+        if incremental and self.filter_text != '' and filter_text.find(self.filter_text) > -1:
+            row_list = self.view_list
+        else:
+            row_list = self.row_list
+        self.filter_text = filter_text
+
+        # filter the rows
+        if filter_text == '':
+            self.view_list = self.row_list
+        else:
+            self.view_list = [row for row in row_list if self.search_text_list[row].find(filter_text) > -1]
+
+        # show the rows from the first one
+        self.first_view_row = 0
+        self.show_rows()
 
     #---------------
 
@@ -174,22 +459,22 @@ class DialogTable(tkinter.Toplevel):
 
         # manege the action
         try:
-            # get the table item selected
-            item = self.treeview.selection()[0]
+            # get the values of the table item selected from the columnar store
+            row_values = self.get_row_values(int(self.treeview.selection()[0]))
         except:
             message = 'There is not any action asociated with this table item.'
             OK = tkinter.messagebox.showwarning(self.title(), message)
         else:
             if self.action == 'view_submission_logs':
-                run_id = self.treeview.item(item)['values'][0]
+                run_id = row_values[0]
                 self.view_local_process_log(run_id)
             elif self.action == 'view_result_logs':
-                experiment_id = self.treeview.item(item)['values'][0]
-                run_id = self.treeview.item(item)['values'][1]
+                experiment_id = row_values[0]
+                run_id = row_values[1]
                 self.view_log(experiment_id, run_id)
             elif self.action == 'list_directory':
-                file_type = self.treeview.item(item)['values'][0]
-                file_name = self.treeview.item(item)['values'][1]
+                file_type = row_values[0]
+                file_name = row_values[1]
                 if file_type == 'directory':
                     self.list_directory(file_name)
                 else:
@@ -370,6 +655,290 @@ class DialogTable(tkinter.Toplevel):
 
 #-------------------------------------------------------------------------------
 
+class DialogBrowser(tkinter.Toplevel):
+
+    #---------------
+
+    WINDOW_MIN_HEIGHT = 500
+    WINDOW_MIN_WIDTH = 700
+
+    BATCH_SIZE = 1000    # entries of a directory inserted each time
+
+    #---------------
+
+    def __init__(self, parent, title_text, cluster_name, root_dir, file_selection=False):
+        '''
+        Execute actions correspending to the creation of a "DialogBrowser" instance.
+        '''
+
+        # save initial parameters in instance variables
+        self.parent = parent
+        self.title_text = title_text
+        self.cluster_name = cluster_name
+        self.root_dir = root_dir.rstrip('/')
+        self.file_selection = file_selection
+
+        # the directories are listed through the pooled SFTP session of the cluster when they are opened;
+        # "entry_type_dict" has the type of every item and "more_dict" the next entry position of the
+        # directories with entries not inserted yet
+        self.entry_type_dict = {}
+        self.more_dict = {}
+
+        # paths of the selected files relative to the root directory
+        self.selected_path_list = []
+
+        # call the parent init method
+        tkinter.Toplevel.__init__(self)
+
+        # create the window of the Dialog Browser.
+        self.create_window()
+
+        # build the graphical user interface
+        self.build_gui()
+
+        # show the entries of the root directory
+        self.load_directory('', 0)
+
+    #---------------
+
+    def create_window(self):
+        '''
+        Create the window of "DialogBrowser".
+        '''
+
+        # define the dimensions
+        self.minsize(height=self.WINDOW_MIN_HEIGHT, width=self.WINDOW_MIN_WIDTH)
+        self.maxsize(height=self.winfo_screenheight(), width=self.winfo_screenwidth())
+        x = round((self.winfo_screenwidth() - self.WINDOW_MIN_WIDTH) / 2)
+        y = round((self.winfo_screenheight() - self.WINDOW_MIN_HEIGHT) / 2)
+        self.geometry('{}x{}+{}+{}'.format(self.WINDOW_MIN_WIDTH, self.WINDOW_MIN_HEIGHT, x, y))
+
+        # set the title
+        self.title('{0} - {1} - Browser'.format(xlib.get_project_name(), self.title_text))
+
+        # set the icon
+        image_app = PIL.Image.open(xlib.get_project_image_file())
+        self.photoimage_app = PIL.ImageTk.PhotoImage(image_app)
+        self.tk.call('wm', 'iconphoto', self._w, self.photoimage_app)
+
+        # associate this window with the parent window
+        self.transient(self.parent)
+
+    #---------------
+
+    def build_gui(self):
+        '''
+        Build the graphical interface user of "DialogBrowser".
+        '''
+
+        # create "imagetk_close"
+        image_close = PIL.Image.open('./image_close.png')
+        imagetk_close = PIL.ImageTk.PhotoImage(image_close)  
+
+        # create "imagetk_refresh"
+        image_refresh = PIL.Image.open('./image_refresh.png')
+        imagetk_refresh = PIL.ImageTk.PhotoImage(image_refresh)  
+
+        # create "frame_toolbar" and register it with the pack geometry manager
+        self.frame_toolbar = tkinter.Frame(self, borderwidth=1, relief='raised')
+        self.frame_toolbar.pack(side='top', fill='x')
+
+        # create "button_close" and register it with the pack geometry manager
+        self.button_close = tkinter.Button(self.frame_toolbar, command=self.close, relief='flat', image=imagetk_close)
+        self.button_close.image = imagetk_close
+        self.button_close.pack(side='left', padx=2, pady=5)
+
+        # create "separator" and register it with the pack geometry manager
+        self.separator = tkinter.ttk.Separator(self.frame_toolbar, orient='vertical')
+        self.separator.pack(side='left', fill='y', padx=2, pady=2)
+
+        # create "button_refresh" and register it with the pack geometry manager
+        self.button_refresh = tkinter.Button(self.frame_toolbar, command=self.refresh, relief='flat', image=imagetk_refresh)
+        self.button_refresh.image = imagetk_refresh
+        self.button_refresh.pack(side='left', padx=2, pady=5)
+
+        # create "button_accept" and register it with the pack geometry manager
+        if self.file_selection:
+            self.button_accept = tkinter.ttk.Button(self.frame_toolbar, text='Accept selected files', command=self.accept)
+            self.button_accept.pack(side='right', padx=5, pady=5)
+
+        # create "treeview" and register it with the pack geometry manager
+        self.treeview = tkinter.ttk.Treeview(self, selectmode='extended' if self.file_selection else 'browse')
+        self.treeview.pack(side='left', fill='both', expand=True)
+
+        # set columns in Treeview widget
+        self.treeview['columns'] = ['size', 'mtime']
+        self.treeview.column('#0', minwidth=350, width=350, stretch=True)
+        self.treeview.heading('#0', text=self.root_dir, anchor=tkinter.W)
+        self.treeview.column('size', minwidth=120, width=120, anchor=tkinter.E, stretch=False)
+        self.treeview.heading('size', text='Size (bytes)')
+        self.treeview.column('mtime', minwidth=150, width=150, anchor=tkinter.W, stretch=False)
+        self.treeview.heading('mtime', text='Modification time')
+
+        # create "scrollbar_x" and register it with the pack geometry manager
+        self.scrollbar_x = tkinter.Scrollbar(self.treeview, orient='horizontal', command=self.treeview.xview)
+        self.scrollbar_x.pack(side='bottom', fill='x')
+        self.treeview.configure(xscrollcommand=self.scrollbar_x.set)
+
+        # create "scrollbar_y" and register it with the pack geometry manager
+        self.scrollbar_y = tkinter.Scrollbar(self.treeview, orient='vertical', command=self.treeview.yview)
+        self.scrollbar_y.pack(side='right', fill='y')
+        self.treeview.configure(yscrollcommand=self.scrollbar_y.set)
+
+        # link a handler to events
+        self.treeview.bind('<<TreeviewOpen>>', self.open_directory)
+        self.treeview.bind('<Double-1>', self.double_click)
+        self.bind('<Alt-F4>', self.close)
+
+        # link a handler to interactions between the application and the window manager
+        self.protocol('WM_DELETE_WINDOW', self.close)
+
+    #---------------
+
+    def load_directory(self, item, start):
+        '''
+        Request the entries of a directory to the background loader and insert
+        them from a position when they are got. The directory of the item "" is
+        the root directory.
+        '''
+
+        # set cursor to show busy status while the directory is listed
+        self.config(cursor='watch')
+
+        # list the directory in the thread pool of the loader; the listing is kept by xssh while the directory does not change
+        cluster_dir = self.root_dir if item == '' else item
+        key = ('sftp_listing', self.cluster_name, cluster_dir)
+        gloader.request(self, 'directory\t{0}'.format(item), key, xssh.list_cluster_dir_sftp, lambda result: self.insert_entries(item, start, result), args=(self.cluster_name, cluster_dir), ttl=0, error_callback=self.show_listing_error)
+
+    #---------------
+
+    def insert_entries(self, item, start, result):
+        '''
+        Insert a batch of the entries of a directory from a position.
+        '''
+
+        # set cursor to show normal status
+        self.config(cursor='')
+
+        # verify the directory has not been removed by a refresh
+        if item != '' and not self.treeview.exists(item):
+            return
+
+        # show the errors
+        (OK, error_list, entry_list) = result
+        if not OK:
+            message = ''
+            for error in error_list:
+                message = '{0}{1}\n'.format(message, error)
+            tkinter.messagebox.showerror(self.title(), message)
+
+        # insert a batch of entries; the directories get a placeholder child to be opened
+        if OK:
+            for entry in entry_list[start:start + self.BATCH_SIZE]:
+                if self.treeview.exists(entry['path']):
+                    continue
+                mtime = datetime.datetime.fromtimestamp(entry['mtime']).strftime('%Y-%m-%d %H:%M:%S')
+                if entry['type'] == 'd':
+                    self.treeview.insert(item, 'end', iid=entry['path'], text=entry['name'], values=['', mtime])
+                    self.treeview.insert(entry['path'], 'end', iid='{0}\tplaceholder'.format(entry['path']), text='')
+                else:
+                    self.treeview.insert(item, 'end', iid=entry['path'], text=entry['name'], values=['{0:,}'.format(entry['size']), mtime])
+                self.entry_type_dict[entry['path']] = entry['type']
+
+        # insert an item to get the next batch of entries
+        if OK:
+            more_item = '{0}\tmore'.format(item)
+            if self.treeview.exists(more_item):
+                self.treeview.delete(more_item)
+            if len(entry_list) > start + self.BATCH_SIZE:
+                self.treeview.insert(item, 'end', iid=more_item, text='... {0} more entries (double click)'.format(len(entry_list) - start - self.BATCH_SIZE))
+                self.more_dict[more_item] = (item, start + self.BATCH_SIZE)
+
+    #---------------
+
+    def show_listing_error(self, exception):
+        '''
+        Show the error raised listing a directory.
+        '''
+
+        self.config(cursor='')
+        tkinter.messagebox.showerror(self.title(), 'The directory can not be listed: {0}'.format(exception))
+
+    #---------------
+
+    def open_directory(self, event=None):
+        '''
+        List the entries of a directory when it is opened for the first time.
+        '''
+
+        item = self.treeview.focus()
+        placeholder_item = '{0}\tplaceholder'.format(item)
+        if self.treeview.exists(placeholder_item):
+            self.treeview.delete(placeholder_item)
+            self.load_directory(item, 0)
+
+    #---------------
+
+    def double_click(self, event):
+        '''
+        Insert the next batch of entries of a directory when its item is clicked.
+        '''
+
+        item = self.treeview.identify_row(event.y)
+        if item in self.more_dict:
+            (directory_item, start) = self.more_dict.pop(item)
+            self.load_directory(directory_item, start)
+
+    #---------------
+
+    def refresh(self, event=None):
+        '''
+        List the root directory again and show its entries.
+        '''
+
+        xssh.forget_sftp_listings(self.cluster_name, self.root_dir)
+        self.treeview.delete(*self.treeview.get_children())
+        self.entry_type_dict = {}
+        self.more_dict = {}
+        self.load_directory('', 0)
+
+    #---------------
+
+    def accept(self, event=None):
+        '''
+        Accept the selected files and close "DialogBrowser".
+        '''
+
+        # get the paths of the selected files relative to the root directory
+        self.selected_path_list = []
+        for item in self.treeview.selection():
+            if self.entry_type_dict.get(item, 'd') != 'd':
+                self.selected_path_list.append(item[len(self.root_dir) + 1:])
+
+        # verify if there are any selected files
+        if self.selected_path_list == []:
+            message = 'There is not any file selected.'
+            tkinter.messagebox.showwarning(self.title(), message)
+            return
+
+        # delete all widgets and terminate the mainloop
+        self.destroy()
+
+    #---------------
+
+    def close(self, event=None):
+        '''
+        Close "DialogBrowser" without selection.
+        '''
+
+        # delete all widgets and terminate the mainloop
+        self.selected_path_list = []
+        self.destroy()
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
 class DialogLog(tkinter.Toplevel):
 
     #---------------
@@ -377,9 +946,12 @@ class DialogLog(tkinter.Toplevel):
     WINDOW_MIN_HEIGHT = 680
     WINDOW_MIN_WIDTH = 680
 
+    PUMP_INTERVAL = 100    # milliseconds between two drains of the message queue
+    FSYNC_INTERVAL = 5     # seconds between two synchronizations of the log file with the disk
+
     #---------------
 
-    def __init__(self, parent, head='', calling_function=None):
+    def __init__(self, parent, head='', calling_function=None, cluster_name=None):
         '''
         Execute actions correspending to the creation a "DialogLog" instance.
         '''
@@ -388,9 +960,17 @@ class DialogLog(tkinter.Toplevel):
         self.parent = parent
         self.head = head
         self.calling_function = calling_function
+        self.cluster_name = cluster_name
 
         self.is_enabled_button_close = False
 
+        # the worker threads only put the messages in the queue and request the close button enabling;
+        # the pump drains them in the thread of the Tk main loop
+        self.message_queue = queue.Queue()
+        self.is_requested_button_close = False
+        self.last_fsync_time = time.time()
+        self.log_file_id = None
+
         # call the parent init method
         tkinter.Toplevel.__init__(self)
 
@@ -419,6 +999,16 @@ class DialogLog(tkinter.Toplevel):
             tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
             # delete all widgets and terminate the mainloop
             self.destroy()
+            return
+
+        # register the log in the log catalog
+        xlogcatalog.register_log(self.log_file, self.cluster_name)
+
+        # synchronize the log file with the disk if the program ends with the dialog open
+        atexit.register(self.sync_log_file)
+
+        # start the pump of the message queue
+        self.after(self.PUMP_INTERVAL, self.pump)
 
     #---------------
 
@@ -489,48 +1079,107 @@ class DialogLog(tkinter.Toplevel):
         Close "DialogLog".
         '''
 
-        # close the local log file
+        # the dialog can not be closed while the process is writing
+        if not self.is_enabled_button_close:
+            return
+
+        # write the pending messages and close the local log file
+        self.drain_message_queue()
+        self.sync_log_file()
+        atexit.unregister(self.sync_log_file)
         self.log_file_id.close()
 
         # delete all widgets and terminate the mainloop
-        if self.is_enabled_button_close:
-            self.destroy()
+        self.destroy()
 
     #---------------
 
     def enable_button_close(self):
         '''
-        Enable "button_close".
+        Request the enabling of "button_close" once the pending messages are
+        written. It can be called from any thread.
         '''
 
-        # set cursor to show normal status
-        self.config(cursor='')
-        self.update()
-        self.text.config(cursor='')
-        self.text.update()
-
-        # set state "normal" to "button_close"
-        self.button_close['state'] = 'normal'
-        self.is_enabled_button_close = True
+        self.is_requested_button_close = True
 
     #---------------
 
     def write(self, message=''):
         '''
-        Add a message in the widget "text" and in the log file.
+        Put a message in the queue to add it in the widget "text" and in the log
+        file. It can be called from any thread.
         '''
 
-        # write the message in widget "text" 
+        self.message_queue.put(message)
+
+    #---------------
+
+    def pump(self):
+        '''
+        Drain the message queue and enable "button_close" when it is requested.
+        It runs in the thread of the Tk main loop.
+        '''
+
+        # get the request before draining, so the messages written before it are drained
+        is_requested_button_close = self.is_requested_button_close
+
+        # write the pending messages
+        self.drain_message_queue()
+
+        # synchronize the log file with the disk periodically
+        if time.time() - self.last_fsync_time >= self.FSYNC_INTERVAL:
+            self.sync_log_file()
+
+        # enable "button_close" once the process has ended and index the log in the log catalog, or schedule the next drain
+        if is_requested_button_close:
+            self.sync_log_file()
+            xlogcatalog.close_log(self.log_file)
+            self.config(cursor='')
+            self.text.config(cursor='')
+            self.button_close['state'] = 'normal'
+            self.is_enabled_button_close = True
+        else:
+            self.after(self.PUMP_INTERVAL, self.pump)
+
+    #---------------
+
+    def drain_message_queue(self):
+        '''
+        Add the messages of the queue in the widget "text" and in the log file
+        as one batch.
+        '''
+
+        # get the pending messages
+        message_list = []
+        while True:
+            try:
+                message_list.append(self.message_queue.get_nowait())
+            except queue.Empty:
+                break
+        if message_list == []:
+            return
+        messages = ''.join(message_list)
+
+        # write the messages in widget "text"
         self.text.configure(state='normal')
-        self.text.insert('end', message)
+        self.text.insert('end', messages)
         self.text.see('end')
-        self.text.update()
         self.text.configure(state='disabled')
 
         # write in the log file
-        self.log_file_id.write(message)
-        self.log_file_id.flush()
-        os.fsync(self.log_file_id.fileno())
+        self.log_file_id.write(messages)
+
+    #---------------
+
+    def sync_log_file(self):
+        '''
+        Flush the log file and synchronize it with the disk.
+        '''
+
+        if self.log_file_id is not None and not self.log_file_id.closed:
+            self.log_file_id.flush()
+            os.fsync(self.log_file_id.fileno())
+        self.last_fsync_time = time.time()
 
     #---------------
 
@@ -551,6 +1200,9 @@ class DialogViewer(tkinter.Toplevel):
 
     WINDOW_MIN_HEIGHT = 650
     WINDOW_MIN_WIDTH = 800
+    PUMP_INTERVAL = 200         # milliseconds between the updates of the search matches and the index progress
+    MAX_LINE_LENGTH = 5000      # characters shown of the long lines
+    MATCH_LIST_HEIGHT = 6       # lines of the list of search matches
 
     #---------------
 
@@ -564,6 +1216,28 @@ class DialogViewer(tkinter.Toplevel):
         self.file_path = file_path
         self.cluster_name = cluster_name
 
+        # the file is read by ranges and only the lines in view are inserted in the Text widget:
+        # "top_offset" is the offset of the first line in view and "bottom_offset" that of the line after the last one
+        self.source = None
+        self.line_index = None
+        self.top_offset = 0
+        self.bottom_offset = 0
+        self.visible_line_count = 1
+
+        # the search runs in a thread that puts the matches in a queue drained by "pump"
+        self.search_regex = None
+        self.search_thread = None
+        self.search_stop_event = threading.Event()
+        self.search_queue = queue.Queue()
+        self.match_offset_list = []
+        self.is_search_done = True
+        self.pump_after_id = None
+
+        # the regions of a FASTA file are fetched in the thread pool of the loader reading only their bytes through its index;
+        # the lock serializes the opening of the reader, which builds the index the first time
+        self.fasta_reader = None
+        self.fasta_reader_lock = threading.Lock()
+
         # call the parent init method
         tkinter.Toplevel.__init__(self)
 
@@ -575,6 +1249,9 @@ class DialogViewer(tkinter.Toplevel):
 
         self.open_file()
 
+        # start the updates of the search matches and the index progress
+        self.pump_after_id = self.after(self.PUMP_INTERVAL, self.pump)
+
     #---------------
 
     def create_window(self):
@@ -629,26 +1306,85 @@ class DialogViewer(tkinter.Toplevel):
         self.separator.pack(side='left', fill='y', padx=2, pady=2)
 
         # create "button_refresh" and register it with the pack geometry manager
-        self.button_refresh = tkinter.Button(self.frame_toolbar, command=self.open_file, relief='flat', image=imagetk_refresh)
+        self.button_refresh = tkinter.Button(self.frame_toolbar, command=self.refresh, relief='flat', image=imagetk_refresh)
         self.button_refresh.image = imagetk_refresh
         self.button_refresh.pack(side='left', padx=2, pady=5)
 
+        # create "entry_line" and its label and button and register them with the pack geometry manager
+        self.label_line = tkinter.Label(self.frame_toolbar, text='Line')
+        self.label_line.pack(side='left', padx=(10, 2), pady=5)
+        self.wrapper_line = tkinter.StringVar()
+        self.entry_line = tkinter.Entry(self.frame_toolbar, textvariable=self.wrapper_line, width=12)
+        self.entry_line.pack(side='left', padx=2, pady=5)
+        self.button_line = tkinter.Button(self.frame_toolbar, text='Go', command=self.go_to_line)
+        self.button_line.pack(side='left', padx=2, pady=5)
+
+        # create "entry_search" and its label and button and register them with the pack geometry manager
+        self.label_search = tkinter.Label(self.frame_toolbar, text='Search (regular expression)')
+        self.label_search.pack(side='left', padx=(10, 2), pady=5)
+        self.wrapper_search = tkinter.StringVar()
+        self.entry_search = tkinter.Entry(self.frame_toolbar, textvariable=self.wrapper_search, width=30)
+        self.entry_search.pack(side='left', padx=2, pady=5)
+        self.button_search = tkinter.Button(self.frame_toolbar, text='Find', command=self.search)
+        self.button_search.pack(side='left', padx=2, pady=5)
+
+        # create "entry_region" and its label and button of a FASTA file and register them with the pack geometry manager
+        if xfasta.is_fasta_file_name(self.file_path):
+            self.label_region = tkinter.Label(self.frame_toolbar, text='Region')
+            self.label_region.pack(side='left', padx=(10, 2), pady=5)
+            self.wrapper_region = tkinter.StringVar()
+            self.entry_region = tkinter.Entry(self.frame_toolbar, textvariable=self.wrapper_region, width=20)
+            self.entry_region.pack(side='left', padx=2, pady=5)
+            self.button_region = tkinter.Button(self.frame_toolbar, text='Fetch', command=self.fetch_region)
+            self.button_region.pack(side='left', padx=2, pady=5)
+            self.entry_region.bind('<Return>', self.fetch_region)
+
+        # create "label_status" and register it with the pack geometry manager
+        self.label_status = tkinter.Label(self.frame_toolbar, text='')
+        self.label_status.pack(side='right', padx=5, pady=5)
+
+        # create "frame_match" and register it with the pack geometry manager
+        self.frame_match = tkinter.Frame(self)
+        self.frame_match.pack(side='bottom', fill='x')
+
+        # create "listbox_match" and register it with the pack geometry manager
+        self.listbox_match = tkinter.Listbox(self.frame_match, height=self.MATCH_LIST_HEIGHT, activestyle='none')
+        self.listbox_match.pack(side='left', expand='yes', fill='x')
+        self.scrollbar_match = tkinter.Scrollbar(self.frame_match, orient='vertical', command=self.listbox_match.yview)
+        self.scrollbar_match.pack(side='right', fill='y')
+        self.listbox_match.configure(yscrollcommand=self.scrollbar_match.set)
+
         # create "text" and register it with the grid geometry manager
         self.text = tkinter.Text(self, wrap='none', state='disabled')
         self.text.pack(expand='yes', fill='both')
+        self.text.tag_configure('match', background='yellow')
+        self.text.tag_configure('current', background='light blue')
 
         # create "scrollbar_x" and register it with the pack geometry manager
         self.scrollbar_x = tkinter.Scrollbar(self.text, orient='horizontal', command=self.text.xview)
         self.scrollbar_x.pack(side='bottom', fill='x')
         self.text.configure(xscrollcommand=self.scrollbar_x.set)
         
-        # create "scrollbar_y" and register it with the pack geometry manager
-        self.scrollbar_y = tkinter.Scrollbar(self.text, orient='vertical', command=self.text.yview)
+        # create "scrollbar_y" and register it with the pack geometry manager; it scrolls the lines in view
+        self.scrollbar_y = tkinter.Scrollbar(self.text, orient='vertical', command=self.scroll_file)
         self.scrollbar_y.pack(side='right', fill='y')
-        self.text.configure(yscrollcommand=self.scrollbar_y.set)
 
         # link a handler to events
         self.bind('<Alt-F4>', self.close)
+        self.entry_line.bind('<Return>', self.go_to_line)
+        self.entry_search.bind('<Return>', self.search)
+        self.listbox_match.bind('<<ListboxSelect>>', self.select_match)
+        self.text.bind('<Configure>', self.resize_text)
+        self.text.bind('<Button-1>', lambda event: self.text.focus_set())
+        self.text.bind('<MouseWheel>', self.scroll_file_wheel)
+        self.text.bind('<Button-4>', self.scroll_file_wheel)
+        self.text.bind('<Button-5>', self.scroll_file_wheel)
+        self.text.bind('<Prior>', lambda event: self.scroll_file('scroll', -1, 'pages'))
+        self.text.bind('<Next>', lambda event: self.scroll_file('scroll', 1, 'pages'))
+        self.text.bind('<Up>', lambda event: self.scroll_file('scroll', -1, 'units'))
+        self.text.bind('<Down>', lambda event: self.scroll_file('scroll', 1, 'units'))
+        self.text.bind('<Control-Home>', lambda event: self.scroll_file('moveto', 0))
+        self.text.bind('<Control-End>', lambda event: self.scroll_file('moveto', 1))
 
         # link a handler to interactions between the application and the window manager
         self.protocol('WM_DELETE_WINDOW', self.close)
@@ -657,75 +1393,394 @@ class DialogViewer(tkinter.Toplevel):
 
     def open_file(self):
         '''
-        Open a config file in "DialogViewer".
+        Open the file in "DialogViewer" and start building its line index.
         '''
 
         # set cursor to show busy status
         self.config(cursor='watch')
         self.update()
-        self.text.config(cursor='watch')
-        self.text.update()
 
-        # initialize the control variable
-        OK = True
+        # open the local file or the cluster file
+        (OK, error_list, self.source) = xviewer.open_file_source(self.file_path, self.cluster_name)
+        if not OK:
+            message = ''
+            for error in error_list:
+                message = '{0}{1}\n'.format(message, error) 
+            tkinter.messagebox.showerror('{0} - Open'.format(xlib.get_project_name()), message)
+
+        # start building the line index and show the lines in view
+        if OK:
+            self.line_index = xviewer.LineIndex(self.source)
+            self.show_lines()
+
+        # set cursor to show normal status
+        self.config(cursor='')
+        self.update()
 
-        # when the file is in the local computer
-        if self.cluster_name == None:
+    #---------------
 
-            local_file_path = self.file_path
+    def close_file(self):
+        '''
+        Stop the line index and the search and close the file.
+        '''
+
+        self.stop_search()
+        if self.line_index is not None:
+            self.line_index.stop()
+            self.line_index = None
+        if self.fasta_reader is not None:
+            try:
+                self.fasta_reader.close()
+            except Exception:
+                pass
+            self.fasta_reader = None
+        if self.source is not None:
+            try:
+                self.source.close()
+            except Exception:
+                pass
+            self.source = None
+
+    #---------------
+
+    def refresh(self):
+        '''
+        Open the file again keeping the lines in view, e.g. when a log has grown,
+        and repeat the search.
+        '''
+
+        self.close_file()
+        self.open_file()
+        if self.source is not None and self.search_regex is not None:
+            self.search()
+
+    #---------------
+
+    def show_lines(self, current_offset=None):
+        '''
+        Insert in the Text widget only the lines in view, highlight the search
+        matches and the current line, and update the vertical scrollbar.
+        '''
+
+        if self.source is None:
+            return
+
+        # keep the last page full
+        last_top_offset = xviewer.find_previous_line_offset(self.source, self.source.size, self.visible_line_count)
+        if self.top_offset > last_top_offset:
+            self.top_offset = last_top_offset
+
+        # replace the lines of the Text widget
+        (line_list, self.bottom_offset) = xviewer.read_lines(self.source, self.top_offset, self.visible_line_count, self.MAX_LINE_LENGTH)
+        self.text.configure(state='normal')
+        self.text.delete('1.0', 'end')
+        self.text.insert('1.0', '\n'.join(line_list))
+
+        # highlight the search matches
+        if self.search_regex is not None:
+            for i, line in enumerate(line_list):
+                for (start, end) in xviewer.get_match_span_list(self.search_regex, line):
+                    self.text.tag_add('match', '{0}.{1}'.format(i + 1, start), '{0}.{1}'.format(i + 1, end))
+
+        # highlight the current line
+        if current_offset is not None:
+            line_number = self.source.read(self.top_offset, max(0, current_offset - self.top_offset)).count(b'\n') + 1
+            self.text.tag_add('current', '{0}.0'.format(line_number), '{0}.0'.format(line_number + 1))
+        self.text.configure(state='disabled')
 
-        # when the file is in a cluster
+        # update the vertical scrollbar and the status
+        if self.source.size == 0:
+            self.scrollbar_y.set(0, 1)
         else:
+            self.scrollbar_y.set(self.top_offset / self.source.size, self.bottom_offset / self.source.size)
+        self.update_status()
 
-            # create the SSH transport connection
-            if OK:
-                (OK, error_list, ssh_transport) = xssh.create_ssh_transport_connection(self.cluster_name, 'master')
-                if not OK:
-                    message = ''
-                    for error in error_list:
-                        message = '{0}{1}\n'.format(message, error) 
-                    tkinter.messagebox.showerror(self.title(), message)
-
-            # create the SFTP client 
-            if OK:
-                sftp_client = xssh.create_sftp_client(ssh_transport)
-
-            # create the local path
-            if not os.path.exists(xlib.get_temp_dir()):
-                os.makedirs(xlib.get_temp_dir())
-
-            # get the log file name and build local and cluster paths
-            if OK:
-                local_file_path = '{0}/{1}'.format(xlib.get_temp_dir(), os.path.basename(self.file_path))
-
-            # download the log file from the cluster
-            if OK:
-                OK = xssh.get_file(sftp_client, self.file_path, local_file_path)
-                if not OK:
-                    message = 'The log file {0} could not be downloaded.'.format(self.file_path)
-                    tkinter.messagebox.showerror(self.title(), message)
+    #---------------
 
-            # close the SSH transport connection
-            xssh.close_ssh_transport_connection(ssh_transport)
+    def update_status(self):
+        '''
+        Update the status with the line in view, the index progress and the
+        search matches.
+        '''
 
+        if self.source is None or self.line_index is None:
+            self.label_status['text'] = ''
+            return
 
-        # load the file content in "text"
-        if OK:
-            self.text.configure(state='normal')
-            self.text.delete('1.0', 'end')
-            try:
-                with open(local_file_path) as local_file_id:
-                    self.text.insert('1.0', local_file_id.read())
-            except:
-                tkinter.messagebox.showerror('{0} - Open'.format(xlib.get_project_name()), 'The file {0} can not be opened.'.format(local_file_path))
+        # get the line in view and the index progress
+        line_number = self.line_index.get_line_number(self.top_offset)
+        if self.line_index.is_done:
+            status = 'Line {0} of {1}'.format(line_number, self.line_index.line_count)
+        else:
+            indexed_percentage = 100 * self.line_index.indexed_size // max(1, self.source.size)
+            status = 'Line {0} - indexing {1}% ({2} lines)'.format('?' if line_number is None else line_number, indexed_percentage, self.line_index.line_count)
+
+        # get the search matches
+        if self.search_regex is not None:
+            status = '{0} - {1} matches{2}'.format(status, len(self.match_offset_list), '' if self.is_search_done else ' (searching)')
+
+        self.label_status['text'] = status
+
+    #---------------
+
+    def resize_text(self, event=None):
+        '''
+        Compute the lines that fit in the Text widget when it is resized.
+        '''
+
+        line_height = max(1, tkinter.font.Font(root=self.text, font=self.text.cget('font')).metrics('linespace'))
+        visible_line_count = max(1, (self.text.winfo_height() - self.scrollbar_x.winfo_height()) // line_height)
+        if visible_line_count != self.visible_line_count:
+            self.visible_line_count = visible_line_count
+            self.show_lines()
+
+    #---------------
+
+    def scroll_file(self, *args):
+        '''
+        Scroll the lines in view from the vertical scrollbar or the keyboard.
+        '''
+
+        if self.source is None:
+            return 'break'
+
+        if args[0] == 'moveto':
+            offset = min(self.source.size, max(0, int(float(args[1]) * self.source.size)))
+            self.top_offset = xviewer.find_line_start(self.source, offset)
+        elif args[0] == 'scroll':
+            line_count = int(args[1]) * (self.visible_line_count if args[2] == 'pages' else 1)
+            if line_count > 0:
+                self.top_offset = xviewer.skip_lines(self.source, self.top_offset, line_count)
             else:
-                self.text.configure(state='disable')
+                self.top_offset = xviewer.find_previous_line_offset(self.source, self.top_offset, -line_count)
+        self.show_lines()
+
+        # avoid the default handling of the key
+        return 'break'
+
+    #---------------
+
+    def scroll_file_wheel(self, event):
+        '''
+        Scroll the lines in view with the mouse wheel.
+        '''
+
+        if event.num == 4 or event.delta > 0:
+            return self.scroll_file('scroll', -3, 'units')
+        else:
+            return self.scroll_file('scroll', 3, 'units')
+
+    #---------------
+
+    def go_to_line(self, event=None):
+        '''
+        Show the line typed in "entry_line".
+        '''
+
+        if self.source is None:
+            return
+
+        # get the line number
+        try:
+            line_number = int(self.wrapper_line.get().strip())
+        except ValueError:
+            tkinter.messagebox.showerror('{0} - Go to line'.format(xlib.get_project_name()), 'The line has to be a positive integer.')
+            return
+        if line_number < 1:
+            tkinter.messagebox.showerror('{0} - Go to line'.format(xlib.get_project_name()), 'The line has to be a positive integer.')
+            return
+
+        # get its offset, the last line when it is greater than the line count
+        offset = self.line_index.get_line_offset(line_number)
+        if offset is None:
+            tkinter.messagebox.showwarning('{0} - Go to line'.format(xlib.get_project_name()), 'The line {0} has not been indexed yet ({1} lines indexed).'.format(line_number, self.line_index.line_count))
+            return
+
+        # show the line
+        self.show_offset(offset)
+
+    #---------------
+
+    def show_offset(self, offset):
+        '''
+        Show the line starting at an offset highlighting it.
+        '''
+
+        self.top_offset = xviewer.find_previous_line_offset(self.source, offset, self.visible_line_count // 3)
+        self.show_lines(current_offset=offset)
+
+    #---------------
+
+    def search(self, event=None):
+        '''
+        Start the search of the regular expression typed in "entry_search".
+        '''
+
+        if self.source is None:
+            return
+
+        # stop the previous search and clear its matches
+        self.stop_search()
+        self.match_offset_list = []
+        self.listbox_match.delete(0, 'end')
+
+        # compile the regular expression
+        pattern = self.wrapper_search.get()
+        if pattern == '':
+            self.search_regex = None
+            self.show_lines()
+            return
+        try:
+            self.search_regex = xviewer.compile_search_pattern(pattern)
+        except re.error as e:
+            self.search_regex = None
+            tkinter.messagebox.showerror('{0} - Search'.format(xlib.get_project_name()), 'The regular expression is wrong: {0}.'.format(e))
+            self.show_lines()
+            return
+
+        # start the search thread
+        self.search_stop_event = threading.Event()
+        self.search_queue = queue.Queue()
+        self.is_search_done = False
+        self.search_thread = threading.Thread(target=self.run_search, args=(self.source, self.search_regex, self.search_queue, self.search_stop_event), daemon=True)
+        self.search_thread.start()
+        self.show_lines()
+
+    #---------------
+
+    def run_search(self, source, regex, search_queue, stop_event):
+        '''
+        Search a regular expression in the file putting the matches in the queue
+        and None at the end.
+        '''
+
+        try:
+            xviewer.search_file(source, regex, lambda line_number, offset, text: search_queue.put((line_number, offset, text)), stop_event)
+        except Exception:
+            pass
+        search_queue.put(None)
+
+    #---------------
+
+    def fetch_region(self, event=None):
+        '''
+        Request to the background loader the sequence of the region typed in
+        "entry_region" in samtools notation: name, name:start or name:start-end.
+        '''
+
+        region = self.wrapper_region.get().strip()
+        if region == '':
+            return
+
+        # set cursor to show busy status while the region is fetched
+        self.config(cursor='watch')
+
+        # fetch the region in the thread pool of the loader; the index is built the first time
+        key = ('fasta_region', self.cluster_name, self.file_path, region)
+        gloader.request(self, 'region', key, self.get_region_sequence, lambda sequence: self.show_region_sequence(region, sequence), args=(region,), ttl=0, error_callback=self.show_region_error)
+
+    #---------------
+
+    def get_region_sequence(self, region):
+        '''
+        Get the sequence of a region opening the FASTA reader when it is not open.
+        It runs in the thread pool of the loader.
+        '''
+
+        with self.fasta_reader_lock:
+            if self.fasta_reader is None:
+                (OK, error_list, self.fasta_reader) = xfasta.open_fasta_reader(self.file_path, self.cluster_name)
+                if not OK:
+                    raise IOError(' '.join([error.strip() for error in error_list]))
+            sequence = self.fasta_reader.fetch_region(region)
+        if sequence is None:
+            raise ValueError('the sequence of {0} is not in the file'.format(region))
+        return sequence
+
+    #---------------
+
+    def show_region_sequence(self, region, sequence):
+        '''
+        Show the sequence of a region in FASTA format in a new window.
+        '''
 
         # set cursor to show normal status
         self.config(cursor='')
-        self.update()
-        self.text.config(cursor='')
-        self.text.update()
+
+        # create the window with the sequence in lines of 60 bases
+        toplevel = tkinter.Toplevel(self)
+        toplevel.title('{0} - Region - {1}'.format(xlib.get_project_name(), region))
+        toplevel.transient(self)
+        text = tkinter.Text(toplevel, wrap='none')
+        scrollbar_y = tkinter.Scrollbar(toplevel, orient='vertical', command=text.yview)
+        scrollbar_y.pack(side='right', fill='y')
+        text.configure(yscrollcommand=scrollbar_y.set)
+        text.pack(expand='yes', fill='both')
+        text.insert('end', '>{0} ({1} bases)\n'.format(region, len(sequence)))
+        text.insert('end', '\n'.join([sequence[i:i + 60] for i in range(0, len(sequence), 60)]))
+        text.configure(state='disabled')
+
+    #---------------
+
+    def show_region_error(self, exception):
+        '''
+        Show the error raised fetching a region.
+        '''
+
+        self.config(cursor='')
+        tkinter.messagebox.showerror('{0} - Region'.format(xlib.get_project_name()), 'The region can not be fetched: {0}.'.format(exception))
+
+    #---------------
+
+    def stop_search(self):
+        '''
+        Stop the running search.
+        '''
+
+        self.search_stop_event.set()
+        if self.search_thread is not None:
+            self.search_thread.join(timeout=5)
+            self.search_thread = None
+        self.is_search_done = True
+
+    #---------------
+
+    def pump(self):
+        '''
+        Add the search matches found since the last call to "listbox_match" and
+        update the status while the window exists.
+        '''
+
+        # drain the queue of the search matches
+        match_list = []
+        while True:
+            try:
+                match = self.search_queue.get_nowait()
+            except queue.Empty:
+                break
+            if match is None:
+                self.is_search_done = True
+                self.search_thread = None
+            else:
+                match_list.append(match)
+        if match_list != []:
+            self.listbox_match.insert('end', *['{0}: {1}'.format(line_number, text) for (line_number, offset, text) in match_list])
+            self.match_offset_list.extend([offset for (line_number, offset, text) in match_list])
+
+        # update the status and pump again
+        self.update_status()
+        self.pump_after_id = self.after(self.PUMP_INTERVAL, self.pump)
+
+    #---------------
+
+    def select_match(self, event=None):
+        '''
+        Show the line of the selected search match.
+        '''
+
+        selection = self.listbox_match.curselection()
+        if selection != () and self.source is not None:
+            self.show_offset(self.match_offset_list[selection[0]])
 
     #---------------
 
@@ -734,11 +1789,18 @@ class DialogViewer(tkinter.Toplevel):
         Close "DialogViewer".
         '''
 
+        # stop the updates, the line index and the search and close the file
+        if self.pump_after_id is not None:
+            self.after_cancel(self.pump_after_id)
+            self.pump_after_id = None
+        self.close_file()
+
         # deletes all widgets and terminate the mainloop
         self.destroy()
 
     #---------------
 
+
 #-------------------------------------------------------------------------------
 
 class DialogEditor(tkinter.Toplevel):
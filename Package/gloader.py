@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#-------------------------------------------------------------------------------
+
+'''
+This software has been developed by:
+
+    GI Genética, Fisiología e Historia Forestal
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politécnica de Madrid
+    http://gfhforestal.com/
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+'''
+This file contains the functions of the background loader of the data of the
+form inputs in gui mode.
+
+A form requests the data of an input with a key and the function that gets it.
+The function runs in a thread pool while the input shows a placeholder, and the
+result is delivered to the form in the Tk thread. The results are kept for a
+while in a cache shared by every form, and the requests of the same key running
+at the same time share one execution. A new request of an input makes its
+previous request outdated, so its result is discarded.
+'''
+
+#-------------------------------------------------------------------------------
+
+import concurrent.futures
+import queue
+import sys
+import threading
+import time
+import tkinter
+import tkinter.messagebox
+
+import xec2
+import xlib
+import xssh
+
+#-------------------------------------------------------------------------------
+
+MAX_WORKERS = 4         # threads of the pool
+PUMP_INTERVAL = 50      # milliseconds between the deliveries of the results
+CACHE_TTL = 30          # seconds a result is kept in the cache by default
+
+#-------------------------------------------------------------------------------
+
+# thread pool where the functions run
+executor = None
+
+# results kept in the cache with their expiration time, futures running and requests waiting for each key
+cache_lock = threading.Lock()
+result_cache_dict = {}
+future_dict = {}
+waiter_count_dict = {}
+
+# last request of every input (number, key and future) and queue of the finished requests to be delivered in the Tk thread
+request_dict = {}
+delivery_queue = queue.Queue()
+
+# widget where the deliveries are scheduled
+pump_widget = None
+
+#-------------------------------------------------------------------------------
+
+def get_executor():
+    '''
+    Get the thread pool creating it if necessary.
+    '''
+
+    global executor
+
+    if executor is None:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    return executor
+
+#-------------------------------------------------------------------------------
+
+def start_pump(widget):
+    '''
+    Start delivering the results of the finished requests in the Tk thread with
+    the after method of a widget which lasts as long as the application, e.g.
+    the main window.
+    '''
+
+    global pump_widget
+
+    if pump_widget is None:
+        pump_widget = widget
+        pump_widget.after(PUMP_INTERVAL, pump)
+
+#-------------------------------------------------------------------------------
+
+def stop():
+    '''
+    Stop the deliveries and the thread pool without waiting for the running
+    functions.
+    '''
+
+    global executor
+    global pump_widget
+
+    pump_widget = None
+    if executor is not None:
+        executor.shutdown(wait=False)
+        executor = None
+
+#-------------------------------------------------------------------------------
+
+def pump():
+    '''
+    Deliver the results of the finished requests which are not outdated and
+    whose widget still exists.
+    '''
+
+    # deliver the finished requests; the discarded results are released when they hold resources
+    while True:
+        try:
+            (widget, input_name, request_number, future, callback, error_callback, release_callback) = delivery_queue.get_nowait()
+        except queue.Empty:
+            break
+        if future.cancelled():
+            continue
+        request_key = (str(widget), input_name)
+        if request_dict.get(request_key, (None, None, None))[0] != request_number:
+            release(future, release_callback)
+            continue
+        del request_dict[request_key]
+        try:
+            if not widget.winfo_exists():
+                release(future, release_callback)
+                continue
+        except tkinter.TclError:
+            release(future, release_callback)
+            continue
+        exception = future.exception()
+        try:
+            if exception is None:
+                callback(future.result())
+            elif error_callback is not None:
+                error_callback(exception)
+        except tkinter.TclError:
+            pass
+
+    # schedule the next delivery
+    if pump_widget is not None:
+        pump_widget.after(PUMP_INTERVAL, pump)
+
+#-------------------------------------------------------------------------------
+
+def release(future, release_callback):
+    '''
+    Release the resources of the result of a finished request which is discarded.
+    '''
+
+    if release_callback is not None and future.exception() is None:
+        try:
+            release_callback(future.result())
+        except Exception:
+            pass
+
+#-------------------------------------------------------------------------------
+
+def submit(key, function, args=(), kwargs={}, ttl=CACHE_TTL):
+    '''
+    Get the future of the result of a key: a finished future when the result is
+    in the cache, the future of the request of the key running or the future of
+    a new execution of the function in the thread pool.
+    '''
+
+    with cache_lock:
+
+        # get the result from the cache
+        cached_result = result_cache_dict.get(key)
+        if cached_result is not None and cached_result[0] > time.time():
+            future = concurrent.futures.Future()
+            future.set_result(cached_result[1])
+            return future
+
+        # get the running future or run the function
+        future = future_dict.get(key)
+        if future is None or future.cancelled():
+            future = get_executor().submit(run, key, function, args, kwargs, ttl)
+            future_dict[key] = future
+            waiter_count_dict[key] = 0
+        waiter_count_dict[key] += 1
+
+    return future
+
+#-------------------------------------------------------------------------------
+
+def run(key, function, args, kwargs, ttl):
+    '''
+    Run the function of a key in a thread of the pool and keep its result in
+    the cache.
+    '''
+
+    try:
+        result = function(*args, **kwargs)
+    except Exception:
+        with cache_lock:
+            future_dict.pop(key, None)
+            waiter_count_dict.pop(key, None)
+        raise
+    with cache_lock:
+        if ttl > 0:
+            result_cache_dict[key] = (time.time() + ttl, result)
+        future_dict.pop(key, None)
+        waiter_count_dict.pop(key, None)
+    return result
+
+#-------------------------------------------------------------------------------
+
+def request(widget, input_name, key, function, callback, args=(), kwargs={}, ttl=CACHE_TTL, error_callback=None, release_callback=None):
+    '''
+    Request the result of a key for an input of a widget. The callback is called
+    with the result in the Tk thread unless another request of the same input is
+    done before or the widget is destroyed; then the release callback, if any,
+    is called with the result instead.
+    '''
+
+    # start the deliveries when no widget has started them yet
+    if pump_widget is None:
+        start_pump(widget.winfo_toplevel())
+
+    # make outdated the previous request of the input
+    cancel(widget, input_name)
+
+    # submit the new request
+    request_key = (str(widget), input_name)
+    request_number = request_dict.get(request_key, (0, None, None))[0] + 1
+    future = submit(key, function, args, kwargs, ttl)
+    request_dict[request_key] = (request_number, key, future)
+    future.add_done_callback(lambda future: delivery_queue.put((widget, input_name, request_number, future, callback, error_callback, release_callback)))
+
+#-------------------------------------------------------------------------------
+
+def cancel(widget, input_name):
+    '''
+    Make outdated the request of an input of a widget. The execution of its key
+    is cancelled when it has not started yet and no other request waits for it.
+    '''
+
+    # make the request outdated
+    request_key = (str(widget), input_name)
+    if request_key not in request_dict:
+        return
+    (request_number, key, future) = request_dict[request_key]
+    request_dict[request_key] = (request_number + 1, None, None)
+
+    # cancel the execution when nobody else waits for it
+    with cache_lock:
+        if future is not None and future_dict.get(key) is future:
+            waiter_count_dict[key] -= 1
+            if waiter_count_dict[key] == 0 and future.cancel():
+                del future_dict[key]
+                del waiter_count_dict[key]
+
+#-------------------------------------------------------------------------------
+
+def populate_combobox(widget, combobox, key, function, callback, args=(), kwargs={}, ttl=CACHE_TTL):
+    '''
+    Request the values of a combobox of a widget. The combobox is cleared and
+    disabled until the result is got; then it is enabled again and the callback
+    is called with the result to load them.
+    '''
+
+    # show the combobox empty and disabled while the values are got
+    if str(combobox['state']) != 'disabled':
+        combobox.state_before_loading = str(combobox['state'])
+    combobox['values'] = []
+    combobox['state'] = 'disabled'
+
+    # enable the combobox and load the values
+    def load_values(result):
+        combobox['state'] = getattr(combobox, 'state_before_loading', 'readonly')
+        callback(result)
+
+    # show the error
+    def show_error(exception):
+        combobox['state'] = getattr(combobox, 'state_before_loading', 'readonly')
+        tkinter.messagebox.showerror(xlib.get_project_name(), 'The data can not be got: {0}'.format(exception))
+
+    # request the values
+    request(widget, str(combobox), key, function, load_values, args, kwargs, ttl, show_error)
+
+#-------------------------------------------------------------------------------
+
+def populate_combobox_running_cluster_name(form, combobox):
+    '''
+    Request the names of the running clusters and load them in a combobox of a
+    form, or warn when there is not any running cluster.
+    '''
+
+    def load_values(running_cluster_list):
+        if running_cluster_list == []:
+            message = 'There is not any running cluster.'
+            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), form.head), message)
+            return
+        combobox['values'] = running_cluster_list
+
+    populate_combobox(form, combobox, ('running_cluster_list',), xec2.get_running_cluster_list, load_values, kwargs={'volume_creator_included': False})
+
+#-------------------------------------------------------------------------------
+
+def connect_cluster(form, callback=None):
+    '''
+    Create in the thread pool the SSH client connection of a form with the master
+    node of the cluster selected in its "wrapper_cluster_name", closing the
+    previous one, and call the callback once it is saved. The connection is kept
+    in "ssh_client" and its cluster in "cluster_name_ant" of the form, which
+    closes it; when it can not be created, the errors are shown and the form is
+    closed. The button "button_execute" of the form is disabled until the
+    connection is got.
+    '''
+
+    # get the cluster name
+    cluster_name = form.wrapper_cluster_name.get()
+
+    # load the inputs when the form is already connected to the cluster
+    if cluster_name == form.cluster_name_ant:
+        if callback is not None:
+            callback()
+        return
+
+    # close the SSH client connection of the previous cluster
+    if form.cluster_name_ant is not None:
+        xssh.close_ssh_client_connection(form.ssh_client)
+        form.ssh_client = None
+        form.cluster_name_ant = None
+
+    # save the connection and load the inputs, or show the errors and close the form
+    def save_connection(result):
+        form.main.config(cursor='')
+        (OK, error_list, ssh_client) = result
+        if not OK:
+            message = ''
+            for error in error_list:
+                message = '{0}{1}\n'.format(message, error)
+            tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), form.head), message)
+            form.close()
+            return
+        form.ssh_client = ssh_client
+        form.cluster_name_ant = cluster_name
+        if callback is not None:
+            callback()
+        form.validate_inputs()
+
+    # show the error
+    def show_error(exception):
+        form.main.config(cursor='')
+        tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), form.head), 'The cluster {0} can not be connected: {1}'.format(cluster_name, exception))
+
+    # close the connection when the form is closed or another cluster is selected before it is got
+    def close_connection(result):
+        if (str(form), 'ssh_client') not in request_dict:
+            form.main.config(cursor='')
+        (OK, error_list, ssh_client) = result
+        if OK:
+            xssh.close_ssh_client_connection(ssh_client)
+
+    # request the connection showing the busy status until it is got; it is not kept in the cache
+    form.main.config(cursor='watch')
+    form.button_execute['state'] = 'disabled'
+    request(form, 'ssh_client', ('ssh_client', str(form), cluster_name), xssh.create_ssh_client_connection, save_connection, args=(cluster_name, 'master'), ttl=0, error_callback=show_error, release_callback=close_connection)
+
+#-------------------------------------------------------------------------------
+
+def get_cluster_subdir_list(cluster_name, cluster_dir):
+    '''
+    Get the sorted names of the subdirectories of a cluster directory, except
+    "lost+found", through the pooled SFTP session of the cluster.
+    '''
+
+    (OK, error_list, entry_list) = xssh.list_cluster_dir_sftp(cluster_name, cluster_dir)
+    if not OK:
+        raise IOError(' '.join([error.strip() for error in error_list]))
+    return sorted([entry['name'] for entry in entry_list if entry['type'] == 'd' and entry['name'] != 'lost+found'])
+
+#-------------------------------------------------------------------------------
+
+def invalidate(key_prefix=()):
+    '''
+    Remove from the cache the results whose key starts with a prefix, all of
+    them when the prefix is empty.
+    '''
+
+    with cache_lock:
+        for key in list(result_cache_dict.keys()):
+            if key[:len(key_prefix)] == key_prefix:
+                del result_cache_dict[key]
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+     print('This file contains the functions of the background loader of the data of the form inputs in gui mode.')
+     sys.exit(0)
+
+#-------------------------------------------------------------------------------
@@ -24,7 +24,6 @@ This file contains the classes related to log forms in gui mode.
 
 #-------------------------------------------------------------------------------
 
-import os
 import PIL.Image
 import PIL.ImageTk
 import re
@@ -32,13 +31,14 @@ import sys
 import threading
 import tkinter
 import tkinter.ttk
-import subprocess
 
 import gdialogs
+import gloader
 import xconfiguration
-import xec2
 import xgzip
 import xlib
+import xlogcatalog
+import xmetrics
 import xread
 import xreference
 import xresult
@@ -72,6 +72,7 @@ class FormViewSubmissionLogs(tkinter.Frame):
         # create the wrappers to track changes in the inputs
         self.wrapper_local_process_text = tkinter.StringVar()
         self.wrapper_local_process_text.trace('w', self.validate_inputs)
+        self.wrapper_search_text = tkinter.StringVar()
 
         # build the graphical user interface
         self.build_gui()
@@ -104,6 +105,14 @@ class FormViewSubmissionLogs(tkinter.Frame):
         self.combobox_local_process_text = tkinter.ttk.Combobox(self, width=40, height=4, state='readonly', textvariable=self.wrapper_local_process_text)
         self.combobox_local_process_text.grid(row=0, column=1, padx=(5,5), pady=(75,5), sticky='w')
 
+        # create "label_search_text" and register it with the grid geometry manager
+        self.label_search_text = tkinter.Label(self, text='Text in the log')
+        self.label_search_text.grid(row=1, column=0, padx=(15,5), pady=(45,5), sticky='e')
+
+        # create "entry_search_text" and register it with the grid geometry manager
+        self.entry_search_text = tkinter.Entry(self, width=43, textvariable=self.wrapper_search_text)
+        self.entry_search_text.grid(row=1, column=1, padx=(5,5), pady=(45,5), sticky='w')
+
         # create "label_fit" and register it with the grid geometry manager
         self.label_fit = tkinter.Label(self, text=' '*20)
         self.label_fit.grid(row=2, column=2, padx=(0,0), pady=(25,5), sticky='e')
@@ -145,35 +154,27 @@ class FormViewSubmissionLogs(tkinter.Frame):
         # get the local process dictionary
         local_process_dict = xlib.get_local_process_dict()
 
+        # synchronize the log catalog with the log directory and get the logs of the process containing the search text
+        if OK:
+            (OK, error_list, indexed_count) = xlogcatalog.sync_log_catalog()
+            if OK:
+                process_id = 'all' if self.wrapper_local_process_text.get() == ' all' else self.local_process_id
+                (OK, error_list, record_list) = xlogcatalog.get_log_record_list(process_id, self.wrapper_search_text.get())
+            if not OK:
+                message = ''
+                for error in error_list:
+                    message = '{0}{1}\n'.format(message, error) 
+                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+
         # build the log dictionary
         if OK:
             log_dict = {}
-            if self.wrapper_local_process_text.get() == ' all':
-                command = xlib.list_log_files_command('all')
-            else:
-                command = xlib.list_log_files_command(self.local_process_id)
-            output = subprocess.run(command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
-            for line in output.stdout.split('\n'):
-                if line != '':
-                    line = os.path.basename(line)
-                    run_id = line
-                    try:
-                        pattern = r'^(.+)\-(.+)\-(.+)\-(.+).txt$'
-                        mo = re.search(pattern, line)
-                        environment = mo.group(1)
-                        local_process_id = mo.group(2).strip()
-                        yymmdd = mo.group(3)
-                        hhmmss = mo.group(4)
-                        process_text = local_process_dict[local_process_id]['text']
-                        date = '20{0}-{1}-{2}'.format(yymmdd[:2], yymmdd[2:4], yymmdd[4:])
-                        time = '{0}:{1}:{2}'.format(hhmmss[:2], hhmmss[2:4], hhmmss[4:])
-                    except:
-                        process_text = 'unknown process'
-                        date = '0000-00-00'
-                        time = '00:00:00'
-                    log_dict[run_id] = {'run_id': run_id, 'process_text': process_text, 'date': date, 'time': time}
+            for record in record_list:
+                process_text = local_process_dict.get(record['process_id'], {'text': 'unknown process'})['text']
+                (date, time) = record['start_datetime'].split(' ')
+                log_dict[record['run_id']] = {'run_id': record['run_id'], 'process_text': process_text, 'date': date, 'time': time, 'cluster_name': record['cluster_name'] or '', 'outcome': record['outcome']}
 
-        # verify if there are any nodes running
+        # verify if there are any logs
         if OK:
             if log_dict == {}:
                 message = 'There is not any local process log.'
@@ -182,7 +183,7 @@ class FormViewSubmissionLogs(tkinter.Frame):
 
         # build the data list
         if OK:
-            data_list = ['run_id', 'process_text', 'date', 'time']
+            data_list = ['run_id', 'process_text', 'date', 'time', 'cluster_name', 'outcome']
 
         # build the data dictionary
         if OK:
@@ -191,10 +192,12 @@ class FormViewSubmissionLogs(tkinter.Frame):
             data_dict['process_text'] = {'text': 'Process', 'width': 300, 'aligment': 'left'}
             data_dict['date'] = {'text': 'Date', 'width': 80, 'aligment': 'right'}
             data_dict['time'] = {'text': 'Time', 'width': 80, 'aligment': 'right'}
+            data_dict['cluster_name'] = {'text': 'Cluster', 'width': 140, 'aligment': 'left'}
+            data_dict['outcome'] = {'text': 'Outcome', 'width': 80, 'aligment': 'left'}
 
         # create the dialog Table to list the local process logs
         if OK:
-            dialog_table = gdialogs.DialogTable(self, 'Local process log', 400, 900, data_list, data_dict, log_dict, 'view_submission_logs')
+            dialog_table = gdialogs.DialogTable(self, 'Local process log', 400, 1120, data_list, data_dict, log_dict, 'view_submission_logs')
             self.wait_window(dialog_table)
 
         # close the form
@@ -364,35 +367,12 @@ class FormViewResultLogs(tkinter.Frame):
         Process the event when an item of "combobox_cluster_name" has been selected
         '''
 
-        # set cursor to show busy status
-        self.main.config(cursor='watch')
-        self.main.update()
-
-        # verify if the cluster name selected is different to the previous cluster name
+        # load data in "combobox_experiment_id" when the cluster name selected is different to the previous cluster name
         if self.wrapper_cluster_name.get() != self.cluster_name_ant:
+            self.populate_combobox_experiment_id()
 
-            # close SSH client connection
-            if self.cluster_name_ant is not None:
-                xssh.close_ssh_client_connection(self.ssh_client)
-
-            # create the SSH client connection
-            (OK, error_list, self.ssh_client) = xssh.create_ssh_client_connection(self.wrapper_cluster_name.get(), 'master')
-            if not OK:
-                message = ''
-                for error in error_list:
-                    message = '{0}{1}\n'.format(message, error) 
-                tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-                self.close()
-
-            # save current cluster name as previous cluster name
-            self.cluster_name_ant = self.wrapper_cluster_name.get()
-
-        # load data in "combobox_experiment_id"
-        self.populate_combobox_experiment_id()
-
-        # set cursor to show normal status
-        self.main.config(cursor='')
-        self.main.update()
+        # save current cluster name as previous cluster name
+        self.cluster_name_ant = self.wrapper_cluster_name.get()
 
     #---------------
 
@@ -416,92 +396,32 @@ class FormViewResultLogs(tkinter.Frame):
             message = 'Some input values are not OK.'
             tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
 
-        # get the run dictionary of the experiment
+        # get the run dictionary of the experiment with their metrics in the background and then show it
         if OK:
-            # -- command = 'ls {0}/{1}'.format(xlib.get_cluster_result_dir(), self.wrapper_experiment_id.get())
-            command = 'cd  {0}/{1}; for list in `ls`; do ls -ld $list | grep -v ^- > /dev/null && echo $list; done;'.format(xlib.get_cluster_result_dir(), self.wrapper_experiment_id.get())
-            (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-            if OK:
-                result_dataset_dict = {}
-                for line in stdout:
-                    line = line.rstrip('\n')
-                    if line != 'lost+found':
-                        result_dataset_id = line
-                        try:
-                            pattern = r'^(.+)\-(.+)\-(.+)$'
-                            mo = re.search(pattern, result_dataset_id)
-                            bioinfo_app_code = mo.group(1).strip()
-                            yymmdd = mo.group(2)
-                            hhmmss = mo.group(3)
-                            date = '20{0}-{1}-{2}'.format(yymmdd[:2], yymmdd[2:4], yymmdd[4:])
-                            time = '{0}:{1}:{2}'.format(hhmmss[:2], hhmmss[2:4], hhmmss[4:])
-                        except:
-                            bioinfo_app_code = 'xxx'
-                            date = '0000-00-00'
-                            time = '00:00:00'
-                        if result_dataset_id.startswith(xlib.get_bedtools_code()+'-'):
-                            bioinfo_app_name = xlib.get_bedtools_name()
-                        elif result_dataset_id.startswith(xlib.get_blastplus_code()+'-'):
-                            bioinfo_app_name = xlib.get_blastplus_name()
-                        elif result_dataset_id.startswith(xlib.get_bowtie2_code()+'-'):
-                            bioinfo_app_name = xlib.get_bowtie2_name()
-                        elif result_dataset_id.startswith(xlib.get_busco_code()+'-'):
-                            bioinfo_app_name = xlib.get_busco_name()
-                        elif result_dataset_id.startswith(xlib.get_cd_hit_code()+'-'):
-                            bioinfo_app_name = xlib.get_cd_hit_name()
-                        elif result_dataset_id.startswith(xlib.get_cd_hit_est_code()+'-'):
-                            bioinfo_app_name = xlib.get_cd_hit_est_name()
-                        elif result_dataset_id.startswith(xlib.get_detonate_code()+'-'):
-                            bioinfo_app_name = xlib.get_detonate_name()
-                        elif result_dataset_id.startswith(xlib.get_emboss_code()+'-'):
-                            bioinfo_app_name = xlib.get_emboss_name()
-                        elif result_dataset_id.startswith(xlib.get_fastqc_code()+'-'):
-                            bioinfo_app_name = xlib.get_fastqc_name()
-                        elif result_dataset_id.startswith(xlib.get_gmap_code()+'-'):
-                            bioinfo_app_name = xlib.get_gmap_name()
-                        elif result_dataset_id.startswith(xlib.get_gmap_gsnap_code()+'-'):
-                            bioinfo_app_name = xlib.get_gmap_gsnap_name()
-                        elif result_dataset_id.startswith(xlib.get_gzip_code()+'-'):
-                            bioinfo_app_name = xlib.get_gzip_name()
-                        elif result_dataset_id.startswith(xlib.get_insilico_read_normalization_code()+'-'):
-                            bioinfo_app_name = xlib.get_insilico_read_normalization_name()
-                        elif result_dataset_id.startswith(xlib.get_miniconda3_code()+'-'):
-                            bioinfo_app_name = xlib.get_miniconda3_name()
-                        elif result_dataset_id.startswith(xlib.get_ngshelper_code()+'-'):
-                            bioinfo_app_name = xlib.get_ngshelper_name()
-                        elif result_dataset_id.startswith(xlib.get_quast_code()+'-'):
-                            bioinfo_app_name = xlib.get_quast_name()
-                        elif result_dataset_id.startswith(xlib.get_r_code()+'-'):
-                            bioinfo_app_name = xlib.get_r_name()
-                        elif result_dataset_id.startswith(xlib.get_ref_eval_code()+'-'):
-                            bioinfo_app_name = xlib.get_ref_eval_name()
-                        elif result_dataset_id.startswith(xlib.get_rnaquast_code()+'-'):
-                            bioinfo_app_name = xlib.get_rnaquast_name()
-                        elif result_dataset_id.startswith(xlib.get_rsem_code()+'-'):
-                            bioinfo_app_name = xlib.get_rsem_name()
-                        elif result_dataset_id.startswith(xlib.get_rsem_eval_code()+'-'):
-                            bioinfo_app_name = xlib.get_rsem_eval_name()
-                        elif result_dataset_id.startswith(xlib.get_samtools_code()+'-'):
-                            bioinfo_app_name = xlib.get_samtools_name()
-                        elif result_dataset_id.startswith(xlib.get_soapdenovotrans_code()+'-'):
-                            bioinfo_app_name = xlib.get_soapdenovotrans_name()
-                        elif result_dataset_id.startswith(xlib.get_star_code()+'-'):
-                            bioinfo_app_name = xlib.get_star_name()
-                        elif result_dataset_id.startswith(xlib.get_transabyss_code()+'-'):
-                            bioinfo_app_name = xlib.get_transabyss_name()
-                        elif result_dataset_id.startswith(xlib.get_transcript_filter_code()+'-'):
-                            bioinfo_app_name = xlib.get_transcript_filter_name()
-                        elif result_dataset_id.startswith(xlib.get_transcriptome_blastx_code()+'-'):
-                            bioinfo_app_name = xlib.get_transcriptome_blastx_name()
-                        elif result_dataset_id.startswith(xlib.get_transrate_code()+'-'):
-                            bioinfo_app_name = xlib.get_transrate_name()
-                        elif result_dataset_id.startswith(xlib.get_trimmomatic_code()+'-'):
-                            bioinfo_app_name = xlib.get_trimmomatic_name()
-                        elif result_dataset_id.startswith(xlib.get_trinity_code()+'-'):
-                            bioinfo_app_name = xlib.get_trinity_name()
-                        else:
-                            bioinfo_app_name = 'xxx'
-                        result_dataset_dict[result_dataset_id] = {'experiment_id': self.wrapper_experiment_id.get(), 'result_dataset_id': result_dataset_id, 'bioinfo_app': bioinfo_app_name, 'date': date, 'time': time}
+            cluster_name = self.wrapper_cluster_name.get()
+            experiment_id = self.wrapper_experiment_id.get()
+            self.main.config(cursor='watch')
+            self.button_execute['state'] = 'disabled'
+            gloader.request(self, 'result_dataset_dict', ('result_dataset_dict', cluster_name, experiment_id), get_result_dataset_dict, self.show_result_dataset_dict, args=(cluster_name, experiment_id), ttl=0, error_callback=self.show_execution_error)
+
+    #---------------
+
+    def show_result_dataset_dict(self, result):
+        '''
+        Show the run dictionary of the experiment got by "execute".
+        '''
+
+        # initialize the control variable and restore the inputs
+        (OK, error_list, result_dataset_dict) = result
+        self.main.config(cursor='')
+        self.validate_inputs()
+
+        # show the errors
+        if not OK:
+            message = ''
+            for error in error_list:
+                message = '{0}{1}\n'.format(message, error) 
+            tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
 
         # verify if there are any nodes running
         if OK:
@@ -511,7 +431,7 @@ class FormViewResultLogs(tkinter.Frame):
 
         # build the data list
         if OK:
-            data_list = ['experiment_id', 'result_dataset_id', 'bioinfo_app', 'date', 'time']
+            data_list = ['experiment_id', 'result_dataset_id', 'bioinfo_app', 'date', 'time', 'wall_time', 'max_rss']
 
         # build the data dictionary
         if OK:
@@ -521,10 +441,12 @@ class FormViewResultLogs(tkinter.Frame):
             data_dict['bioinfo_app'] = {'text': 'Bioinfo app / Utility', 'width': 200, 'aligment': 'left'}
             data_dict['date'] = {'text': 'Date', 'width': 80, 'aligment': 'right'}
             data_dict['time'] = {'text': 'Time', 'width': 80, 'aligment': 'right'}
+            data_dict['wall_time'] = {'text': 'Wall time', 'width': 80, 'aligment': 'right'}
+            data_dict['max_rss'] = {'text': 'Max RSS', 'width': 80, 'aligment': 'right'}
 
         # create the dialog Table to show the nodes running
         if OK:
-            dialog_table = gdialogs.DialogTable(self, 'Experiment runs in {0}/{1}'.format(xlib.get_cluster_result_dir(), self.wrapper_experiment_id.get()), 400, 900, data_list, data_dict, result_dataset_dict, 'view_result_logs', [self.wrapper_cluster_name.get()])
+            dialog_table = gdialogs.DialogTable(self, 'Experiment runs in {0}/{1}'.format(xlib.get_cluster_result_dir(), self.wrapper_experiment_id.get()), 400, 1060, data_list, data_dict, result_dataset_dict, 'view_result_logs', [self.wrapper_cluster_name.get()])
             self.wait_window(dialog_table)
 
         # close the form
@@ -533,15 +455,22 @@ class FormViewResultLogs(tkinter.Frame):
 
     #---------------
 
+    def show_execution_error(self, exception):
+        '''
+        Show the error raised getting the run dictionary of the experiment.
+        '''
+
+        self.main.config(cursor='')
+        self.validate_inputs()
+        tkinter.messagebox.showerror('{0} - {1}'.format(xlib.get_project_name(), self.head), 'The runs can not be got: {0}'.format(exception))
+
+    #---------------
+
     def close(self, event=None):
         '''
         Close "FormViewResultLogs".
         '''
 
-        # close SSH client connection
-        if self.cluster_name_ant is not None:
-            xssh.close_ssh_client_connection(self.ssh_client)
-
         # clear the label of the current process name
         self.main.label_process['text'] = ''
 
@@ -568,15 +497,8 @@ class FormViewResultLogs(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_cluster_name.set('')
 
-        # verify if there are some running clusters
-        running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
-        if running_cluster_list == []:
-            message = 'There is not any running cluster.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
-
-        # load the names of clusters which are running in the combobox
-        self.combobox_cluster_name['values'] = running_cluster_list
+        # request the names of clusters which are running and load them in the combobox when they are got
+        gloader.populate_combobox_running_cluster_name(self, self.combobox_cluster_name)
 
     #---------------
 
@@ -588,26 +510,18 @@ class FormViewResultLogs(tkinter.Frame):
         # clear the value selected in the combobox
         self.wrapper_experiment_id.set('')
 
-        # initialize the experiment identification list
-        experiment_id_list = []
-
-        # get the experiment identifications
-        command = 'ls {0}'.format(xlib.get_cluster_result_dir())
-        (OK, stdout, stderr) = xssh.execute_cluster_command(self.ssh_client, command)
-        if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    experiment_id_list.append(line)
-
-        # verify if there are any experimment identifications
-        if experiment_id_list == []:
-            message = 'The cluster has not experiment data.'
-            tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
-            return
+        # load the experiment identifications in the combobox or warn when there are not any
+        def load_values(experiment_id_list):
+            if experiment_id_list == []:
+                message = 'The cluster has not experiment data.'
+                tkinter.messagebox.showwarning('{0} - {1}'.format(xlib.get_project_name(), self.head), message)
+                return
+            self.combobox_experiment_id['values'] = experiment_id_list
 
-        # load the names of clusters which are running in the combobox
-        self.combobox_experiment_id['values'] = experiment_id_list
+        # request the experiment identifications through the SFTP session of the cluster
+        cluster_name = self.wrapper_cluster_name.get()
+        cluster_dir = xlib.get_cluster_result_dir()
+        gloader.populate_combobox(self, self.combobox_experiment_id, ('cluster_subdir_list', cluster_name, cluster_dir), gloader.get_cluster_subdir_list, load_values, args=(cluster_name, cluster_dir))
 
     #---------------
 
@@ -632,6 +546,65 @@ class FormViewResultLogs(tkinter.Frame):
 
 #-------------------------------------------------------------------------------
 
+def get_result_dataset_dict(cluster_name, experiment_id):
+    '''
+    Get the run dictionary of an experiment in the cluster with their wall time
+    and maximum memory. It creates and closes its own SSH client connection to be
+    executed in the thread pool of the loader.
+    '''
+
+    # initialize the control variable and the error list
+    OK = True
+    error_list = []
+
+    # initialize the run dictionary
+    result_dataset_dict = {}
+
+    # create the SSH client connection
+    (OK, error_list, ssh_client) = xssh.create_ssh_client_connection(cluster_name, 'master')
+
+    # get the run dictionary of the experiment
+    if OK:
+        (OK, error_list, entry_list) = xssh.list_cluster_dir(ssh_client, xlib.get_cluster_experiment_result_dir(experiment_id), entry_type='d')
+        if OK:
+            for entry in entry_list:
+                line = entry['name']
+                if line != 'lost+found':
+                    result_dataset_id = line
+                    try:
+                        pattern = r'^(.+)\-(.+)\-(.+)$'
+                        mo = re.search(pattern, result_dataset_id)
+                        bioinfo_app_code = mo.group(1).strip()
+                        yymmdd = mo.group(2)
+                        hhmmss = mo.group(3)
+                        date = '20{0}-{1}-{2}'.format(yymmdd[:2], yymmdd[2:4], yymmdd[4:])
+                        time = '{0}:{1}:{2}'.format(hhmmss[:2], hhmmss[2:4], hhmmss[4:])
+                    except:
+                        bioinfo_app_code = 'xxx'
+                        date = '0000-00-00'
+                        time = '00:00:00'
+                    (app_data, app_date, app_time) = xlib.parse_dataset_id(result_dataset_id)
+                    bioinfo_app_name = app_data['name'] if app_data is not None else 'xxx'
+                    result_dataset_dict[result_dataset_id] = {'experiment_id': experiment_id, 'result_dataset_id': result_dataset_id, 'bioinfo_app': bioinfo_app_name, 'date': date, 'time': time}
+
+    # add the metrics of the experiment runs
+    if OK:
+        (OK, error_list, record_count) = xmetrics.collect_metrics_files(cluster_name, experiment_id, passed_connection=True, ssh_client=ssh_client)
+        run_metrics_dict = xmetrics.get_run_metrics_dict(experiment_id)
+        for result_dataset_id in result_dataset_dict.keys():
+            run_metrics = run_metrics_dict.get(result_dataset_id, {})
+            result_dataset_dict[result_dataset_id]['wall_time'] = xmetrics.format_wall_time(run_metrics.get('wall_time'))
+            result_dataset_dict[result_dataset_id]['max_rss'] = xmetrics.format_memory(run_metrics.get('max_rss_kb'))
+
+    # close the SSH client connection
+    if ssh_client is not None:
+        xssh.close_ssh_client_connection(ssh_client)
+
+    # return the control variable, the error list and the run dictionary
+    return (OK, error_list, result_dataset_dict)
+
+#-------------------------------------------------------------------------------
+
 if __name__ == '__main__':
     print('This file contains the classes related to log form in gui mode.')
     sys.exit(0)
@@ -28,6 +28,7 @@ the NGScloud software package.
 import os
 import PIL.Image
 import PIL.ImageTk
+import queue
 import tkinter
 import tkinter.messagebox
 import tkinter.ttk
@@ -35,35 +36,40 @@ import sys
 import threading
 import webbrowser
 
-import gbioinfoapp
-import gcloud
-import gdataset
 import gdialogs
-import glog
-import xbusco
-import xcdhit
+import gloader
 import xcluster
 import xconfiguration
 import xdatabase
-import xdetonate
 import xec2
-import xfastqc
-import xgmap
 import xgzip
 import xlib
-import xngshelper
-import xquast
-import xsoapdenovotrans
-import xstar
 import xread
 import xreference
 import xresult
-import xrnaquast
-import xtransabyss
-import xtransrate
-import xtrimmomatic
-import xtrinity
+import xssh
 import xvolume
+import xwatcher
+
+# modules of the menus and applications imported when they are first used
+gbioinfoapp = xlib.import_lazy_module('gbioinfoapp')
+gcloud = xlib.import_lazy_module('gcloud')
+gdataset = xlib.import_lazy_module('gdataset')
+glog = xlib.import_lazy_module('glog')
+xbusco = xlib.import_lazy_module('xbusco')
+xcdhit = xlib.import_lazy_module('xcdhit')
+xdetonate = xlib.import_lazy_module('xdetonate')
+xfastqc = xlib.import_lazy_module('xfastqc')
+xgmap = xlib.import_lazy_module('xgmap')
+xngshelper = xlib.import_lazy_module('xngshelper')
+xquast = xlib.import_lazy_module('xquast')
+xrnaquast = xlib.import_lazy_module('xrnaquast')
+xsoapdenovotrans = xlib.import_lazy_module('xsoapdenovotrans')
+xstar = xlib.import_lazy_module('xstar')
+xtransabyss = xlib.import_lazy_module('xtransabyss')
+xtransrate = xlib.import_lazy_module('xtransrate')
+xtrimmomatic = xlib.import_lazy_module('xtrimmomatic')
+xtrinity = xlib.import_lazy_module('xtrinity')
 
 #-------------------------------------------------------------------------------
 
@@ -94,6 +100,13 @@ class Main(tkinter.Tk):
         # initialize the forms dictionary
         self.forms_dict = {}
 
+        # initialize the queue of the batch job watcher events and the job text of every cluster
+        self.watcher_event_queue = queue.Queue()
+        self.watcher_text_dict = {}
+
+        # start delivering the data of the form inputs got by the background loader
+        gloader.start_pump(self)
+
         # create the window
         self.create_window()
 
@@ -214,6 +227,10 @@ class Main(tkinter.Tk):
         self.label_process = tkinter.Label(self.frame_information, text='')
         self.label_process.pack(side='right', padx=(0,10))
 
+        # create "label_jobs" and register it in "frame_information" with the pack geometry manager
+        self.label_jobs = tkinter.Label(self.frame_information, text='', foreground='dark olive green')
+        self.label_jobs.pack(side='right', padx=(0,10))
+
         # create "container" and register it in "Main" with the grid geometry manager
         self.container = tkinter.Frame(self)
         self.container.grid(row=2, column=0, sticky='nsew')
@@ -232,6 +249,12 @@ class Main(tkinter.Tk):
         Build the full menu of "Main".
         '''
 
+        # start the batch job watcher and show its events in the status bar
+        if not xwatcher.is_watcher_running():
+            xwatcher.subscribe(self.watcher_event_queue.put)
+            xwatcher.start_watcher()
+            self.after(1000, self.show_watcher_events)
+
         # create "imagetk_exit"
         image_exit = PIL.Image.open('./image_exit.png')
         imagetk_exit = PIL.ImageTk.PhotoImage(image_exit)  
@@ -390,6 +413,7 @@ class Main(tkinter.Tk):
         self.menu_soapdenovotrans.add_command(label='Edit config file', command=self.edit_soapdenovotrans_config_file)
         self.menu_soapdenovotrans.add_separator()
         self.menu_soapdenovotrans.add_command(label='Run assembly process', command=self.run_soapdenovotrans_process)
+        self.menu_soapdenovotrans.add_command(label='Resume assembly process', command=self.resume_soapdenovotrans_process)
         self.menu_soapdenovotrans.add_separator()
         self.menu_soapdenovotrans.add_command(label='List runs and view logs', command=self.view_soapdenovotrans_run_logs)
 
@@ -399,6 +423,7 @@ class Main(tkinter.Tk):
         self.menu_transabyss.add_command(label='Edit config file', command=self.edit_transabyss_config_file)
         self.menu_transabyss.add_separator()
         self.menu_transabyss.add_command(label='Run assembly process', command=self.run_transabyss_process)
+        self.menu_transabyss.add_command(label='Resume assembly process', command=self.resume_transabyss_process)
         self.menu_transabyss.add_separator()
         self.menu_transabyss.add_command(label='List runs and view logs', command=self.view_transabyss_run_logs)
 
@@ -408,6 +433,7 @@ class Main(tkinter.Tk):
         self.menu_trinity.add_command(label='Edit config file', command=self.edit_trinity_config_file)
         self.menu_trinity.add_separator()
         self.menu_trinity.add_command(label='Run assembly process', command=self.run_trinity_process)
+        self.menu_trinity.add_command(label='Resume assembly process', command=self.resume_trinity_process)
         self.menu_trinity.add_separator()
         self.menu_trinity.add_command(label='List runs and view logs', command=self.view_trinity_run_logs)
 
@@ -603,6 +629,7 @@ class Main(tkinter.Tk):
         self.menu_result_file_transfer.add_command(label='Edit config file', command=self.edit_result_transfer_config_file)
         self.menu_result_file_transfer.add_separator()
         self.menu_result_file_transfer.add_command(label='Download dataset from a cluster', command=self.download_result_dataset)
+        self.menu_result_file_transfer.add_command(label='Compare assessment metrics of the downloaded datasets', command=self.compare_assessment_metrics)
 
         # create "menu_result_file_compression_decompression" add add its menu items
         self.menu_result_file_compression_decompression = tkinter.Menu(self.menu_bar, tearoff=0)
@@ -666,10 +693,36 @@ class Main(tkinter.Tk):
 
         message = 'Are you sure to exit NGscloud?'
         if tkinter.messagebox.askyesno('{0} - Exit'.format(xlib.get_project_name()), message):
+            xwatcher.unsubscribe(self.watcher_event_queue.put)
+            xwatcher.stop_watcher()
+            gloader.stop()
+            xssh.release_pooled_sftp_clients()
             self.destroy()
 
     #---------------
 
+    def show_watcher_events(self):
+        '''
+        Show in the status bar the events published by the batch job watcher.
+        The events are queued by the watcher thread and read here in the Tk thread.
+        '''
+
+        # read the pending events
+        while True:
+            try:
+                event = self.watcher_event_queue.get_nowait()
+            except queue.Empty:
+                break
+            self.watcher_text_dict[event['cluster_name']] = xwatcher.get_event_text(event)
+
+        # update "label_jobs"
+        self.label_jobs['text'] = '; '.join([self.watcher_text_dict[cluster_name] for cluster_name in sorted(self.watcher_text_dict.keys())])
+
+        # schedule the next reading
+        self.after(1000, self.show_watcher_events)
+
+    #---------------
+
     def set_environment(self, event=None):
         '''
         Set the configuration corresponding to an environment.
@@ -1328,7 +1381,7 @@ class Main(tkinter.Tk):
 
         # review volumen link
         if OK:
-            dialog_log = gdialogs.DialogLog(self, head, xcluster.terminate_cluster.__name__)
+            dialog_log = gdialogs.DialogLog(self, head, xcluster.terminate_cluster.__name__, cluster_name=xlib.get_volume_creator_name())
             threading.Thread(target=self.wait_window, args=(dialog_log,)).start()
             threading.Thread(target=xcluster.terminate_cluster, args=(xlib.get_volume_creator_name(), True, dialog_log, lambda: dialog_log.enable_button_close())).start()
 
@@ -2113,6 +2166,27 @@ class Main(tkinter.Tk):
 
     #---------------
 
+    def resume_soapdenovotrans_process(self, event=None):
+        '''
+        Resume a failed SOAPdenovo-Trans process in its run directory.
+        '''
+
+        # close the current form
+        self.close_current_form()
+
+        # create and register "form_resume_soapdenovotrans_process" in "container" with the grid geometry manager
+        form_resume_soapdenovotrans_process = gbioinfoapp.FormResumeBioinfoProcess(self.container, self, app=xlib.get_soapdenovotrans_code())
+        form_resume_soapdenovotrans_process.grid(row=0, column=0, sticky='nsew')
+
+        # set "form_resume_soapdenovotrans_process" as current form and add it in the forms dictionary
+        self.current_form = 'form_resume_soapdenovotrans_process'
+        self.forms_dict[self.current_form] = form_resume_soapdenovotrans_process
+
+        # raise "form_resume_soapdenovotrans_process" to front
+        form_resume_soapdenovotrans_process.tkraise()
+
+    #---------------
+
     def view_soapdenovotrans_run_logs(self, event=None):
         '''
         List the SOAPdenovo-Trans process runs and view run logs.
@@ -2208,6 +2282,27 @@ class Main(tkinter.Tk):
 
     #---------------
 
+    def resume_transabyss_process(self, event=None):
+        '''
+        Resume a failed Trans-ABySS process in its run directory.
+        '''
+
+        # close the current form
+        self.close_current_form()
+
+        # create and register "form_resume_transabyss_process" in "container" with the grid geometry manager
+        form_resume_transabyss_process = gbioinfoapp.FormResumeBioinfoProcess(self.container, self, app=xlib.get_transabyss_code())
+        form_resume_transabyss_process.grid(row=0, column=0, sticky='nsew')
+
+        # set "form_resume_transabyss_process" as current form and add it in the forms dictionary
+        self.current_form = 'form_resume_transabyss_process'
+        self.forms_dict[self.current_form] = form_resume_transabyss_process
+
+        # raise "form_resume_transabyss_process" to front
+        form_resume_transabyss_process.tkraise()
+
+    #---------------
+
     def view_transabyss_run_logs(self, event=None):
         '''
         List the Trans-ABySS process runs and view run logs.
@@ -2303,6 +2398,27 @@ class Main(tkinter.Tk):
 
     #---------------
 
+    def resume_trinity_process(self, event=None):
+        '''
+        Resume a failed Trinity process in its run directory.
+        '''
+
+        # close the current form
+        self.close_current_form()
+
+        # create and register "form_resume_trinity_process" in "container" with the grid geometry manager
+        form_resume_trinity_process = gbioinfoapp.FormResumeBioinfoProcess(self.container, self, app=xlib.get_trinity_code())
+        form_resume_trinity_process.grid(row=0, column=0, sticky='nsew')
+
+        # set "form_resume_trinity_process" as current form and add it in the forms dictionary
+        self.current_form = 'form_resume_trinity_process'
+        self.forms_dict[self.current_form] = form_resume_trinity_process
+
+        # raise "form_resume_trinity_process" to front
+        form_resume_trinity_process.tkraise()
+
+    #---------------
+
     def view_trinity_run_logs(self, event=None):
         '''
         List the Trinity process runs and view run logs.
@@ -4037,6 +4153,27 @@ class Main(tkinter.Tk):
 
     #---------------
 
+    def compare_assessment_metrics(self, event=None):
+        '''
+        Compare the assessment metrics of the downloaded result datasets.
+        '''
+
+        # close the current form
+        self.close_current_form()
+
+        # create and register "form_compare_assessment_metrics" in "container" with the grid geometry manager
+        form_compare_assessment_metrics = gdataset.FormCompareAssessmentMetrics(self.container, self)
+        form_compare_assessment_metrics.grid(row=0, column=0, sticky='nsew')
+
+        # set "form_compare_assessment_metrics" as current form and add it in the forms dictionary
+        self.current_form = 'form_compare_assessment_metrics'
+        self.forms_dict[self.current_form] = form_compare_assessment_metrics
+
+        # raise "form_compare_assessment_metrics" to front
+        form_compare_assessment_metrics.tkraise()
+
+    #---------------
+
     def remove_result_dataset(self, event=None):
         '''
        Remove a run result dataset in a cluster.
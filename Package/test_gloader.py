@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#-------------------------------------------------------------------------------
+
+'''
+This software has been developed by:
+
+    GI Genética, Fisiología e Historia Forestal
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politécnica de Madrid
+    http://gfhforestal.com/
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+'''
+This file contains the tests of the background loader of the data of the form
+inputs in gui mode. They run without Tk windows nor clusters: the forms are
+replaced by plain objects and the SSH functions by mocks.
+
+Run them with: python3 -m unittest test_gloader
+'''
+
+#-------------------------------------------------------------------------------
+
+import time
+import unittest
+import unittest.mock
+
+import gloader
+
+#-------------------------------------------------------------------------------
+
+class PumpWidget(object):
+    '''
+    Widget whose after method does not schedule anything, so the deliveries
+    are done calling gloader.pump.
+    '''
+
+    def after(self, *args):
+        pass
+
+#-------------------------------------------------------------------------------
+
+class Wrapper(object):
+    '''
+    Value holder with the get method of the Tk variables.
+    '''
+
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+#-------------------------------------------------------------------------------
+
+class Main(object):
+    '''
+    Main window which records its cursor.
+    '''
+
+    def __init__(self):
+        self.cursor = ''
+
+    def config(self, cursor):
+        self.cursor = cursor
+
+#-------------------------------------------------------------------------------
+
+class Form(object):
+    '''
+    Form with the attributes used by gloader.connect_cluster.
+    '''
+
+    def __init__(self, cluster_name):
+        self.head = 'Test'
+        self.main = Main()
+        self.wrapper_cluster_name = Wrapper(cluster_name)
+        self.cluster_name_ant = None
+        self.ssh_client = None
+        self.button_execute = {'state': 'enable'}
+        self.is_closed = False
+        self.loaded_input_count = 0
+
+    def winfo_exists(self):
+        return not self.is_closed
+
+    def validate_inputs(self):
+        self.button_execute['state'] = 'enable'
+        return True
+
+    def load_cluster_inputs(self):
+        self.loaded_input_count += 1
+
+    def close(self):
+        self.is_closed = True
+
+#-------------------------------------------------------------------------------
+
+class TestLoader(unittest.TestCase):
+
+    #---------------
+
+    def setUp(self):
+        gloader.pump_widget = PumpWidget()
+        gloader.invalidate()
+
+    #---------------
+
+    def tearDown(self):
+        gloader.stop()
+        gloader.request_dict.clear()
+
+    #---------------
+
+    def deliver(self, timeout=5):
+        '''
+        Deliver the results of the requests once they have finished.
+        '''
+
+        end_time = time.time() + timeout
+        while any(future is not None and not future.done() for (number, key, future) in gloader.request_dict.values()) and time.time() < end_time:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        gloader.pump()
+
+    #---------------
+
+    def test_connect_cluster(self):
+        '''
+        The connection is saved in the form, the inputs are loaded and the
+        button "button_execute" is enabled again.
+        '''
+
+        form = Form('cluster-1')
+        ssh_client = unittest.mock.Mock()
+        with unittest.mock.patch('xssh.create_ssh_client_connection', return_value=(True, [], ssh_client)) as create_mock:
+            gloader.connect_cluster(form, form.load_cluster_inputs)
+            self.assertEqual(form.button_execute['state'], 'disabled')
+            self.assertEqual(form.main.cursor, 'watch')
+            self.deliver()
+        create_mock.assert_called_once_with('cluster-1', 'master')
+        self.assertIs(form.ssh_client, ssh_client)
+        self.assertEqual(form.cluster_name_ant, 'cluster-1')
+        self.assertEqual(form.loaded_input_count, 1)
+        self.assertEqual(form.button_execute['state'], 'enable')
+        self.assertEqual(form.main.cursor, '')
+
+        # the same cluster is not connected again
+        with unittest.mock.patch('xssh.create_ssh_client_connection') as create_mock:
+            gloader.connect_cluster(form, form.load_cluster_inputs)
+        create_mock.assert_not_called()
+        self.assertEqual(form.loaded_input_count, 2)
+
+    #---------------
+
+    def test_connect_cluster_outdated(self):
+        '''
+        The connection got after another cluster is selected is closed and the
+        connection of the last cluster is saved.
+        '''
+
+        form = Form('cluster-1')
+        ssh_client_1 = unittest.mock.Mock()
+        ssh_client_2 = unittest.mock.Mock()
+        ssh_client_dict = {'cluster-1': ssh_client_1, 'cluster-2': ssh_client_2}
+        with unittest.mock.patch('xssh.create_ssh_client_connection', side_effect=lambda cluster_name, node_name: (True, [], ssh_client_dict[cluster_name])) as create_mock, unittest.mock.patch('xssh.close_ssh_client_connection') as close_mock:
+            gloader.connect_cluster(form)
+            form.wrapper_cluster_name = Wrapper('cluster-2')
+            gloader.connect_cluster(form)
+            self.deliver()
+        self.assertIs(form.ssh_client, ssh_client_2)
+        self.assertEqual(form.cluster_name_ant, 'cluster-2')
+
+        # the connection of the first cluster is closed unless its execution was cancelled before starting
+        if unittest.mock.call('cluster-1', 'master') in create_mock.call_args_list:
+            close_mock.assert_called_once_with(ssh_client_1)
+        else:
+            close_mock.assert_not_called()
+
+    #---------------
+
+    def test_connect_cluster_error(self):
+        '''
+        The form is closed when the connection can not be created.
+        '''
+
+        form = Form('cluster-1')
+        with unittest.mock.patch('xssh.create_ssh_client_connection', return_value=(False, ['*** ERROR: cluster-1 can not be connected.'], unittest.mock.Mock())), unittest.mock.patch('tkinter.messagebox.showerror') as showerror_mock:
+            gloader.connect_cluster(form, form.load_cluster_inputs)
+            self.deliver()
+        showerror_mock.assert_called_once()
+        self.assertTrue(form.is_closed)
+        self.assertIsNone(form.ssh_client)
+        self.assertEqual(form.loaded_input_count, 0)
+
+    #---------------
+
+    def test_get_cluster_subdir_list(self):
+        '''
+        Only the subdirectories except "lost+found" are got, sorted by name.
+        '''
+
+        entry_list = [{'name': 'exp2', 'type': 'd'}, {'name': 'lost+found', 'type': 'd'}, {'name': 'file.txt', 'type': 'f'}, {'name': 'exp1', 'type': 'd'}]
+        with unittest.mock.patch('xssh.list_cluster_dir_sftp', return_value=(True, [], entry_list)) as list_mock:
+            self.assertEqual(gloader.get_cluster_subdir_list('cluster-1', '/results'), ['exp1', 'exp2'])
+        list_mock.assert_called_once_with('cluster-1', '/results')
+
+    #---------------
+
+    def test_get_cluster_subdir_list_error(self):
+        '''
+        The errors of the listing are raised, so the request shows them.
+        '''
+
+        with unittest.mock.patch('xssh.list_cluster_dir_sftp', return_value=(False, ['*** ERROR: /results can not be listed.\n'], [])):
+            with self.assertRaises(IOError):
+                gloader.get_cluster_subdir_list('cluster-1', '/results')
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+    unittest.main()
+
+#-------------------------------------------------------------------------------
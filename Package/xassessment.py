@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#-------------------------------------------------------------------------------
+
+'''
+This software has been developed by:
+
+    GI Genética, Fisiología e Historia Forestal
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politécnica de Madrid
+    http://gfhforestal.com/
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+'''
+This file contains functions related to the store of the assembly assessment
+metrics of the runs used in both console mode and gui mode.
+
+The metrics are stored by the assessed assembly dataset, so the metrics of the
+different assessment tools of an assembly are compared in the same row; the
+assessment run that computed each metric is kept too.
+'''
+
+#-------------------------------------------------------------------------------
+
+import csv
+import os
+import re
+import sqlite3
+import sys
+
+import xlib
+
+#-------------------------------------------------------------------------------
+
+# metrics used to rank the assemblies, one per tool so every tool counts once in the mean rank: (tool, metric, True when a higher value is better)
+RANKING_METRIC_LIST = [
+    ('busco', 'complete_percentage', True),
+    ('quast', 'N50', True),
+    ('rsem_eval', 'Score', True),
+    ('transrate', 'score', True),
+    ]
+
+#-------------------------------------------------------------------------------
+
+def get_assessment_store_file():
+    '''
+    Get the path of the local assessment store.
+    '''
+
+    return '{0}/assessment.db'.format(xlib.get_log_dir())
+
+#-------------------------------------------------------------------------------
+
+def get_assessment_comparison_file():
+    '''
+    Get the path of the CSV file where the assessment comparison is exported.
+    '''
+
+    return '{0}/assessment-comparison.csv'.format(xlib.get_log_dir())
+
+#-------------------------------------------------------------------------------
+
+def open_assessment_store():
+    '''
+    Open the local assessment store creating it when it does not exist.
+    '''
+
+    # create the log directory
+    if not os.path.exists(xlib.get_log_dir()):
+        os.makedirs(xlib.get_log_dir())
+
+    # open the store and create the assessment table, where result_dataset_id is the assessed assembly dataset
+    # and the rows are keyed by their source file because a tool can write several files with the same metrics
+    create_table_sql = '''
+        CREATE TABLE IF NOT EXISTS assessment (
+            experiment_id TEXT NOT NULL,
+            result_dataset_id TEXT NOT NULL,
+            tool TEXT NOT NULL,
+            metric TEXT NOT NULL,
+            value REAL,
+            text TEXT,
+            source_file TEXT NOT NULL DEFAULT '',
+            assessment_dataset_id TEXT,
+            PRIMARY KEY (experiment_id, result_dataset_id, tool, metric, source_file)
+        )'''
+    connection = sqlite3.connect(get_assessment_store_file())
+    connection.execute(create_table_sql)
+
+    # add the assessment run to the stores created before it was kept
+    column_name_list = [row[1] for row in connection.execute('PRAGMA table_info(assessment)')]
+    if 'assessment_dataset_id' not in column_name_list:
+        connection.execute('ALTER TABLE assessment ADD COLUMN assessment_dataset_id TEXT')
+
+    # rebuild the table of the stores created before the rows were keyed by their source file
+    key_column_name_list = [row[1] for row in connection.execute('PRAGMA table_info(assessment)') if row[5] > 0]
+    if 'source_file' not in key_column_name_list:
+        with connection:
+            connection.execute('DROP INDEX IF EXISTS assessment_metric')
+            connection.execute('ALTER TABLE assessment RENAME TO assessment_old')
+            connection.execute(create_table_sql)
+            connection.execute("INSERT INTO assessment (experiment_id, result_dataset_id, tool, metric, value, text, source_file, assessment_dataset_id) SELECT experiment_id, result_dataset_id, tool, metric, value, text, COALESCE(source_file, ''), assessment_dataset_id FROM assessment_old")
+            connection.execute('DROP TABLE assessment_old')
+    connection.execute('CREATE INDEX IF NOT EXISTS assessment_metric ON assessment (tool, metric)')
+
+    # return the connection
+    return connection
+
+#-------------------------------------------------------------------------------
+
+def get_assessment_tool(file_name):
+    '''
+    Get the tool that has written an assessment file from its name, or None
+    when the file is not an assessment file.
+    '''
+
+    if file_name.startswith('short_summary') and file_name.endswith('.txt'):
+        return 'busco'
+    elif file_name == 'report.tsv':
+        return 'quast'
+    elif file_name == 'short_report.tsv':
+        return 'rnaquast'
+    elif file_name.endswith('.score'):
+        return 'rsem_eval'
+    elif file_name == 'assemblies.csv':
+        return 'transrate'
+    return None
+
+#-------------------------------------------------------------------------------
+
+def convert_value(text):
+    '''
+    Convert the text of a metric value to a number, or None when it is not numeric.
+    '''
+
+    text = text.strip().rstrip('%')
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+#-------------------------------------------------------------------------------
+
+def parse_busco_file(path):
+    '''
+    Parse a BUSCO short summary file and return a list of (metric, text) tuples.
+    '''
+
+    # initialize the metric list
+    metric_list = []
+
+    # parse the notation line, e.g. C:85.0%[S:80.0%,D:5.0%],F:5.0%,M:10.0%,n:303
+    with open(path, mode='r', encoding='iso-8859-1') as file_id:
+        for line in file_id:
+            line = line.strip()
+            if line.startswith('# Summarized benchmarking in BUSCO notation for file'):
+                metric_list.append(('assembly', line.split()[-1]))
+            mo = re.match(r'^C:([\d.]+)%\[S:([\d.]+)%,D:([\d.]+)%\],F:([\d.]+)%,M:([\d.]+)%,n:(\d+)', line)
+            if mo:
+                metric_list.append(('complete_percentage', mo.group(1)))
+                metric_list.append(('single_copy_percentage', mo.group(2)))
+                metric_list.append(('duplicated_percentage', mo.group(3)))
+                metric_list.append(('fragmented_percentage', mo.group(4)))
+                metric_list.append(('missing_percentage', mo.group(5)))
+                metric_list.append(('busco_count', mo.group(6)))
+
+    # return the metric list
+    return metric_list
+
+#-------------------------------------------------------------------------------
+
+def parse_metric_value_file(path):
+    '''
+    Parse a file of tab-separated metric and value lines (QUAST report.tsv, rnaQUAST
+    short_report.tsv and RSEM-eval score files) and return a list of (metric, text)
+    tuples. The lines without value, e.g. section titles, are skipped.
+    '''
+
+    # initialize the metric list
+    metric_list = []
+
+    # parse the lines keeping the value of the first column
+    with open(path, mode='r', encoding='iso-8859-1') as file_id:
+        for line in file_id:
+            data_list = line.rstrip('\r\n').split('\t')
+            if len(data_list) < 2 or data_list[0].strip() == '':
+                continue
+            metric = data_list[0].strip()
+            if metric in ['Assembly', 'METRICS/TRANSCRIPTS']:
+                metric_list.append(('assembly', data_list[1].strip()))
+            else:
+                metric_list.append((metric, data_list[1].strip()))
+
+    # return the metric list
+    return metric_list
+
+#-------------------------------------------------------------------------------
+
+def parse_transrate_file(path):
+    '''
+    Parse a Transrate assemblies.csv file and return a list of (metric, text) tuples
+    with the values of its first assembly.
+    '''
+
+    # initialize the metric list
+    metric_list = []
+
+    # parse the header and the first data row
+    with open(path, mode='r', encoding='iso-8859-1', newline='') as file_id:
+        reader = csv.DictReader(file_id)
+        for row in reader:
+            for (metric, text) in row.items():
+                if metric is None or text is None:
+                    continue
+                metric_list.append((metric, text))
+            break
+
+    # return the metric list
+    return metric_list
+
+#-------------------------------------------------------------------------------
+
+def load_assessment_file(experiment_id, result_dataset_id, path, assessment_dataset_id=None):
+    '''
+    Load the metrics of an assessment file of the assembly dataset result_dataset_id,
+    written by the assessment run assessment_dataset_id, into the local assessment
+    store replacing the ones of the same file and the ones of the same tool written
+    by other assessment runs of the assembly dataset.
+    '''
+
+    # initialize the control variable, the error list and the metric count
+    OK = True
+    error_list = []
+    metric_count = 0
+
+    # get the tool of the file
+    tool = get_assessment_tool(os.path.basename(path))
+    if tool is None:
+        return (OK, error_list, metric_count)
+
+    # parse the file
+    try:
+        if tool == 'busco':
+            metric_list = parse_busco_file(path)
+        elif tool == 'transrate':
+            metric_list = parse_transrate_file(path)
+        else:
+            metric_list = parse_metric_value_file(path)
+    except Exception as e:
+        error_list.append('*** ERROR: The file {0} can not be parsed: {1}'.format(path, e))
+        OK = False
+
+    # store the metrics
+    if OK and metric_list != []:
+        connection = None
+        try:
+            connection = open_assessment_store()
+            with connection:
+                connection.execute('DELETE FROM assessment WHERE experiment_id = ? AND result_dataset_id = ? AND tool = ? AND (source_file = ? OR assessment_dataset_id IS NOT ?)', (experiment_id, result_dataset_id, tool, os.path.abspath(path), assessment_dataset_id))
+                for (metric, text) in metric_list:
+                    connection.execute('INSERT OR REPLACE INTO assessment (experiment_id, result_dataset_id, tool, metric, value, text, source_file, assessment_dataset_id) VALUES (?,?,?,?,?,?,?,?)', (experiment_id, result_dataset_id, tool, metric, convert_value(text), text, os.path.abspath(path), assessment_dataset_id))
+                    metric_count += 1
+        except sqlite3.Error as e:
+            error_list.append('*** ERROR: The assessment store {0} can not be updated: {1}'.format(get_assessment_store_file(), e))
+            OK = False
+            metric_count = 0
+        finally:
+            if connection is not None:
+                connection.close()
+
+    # return the control variable, error list and metric count
+    return (OK, error_list, metric_count)
+
+#-------------------------------------------------------------------------------
+
+def get_experiment_id_list():
+    '''
+    Get the list of the experiment identifications in the local assessment store.
+    '''
+
+    # initialize the experiment identification list
+    experiment_id_list = []
+
+    # query the local assessment store
+    if os.path.isfile(get_assessment_store_file()):
+        connection = open_assessment_store()
+        experiment_id_list = [row[0] for row in connection.execute('SELECT DISTINCT experiment_id FROM assessment ORDER BY experiment_id')]
+        connection.close()
+
+    # return the experiment identification list
+    return experiment_id_list
+
+#-------------------------------------------------------------------------------
+
+def get_assessment_table(experiment_id=None):
+    '''
+    Get the metrics of the local assessment store as columns: a list of the
+    (experiment_id, result_dataset_id) keys of the rows, one per assessed assembly
+    dataset, and a dictionary whose keys
+    are the column names ("tool metric") and whose values are the lists of the
+    numeric values of the rows (None when a row has not the metric). When a tool
+    has written several files of an assembly dataset, the metrics of its main file
+    (see get_main_source_file) are in the "tool metric" columns and the ones of
+    the other files in "tool metric (file name)" columns.
+    '''
+
+    # initialize the key list and the column dictionary
+    key_list = []
+    column_dict = {}
+
+    # query the local assessment store
+    if os.path.isfile(get_assessment_store_file()):
+        connection = open_assessment_store()
+        query = 'SELECT experiment_id, result_dataset_id, tool, metric, value, source_file FROM assessment WHERE value IS NOT NULL'
+        if experiment_id is None:
+            record_list = connection.execute('{0} ORDER BY experiment_id, result_dataset_id'.format(query)).fetchall()
+        else:
+            record_list = connection.execute('{0} AND experiment_id = ? ORDER BY experiment_id, result_dataset_id'.format(query), (experiment_id,)).fetchall()
+        source_file_dict = {}
+        for (row_experiment_id, result_dataset_id, tool, metric, value, source_file) in record_list:
+            source_file_dict.setdefault((row_experiment_id, result_dataset_id, tool), set()).add(source_file)
+        row_dict = {}
+        for (row_experiment_id, result_dataset_id, tool, metric, value, source_file) in record_list:
+            key = (row_experiment_id, result_dataset_id)
+            if key not in row_dict:
+                row_dict[key] = len(key_list)
+                key_list.append(key)
+            if source_file == get_main_source_file(source_file_dict[(row_experiment_id, result_dataset_id, tool)]):
+                column_name = '{0} {1}'.format(tool, metric)
+            else:
+                column_name = '{0} {1} ({2})'.format(tool, metric, os.path.basename(source_file))
+            if column_name not in column_dict:
+                column_dict[column_name] = []
+            column = column_dict[column_name]
+            column.extend([None] * (row_dict[key] + 1 - len(column)))
+            column[row_dict[key]] = value
+        connection.close()
+
+    # fill the columns up to the row number
+    for column in column_dict.values():
+        column.extend([None] * (len(key_list) - len(column)))
+
+    # return the key list and the column dictionary
+    return (key_list, column_dict)
+
+#-------------------------------------------------------------------------------
+
+def get_main_source_file(source_file_set):
+    '''
+    Get the main file of the files written by a tool for an assembly dataset, whose
+    metrics are ranked: the first one by name except the generic BUSCO summaries,
+    because the summary of the specific lineage is more accurate.
+    '''
+
+    return sorted(source_file_set, key=lambda source_file: ('.generic.' in os.path.basename(source_file), os.path.basename(source_file)))[0]
+
+#-------------------------------------------------------------------------------
+
+def get_rank_list(value_list, higher_is_better):
+    '''
+    Get the ranks (1 is the best, ties get the average rank) of a value list;
+    the rank of the None values is None.
+    '''
+
+    # initialize the rank list
+    rank_list = [None] * len(value_list)
+
+    # sort the indexes of the values and assign the average rank to each group of ties
+    index_list = sorted([i for i in range(len(value_list)) if value_list[i] is not None], key=lambda i: value_list[i], reverse=higher_is_better)
+    i = 0
+    while i < len(index_list):
+        j = i
+        while j + 1 < len(index_list) and value_list[index_list[j + 1]] == value_list[index_list[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            rank_list[index_list[k]] = (i + j) / 2 + 1
+        i = j + 1
+
+    # return the rank list
+    return rank_list
+
+#-------------------------------------------------------------------------------
+
+def get_assessment_comparison(experiment_id=None):
+    '''
+    Get the assembly datasets ranked by the mean of their ranks in the ranking
+    metrics. The result is a list of dictionaries with the keys experiment_id,
+    result_dataset_id, mean_rank, ranked_metric_count and the ranking metric
+    columns, sorted from the best to the worst.
+    '''
+
+    # get the columnar table
+    (key_list, column_dict) = get_assessment_table(experiment_id)
+
+    # rank the rows in each ranking metric
+    rank_column_list = []
+    for (tool, metric, higher_is_better) in RANKING_METRIC_LIST:
+        column_name = '{0} {1}'.format(tool, metric)
+        if column_name in column_dict:
+            rank_column_list.append(get_rank_list(column_dict[column_name], higher_is_better))
+
+    # build the comparison with the mean rank of each row
+    comparison_list = []
+    for i in range(len(key_list)):
+        rank_list = [rank_column[i] for rank_column in rank_column_list if rank_column[i] is not None]
+        comparison = {'experiment_id': key_list[i][0], 'result_dataset_id': key_list[i][1], 'mean_rank': sum(rank_list) / len(rank_list) if rank_list != [] else None, 'ranked_metric_count': len(rank_list)}
+        for (tool, metric, higher_is_better) in RANKING_METRIC_LIST:
+            column_name = '{0} {1}'.format(tool, metric)
+            comparison[column_name] = column_dict[column_name][i] if column_name in column_dict else None
+        comparison_list.append(comparison)
+
+    # sort the comparison: rows without rank at the end and the rows with more ranked metrics first on ties
+    comparison_list.sort(key=lambda comparison: (comparison['mean_rank'] is None, comparison['mean_rank'] or 0, -comparison['ranked_metric_count'], comparison['result_dataset_id']))
+
+    # return the comparison list
+    return comparison_list
+
+#-------------------------------------------------------------------------------
+
+def export_assessment_comparison(experiment_id=None, path=None):
+    '''
+    Export the ranked comparison of the result datasets with all their metrics
+    to a CSV file.
+    '''
+
+    # initialize the control variable and the error list
+    OK = True
+    error_list = []
+
+    # set the path of the CSV file
+    if path is None:
+        path = get_assessment_comparison_file()
+
+    # get the comparison and the columnar table
+    comparison_list = get_assessment_comparison(experiment_id)
+    (key_list, column_dict) = get_assessment_table(experiment_id)
+    row_dict = {key: i for (i, key) in enumerate(key_list)}
+    column_name_list = sorted(column_dict.keys())
+
+    # write the CSV file
+    try:
+        if not os.path.exists(os.path.dirname(os.path.abspath(path))):
+            os.makedirs(os.path.dirname(os.path.abspath(path)))
+        with open(path, mode='w', encoding='iso-8859-1', newline='') as file_id:
+            writer = csv.writer(file_id)
+            writer.writerow(['experiment_id', 'result_dataset_id', 'mean_rank', 'ranked_metric_count'] + column_name_list)
+            for comparison in comparison_list:
+                i = row_dict[(comparison['experiment_id'], comparison['result_dataset_id'])]
+                writer.writerow([comparison['experiment_id'], comparison['result_dataset_id'], comparison['mean_rank'], comparison['ranked_metric_count']] + [column_dict[column_name][i] for column_name in column_name_list])
+    except Exception as e:
+        error_list.append('*** ERROR: The file {0} can not be written: {1}'.format(path, e))
+        OK = False
+
+    # return the control variable and error list
+    return (OK, error_list)
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+     print('This file contains functions related to the store of the assembly assessment metrics of the runs used in both console mode and gui mode.')
+     sys.exit(0)
+
+#-------------------------------------------------------------------------------
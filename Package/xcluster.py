@@ -24,9 +24,10 @@ both console mode and gui mode.
 '''
 #-------------------------------------------------------------------------------
 
-import re
 import subprocess
 import sys
+import threading
+import xml.etree.ElementTree
 
 import xconfiguration
 import xec2
@@ -473,7 +474,9 @@ def kill_batch_job(cluster_name, job_id, log, function=None):
 
 def get_batch_job_dict(ssh_client):
     '''
-    Get a dictionary with the batch jobs in the cluster.
+    Get a dictionary with the batch jobs of all users in the cluster. The array
+    jobs have an entry per running task and another one per pending task range;
+    their identification is job_id.tasks, e.g. 123.4 or 123.5-10:1.
     '''
 
     # initialize the control variable and the error list
@@ -483,52 +486,17 @@ def get_batch_job_dict(ssh_client):
     # initialize the dictionary of the batch jobs
     batch_job_dict = {}
 
-    # list the jobs running in the cluster and load the dictionary
+    # list the jobs of the cluster in XML format and load the dictionary
     if OK:
         sge_env = get_sge_env()
-        command = '{0}; qstat'.format(sge_env)
+        command = '{0}; qstat -xml -u \'*\''.format(sge_env)
         (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
         if OK:
-            if len(stdout) > 0:
-                i = 0
-                for line in stdout:
-                    if i >= 2:
-                        try:
-                            line_pattern = r'^(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(.+)$'
-                            mo = re.search(line_pattern, line.strip())
-                            job_id = mo.group(1).strip()
-                            priority = mo.group(2).strip()
-                            job_name = mo.group(3).strip()
-                            user = mo.group(4).strip()
-                            state_id = mo.group(5).strip()
-                            if state_id == 'd':
-                                state_name = 'deletion'
-                            elif state_id == 'E':
-                                state_name = 'error'
-                            elif state_id == 'h':
-                                state_name = 'hold'
-                            elif state_id == 'r':
-                                state_name = 'running'
-                            elif state_id == 'R':
-                                state_name = 'restarted'
-                            elif state_id in ['s', 'S']:
-                                state_name = 'suspended'
-                            elif state_id == 't':
-                                state_name = 'transfering'
-                            elif state_id == 'T':
-                                state_name = 'thresold'
-                            elif state_id in ['w', 'qw']:
-                                state_name = 'waiting'
-                            else:
-                                state_name = 'xxx'
-                            state = '{0} ({1})'.format(state_id, state_name)
-                            mm_dd_yyyy = mo.group(6).strip()
-                            start_date = '{0}-{1}-{2}'.format(mm_dd_yyyy[6:], mm_dd_yyyy[:2], mm_dd_yyyy[3:5])
-                            start_time = mo.group(7).strip()
-                            batch_job_dict[job_id] = {'job_id': job_id, 'priority': priority, 'job_name': job_name, 'user': user, 'state_id': state_id, 'state_name': state_name, 'state': state, 'start_date': start_date, 'start_time': start_time}
-                        except:
-                            pass
-                    i += 1
+            try:
+                batch_job_dict = parse_qstat_xml(stdout)
+            except xml.etree.ElementTree.ParseError as e:
+                error_list.append('*** ERROR: The output of qstat can not be parsed: {0}.\n'.format(e))
+                OK = False
         else:
             error_list.append('*** ERROR: Wrong command ---> {0}.\n'.format(command))
 
@@ -537,6 +505,108 @@ def get_batch_job_dict(ssh_client):
 
 #-------------------------------------------------------------------------------
 
+def parse_qstat_xml(line_list):
+    '''
+    Parse the lines of the output of "qstat -xml" with a streaming parser and
+    get a dictionary with the batch jobs.
+    '''
+
+    # initialize the dictionary of the batch jobs
+    batch_job_dict = {}
+
+    # get the dictionary of the batch job states
+    state_dict = get_batch_job_state_dict()
+
+    # feed the parser line by line and process every job element when it is complete
+    parser = xml.etree.ElementTree.XMLPullParser(events=('end',))
+    for line in line_list:
+        parser.feed(line)
+        for (event, element) in parser.read_events():
+            if element.tag != 'job_list':
+                continue
+            job_number = element.findtext('JB_job_number', '').strip()
+            tasks = element.findtext('tasks', '').strip()
+            job_id = job_number if tasks == '' else '{0}.{1}'.format(job_number, tasks)
+            state_id = element.findtext('state', '').strip()
+            state_letter_list = [letter for letter in state_id if not (letter == 'q' and 'w' in state_id)]
+            state_name = ', '.join([state_dict.get(letter, 'xxx') for letter in state_letter_list])
+            date_time = element.findtext('JAT_start_time', element.findtext('JB_submission_time', '')).strip()
+            start_date = date_time[:10]
+            start_time = date_time[11:19]
+            batch_job_dict[job_id] = {'job_id': job_id, 'job_number': job_number, 'tasks': tasks, 'priority': element.findtext('JAT_prio', '').strip(), 'job_name': element.findtext('JB_name', '').strip(), 'user': element.findtext('JB_owner', '').strip(), 'queue': element.findtext('queue_name', '').strip(), 'slots': element.findtext('slots', '').strip(), 'state_id': state_id, 'state_name': state_name, 'state': '{0} ({1})'.format(state_id, state_name), 'start_date': start_date, 'start_time': start_time}
+            element.clear()
+    parser.close()
+
+    # return the dictionary of the batch jobs
+    return batch_job_dict
+
+#-------------------------------------------------------------------------------
+
+def get_batch_job_state_dict():
+    '''
+    Get the dictionary of the names of the SGE job state letters.
+    '''
+
+    return {'d': 'deletion', 'E': 'error', 'h': 'hold', 'q': 'queued', 'r': 'running', 'R': 'restarted', 's': 'suspended', 'S': 'suspended', 't': 'transfering', 'T': 'thresold', 'w': 'waiting'}
+
+#-------------------------------------------------------------------------------
+
+# dictionary of the batch job tables of the clusters and its lock
+batch_job_table_dict = {}
+batch_job_table_lock = threading.Lock()
+
+#-------------------------------------------------------------------------------
+
+def poll_batch_job_table(cluster_name, ssh_client):
+    '''
+    Poll the batch jobs of a cluster and update incrementally its batch job table.
+    Every poll gets a sequence number and every job records the poll when it
+    appeared or changed for the last time.
+    '''
+
+    # get the current batch jobs
+    (OK, error_list, batch_job_dict) = get_batch_job_dict(ssh_client)
+
+    # initialize the poll number
+    poll_number = None
+
+    # update the batch job table of the cluster
+    if OK:
+        with batch_job_table_lock:
+            table = batch_job_table_dict.setdefault(cluster_name, {'poll_number': 0, 'job_dict': {}, 'removed_dict': {}})
+            table['poll_number'] += 1
+            poll_number = table['poll_number']
+            job_dict = table['job_dict']
+            for job_id, job_data in batch_job_dict.items():
+                previous_job_data = job_dict.get(job_id)
+                if previous_job_data is None or previous_job_data['data'] != job_data:
+                    job_dict[job_id] = {'data': job_data, 'poll_number': poll_number}
+                    table['removed_dict'].pop(job_id, None)
+            for job_id in list(job_dict.keys()):
+                if job_id not in batch_job_dict:
+                    del job_dict[job_id]
+                    table['removed_dict'][job_id] = poll_number
+
+    # return the control variable, error list and poll number
+    return (OK, error_list, poll_number)
+
+#-------------------------------------------------------------------------------
+
+def get_batch_job_changes(cluster_name, since_poll_number=0):
+    '''
+    Get the changes of the batch job table of a cluster since a poll: the last
+    poll number, a dictionary with the jobs appeared or changed after that poll
+    and a list with the identifications of the jobs removed after that poll.
+    '''
+
+    with batch_job_table_lock:
+        table = batch_job_table_dict.get(cluster_name, {'poll_number': 0, 'job_dict': {}, 'removed_dict': {}})
+        changed_job_dict = {job_id: job['data'] for job_id, job in table['job_dict'].items() if job['poll_number'] > since_poll_number}
+        removed_job_id_list = [job_id for job_id, poll_number in table['removed_dict'].items() if poll_number > since_poll_number]
+        return (table['poll_number'], changed_job_dict, removed_job_id_list)
+
+#-------------------------------------------------------------------------------
+
 def open_terminal(cluster_name, node_name):
     '''
     Open a terminal window in a node of the cluster.
@@ -38,6 +38,11 @@ import xlib
 
 environment =  ''    # the AWS environment where the processes are run
 
+# parsed NGScloud config file, its path and its modification key (modification time and size)
+ngscloud_config = None
+ngscloud_config_path = None
+ngscloud_config_key = None
+
 #-------------------------------------------------------------------------------
 
 def get_environments_file():
@@ -138,6 +143,7 @@ def create_ngscloud_config_file(user_id, access_key_id, secret_access_key, email
                 file_id.write('{0}\n'.format('environment = {0}'.format(environment)))
                 file_id.write('{0}\n'.format('current_region = {0}'.format(region_name)))
                 file_id.write('{0}\n'.format('current_zone = {0}'.format(zone_name)))
+                file_id.write('{0}\n'.format('job_watcher_interval = 60'))
                 file_id.write('{0}\n'.format(''))
                 file_id.write('{0}\n'.format('[aws info]'))
                 file_id.write('{0}\n'.format('aws_user_id = {0}'.format(user_id)))
@@ -457,6 +463,9 @@ def create_ngscloud_config_file(user_id, access_key_id, secret_access_key, email
             error_list.append('*** ERROR: The file {0} can not be created'.format(ngscloud_config_file))
             OK = False
 
+    # discard the parsed NGScloud config file
+    invalidate_ngscloud_config()
+
     # return the control variable and the error list
     return (OK, error_list)
 
@@ -471,11 +480,8 @@ def update_connection_data(user_id, access_key_id, secret_access_key):
     # initialize the control variable
     OK = True
 
-    # get the NGScloud config file
-    ngscloud_config_file = get_ngscloud_config_file()
-
     # get the options dictionary corresponding to the NGScloud config file
-    ngscloud_options_dict = xlib.get_option_dict(ngscloud_config_file)
+    ngscloud_options_dict = get_ngscloud_option_dict()
 
     # update the current region and zone in the options dictionary corresponding to the NGScloud config file
     ngscloud_options_dict['aws info']['aws_user_id'] = user_id
@@ -499,11 +505,8 @@ def update_contact_data(email):
     # initialize the control variable
     OK = True
 
-    # get the NGScloud config file
-    ngscloud_config_file = get_ngscloud_config_file()
-
     # get the options dictionary corresponding to the NGScloud config file
-    ngscloud_options_dict = xlib.get_option_dict(ngscloud_config_file)
+    ngscloud_options_dict = get_ngscloud_option_dict()
 
     # update the contact e-mail in the options dictionary corresponding to the NGScloud config file
     ngscloud_options_dict['contact info']['email'] = email
@@ -529,11 +532,8 @@ def update_region_zone_data(region_name, zone_name):
     # get NGScloud Key
     ngscloud_key = get_ngscloud_key()
 
-    # get the NGScloud config file
-    ngscloud_config_file = get_ngscloud_config_file()
-
     # get the options dictionary corresponding to the NGScloud config file
-    ngscloud_options_dict = xlib.get_option_dict(ngscloud_config_file)
+    ngscloud_options_dict = get_ngscloud_option_dict()
 
     # get the old region and  user identification
     old_region_name = ngscloud_options_dict['global']['current_region']
@@ -590,7 +590,7 @@ def link_volume_to_template(template_name, mount_path, volume_name, log, functio
     ngscloud_config_file = get_ngscloud_config_file()
 
     # get the options dictionary corresponding to the NGScloud config file
-    ngscloud_options_dict = xlib.get_option_dict(ngscloud_config_file)
+    ngscloud_options_dict = get_ngscloud_option_dict()
 
     # get the defined cluster templates list
     if template_name == 'all':
@@ -674,7 +674,7 @@ def delink_volume_from_template(template_name, volume_name, log, function=None):
     ngscloud_config_file = get_ngscloud_config_file()
 
     # get the options dictionary corresponding to the NGScloud config file
-    ngscloud_options_dict = xlib.get_option_dict(ngscloud_config_file)
+    ngscloud_options_dict = get_ngscloud_option_dict()
 
     # get the defined cluster templates list
     if template_name == 'all':
@@ -767,7 +767,7 @@ def review_volume_links(zone_name, log, function=None):
     ngscloud_config_file = get_ngscloud_config_file()
 
     # get the options dictionary corresponding to the NGScloud config file
-    ngscloud_options_dict = xlib.get_option_dict(ngscloud_config_file)
+    ngscloud_options_dict = get_ngscloud_option_dict()
     
     # get the dictionary of cluster templates
     templates_dict = get_template_dict()
@@ -889,6 +889,12 @@ def save_ngscloud_config_file(ngscloud_options_dict):
         error_list.append('*** ERROR: The file {0} can not be written'.format(ngscloud_config_file))
         OK = False
 
+    # keep the written config as the parsed NGScloud config file
+    if OK:
+        set_ngscloud_config(config)
+    else:
+        invalidate_ngscloud_config()
+
     # return the control variable and the error list
     return (OK, error_list)
 
@@ -918,17 +924,10 @@ def get_basic_aws_data():
     identification and the secret access key from NGScloud config file.
     '''
 
-    # create class to parse the config file
-    config = configparser.ConfigParser()
-
-    # read the NGScloud config file
-    ngscloud_config_file = get_ngscloud_config_file()
-    config.read(ngscloud_config_file)
-
     # get the connection data from NGScloud config file
-    user_id= config.get('aws info', 'aws_user_id', fallback='')
-    access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
-    secret_access_key = config.get('aws info', 'aws_secret_access_key', fallback='')
+    user_id = get_ngscloud_config_value('aws info', 'aws_user_id')
+    access_key_id = get_ngscloud_config_value('aws info', 'aws_access_key_id')
+    secret_access_key = get_ngscloud_config_value('aws info', 'aws_secret_access_key')
 
     # return the connection data
     return (user_id, access_key_id, secret_access_key)
@@ -940,21 +939,28 @@ def get_contact_data():
     Get the access the contact e-mail from NGScloud config file.
     '''
 
-    # create class to parse the config file
-    config = configparser.ConfigParser()
-
-    # read the NGScloud config file
-    ngscloud_config_file = get_ngscloud_config_file()
-    config.read(ngscloud_config_file)
-
     # get the contact e-mail data from the NGScloud config file
-    email = config.get('contact info', 'email', fallback='')
+    email = get_ngscloud_config_value('contact info', 'email')
 
     # return the contact e-mail
     return email
 
 #-------------------------------------------------------------------------------
 
+def get_job_watcher_interval():
+    '''
+    Get the interval in seconds between two polls of the batch job watcher from
+    the NGScloud config file.
+    '''
+
+    # get the interval
+    interval = max(10, get_ngscloud_config_int('global', 'job_watcher_interval', fallback=60))
+
+    # return the interval
+    return interval
+
+#-------------------------------------------------------------------------------
+
 def get_key_sections_dict():
     '''
     Get the key sections data dictionary from the NGScloud config file
@@ -964,12 +970,8 @@ def get_key_sections_dict():
     # initialize the key sections data dictionary
     key_sections_dict = {}
     
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # read the NGScloud config file
-    ngscloud_config_file = get_ngscloud_config_file()
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = get_ngscloud_config()
 
     # get the sections list
     sections_list = []
@@ -1000,12 +1002,8 @@ def get_template_dict():
     # initialize the key sections data dictionary
     template_dict = {}
     
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # read the NGScloud config file
-    ngscloud_config_file = get_ngscloud_config_file()
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = get_ngscloud_config()
 
     # get the sections list
     sections_list = []
@@ -1037,14 +1035,8 @@ def get_template_name_list(volume_creator_included):
     # initialize the template name list
     template_name_list = []
     
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = get_ngscloud_config()
 
     # build the key sections data dictionary
     for section in config.sections():
@@ -1072,12 +1064,8 @@ def get_volumes_dict():
     # initialize the key sections data dictionary
     volumes_dict = {}
     
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # read the NGScloud config file
-    ngscloud_config_file = get_ngscloud_config_file()
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = get_ngscloud_config()
 
     # get the sections list
     sections_list = []
@@ -1119,17 +1107,8 @@ def get_linked_volumes_list(template_name):
     config file corresponding to the environment.
     '''
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
-
     # get the linked volumes of the template name
-    linked_volumes = config.get('cluster {0}'.format(template_name), 'volumes', fallback='')
+    linked_volumes = get_ngscloud_config_value('cluster {0}'.format(template_name), 'volumes')
 
     # get the linked volumes list
     linked_volumes_list = xlib.split_literal_to_string_list(linked_volumes)
@@ -1145,17 +1124,8 @@ def get_current_region_name():
     to the environment.
     '''
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
-
     # get the current region name
-    current_region_name = config.get('global', 'current_region', fallback='')
+    current_region_name = get_ngscloud_config_value('global', 'current_region')
 
     # return  the current region name
     return current_region_name
@@ -1168,17 +1138,8 @@ def get_current_zone_name():
     the environment.
     '''
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
-
     # get the current zone name
-    current_zone_name = config.get('global', 'current_zone', fallback='')
+    current_zone_name = get_ngscloud_config_value('global', 'current_zone')
 
     # return  the current zone name
     return current_zone_name
@@ -1191,14 +1152,8 @@ def get_keypair_file():
     config file corresponding to the environment.
     '''
 
-    # get the NGScloud config file
-    ngscloud_config_file = get_ngscloud_config_file()
-
-    # get the options dictionary
-    ngscloud_options_dict = xlib.get_option_dict(ngscloud_config_file)
-
     # get the key pair file
-    keypair_file = ngscloud_options_dict['key NGScloudKey']['key_location']
+    keypair_file = get_ngscloud_config_value('key {0}'.format(get_ngscloud_key()), 'key_location')
 
     # return the key pair file
     return keypair_file
@@ -1211,18 +1166,9 @@ def get_bioinfo_app_data(bioinfo_app_name):
     config file corresponding to the environment.
     '''
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
-
     # get the data
-    bioinfo_app_version = config.get('bioinfoapp {0}'.format(bioinfo_app_name), 'version', fallback='')
-    bioinfo_app_url = config.get('bioinfoapp {0}'.format(bioinfo_app_name), 'url', fallback='')
+    bioinfo_app_version = get_ngscloud_config_value('bioinfoapp {0}'.format(bioinfo_app_name), 'version')
+    bioinfo_app_url = get_ngscloud_config_value('bioinfoapp {0}'.format(bioinfo_app_name), 'url')
 
     # return the data
     return (bioinfo_app_version, bioinfo_app_url)
@@ -1271,9 +1217,6 @@ def set_environment_variables():
     secret access key and the current region name
     '''
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
     # get the NGScloud config file
     ngscloud_config_file = get_ngscloud_config_file()
 
@@ -1282,6 +1225,125 @@ def set_environment_variables():
 
 #-------------------------------------------------------------------------------
 
+def get_ngscloud_config():
+    '''
+    Get the parsed NGScloud config file corresponding to the environment. The
+    file is parsed again only when its path, modification time or size change.
+    The parsed config is shared, so it must not be modified.
+    '''
+
+    global ngscloud_config
+    global ngscloud_config_path
+    global ngscloud_config_key
+
+    # get the NGScloud config file and its modification key
+    ngscloud_config_file = get_ngscloud_config_file()
+    config_key = get_ngscloud_config_key(ngscloud_config_file)
+
+    # parse the NGScloud config file when it has changed
+    if ngscloud_config is None or ngscloud_config_path != ngscloud_config_file or ngscloud_config_key != config_key:
+        config = configparser.ConfigParser()
+        if config_key is not None:
+            config.read(ngscloud_config_file)
+        (ngscloud_config, ngscloud_config_path, ngscloud_config_key) = (config, ngscloud_config_file, config_key)
+
+    # return the parsed NGScloud config file
+    return ngscloud_config
+
+#-------------------------------------------------------------------------------
+
+def get_ngscloud_config_key(ngscloud_config_file):
+    '''
+    Get the modification key of the NGScloud config file: its modification time
+    and size, or None when it does not exist.
+    '''
+
+    try:
+        stat_result = os.stat(ngscloud_config_file)
+        config_key = (stat_result.st_mtime_ns, stat_result.st_size)
+    except OSError:
+        config_key = None
+
+    return config_key
+
+#-------------------------------------------------------------------------------
+
+def set_ngscloud_config(config):
+    '''
+    Set the parsed NGScloud config file after writing it, so it is not parsed
+    again.
+    '''
+
+    global ngscloud_config
+    global ngscloud_config_path
+    global ngscloud_config_key
+
+    # get the NGScloud config file and its modification key
+    ngscloud_config_file = get_ngscloud_config_file()
+    config_key = get_ngscloud_config_key(ngscloud_config_file)
+
+    # set the parsed NGScloud config file
+    (ngscloud_config, ngscloud_config_path, ngscloud_config_key) = (config, ngscloud_config_file, config_key)
+
+#-------------------------------------------------------------------------------
+
+def invalidate_ngscloud_config():
+    '''
+    Discard the parsed NGScloud config file, so it is parsed in the next access.
+    '''
+
+    global ngscloud_config
+
+    ngscloud_config = None
+
+#-------------------------------------------------------------------------------
+
+def get_ngscloud_config_value(section, option, fallback=''):
+    '''
+    Get the value of an option of the NGScloud config file without comments
+    and spaces.
+    '''
+
+    return xlib.get_option_value(get_ngscloud_config().get(section, option, fallback=fallback))
+
+#-------------------------------------------------------------------------------
+
+def get_ngscloud_config_int(section, option, fallback):
+    '''
+    Get the integer value of an option of the NGScloud config file; the fallback
+    value is returned when the option is not found or it is not an integer.
+    '''
+
+    try:
+        value = int(get_ngscloud_config_value(section, option, fallback=str(fallback)))
+    except ValueError:
+        value = fallback
+
+    return value
+
+#-------------------------------------------------------------------------------
+
+def get_ngscloud_option_dict():
+    '''
+    Get a new dictionary with the options of the NGScloud config file, which can
+    be modified and saved with save_ngscloud_config_file.
+    '''
+
+    # initialize the options dictionary
+    ngscloud_options_dict = {}
+
+    # build the dictionary from the parsed NGScloud config file
+    config = get_ngscloud_config()
+    for section in config.sections():
+        ngscloud_options_dict[section] = {}
+        for key in config[section]:
+            ngscloud_options_dict[section][key] = xlib.get_option_value(config.get(section, key, fallback=''))
+
+    # return the options dictionary
+    return ngscloud_options_dict
+
+#-------------------------------------------------------------------------------
+
 def get_ngscloud_config_file():
     '''
     Get the path of the NGScloud config file corresponding to the environment.
@@ -33,6 +33,7 @@ import sys
 import xconfiguration
 import xec2
 import xlib
+import xmanifest
 import xssh
 
 #-------------------------------------------------------------------------------
@@ -169,6 +170,12 @@ def upload_database_dataset(cluster_name, log, function=None):
                         log.write('{0}\n'.format(error))
                     break
 
+    # record the database dataset in the manifest of the volume
+    if OK:
+        (OK, error_list) = xmanifest.write_manifest_record(ssh_client, 'database', cluster_database_dir, 'uploaded')
+        for error in error_list:
+            log.write('{0}\n'.format(error))
+
     # close the SSH transport connection
     if OK:
         xssh.close_ssh_transport_connection(ssh_transport)
@@ -302,15 +309,11 @@ def get_database_dataset_dict(cluster_name, passed_connection=False, ssh_client=
 
     # build the dictionary of the database datasets
     if OK:
-        command = 'ls {0}'.format(xlib.get_cluster_database_dir())
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+        (OK, error_list, dataset_record_dict) = xmanifest.get_manifest_dataset_dict(cluster_name, 'database', ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    database_dataset_id = line
-                    database_dataset_name = database_dataset_id
-                    database_dataset_dict[database_dataset_id] = {'database_dataset_id': database_dataset_id, 'database_dataset_name': database_dataset_name}
+            for database_dataset_id in sorted(dataset_record_dict.keys()):
+                database_dataset_name = database_dataset_id
+                database_dataset_dict[database_dataset_id] = {'database_dataset_id': database_dataset_id, 'database_dataset_name': database_dataset_name}
 
     # close the SSH client connection
     if OK and not passed_connection:
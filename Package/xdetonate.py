@@ -35,6 +35,7 @@ import xcluster
 import xconfiguration
 import xec2
 import xlib
+import xresult
 import xssh
 
 #-------------------------------------------------------------------------------
@@ -130,8 +131,9 @@ def run_rsem_eval_process(cluster_name, log, function=None):
     # get the RSEM-EVAL option dictionary
     rsem_eval_option_dict = xlib.get_option_dict(get_rsem_eval_config_file())
 
-    # get the experiment identification
+    # get the experiment and assembly dataset identifications
     experiment_id = rsem_eval_option_dict['identification']['experiment_id']
+    assembly_dataset_id = rsem_eval_option_dict['identification']['assembly_dataset_id']
 
     # warn that the log window must not be closed
     if not isinstance(log, xlib.DevStdOut):
@@ -198,10 +200,56 @@ def run_rsem_eval_process(cluster_name, log, function=None):
         else:
             log.write('*** ERROR: The verification of {0} setup could not be performed.\n'.format(xlib.get_detonate_name()))
 
+    # verify the RSEM is set up (it prepares the reference of the assembly)
+    if OK:
+        (OK, error_list, is_setup) = xbioinfoapp.is_setup_bioconda_package(xlib.get_rsem_bioconda_code(), cluster_name, True, ssh_client)
+        if OK:
+            if not is_setup:
+                log.write('*** ERROR: {0} is not setup. It is required to prepare the reference of the assembly.\n'.format(xlib.get_rsem_name()))
+                OK = False
+        else:
+            log.write('*** ERROR: The verification of {0} setup could not be performed.\n'.format(xlib.get_rsem_name()))
+
+    # verify the Bowtie2 is set up (it aligns the reads to the prepared reference)
+    if OK:
+        (OK, error_list, is_setup) = xbioinfoapp.is_setup_bioconda_package(xlib.get_bowtie2_bioconda_code(), cluster_name, True, ssh_client)
+        if OK:
+            if not is_setup:
+                log.write('*** ERROR: {0} is not setup. It is required to align the reads to the prepared reference.\n'.format(xlib.get_bowtie2_name()))
+                OK = False
+        else:
+            log.write('*** ERROR: The verification of {0} setup could not be performed.\n'.format(xlib.get_bowtie2_name()))
+
     # warn that the requirements are OK 
     if OK:
         log.write('Process requirements are OK.\n')
 
+    # calculate the run fingerprint
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Calculating the run fingerprint ...\n')
+        (OK, error_list, fingerprint) = xresult.get_run_fingerprint(xlib.get_rsem_eval_code(), get_rsem_eval_config_file(), ssh_client)
+        if OK:
+            log.write('The run fingerprint is {0}.\n'.format(fingerprint))
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
+    # look for prepared references of the assembly in the cache
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Looking for prepared references of the assembly in the cache ...\n')
+        (OK, error_list, cached_reference_list) = get_cached_rsem_reference_list(ssh_client, experiment_id, assembly_dataset_id)
+        if OK:
+            if cached_reference_list != []:
+                log.write('Cache hit: {0}.\n'.format(', '.join(cached_reference_list)))
+                log.write('The reference build will be skipped if the assembly file has not changed.\n')
+            else:
+                log.write('Cache miss: the reference will be built and cached by the process.\n')
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
     # determine the run directory in the cluster
     if OK:
         log.write('{0}\n'.format(xlib.get_separator()))
@@ -214,6 +262,28 @@ def run_rsem_eval_process(cluster_name, log, function=None):
         else:
             log.write('*** ERROR: Wrong command ---> {0}\n'.format(command))
 
+    # save the run fingerprint in the run directory
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Saving the run fingerprint ...\n')
+        (OK, error_list) = xresult.save_run_fingerprint(ssh_client, current_run_dir, fingerprint)
+        if OK:
+            log.write('The run fingerprint is saved.\n')
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
+    # save a copy of the config file in the run directory, which identifies the assessed assembly
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Saving a copy of the config file in the run directory ...\n')
+        (OK, error_list) = xresult.save_run_config_snapshot(sftp_client, current_run_dir, get_rsem_eval_config_file())
+        if OK:
+            log.write('The copy of the config file is saved.\n')
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
     # build the RSEM-EVAL process script
     if OK:
         log.write('{0}\n'.format(xlib.get_separator()))
@@ -587,6 +657,12 @@ def build_rsem_eval_process_script(cluster_name, current_run_dir):
     # set the temporaly directory path
     temp_dir = '{0}/temp'.format(current_run_dir)
 
+    # set the directory of the prepared references in the cluster
+    reference_cache_dir = xlib.get_cluster_rsem_reference_cache_dir()
+
+    # set the alignment file path
+    alignment_file = '{0}/alignments.sam'.format(current_run_dir)
+
     # write the RSEM-EVAL process script
     try:
         if not os.path.exists(os.path.dirname(get_rsem_eval_process_script())):
@@ -596,17 +672,96 @@ def build_rsem_eval_process_script(cluster_name, current_run_dir):
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
             file_id.write('{0}\n'.format('DETONATE_PATH={0}/{1}/envs/{2}/bin'.format(xlib.get_cluster_app_dir(), xlib.get_miniconda3_name(), xlib.get_detonate_bioconda_code())))
             file_id.write('{0}\n'.format('BOWTIE2_PATH={0}/{1}/envs/{2}/bin'.format(xlib.get_cluster_app_dir(), xlib.get_miniconda3_name(), xlib.get_bowtie2_bioconda_code())))
-            file_id.write('{0}\n'.format('PATH=$DETONATE_PATH:$BOWTIE2_PATH:$PATH'))
+            file_id.write('{0}\n'.format('RSEM_PATH={0}/{1}/envs/{2}/bin'.format(xlib.get_cluster_app_dir(), xlib.get_miniconda3_name(), xlib.get_rsem_bioconda_code())))
+            file_id.write('{0}\n'.format('PATH=$DETONATE_PATH:$BOWTIE2_PATH:$RSEM_PATH:$PATH'))
             file_id.write('{0}\n'.format('SEP="#########################################"'))
             file_id.write('{0}\n'.format('cd {0}/{1}/bin'.format(xlib.get_cluster_app_dir(), xlib.get_miniconda3_name())))
             file_id.write('{0}\n'.format('source activate {0}'.format(xlib.get_detonate_bioconda_code())))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
+            for line in xlib.get_metrics_function_list(current_run_dir, rsem_eval_option_dict):
+                file_id.write('{0}\n'.format(line))
+            for line in xlib.get_manifest_function_list():
+                file_id.write('{0}\n'.format(line))
+            file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
             file_id.write('{0}\n'.format('function init'))
             file_id.write('{0}\n'.format('{'))
             file_id.write('{0}\n'.format('    INIT_DATETIME=`date --utc +%s`'))
             file_id.write('{0}\n'.format('    FORMATTED_INIT_DATETIME=`date --date="@$INIT_DATETIME" "+%Y-%m-%d %H:%M:%S"`'))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
             file_id.write('{0}\n'.format('    echo "Script started in node $HOSTNAME of cluster {0} at $FORMATTED_INIT_DATETIME UTC."'.format(cluster_name)))
+            file_id.write('{0}\n'.format('    write_manifest result {0} running'.format(current_run_dir)))
+            file_id.write('{0}\n'.format('}'))
+            file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
+            file_id.write('{0}\n'.format('function prepare_reference'))
+            file_id.write('{0}\n'.format('{'))
+            file_id.write('{0}\n'.format('    echo "$SEP"'))
+            file_id.write('{0}\n'.format('    echo "Looking for the prepared reference of the assembly in the cache ... "'))
+            file_id.write('{0}\n'.format('    mkdir --parents {0}'.format(reference_cache_dir)))
+            file_id.write('{0}\n'.format('    ASSEMBLY_HASH=`md5sum {0} | cut --delimiter=" " --fields=1`'.format(transcriptome_file)))
+            file_id.write('{0}\n'.format('    REFERENCE_DIR={0}/{1}-{2}-$ASSEMBLY_HASH'.format(reference_cache_dir, experiment_id, assembly_dataset_id)))
+            file_id.write('{0}\n'.format('    REFERENCE_NAME=$REFERENCE_DIR/reference'))
+            file_id.write('{0}\n'.format('    exec 9>$REFERENCE_DIR.lock'))
+            file_id.write('{0}\n'.format('    flock 9'))
+            file_id.write('{0}\n'.format('    if [ -f $REFERENCE_DIR/.complete ]; then'))
+            file_id.write('{0}\n'.format('        echo "REFERENCE_CACHE - HIT: $REFERENCE_DIR"'))
+            file_id.write('{0}\n'.format('    else'))
+            file_id.write('{0}\n'.format('        echo "REFERENCE_CACHE - MISS: $REFERENCE_DIR"'))
+            file_id.write('{0}\n'.format('        rm -fr $REFERENCE_DIR'))
+            file_id.write('{0}\n'.format('        mkdir --parents $REFERENCE_DIR'))
+            file_id.write('{0}\n'.format('        echo "Running rsem-prepare-reference ... "'))
+            file_id.write('{0}\n'.format('        /usr/bin/time \\'))
+            file_id.write('{0}\n'.format('            --output=$TIME_FILE --format="%e %S %U %P %M %K" \\'))
+            file_id.write('{0}\n'.format('            rsem-prepare-reference \\'))
+            file_id.write('{0}\n'.format('                --bowtie2 \\'))
+            file_id.write('{0}\n'.format('                --bowtie2-path $BOWTIE2_PATH \\'))
+            file_id.write('{0}\n'.format('                {0} \\'.format(transcriptome_file)))
+            file_id.write('{0}\n'.format('                $REFERENCE_NAME'))
+            file_id.write('{0}\n'.format('        RC=$?'))
+            file_id.write('{0}\n'.format('        write_metrics rsem-prepare-reference $RC'))
+            file_id.write('{0}\n'.format('        if [ $RC -ne 0 ]; then rm -fr $REFERENCE_DIR; manage_error rsem-prepare-reference $RC; fi'))
+            file_id.write('{0}\n'.format('        touch $REFERENCE_DIR/.complete'))
+            file_id.write('{0}\n'.format('    fi'))
+            file_id.write('{0}\n'.format('    flock --unlock 9'))
+            file_id.write('{0}\n'.format('}'))
+            file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
+            file_id.write('{0}\n'.format('function align_reads'))
+            file_id.write('{0}\n'.format('{'))
+            file_id.write('{0}\n'.format('    cd {0}'.format(current_run_dir)))
+            file_id.write('{0}\n'.format('    echo "$SEP"'))
+            file_id.write('{0}\n'.format('    bowtie2 --version'))
+            file_id.write('{0}\n'.format('    echo "$SEP"'))
+            file_id.write('{0}\n'.format('    echo "Running bowtie2 with the prepared reference ... "'))
+            file_id.write('{0}\n'.format('    /usr/bin/time \\'))
+            file_id.write('{0}\n'.format('        --output=$TIME_FILE --format="%e %S %U %P %M %K" \\'))
+            file_id.write('{0}\n'.format('        bowtie2 \\'))
+            if format == 'FASTA':
+                file_id.write('{0}\n'.format('            -f \\'))
+            else:
+                file_id.write('{0}\n'.format('            -q \\'))
+                file_id.write('{0}\n'.format('            --phred33 \\'))
+            file_id.write('{0}\n'.format('            --sensitive \\'))
+            file_id.write('{0}\n'.format('            --dpad 0 \\'))
+            file_id.write('{0}\n'.format('            --gbar 99999999 \\'))
+            file_id.write('{0}\n'.format('            --mp 1,1 \\'))
+            file_id.write('{0}\n'.format('            --np 1 \\'))
+            file_id.write('{0}\n'.format('            --score-min L,0,-{0} \\'.format(bowtie2_mismatch_rate)))
+            if read_type == 'PE':
+                file_id.write('{0}\n'.format('            -I 1 \\'))
+                file_id.write('{0}\n'.format('            -X 1000 \\'))
+                file_id.write('{0}\n'.format('            --no-mixed \\'))
+                file_id.write('{0}\n'.format('            --no-discordant \\'))
+            file_id.write('{0}\n'.format('            -k 200 \\'))
+            file_id.write('{0}\n'.format('            -p {0} \\'.format(num_threads)))
+            file_id.write('{0}\n'.format('            -x $REFERENCE_NAME \\'))
+            if read_type == 'PE':
+                file_id.write('{0}\n'.format('            -1 {0} \\'.format(files1)))
+                file_id.write('{0}\n'.format('            -2 {0} \\'.format(files2)))
+            else:
+                file_id.write('{0}\n'.format('            -U {0} \\'.format(files1)))
+            file_id.write('{0}\n'.format('            -S {0}'.format(alignment_file)))
+            file_id.write('{0}\n'.format('    RC=$?'))
+            file_id.write('{0}\n'.format('    write_metrics bowtie2 $RC'))
+            file_id.write('{0}\n'.format('    if [ $RC -ne 0 ]; then manage_error bowtie2 $RC; fi'))
             file_id.write('{0}\n'.format('}'))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
             file_id.write('{0}\n'.format('function run_rsem_eval_process'))
@@ -617,35 +772,37 @@ def build_rsem_eval_process_script(cluster_name, current_run_dir):
             file_id.write('{0}\n'.format('    echo "$SEP"'))
             file_id.write('{0}\n'.format('    echo "Running rsem-eval-estimate-transcript-length-distribution ... "'))
             file_id.write('{0}\n'.format('    /usr/bin/time \\'))
-            file_id.write('{0}\n'.format('        --format="$SEP\\nElapsed real time (s): %e\\nCPU time in kernel mode (s): %S\\nCPU time in user mode (s): %U\\nPercentage of CPU: %P\\nMaximum resident set size(Kb): %M\\nAverage total memory use (Kb):%K" \\'))
+            file_id.write('{0}\n'.format('        --output=$TIME_FILE --format="%e %S %U %P %M %K" \\'))
             file_id.write('{0}\n'.format('        rsem-eval-estimate-transcript-length-distribution \\'))
             file_id.write('{0}\n'.format('            {0} \\'.format(transcriptome_file)))
             file_id.write('{0}\n'.format('            {0}'.format(distribution_file)))
             file_id.write('{0}\n'.format('    RC=$?'))
+            file_id.write('{0}\n'.format('    write_metrics rsem-eval-estimate-transcript-length-distribution $RC'))
             file_id.write('{0}\n'.format('    if [ $RC -ne 0 ]; then manage_error rsem-eval-estimate-transcript-length-distribution $RC; fi'))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
             file_id.write('{0}\n'.format('    echo "Running rsem-eval-calculate-score ... "'))
             file_id.write('{0}\n'.format('    /usr/bin/time \\'))
-            file_id.write('{0}\n'.format('        --format="$SEP\\nElapsed real time (s): %e\\nCPU time in kernel mode (s): %S\\nCPU time in user mode (s): %U\\nPercentage of CPU: %P\\nMaximum resident set size(Kb): %M\\nAverage total memory use (Kb):%K" \\'))
+            file_id.write('{0}\n'.format('        --output=$TIME_FILE --format="%e %S %U %P %M %K" \\'))
             file_id.write('{0}\n'.format('        rsem-eval-calculate-score \\'))
             file_id.write('{0}\n'.format('            --num-threads {0} \\'.format(num_threads)))
-            file_id.write('{0}\n'.format('            --bowtie2 \\'))
-            file_id.write('{0}\n'.format('            --bowtie2-mismatch-rate {0} \\'.format(bowtie2_mismatch_rate)))
             file_id.write('{0}\n'.format('            --transcript-length-parameters {0} \\'.format(distribution_file)))
             file_id.write('{0}\n'.format('            --temporary-folder {0} \\'.format(temp_dir)))
             if keep_intermediate_files.upper() == 'YES':
                 file_id.write('{0}\n'.format('            --keep-intermediate-files \\'))
             if format == 'FASTA':
                 file_id.write('{0}\n'.format('            --no-qualities \\'))
+            file_id.write('{0}\n'.format('            --sam \\'))
             if read_type == 'PE':
-                file_id.write('{0}\n'.format('            --paired-end {0} {1} \\'.format(files1, files2)))
-            else:
-                file_id.write('{0}\n'.format('            {0} \\'.format(files1)))
+                file_id.write('{0}\n'.format('            --paired-end \\'))
+            file_id.write('{0}\n'.format('            {0} \\'.format(alignment_file)))
             file_id.write('{0}\n'.format('            {0} \\'.format(transcriptome_file)))
             file_id.write('{0}\n'.format('            {0} \\'.format(current_run_dir)))
             file_id.write('{0}\n'.format('            {0}'.format(length)))
             file_id.write('{0}\n'.format('    RC=$?'))
-            file_id.write('{0}\n'.format('    if [ $RC -ne 0 ]; then rsem-eval-calculate-score $RC; fi'))
+            file_id.write('{0}\n'.format('    write_metrics rsem-eval-calculate-score $RC'))
+            file_id.write('{0}\n'.format('    if [ $RC -ne 0 ]; then manage_error rsem-eval-calculate-score $RC; fi'))
+            if keep_intermediate_files.upper() == 'NO':
+                file_id.write('{0}\n'.format('    rm -f {0}'.format(alignment_file)))
             file_id.write('{0}\n'.format('}'))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
             file_id.write('{0}\n'.format('function move_result_files'))
@@ -669,6 +826,7 @@ def build_rsem_eval_process_script(cluster_name, current_run_dir):
             file_id.write('{0}\n'.format('    echo "FILTERING_DATA - ASSEMBLY_DATASET_ID: {0}"'.format(assembly_dataset_id)))
             file_id.write('{0}\n'.format('    echo "FILTERING_DATA - ASSEMBLY_TYPE: {0}"'.format(assembly_type)))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
+            file_id.write('{0}\n'.format('    write_manifest result {0} ended'.format(current_run_dir)))
             file_id.write('{0}\n'.format('    RECIPIENT={0}'.format(xconfiguration.get_contact_data())))
             file_id.write('{0}\n'.format('    SUBJECT="{0}: {1} process"'.format(xlib.get_project_name(), xlib.get_rsem_eval_name())))
             file_id.write('{0}\n'.format('    MESSAGE="The {0} process in node $HOSTNAME of cluster {0} ended OK at $FORMATTED_END_DATETIME with a run duration of $DURATION s ($FORMATTED_DURATION). Please review its log.<br/><br/>Regards,<br/>GI Genetica, Fisiologia e Historia Forestal<br/>Dpto. Sistemas y Recursos Naturales<br/>ETSI Montes, Forestal y del Medio Natural<br/>Universidad Politecnica de Madrid<br/>https://github.com/ggfhf/"'.format(xlib.get_rsem_eval_name(), cluster_name)))
@@ -685,6 +843,7 @@ def build_rsem_eval_process_script(cluster_name, current_run_dir):
             file_id.write('{0}\n'.format('    echo "ERROR: $1 returned error $2"'))
             file_id.write('{0}\n'.format('    echo "Script ended WRONG at $FORMATTED_END_DATETIME UTC with a run duration of $DURATION s ($FORMATTED_DURATION)."'))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
+            file_id.write('{0}\n'.format('    write_manifest result {0} failed'.format(current_run_dir)))
             file_id.write('{0}\n'.format('    RECIPIENT={0}'.format(xconfiguration.get_contact_data())))
             file_id.write('{0}\n'.format('    SUBJECT="{0}: {1} process"'.format(xlib.get_project_name(), xlib.get_rsem_eval_name())))
             file_id.write('{0}\n'.format('    MESSAGE="The {0} process in node $HOSTNAME of cluster {0} ended WRONG at $FORMATTED_END_DATETIME with a run duration of $DURATION s ($FORMATTED_DURATION). Please review its log.<br/><br/>Regards,<br/>GI Genetica, Fisiologia e Historia Forestal<br/>Dpto. Sistemas y Recursos Naturales<br/>ETSI Montes, Forestal y del Medio Natural<br/>Universidad Politecnica de Madrid<br/>https://github.com/ggfhf/"'.format(xlib.get_rsem_eval_name(), cluster_name)))
@@ -702,6 +861,8 @@ def build_rsem_eval_process_script(cluster_name, current_run_dir):
             file_id.write('{0}\n'.format('}'))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
             file_id.write('{0}\n'.format('init'))
+            file_id.write('{0}\n'.format('prepare_reference'))
+            file_id.write('{0}\n'.format('align_reads'))
             file_id.write('{0}\n'.format('run_rsem_eval_process'))
             file_id.write('{0}\n'.format('move_result_files'))
             file_id.write('{0}\n'.format('end'))
@@ -740,6 +901,31 @@ def build_rsem_eval_process_starter(current_run_dir):
 
 #-------------------------------------------------------------------------------
 
+def get_cached_rsem_reference_list(ssh_client, experiment_id, assembly_dataset_id):
+    '''
+    Get the list of prepared RSEM/Bowtie2 references of an assembly dataset in the cluster cache.
+    '''
+
+    # initialize the control variable, the error list and the cached reference list
+    OK = True
+    error_list = []
+    cached_reference_list = []
+
+    # list the complete prepared references of the assembly dataset
+    command = 'ls -d {0}/{1}-{2}-*/.complete 2>/dev/null; echo RC=0'.format(xlib.get_cluster_rsem_reference_cache_dir(), experiment_id, assembly_dataset_id)
+    (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+    if OK:
+        for line in stdout:
+            if line != 'RC=0':
+                cached_reference_list.append(os.path.basename(os.path.dirname(line)))
+    else:
+        error_list.append('*** ERROR: Wrong command ---> {0}'.format(command))
+
+    # return the control variable, the error list and the cached reference list
+    return (OK, error_list, cached_reference_list)
+
+#-------------------------------------------------------------------------------
+
 def get_rsem_eval_config_file():
     '''
     Get the RSEM-EVAL config file path.
@@ -886,6 +1072,17 @@ def run_ref_eval_process(cluster_name, log, function=None):
     if OK:
         log.write('Process requirements are OK.\n')
 
+    # calculate the run fingerprint
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Calculating the run fingerprint ...\n')
+        (OK, error_list, fingerprint) = xresult.get_run_fingerprint(xlib.get_ref_eval_code(), get_ref_eval_config_file(), ssh_client)
+        if OK:
+            log.write('The run fingerprint is {0}.\n'.format(fingerprint))
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
     # determine the run directory in the cluster
     if OK:
         log.write('{0}\n'.format(xlib.get_separator()))
@@ -898,6 +1095,17 @@ def run_ref_eval_process(cluster_name, log, function=None):
         else:
             log.write('*** ERROR: Wrong command ---> {0}\n'.format(command))
 
+    # save the run fingerprint in the run directory
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Saving the run fingerprint ...\n')
+        (OK, error_list) = xresult.save_run_fingerprint(ssh_client, current_run_dir, fingerprint)
+        if OK:
+            log.write('The run fingerprint is saved.\n')
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
     # build the REF-EVAL process script
     if OK:
         log.write('{0}\n'.format(xlib.get_separator()))
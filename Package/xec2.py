@@ -23,7 +23,6 @@ This file contains the functions related to EC2 objetcs used in both console mod
 '''
 #-------------------------------------------------------------------------------
 
-import configparser
 import os
 import stat
 import sys
@@ -66,14 +65,8 @@ def get_available_region_list():
     # initialize the region names list
     region_names_list = []
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification and the AWS secret access key
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -134,14 +127,8 @@ def get_available_zone_list(region_name):
     # initialize the zone names list
     zone_names_list = []
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification and the AWS secret access key
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -202,14 +189,8 @@ def get_keypair_dict(region_name):
     # initialize the key pairs dictionary
     keypairs_dict = {}
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification and the AWS secret access key
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -281,14 +262,8 @@ def create_keypair(keypair_file, keypair_name, region_name):
     OK = True
     error_list = []
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification and the AWS secret access key
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -361,14 +336,8 @@ def delete_keypair(keypair_file, keypair_name, region_name):
     OK = True
     error_list = []
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification and the AWS secret access key
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -419,14 +388,8 @@ def get_running_cluster_list(volume_creator_included):
     # initialize of the running cluster list
     running_cluster_list = []
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -480,14 +443,8 @@ def get_node_dict():
     # initialize the node dictionary
     node_dict = {}
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -532,14 +489,8 @@ def get_cluster_node_list(cluster_name):
     # initialize of the cluster node list
     cluster_node_list = []
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -594,14 +545,8 @@ def get_node_id(cluster_name, node_name):
     # initialize of the node identification
     node_id = ''
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -655,14 +600,8 @@ def get_node_state(cluster_name, node_name):
     node_state_code = -1
     node_state_name = 'non-existent'
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -716,14 +655,8 @@ def get_node_zone_name(cluster_name, node_name):
     # initialize of the node zone name
     node_zone_name = ''
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -776,14 +709,8 @@ def get_node_public_dns_name(cluster_name, node_name):
     # initialize of the public DNS name
     public_dns_name = ''
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -920,14 +847,8 @@ def create_volume(volume_name, volume_type, volume_size, iops=0):
     # initialize the volume identificacion
     volume_id = None
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification, the AWS secret access key and the current region and zone names
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -981,14 +902,8 @@ def delete_volume(volume_name):
     # initialize the control variable
     OK = True
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification, the AWS secret access key and the current region and zone names
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -1034,14 +949,8 @@ def get_volume_dict():
     # initialize the node dictionary
     volumes_dict = {}
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -1089,14 +998,8 @@ def get_created_volume_dict(zone_name):
     # initialize the volumes dictionary
     created_volume_dict = {}
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -1135,14 +1038,8 @@ def get_created_volume_name_list(zone_name):
     # initialize the available volume names list
     available_volume_names_list = []
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -1185,14 +1082,8 @@ def get_noattached_volume_name_list(zone_name):
     # initialize the available volume names list
     available_volume_names_list = []
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -1235,14 +1126,8 @@ def is_volume_created(volume_name, zone_name):
     # initialize the found variable
     found = False
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -1284,14 +1169,8 @@ def get_volume_id(volume_name, zone_name):
     # initialize volume identification
     volume_id = ''
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -1334,14 +1213,8 @@ def get_volume_state(volume_name, zone_name):
     # initialize volume state
     volume_state = ''
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -1384,14 +1257,8 @@ def get_volume_attachments(volume_name, zone_name):
     # initialize volume identification
     volume_attachments = []
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -1434,14 +1301,8 @@ def get_volume_device_file(cluster_name, node_name, volume_name):
     # initialize the device file
     device_file = ''
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -1493,14 +1354,8 @@ def attach_volume(node_id, volume_id, aws_device_file):
     # initialize the control variable
     OK = True
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -1538,14 +1393,8 @@ def detach_volume(node_id, volume_id, aws_device_file):
     # initialize the control variable
     OK = True
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification, the AWS secret access key and the current region name
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
@@ -1586,14 +1435,8 @@ def get_starcluster_ami_id(region_name):
     # initialize the starcluster AMI identification
     starcluster_ami_id = get_unknown_ami_id()
 
-    # create class to parse the config files
-    config = configparser.ConfigParser()
-
-    # get the NGScloud config file
-    ngscloud_config_file = xconfiguration.get_ngscloud_config_file()
-
-    # read the NGScloud config file
-    config.read(ngscloud_config_file)
+    # get the parsed NGScloud config file
+    config = xconfiguration.get_ngscloud_config()
 
     # get the AWS access key identification and the AWS secret access key
     aws_access_key_id = config.get('aws info', 'aws_access_key_id', fallback='')
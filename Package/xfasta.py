@@ -0,0 +1,613 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#-------------------------------------------------------------------------------
+
+'''
+This software has been developed by:
+
+    GI Genética, Fisiología e Historia Forestal
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politécnica de Madrid
+    http://gfhforestal.com/
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+'''
+This file contains the functions of the statistics engine of local FASTA files
+used in both console mode and gui mode, e.g. with the assemblies downloaded
+from a cluster.
+
+The file is memory-mapped and scanned by chunks with NumPy byte operations: only
+the positions of the headers and the line ends are got, so no Python object is
+created per line. The statistics are the sequence count and lengths (N50, N90,
+histogram), the base composition and, with the Trinity sequence names
+(TRINITY_DN1000_c0_g1_i1), the gene and isoform counts. The engine requires
+NumPy; without it, the statistics are not computed.
+
+The file also contains the FASTA indexer, which writes a samtools faidx
+compatible index (.fai) in one pass, and the fetch of sequences and regions by
+name, which only reads their bytes; with a cluster file, the index is built in
+the cluster and the sequences are read by ranges through the pooled SFTP session.
+'''
+
+#-------------------------------------------------------------------------------
+
+import concurrent.futures
+import json
+import mmap
+import os
+import re
+import shlex
+import sys
+import time
+
+import xssh
+import xviewer
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+#-------------------------------------------------------------------------------
+
+CHUNK_SIZE = 8 * 1024 * 1024    # bytes scanned each time
+LENGTH_BIN_LIST = [0, 200, 500, 1000, 2000, 5000, 10000]    # lower limits of the bins of the length histogram
+BASE_LIST = ['A', 'C', 'G', 'T', 'N']                       # bases counted (in upper or lower case)
+
+#-------------------------------------------------------------------------------
+
+# Trinity sequence name: the gene is the name without the isoform suffix
+TRINITY_NAME_PATTERN = re.compile(rb'^(.+_c\d+_g\d+)_i\d+$')
+
+#-------------------------------------------------------------------------------
+
+def is_engine_available():
+    '''
+    Verify if the statistics engine can be used, i.e. NumPy is installed.
+    '''
+
+    return numpy is not None
+
+#-------------------------------------------------------------------------------
+
+def is_fasta_file_name(file_name):
+    '''
+    Verify if a file name has an extension of an uncompressed FASTA file.
+    '''
+
+    return os.path.splitext(file_name)[1].lower() in ['.fasta', '.fa', '.fas', '.fna', '.ffn', '.fsa']
+
+#-------------------------------------------------------------------------------
+
+def scan_fasta_file(path):
+    '''
+    Scan a FASTA file. Return the list of its headers (bytes without ">" and line
+    end), the array of its sequence lengths and the array of the counts of the
+    bases of BASE_LIST in its sequences.
+    '''
+
+    header_list = []
+    base_count_array = numpy.zeros(len(BASE_LIST), dtype=numpy.int64)
+
+    with open(path, mode='rb') as file_id:
+        size = os.fstat(file_id.fileno()).st_size
+        if size == 0:
+            return (header_list, numpy.zeros(0, dtype=numpy.int64), base_count_array)
+        file_map = mmap.mmap(file_id.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+
+            # get the chunks, which end at a line end
+            chunk_list = []
+            start = 0
+            while start < size:
+                end = min(start + CHUNK_SIZE, size)
+                if end < size:
+                    line_end = file_map.rfind(b'\n', start, end)
+                    end = line_end + 1 if line_end > -1 else (file_map.find(b'\n', end) + 1 or size)
+                chunk_list.append((start, end))
+                start = end
+
+            # scan the chunks in threads because NumPy releases the GIL in the byte operations
+            with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+                result_list = list(executor.map(lambda chunk: scan_chunk(file_map, *chunk), chunk_list))
+
+        finally:
+            file_map.close()
+
+    # join the results of the chunks adding the line ends of the previous chunks to the line end counts
+    header_start_list = []
+    header_end_list = []
+    start_line_end_count_list = []
+    end_line_end_count_list = []
+    line_end_count = 0
+    for (chunk_header_list, header_start_array, header_end_array, start_line_end_count_array, end_line_end_count_array, chunk_line_end_count, chunk_base_count_array) in result_list:
+        header_list.extend(chunk_header_list)
+        header_start_list.append(header_start_array)
+        header_end_list.append(header_end_array)
+        start_line_end_count_list.append(start_line_end_count_array + line_end_count)
+        end_line_end_count_list.append(end_line_end_count_array + line_end_count)
+        line_end_count += chunk_line_end_count
+        base_count_array += chunk_base_count_array
+
+    # compute the sequence lengths: the bytes after the header line end until the next header minus the line ends among them
+    header_start_array = numpy.concatenate(header_start_list)
+    header_end_array = numpy.concatenate(header_end_list)
+    next_start_array = numpy.append(header_start_array[1:], size)
+    next_line_end_count_array = numpy.append(numpy.concatenate(start_line_end_count_list)[1:], line_end_count)
+    length_array = (next_start_array - header_end_array - 1) - (next_line_end_count_array - numpy.concatenate(end_line_end_count_list) - 1)
+    length_array = numpy.maximum(length_array, 0)
+
+    # return the headers, the sequence lengths and the base counts
+    return (header_list, length_array, base_count_array)
+
+#-------------------------------------------------------------------------------
+
+def scan_chunk(file_map, start, end):
+    '''
+    Scan a chunk of a memory-mapped FASTA file which starts at a line start.
+    Return its headers, the offsets of the headers and of their line ends, the
+    numbers of line ends of the chunk before them, the number of line ends of the
+    chunk and the base counts of its sequences.
+    '''
+
+    chunk = numpy.frombuffer(file_map, dtype=numpy.uint8, count=end - start, offset=start)
+
+    # get the headers: ">" at the start of a line
+    greater_array = numpy.flatnonzero(chunk == ord('>'))
+    header_start_array = greater_array[(greater_array == 0) | (chunk[numpy.maximum(greater_array - 1, 0)] == ord('\n'))]
+
+    # get the line ends of the headers and the numbers of line ends before the headers and their line ends
+    newline_array = numpy.append(numpy.flatnonzero(chunk == ord('\n')), len(chunk))
+    if numpy.count_nonzero(chunk == ord('\r')) > 0:
+        line_end_array = numpy.flatnonzero((chunk == ord('\n')) | (chunk == ord('\r')))
+    else:
+        line_end_array = newline_array[:-1]
+    header_end_array = newline_array[numpy.searchsorted(newline_array, header_start_array)]
+    start_line_end_count_array = numpy.searchsorted(line_end_array, header_start_array)
+    end_line_end_count_array = numpy.searchsorted(line_end_array, header_end_array)
+
+    # count the bases of the chunk except those of the headers
+    header_list = [file_map[start + header_start:start + header_end] for (header_start, header_end) in zip(header_start_array.tolist(), header_end_array.tolist())]
+    base_count_array = count_bases(chunk) - count_bases(numpy.frombuffer(b''.join(header_list), dtype=numpy.uint8))
+    header_list = [header.rstrip(b'\r')[1:] for header in header_list]
+    line_end_count = len(line_end_array)
+    del chunk
+
+    return (header_list, header_start_array + start, header_end_array + start, start_line_end_count_array, end_line_end_count_array, line_end_count, base_count_array)
+
+#-------------------------------------------------------------------------------
+
+def count_bases(byte_array):
+    '''
+    Count the bases of BASE_LIST in an array of bytes in upper or lower case.
+    '''
+
+    # the lower case letters are changed to upper case
+    upper_array = byte_array & 0xDF
+    return numpy.array([numpy.count_nonzero(upper_array == ord(base)) for base in BASE_LIST], dtype=numpy.int64)
+
+#-------------------------------------------------------------------------------
+
+def get_fasta_stats(path):
+    '''
+    Get the statistics of a FASTA file as a dictionary of plain Python values.
+    '''
+
+    start_time = time.time()
+
+    # scan the file
+    (header_list, length_array, base_count_array) = scan_fasta_file(path)
+    sequence_count = len(length_array)
+    total_length = int(length_array.sum())
+
+    # get the length statistics
+    stats_dict = {'path': path, 'sequence_count': sequence_count, 'total_length': total_length}
+    if sequence_count > 0:
+        sorted_length_array = numpy.sort(length_array)[::-1]
+        cumulative_length_array = numpy.cumsum(sorted_length_array)
+        for (name, fraction) in [('50', 0.5), ('90', 0.9)]:
+            i = int(numpy.searchsorted(cumulative_length_array, fraction * total_length))
+            i = min(i, sequence_count - 1)
+            stats_dict['n{0}'.format(name)] = int(sorted_length_array[i])
+            stats_dict['l{0}'.format(name)] = i + 1
+        stats_dict['min_length'] = int(sorted_length_array[-1])
+        stats_dict['max_length'] = int(sorted_length_array[0])
+        stats_dict['mean_length'] = round(total_length / sequence_count, 2)
+        stats_dict['median_length'] = float(numpy.median(length_array))
+    else:
+        stats_dict.update({'n50': 0, 'l50': 0, 'n90': 0, 'l90': 0, 'min_length': 0, 'max_length': 0, 'mean_length': 0, 'median_length': 0})
+
+    # get the length histogram
+    bin_count_array = numpy.bincount(numpy.searchsorted(LENGTH_BIN_LIST, length_array, side='right') - 1, minlength=len(LENGTH_BIN_LIST))
+    histogram_list = []
+    for i, lower_limit in enumerate(LENGTH_BIN_LIST):
+        upper_limit = LENGTH_BIN_LIST[i + 1] - 1 if i + 1 < len(LENGTH_BIN_LIST) else None
+        histogram_list.append({'min_length': lower_limit, 'max_length': upper_limit, 'sequence_count': int(bin_count_array[i])})
+    stats_dict['length_histogram'] = histogram_list
+
+    # get the base composition
+    base_count_dict = {base: int(count) for (base, count) in zip(BASE_LIST, base_count_array)}
+    base_count_dict['other'] = total_length - sum(base_count_dict.values())
+    stats_dict['base_count'] = base_count_dict
+    acgt_count = base_count_dict['A'] + base_count_dict['C'] + base_count_dict['G'] + base_count_dict['T']
+    stats_dict['gc_percentage'] = round(100 * (base_count_dict['G'] + base_count_dict['C']) / acgt_count, 2) if acgt_count > 0 else 0
+
+    # get the gene and isoform counts when the sequences have Trinity names
+    gene_set = set()
+    isoform_count = 0
+    for header in header_list:
+        mo = TRINITY_NAME_PATTERN.match(header.split(None, 1)[0] if header.strip() != b'' else b'')
+        if mo is not None:
+            gene_set.add(mo.group(1))
+            isoform_count += 1
+    if isoform_count > 0 and isoform_count == sequence_count:
+        stats_dict['gene_count'] = len(gene_set)
+        stats_dict['isoform_count'] = isoform_count
+        stats_dict['mean_isoforms_per_gene'] = round(isoform_count / len(gene_set), 2)
+
+    # return the statistics dictionary
+    stats_dict['elapsed_time'] = round(time.time() - start_time, 3)
+    return stats_dict
+
+#-------------------------------------------------------------------------------
+
+def get_fasta_stats_file(path):
+    '''
+    Get the path of the JSON file with the statistics of a FASTA file.
+    '''
+
+    return '{0}.stats.json'.format(path)
+
+#-------------------------------------------------------------------------------
+
+def write_fasta_stats(path):
+    '''
+    Get the statistics of a FASTA file and save them in a JSON file beside it.
+    '''
+
+    # initialize the control variable, the error list and the statistics
+    OK = True
+    error_list = []
+    stats_dict = {}
+
+    # get and save the statistics
+    try:
+        stats_dict = get_fasta_stats(path)
+    except (OSError, ValueError) as e:
+        error_list.append('*** ERROR: The statistics of the file {0} can not be got: {1}'.format(path, e))
+        OK = False
+    if OK:
+        try:
+            with open(get_fasta_stats_file(path), mode='w', encoding='utf-8') as file_id:
+                json.dump(stats_dict, file_id, indent=4)
+        except OSError:
+            error_list.append('*** ERROR: The file {0} can not be created.'.format(get_fasta_stats_file(path)))
+            OK = False
+
+    # return the control variable, the error list and the statistics
+    return (OK, error_list, stats_dict)
+
+#-------------------------------------------------------------------------------
+
+def get_stats_text_list(stats_dict):
+    '''
+    Get the lines of text that summarize the statistics of a FASTA file.
+    '''
+
+    text_list = []
+    text_list.append('Sequences: {0} - total length: {1} - GC: {2}%'.format(stats_dict['sequence_count'], stats_dict['total_length'], stats_dict['gc_percentage']))
+    text_list.append('Length: min {0} - median {1} - mean {2} - max {3} - N50 {4} - N90 {5}'.format(stats_dict['min_length'], stats_dict['median_length'], stats_dict['mean_length'], stats_dict['max_length'], stats_dict['n50'], stats_dict['n90']))
+    if 'gene_count' in stats_dict:
+        text_list.append('Trinity genes: {0} - isoforms: {1} - isoforms per gene: {2}'.format(stats_dict['gene_count'], stats_dict['isoform_count'], stats_dict['mean_isoforms_per_gene']))
+    return text_list
+
+#-------------------------------------------------------------------------------
+
+def get_fasta_index_file(path):
+    '''
+    Get the path of the index file (.fai) of a FASTA file.
+    '''
+
+    return '{0}.fai'.format(path)
+
+#-------------------------------------------------------------------------------
+
+def build_fasta_index(path):
+    '''
+    Build the index of a FASTA file. Return a dictionary whose keys are the sequence
+    names (the header until the first blank) and whose values are tuples with the
+    sequence length, the offset of its first base, the bases per line and the
+    bytes per line, like samtools faidx. A ValueError is raised when the lines of
+    a sequence have different length, except the last one, or a name is repeated.
+    '''
+
+    index_dict = {}
+
+    with open(path, mode='rb') as file_id:
+        size = os.fstat(file_id.fileno()).st_size
+        if size == 0:
+            return index_dict
+        file_map = mmap.mmap(file_id.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+
+            # get the first header
+            if file_map[:1] == b'>':
+                header_start = 0
+            else:
+                header_start = file_map.find(b'\n>')
+                if file_map[:header_start if header_start > -1 else size].strip() != b'':
+                    raise ValueError('there is data before the first header')
+                header_start = header_start + 1 if header_start > -1 else size
+
+            # process the records: the sequence lines of each record are checked with byte slices
+            while header_start < size:
+                header_end = file_map.find(b'\n', header_start)
+                sequence_start = header_end + 1 if header_end > -1 else size
+                next_header_start = file_map.find(b'\n>', sequence_start - 1) + 1 if sequence_start < size else 0
+                if next_header_start == 0:
+                    next_header_start = size
+                name_list = file_map[header_start + 1:sequence_start].split(None, 1)
+                name = name_list[0].decode('iso-8859-1') if name_list != [] else ''
+                if name in index_dict:
+                    raise ValueError('the sequence name {0} is repeated'.format(name))
+                (length, line_bases, line_width) = get_sequence_layout(file_map[sequence_start:next_header_start], name)
+                index_dict[name] = (length, sequence_start, line_bases, line_width)
+                header_start = next_header_start
+
+        finally:
+            file_map.close()
+
+    return index_dict
+
+#-------------------------------------------------------------------------------
+
+def get_sequence_layout(data, name):
+    '''
+    Get the length, the bases per line and the bytes per line of the sequence lines
+    of a record. The lines are checked without splitting them: in a well-formed
+    sequence, every line end is a multiple of the line width.
+    '''
+
+    # remove the line ends and the blank lines at the end of the record
+    sequence = data.rstrip(b'\r\n')
+    if sequence == b'':
+        return (0, 0, 0)
+
+    # get the layout of the first line
+    line_width = sequence.find(b'\n') + 1
+    if line_width == 0:
+        return (len(sequence), len(sequence), len(sequence) + (2 if data[len(sequence):len(sequence) + 2] == b'\r\n' else 1))
+    line_bases = line_width - 2 if sequence[line_width - 2:line_width - 1] == b'\r' else line_width - 1
+
+    # check every line except the last one has the same layout and get the length
+    line_end_list = sequence[line_width - 1::line_width]
+    last_line_length = len(sequence) - len(line_end_list) * line_width
+    if line_end_list.count(b'\n') != len(line_end_list) or sequence.count(b'\n') != len(line_end_list) or last_line_length > line_bases:
+        raise ValueError('the lines of the sequence {0} have different length'.format(name))
+    if line_width - line_bases == 2 and sequence[line_width - 2::line_width].count(b'\r') != len(line_end_list):
+        raise ValueError('the lines of the sequence {0} have different line ends'.format(name))
+
+    return (len(line_end_list) * line_bases + last_line_length, line_bases, line_width)
+
+#-------------------------------------------------------------------------------
+
+def write_fasta_index(path):
+    '''
+    Build the index of a FASTA file and save it in a .fai file beside it.
+    '''
+
+    # initialize the control variable, the error list and the index
+    OK = True
+    error_list = []
+    index_dict = {}
+
+    # build and save the index
+    try:
+        index_dict = build_fasta_index(path)
+    except (OSError, ValueError) as e:
+        error_list.append('*** ERROR: The file {0} can not be indexed: {1}'.format(path, e))
+        OK = False
+    if OK:
+        try:
+            with open(get_fasta_index_file(path), mode='w', encoding='iso-8859-1') as file_id:
+                for (name, (length, offset, line_bases, line_width)) in index_dict.items():
+                    file_id.write('{0}\t{1}\t{2}\t{3}\t{4}\n'.format(name, length, offset, line_bases, line_width))
+        except OSError:
+            error_list.append('*** ERROR: The file {0} can not be created.'.format(get_fasta_index_file(path)))
+            OK = False
+
+    # return the control variable, the error list and the index
+    return (OK, error_list, index_dict)
+
+#-------------------------------------------------------------------------------
+
+def parse_fasta_index(data):
+    '''
+    Parse the bytes of a .fai file and return the index dictionary.
+    '''
+
+    index_dict = {}
+    for line in data.decode('iso-8859-1').splitlines():
+        data_list = line.split('\t')
+        if len(data_list) >= 5:
+            index_dict[data_list[0]] = (int(data_list[1]), int(data_list[2]), int(data_list[3]), int(data_list[4]))
+    return index_dict
+
+#-------------------------------------------------------------------------------
+
+def get_cluster_fasta_index_command(path):
+    '''
+    Get the command that builds in the cluster the index of a FASTA file when it
+    does not exist or it is older than the file.
+    '''
+
+    index_file = get_fasta_index_file(path)
+    awk_program = (
+        'function flush() { if (seen) print name "\\t" len "\\t" start "\\t" lb "\\t" lw } '
+        '/^>/ { flush(); name = substr($0, 2); sub(/\\r$/, "", name); sub(/[ \\t].*/, "", name); if (name in names) { print "the sequence name " name " is repeated" > "/dev/stderr"; exit 1 } names[name] = 1; seen = 1; offset += length($0) + 1; start = offset; len = 0; lb = 0; lw = 0; last = 0; next } '
+        '{ w = length($0) + 1; line = $0; sub(/\\r$/, "", line); b = length(line); offset += w; '
+        'if (!seen) { if (b > 0) { print "there is data before the first header" > "/dev/stderr"; exit 1 } next } '
+        'if (b == 0) { last = 1; next } '
+        'if (last || (lb > 0 && b > lb)) { print "the lines of the sequence " name " have different length" > "/dev/stderr"; exit 1 } '
+        'if (lb == 0) { lb = b; lw = w } else if (b < lb || w != lw) { last = 1 } '
+        'len += b } '
+        'END { flush() }'
+        )
+    return '[ {1} -nt {0} ] || {{ LC_ALL=C awk {2} {0} > {3} && mv {3} {1} || {{ rm -f {3}; exit 1; }}; }}'.format(shlex.quote(path), shlex.quote(index_file), shlex.quote(awk_program), shlex.quote('{0}.tmp'.format(index_file)))
+
+#-------------------------------------------------------------------------------
+
+class FastaReader(object):
+    '''
+    This class fetches sequences and regions of an indexed FASTA file reading only
+    their bytes from a local or cluster file source.
+    '''
+
+    #---------------
+
+    def __init__(self, source, index_dict):
+        '''
+        Execute actions correspending to the creation of a "FastaReader" instance.
+        '''
+
+        self.source = source
+        self.index_dict = index_dict
+
+    #---------------
+
+    def get_name_list(self):
+        '''
+        Get the sequence names in the order of the file.
+        '''
+
+        return list(self.index_dict.keys())
+
+    #---------------
+
+    def fetch(self, name, start=None, end=None):
+        '''
+        Fetch the sequence of a name or its region from start to end (0-based and
+        end excluded). Return None when the name is not in the index.
+        '''
+
+        if name not in self.index_dict:
+            return None
+        (length, offset, line_bases, line_width) = self.index_dict[name]
+
+        # fit the region to the sequence
+        start = 0 if start is None else max(0, min(start, length))
+        end = length if end is None else max(start, min(end, length))
+        if start == end:
+            return ''
+
+        # read the bytes from the line of the first base to the last base and remove the line ends
+        first_byte = offset + start // line_bases * line_width + start % line_bases
+        last_byte = offset + (end - 1) // line_bases * line_width + (end - 1) % line_bases
+        data = self.source.read(first_byte, last_byte - first_byte + 1)
+        return data.replace(b'\n', b'').replace(b'\r', b'').decode('iso-8859-1')
+
+    #---------------
+
+    def fetch_region(self, region):
+        '''
+        Fetch a region in samtools notation: name, name:start or name:start-end
+        (1-based and end included).
+        '''
+
+        (name, start, end) = parse_region(region, self.index_dict)
+        return self.fetch(name, start, end)
+
+    #---------------
+
+    def close(self):
+        '''
+        Close the file source.
+        '''
+
+        self.source.close()
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+def parse_region(region, index_dict):
+    '''
+    Parse a region in samtools notation and return its name, start and end
+    (0-based, end excluded, None when not indicated). A name with ":" is
+    accepted when it is in the index.
+    '''
+
+    if region in index_dict:
+        return (region, None, None)
+    mo = re.match(r'^(.+):([\d,]+)(?:-([\d,]*))?$', region)
+    if not mo:
+        return (region, None, None)
+    start = max(0, int(mo.group(2).replace(',', '')) - 1)
+    end = int(mo.group(3).replace(',', '')) if mo.group(3) else None
+    return (mo.group(1), start, end)
+
+#-------------------------------------------------------------------------------
+
+def open_fasta_reader(path, cluster_name=None):
+    '''
+    Open a local FASTA file or, when the cluster name is passed, a cluster FASTA
+    file to fetch its sequences. The index is used when it is newer than the file;
+    otherwise, it is built and saved (in the cluster for a cluster file).
+    '''
+
+    # initialize the control variable, the error list and the reader
+    OK = True
+    error_list = []
+    reader = None
+
+    # get the index of a local file
+    if cluster_name is None:
+        index_file = get_fasta_index_file(path)
+        if os.path.isfile(index_file) and os.path.isfile(path) and os.path.getmtime(index_file) >= os.path.getmtime(path):
+            try:
+                with open(index_file, mode='rb') as file_id:
+                    index_dict = parse_fasta_index(file_id.read())
+            except (OSError, ValueError):
+                error_list.append('*** ERROR: The file {0} can not be read.'.format(index_file))
+                OK = False
+        else:
+            (OK, error_list, index_dict) = write_fasta_index(path)
+
+    # get the index of a cluster file
+    else:
+        (OK, error_list, stdout) = xssh.execute_pooled_cluster_command(cluster_name, get_cluster_fasta_index_command(path))
+        if not OK:
+            error_list.append('*** ERROR: The cluster file {0} can not be indexed.'.format(path))
+        if OK:
+            (OK, error_list, index_source) = xviewer.open_file_source(get_fasta_index_file(path), cluster_name)
+        if OK:
+            try:
+                index_dict = parse_fasta_index(index_source.read(0, index_source.size))
+            except (IOError, ValueError):
+                error_list.append('*** ERROR: The cluster file {0} can not be read.'.format(get_fasta_index_file(path)))
+                OK = False
+            index_source.close()
+
+    # open the file source
+    if OK:
+        (OK, error_list, source) = xviewer.open_file_source(path, cluster_name)
+    if OK:
+        reader = FastaReader(source, index_dict)
+
+    # return the control variable, the error list and the reader
+    return (OK, error_list, reader)
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+     print('This file contains the functions of the statistics engine of local FASTA files and of the FASTA indexer used in both console mode and gui mode.')
+     sys.exit(0)
+
+#-------------------------------------------------------------------------------
@@ -0,0 +1,701 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#-------------------------------------------------------------------------------
+
+'''
+This software has been developed by:
+
+    GI Genética, Fisiología e Historia Forestal
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politécnica de Madrid
+    http://gfhforestal.com/
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+'''
+This file contains the functions of the profiler and the paired-end checker of
+local FASTQ files used in both console mode and gui mode before uploading them
+to a cluster.
+
+The files, plain or compressed with gzip, are read in large blocks and their
+records are summarized by batches with NumPy: read count, length distribution,
+base composition, quality encoding and quality per position. The files are
+profiled in parallel worker processes and the profiles are kept in a cache in
+the temporal directory while the files do not change. The profiler requires
+NumPy; without it, the profiles are not computed.
+
+The two files of a paired-end library are read in lockstep by batches of records
+to verify that their reads correspond.
+'''
+
+#-------------------------------------------------------------------------------
+
+import concurrent.futures
+import gzip
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+#-------------------------------------------------------------------------------
+
+BLOCK_SIZE = 16 * 1024 * 1024       # bytes read each time by the profiler
+MAX_POSITION = 1000                 # positions with quality summary; the longer reads are summarized until it
+QUALITY_BINS = 128                  # bins of the quality histograms (one per ASCII code)
+PAIR_BLOCK_SIZE = 4 * 1024 * 1024   # bytes read each time from every file of a pair
+PAIR_BATCH_SIZE = 50000             # read pairs compared each time
+
+#-------------------------------------------------------------------------------
+
+def is_profiler_available():
+    '''
+    Verify if the profiler can be used, i.e. NumPy is installed.
+    '''
+
+    return numpy is not None
+
+#-------------------------------------------------------------------------------
+
+def get_profile_cache_file():
+    '''
+    Get the path of the cache of the FASTQ file profiles.
+    '''
+
+    # the temporal directory is got as in xlib.get_temp_dir, which is not imported to keep the worker processes light
+    return './temp/fastq-profiles.json'
+
+#-------------------------------------------------------------------------------
+
+def open_fastq_file(path):
+    '''
+    Open a FASTQ file in binary mode decompressing it when it is compressed with gzip.
+    '''
+
+    with open(path, mode='rb') as file_id:
+        magic_number = file_id.read(2)
+    if magic_number == b'\x1f\x8b':
+        return gzip.open(path, mode='rb')
+    else:
+        return open(path, mode='rb')
+
+#-------------------------------------------------------------------------------
+
+class FastqProfile(object):
+    '''
+    This class accumulates the summaries of the batches of records of a FASTQ file.
+    '''
+
+    #---------------
+
+    def __init__(self):
+        '''
+        Execute actions correspending to the creation of a "FastqProfile" instance.
+        '''
+
+        self.read_count = 0
+        self.invalid_record_count = 0
+        self.length_count_array = numpy.zeros(1, dtype=numpy.int64)
+        self.base_count_array = numpy.zeros(256, dtype=numpy.int64)
+        self.quality_count_array = numpy.zeros(QUALITY_BINS, dtype=numpy.int64)
+        self.position_quality_count_array = numpy.zeros(MAX_POSITION * QUALITY_BINS, dtype=numpy.int64)
+
+    #---------------
+
+    def add_records(self, line_list):
+        '''
+        Add a batch of records given as a list of lines whose length is a multiple of 4.
+        '''
+
+        # get the lines of the records
+        header_list = line_list[0::4]
+        sequence_list = line_list[1::4]
+        separator_list = line_list[2::4]
+        quality_list = line_list[3::4]
+        record_count = len(header_list)
+        if record_count == 0:
+            return
+
+        # get the lengths and discard the invalid records
+        sequence_length_array = numpy.fromiter(map(len, sequence_list), dtype=numpy.int64, count=record_count)
+        quality_length_array = numpy.fromiter(map(len, quality_list), dtype=numpy.int64, count=record_count)
+        is_valid_array = (numpy.frombuffer(b''.join([header[:1] or b' ' for header in header_list]), dtype=numpy.uint8) == ord('@')) & (numpy.frombuffer(b''.join([separator[:1] or b' ' for separator in separator_list]), dtype=numpy.uint8) == ord('+')) & (sequence_length_array == quality_length_array)
+        if not is_valid_array.all():
+            self.invalid_record_count += int(record_count - is_valid_array.sum())
+            valid_index_list = numpy.flatnonzero(is_valid_array).tolist()
+            sequence_list = [sequence_list[i] for i in valid_index_list]
+            quality_list = [quality_list[i] for i in valid_index_list]
+            sequence_length_array = sequence_length_array[is_valid_array]
+        self.read_count += len(sequence_list)
+        if sequence_list == []:
+            return
+
+        # accumulate the length distribution
+        length_count_array = numpy.bincount(sequence_length_array)
+        if len(length_count_array) > len(self.length_count_array):
+            self.length_count_array = numpy.concatenate([self.length_count_array, numpy.zeros(len(length_count_array) - len(self.length_count_array), dtype=numpy.int64)])
+        self.length_count_array[:len(length_count_array)] += length_count_array
+
+        # accumulate the base composition
+        self.base_count_array += numpy.bincount(numpy.frombuffer(b''.join(sequence_list), dtype=numpy.uint8), minlength=256)
+
+        # accumulate the quality distribution and the quality distribution per position
+        quality_array = numpy.frombuffer(b''.join(quality_list), dtype=numpy.uint8) & (QUALITY_BINS - 1)
+        self.quality_count_array += numpy.bincount(quality_array, minlength=QUALITY_BINS)
+        start_array = numpy.repeat(numpy.cumsum(sequence_length_array) - sequence_length_array, sequence_length_array)
+        position_array = numpy.arange(len(quality_array), dtype=numpy.int64) - start_array
+        is_summarized_array = position_array < MAX_POSITION
+        self.position_quality_count_array += numpy.bincount(position_array[is_summarized_array] * QUALITY_BINS + quality_array[is_summarized_array], minlength=MAX_POSITION * QUALITY_BINS)
+
+    #---------------
+
+    def get_profile_dict(self):
+        '''
+        Get a dictionary with the profile data as plain Python values.
+        '''
+
+        # get the length statistics
+        length_array = numpy.flatnonzero(self.length_count_array)
+        base_count = int((numpy.arange(len(self.length_count_array)) * self.length_count_array).sum())
+        if self.read_count > 0:
+            cumulative_count_array = numpy.cumsum(self.length_count_array)
+            median_length = int(numpy.searchsorted(cumulative_count_array, (self.read_count + 1) / 2))
+            min_length = int(length_array[0])
+            max_length = int(length_array[-1])
+            mean_length = base_count / self.read_count
+        else:
+            (median_length, min_length, max_length, mean_length) = (0, 0, 0, 0)
+
+        # get the base composition
+        base_count_dict = {}
+        for base in 'ACGTN':
+            base_count_dict[base] = int(self.base_count_array[ord(base)] + self.base_count_array[ord(base.lower())])
+        base_count_dict['other'] = int(base_count - sum(base_count_dict.values()))
+        gc_percentage = 100 * (base_count_dict['G'] + base_count_dict['C']) / base_count if base_count > 0 else 0
+        n_percentage = 100 * base_count_dict['N'] / base_count if base_count > 0 else 0
+
+        # detect the quality encoding
+        quality_code_array = numpy.flatnonzero(self.quality_count_array)
+        if len(quality_code_array) == 0:
+            (min_quality_code, max_quality_code, quality_encoding, quality_offset) = (0, 0, 'unknown', 33)
+        else:
+            min_quality_code = int(quality_code_array[0])
+            max_quality_code = int(quality_code_array[-1])
+            (quality_encoding, quality_offset) = get_quality_encoding(min_quality_code, max_quality_code)
+        quality_count = int(self.quality_count_array.sum())
+        mean_quality = float((numpy.arange(QUALITY_BINS) * self.quality_count_array).sum() / quality_count - quality_offset) if quality_count > 0 else 0
+
+        # get the quality summary per position: mean and quartiles
+        position_quality_list = []
+        position_quality_count_array = self.position_quality_count_array.reshape(MAX_POSITION, QUALITY_BINS)
+        position_count_array = position_quality_count_array.sum(axis=1)
+        position_number = int(numpy.count_nonzero(position_count_array))
+        if position_number > 0:
+            position_quality_count_array = position_quality_count_array[:position_number]
+            position_count_array = position_count_array[:position_number]
+            mean_array = (position_quality_count_array * numpy.arange(QUALITY_BINS)).sum(axis=1) / position_count_array - quality_offset
+            cumulative_count_array = numpy.cumsum(position_quality_count_array, axis=1)
+            quartile_array_list = [(cumulative_count_array < fraction * position_count_array[:, None]).sum(axis=1) - quality_offset for fraction in (0.25, 0.5, 0.75)]
+            for i in range(position_number):
+                position_quality_list.append((i + 1, round(float(mean_array[i]), 2), int(quartile_array_list[0][i]), int(quartile_array_list[1][i]), int(quartile_array_list[2][i])))
+
+        # return the profile dictionary
+        return {
+            'read_count': self.read_count,
+            'invalid_record_count': self.invalid_record_count,
+            'base_count': base_count,
+            'min_length': min_length,
+            'max_length': max_length,
+            'mean_length': round(mean_length, 2),
+            'median_length': median_length,
+            'length_count_dict': {int(length): int(self.length_count_array[length]) for length in length_array},
+            'base_count_dict': base_count_dict,
+            'gc_percentage': round(gc_percentage, 2),
+            'n_percentage': round(n_percentage, 4),
+            'min_quality_char': chr(min_quality_code) if min_quality_code > 0 else '',
+            'max_quality_char': chr(max_quality_code) if max_quality_code > 0 else '',
+            'quality_encoding': quality_encoding,
+            'mean_quality': round(mean_quality, 2),
+            'position_quality_list': position_quality_list,
+        }
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+def get_quality_encoding(min_quality_code, max_quality_code):
+    '''
+    Get the quality encoding and its offset from the minimum and maximum ASCII
+    codes of the quality values.
+    '''
+
+    if min_quality_code < 59:
+        return ('Phred+33', 33)
+    elif min_quality_code < 64:
+        return ('Solexa+64', 64)
+    else:
+        return ('Phred+64', 64)
+
+#-------------------------------------------------------------------------------
+
+def profile_fastq_file(path):
+    '''
+    Profile a FASTQ file reading it in blocks. A truncated file (an incomplete
+    last record or a compressed stream without end) is marked in the profile.
+    '''
+
+    start_time = time.time()
+    profile = FastqProfile()
+    is_truncated = False
+    error = None
+
+    # read the file in blocks and add its complete records; the lines of an incomplete record are added to the next block
+    try:
+        with open_fastq_file(path) as file_id:
+            pending_line_list = []
+            pending_data = b''
+            while True:
+                try:
+                    data = file_id.read(BLOCK_SIZE)
+                except EOFError:
+                    is_truncated = True
+                    data = b''
+                if data == b'':
+                    break
+                data = pending_data + data
+                if b'\r' in data:
+                    data = data.replace(b'\r\n', b'\n')
+                end = data.rfind(b'\n')
+                pending_data = data[end + 1:]
+                line_list = pending_line_list + data[:end].split(b'\n') if end > -1 else pending_line_list
+                complete_line_count = len(line_list) - len(line_list) % 4
+                pending_line_list = line_list[complete_line_count:]
+                profile.add_records(line_list[:complete_line_count])
+
+            # add the last line without line end and verify that the last record is complete (a quality line without line end can be cut)
+            if pending_data != b'':
+                pending_line_list.append(pending_data)
+            while pending_line_list != [] and pending_line_list[-1] == b'':
+                pending_line_list.pop()
+            if pending_line_list != []:
+                if len(pending_line_list) % 4 == 0 and (pending_data == b'' or len(pending_line_list[-1]) >= len(pending_line_list[-3])):
+                    profile.add_records(pending_line_list)
+                else:
+                    is_truncated = True
+    except (OSError, EOFError) as e:
+        error = str(e)
+
+    # build the profile dictionary
+    profile_dict = profile.get_profile_dict()
+    profile_dict['path'] = path
+    profile_dict['is_truncated'] = is_truncated
+    profile_dict['error'] = error
+    profile_dict['elapsed_time'] = round(time.time() - start_time, 3)
+
+    # return the profile dictionary
+    return profile_dict
+
+#-------------------------------------------------------------------------------
+
+def map_in_processes(function, argument_list, process_count=None):
+    '''
+    Call a function with every tuple of arguments of a list in worker processes
+    and return the list of results in the same order. The processes are started
+    with "spawn" because the calling process can have threads (Tk, SSH).
+    '''
+
+    if argument_list == []:
+        return []
+    if process_count is None:
+        process_count = max(1, min(len(argument_list), os.cpu_count() or 1))
+    if process_count == 1 or len(argument_list) == 1:
+        return [function(*arguments) for arguments in argument_list]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=process_count, mp_context=multiprocessing.get_context('spawn')) as executor:
+        return list(executor.map(function, *zip(*argument_list)))
+
+#-------------------------------------------------------------------------------
+
+def get_file_key(path):
+    '''
+    Get the key of a file in the profile cache: its absolute path, size and
+    modification time.
+    '''
+
+    stat_result = os.stat(path)
+    return [os.path.abspath(path), stat_result.st_size, stat_result.st_mtime_ns]
+
+#-------------------------------------------------------------------------------
+
+def profile_fastq_files(path_list, process_count=None):
+    '''
+    Profile several FASTQ files in parallel worker processes, using the cached
+    profiles of the files which have not changed. Return a list of profile
+    dictionaries in the same order as the paths.
+    '''
+
+    # load the cache
+    cache_file = get_profile_cache_file()
+    try:
+        with open(cache_file, mode='r', encoding='utf-8') as file_id:
+            cache_list = json.load(file_id)
+    except (OSError, ValueError):
+        cache_list = []
+    cache_dict = {tuple(item['key']): item['profile'] for item in cache_list if 'key' in item and 'profile' in item}
+
+    # get the cached profiles and the files to be profiled
+    profile_list = [None] * len(path_list)
+    key_list = [None] * len(path_list)
+    pending_index_list = []
+    for i, path in enumerate(path_list):
+        try:
+            key_list[i] = tuple(get_file_key(path))
+        except OSError as e:
+            profile_list[i] = {'path': path, 'error': str(e)}
+            continue
+        if key_list[i] in cache_dict:
+            profile_list[i] = dict(cache_dict[key_list[i]], path=path)
+        else:
+            pending_index_list.append(i)
+
+    # profile the files in worker processes
+    for i, profile_dict in zip(pending_index_list, map_in_processes(profile_fastq_file, [(path_list[i],) for i in pending_index_list], process_count)):
+        profile_list[i] = profile_dict
+
+    # save the profiles of the files without errors in the cache
+    for i in pending_index_list:
+        if profile_list[i].get('error') is None:
+            cache_dict[key_list[i]] = profile_list[i]
+    try:
+        if not os.path.exists(os.path.dirname(cache_file)):
+            os.makedirs(os.path.dirname(cache_file))
+        with open(cache_file, mode='w', encoding='utf-8') as file_id:
+            json.dump([{'key': list(key), 'profile': profile} for key, profile in cache_dict.items() if os.path.exists(key[0])], file_id)
+    except OSError:
+        pass
+
+    # return the profile list
+    return profile_list
+
+#-------------------------------------------------------------------------------
+
+def get_profile_text_list(profile_dict, position_step=10):
+    '''
+    Get the lines of text that summarize a profile.
+    '''
+
+    text_list = []
+    if profile_dict.get('error') is not None:
+        text_list.append('*** ERROR: The file {0} can not be read: {1}'.format(profile_dict['path'], profile_dict['error']))
+        return text_list
+    text_list.append('File: {0} (profiled in {1:.1f} s)'.format(profile_dict['path'], profile_dict['elapsed_time']))
+    text_list.append('    Reads: {0} - bases: {1} - invalid records: {2}{3}'.format(profile_dict['read_count'], profile_dict['base_count'], profile_dict['invalid_record_count'], ' - TRUNCATED' if profile_dict['is_truncated'] else ''))
+    text_list.append('    Length: min {0} - median {1} - mean {2} - max {3}'.format(profile_dict['min_length'], profile_dict['median_length'], profile_dict['mean_length'], profile_dict['max_length']))
+    text_list.append('    Bases: {0} - GC {1}% - N {2}%'.format(' '.join(['{0}={1}'.format(base, count) for base, count in profile_dict['base_count_dict'].items()]), profile_dict['gc_percentage'], profile_dict['n_percentage']))
+    text_list.append('    Quality: {0} (characters {1} to {2}) - mean {3}'.format(profile_dict['quality_encoding'], profile_dict['min_quality_char'], profile_dict['max_quality_char'], profile_dict['mean_quality']))
+    position_quality_list = profile_dict['position_quality_list']
+    if position_quality_list != []:
+        text_list.append('    Quality per position (position: mean Q1/median/Q3):')
+        shown_position_quality_list = [item for item in position_quality_list if item[0] == 1 or item[0] % position_step == 0]
+        if shown_position_quality_list[-1] != position_quality_list[-1]:
+            shown_position_quality_list.append(position_quality_list[-1])
+        for j in range(0, len(shown_position_quality_list), 5):
+            text_list.append('        {0}'.format('   '.join(['{0}: {1} {2}/{3}/{4}'.format(*item) for item in shown_position_quality_list[j:j + 5]])))
+    return text_list
+
+#-------------------------------------------------------------------------------
+
+def get_profile_problem_list(profile_list):
+    '''
+    Get the errors and warnings of a set of profiles: unreadable, truncated or
+    empty files and files with invalid records are errors; mixed quality encodings
+    and very different read lengths are warnings. Return a list of tuples (is_error,
+    text).
+    '''
+
+    problem_list = []
+
+    # verify every file
+    for profile_dict in profile_list:
+        if profile_dict.get('error') is not None:
+            problem_list.append((True, 'The file {0} can not be read.'.format(profile_dict['path'])))
+            continue
+        if profile_dict['is_truncated']:
+            problem_list.append((True, 'The file {0} is truncated.'.format(profile_dict['path'])))
+        if profile_dict['read_count'] == 0:
+            problem_list.append((True, 'The file {0} has not any read.'.format(profile_dict['path'])))
+        if profile_dict['invalid_record_count'] > 0:
+            problem_list.append((True, 'The file {0} has {1} invalid records.'.format(profile_dict['path'], profile_dict['invalid_record_count'])))
+
+    # compare the files
+    readable_profile_list = [profile_dict for profile_dict in profile_list if profile_dict.get('error') is None and profile_dict['read_count'] > 0]
+    quality_encoding_set = {profile_dict['quality_encoding'] for profile_dict in readable_profile_list}
+    if len(quality_encoding_set) > 1:
+        problem_list.append((False, 'The files have mixed quality encodings: {0}.'.format(', '.join(sorted(quality_encoding_set)))))
+    if readable_profile_list != []:
+        median_length_list = [profile_dict['median_length'] for profile_dict in readable_profile_list]
+        if min(median_length_list) > 0 and max(median_length_list) > 2 * min(median_length_list):
+            problem_list.append((False, 'The median read lengths of the files are very different: from {0} to {1}.'.format(min(median_length_list), max(median_length_list))))
+
+    return problem_list
+
+#-------------------------------------------------------------------------------
+
+class FastqRecordReader(object):
+    '''
+    This class reads the records of a FASTQ file by batches keeping only the
+    lines of a batch and of the last block read.
+    '''
+
+    #---------------
+
+    def __init__(self, path):
+        '''
+        Execute actions correspending to the creation of a "FastqRecordReader" instance.
+        '''
+
+        self.file_id = open_fastq_file(path)
+        self.line_list = []
+        self.pending_data = b''
+        self.offset = 0
+        self.record_count = 0
+        self.is_eof = False
+
+    #---------------
+
+    def fill(self, record_count):
+        '''
+        Read blocks until there are lines of a number of records or the file ends.
+        '''
+
+        while len(self.line_list) < 4 * record_count and not self.is_eof:
+            data = self.file_id.read(PAIR_BLOCK_SIZE)
+            if data == b'':
+                if self.pending_data != b'':
+                    self.line_list.append(self.pending_data)
+                    self.pending_data = b''
+                self.is_eof = True
+                break
+            data = self.pending_data + data
+            end = data.rfind(b'\n')
+            self.pending_data = data[end + 1:]
+            if end > -1:
+                self.line_list.extend(data[:end].split(b'\n'))
+
+    #---------------
+
+    def take(self, record_count):
+        '''
+        Take the lines of a number of records. Return the offset of the first
+        record and its lines.
+        '''
+
+        offset = self.offset
+        line_list = self.line_list[:4 * record_count]
+        del self.line_list[:4 * record_count]
+        self.offset += sum(map(len, line_list)) + len(line_list)
+        self.record_count += len(line_list) // 4
+        return (offset, line_list)
+
+    #---------------
+
+    def close(self):
+        '''
+        Close the file.
+        '''
+
+        self.file_id.close()
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+def get_read_name(header, mate):
+    '''
+    Get the read name of a header without the mate suffix ("/1" or "/2").
+    '''
+
+    field_list = header[1:].split(None, 1)
+    name = field_list[0] if field_list != [] else b''
+    if name.endswith(mate):
+        name = name[:-2]
+    return name
+
+#-------------------------------------------------------------------------------
+
+def get_casava_mate(header):
+    '''
+    Get the mate number of a Casava 1.8 header ("@name 1:N:0:ATCACG"), or None
+    when the header has not this style.
+    '''
+
+    field_list = header.split(None, 2)
+    if len(field_list) > 1 and len(field_list[1]) > 3 and field_list[1][1:2] == b':' and field_list[1][3:4] == b':':
+        return field_list[1][:1]
+    return None
+
+#-------------------------------------------------------------------------------
+
+def check_paired_fastq_file(path_1, path_2):
+    '''
+    Read the two files of a paired-end library in lockstep verifying that they
+    have the same number of complete reads and that their read names correspond
+    (the suffixes "/1" and "/2" are ignored and the mate numbers of the Casava
+    1.8 headers are verified in every pair). The first divergence is reported with
+    the number of its read pair and its byte offset in every file (in the
+    decompressed data when the file is compressed); the reads are counted to the
+    end anyway. Files without any read are a divergence too.
+    '''
+
+    start_time = time.time()
+    divergence = None
+    error = None
+    reader_list = []
+
+    try:
+
+        # open the files
+        reader_list = [FastqRecordReader(path_1), FastqRecordReader(path_2)]
+        (reader_1, reader_2) = reader_list
+
+        # compare the batches of records
+        while True:
+            reader_1.fill(PAIR_BATCH_SIZE)
+            reader_2.fill(PAIR_BATCH_SIZE)
+            record_count = min(len(reader_1.line_list), len(reader_2.line_list)) // 4
+            if record_count == 0:
+                break
+            (offset_1, line_list_1) = reader_1.take(record_count)
+            (offset_2, line_list_2) = reader_2.take(record_count)
+            if divergence is not None:
+                continue
+
+            # verify the mate numbers of the Casava 1.8 headers
+            mate_i = record_count
+            for (i, mate_pair) in enumerate(zip(map(get_casava_mate, line_list_1[0::4]), map(get_casava_mate, line_list_2[0::4]))):
+                if None not in mate_pair and mate_pair != (b'1', b'2'):
+                    mate_i = i
+                    break
+
+            # verify that the sequences and the qualities have the same length, i.e. the records are complete
+            invalid_i = record_count
+            for line_list in (line_list_1, line_list_2):
+                length_list_1 = list(map(len, line_list[1::4]))
+                length_list_2 = list(map(len, line_list[3::4]))
+                if length_list_1 != length_list_2:
+                    invalid_i = min(invalid_i, next(i for i in range(record_count) if length_list_1[i] != length_list_2[i]))
+
+            # compare the read names
+            name_list_1 = [get_read_name(header, b'/1') for header in line_list_1[0::4]]
+            name_list_2 = [get_read_name(header, b'/2') for header in line_list_2[0::4]]
+            different_i = record_count
+            if name_list_1 != name_list_2:
+                different_i = next(i for i in range(record_count) if name_list_1[i] != name_list_2[i])
+
+            # get the first divergence
+            if mate_i < record_count and mate_i <= min(different_i, invalid_i):
+                divergence = get_divergence(mate_i, offset_1, offset_2, line_list_1, line_list_2, 'the mate numbers of the headers are not 1 and 2', reader_1.record_count - record_count)
+            elif different_i < record_count and different_i <= invalid_i:
+                divergence = get_divergence(different_i, offset_1, offset_2, line_list_1, line_list_2, 'the read names are different', reader_1.record_count - record_count)
+            elif invalid_i < record_count:
+                divergence = get_divergence(invalid_i, offset_1, offset_2, line_list_1, line_list_2, 'a record is truncated or invalid', reader_1.record_count - record_count)
+
+        # count the records left in the longer file
+        end_offset_list = [reader_1.offset, reader_2.offset]
+        for reader in reader_list:
+            while not reader.is_eof or len(reader.line_list) >= 4:
+                reader.fill(PAIR_BATCH_SIZE)
+                reader.take(len(reader.line_list) // 4)
+        if divergence is None and reader_1.record_count != reader_2.record_count:
+            record_number = min(reader_1.record_count, reader_2.record_count) + 1
+            divergence = {'record_number': record_number, 'offset_1': end_offset_list[0], 'offset_2': end_offset_list[1], 'header_1': '', 'header_2': '', 'reason': 'the file {0} ends before the other one'.format(1 if reader_1.record_count < reader_2.record_count else 2)}
+        if divergence is None:
+            for i, reader in enumerate(reader_list):
+                if [line for line in reader.line_list if line.strip() != b''] != []:
+                    divergence = {'record_number': reader.record_count + 1, 'offset_1': reader_1.offset, 'offset_2': reader_2.offset, 'header_1': '', 'header_2': '', 'reason': 'the last record of the file {0} is truncated'.format(i + 1)}
+                    break
+        if divergence is None and reader_1.record_count == 0:
+            divergence = {'record_number': 1, 'offset_1': 0, 'offset_2': 0, 'header_1': '', 'header_2': '', 'reason': 'the files have not any read'}
+
+    except (OSError, EOFError) as e:
+        error = str(e)
+    finally:
+        for reader in reader_list:
+            reader.close()
+
+    # return the result dictionary
+    return {
+        'path_1': path_1,
+        'path_2': path_2,
+        'record_count_1': reader_list[0].record_count if len(reader_list) > 0 else 0,
+        'record_count_2': reader_list[1].record_count if len(reader_list) > 1 else 0,
+        'divergence': divergence,
+        'error': error,
+        'elapsed_time': round(time.time() - start_time, 3),
+    }
+
+#-------------------------------------------------------------------------------
+
+def get_divergence(i, offset_1, offset_2, line_list_1, line_list_2, reason, previous_record_count):
+    '''
+    Get the data of the divergence of the record i of two batches of records.
+    '''
+
+    return {
+        'record_number': previous_record_count + i + 1,
+        'offset_1': offset_1 + sum(map(len, line_list_1[:4 * i])) + 4 * i,
+        'offset_2': offset_2 + sum(map(len, line_list_2[:4 * i])) + 4 * i,
+        'header_1': line_list_1[4 * i].decode('utf-8', errors='replace').rstrip(),
+        'header_2': line_list_2[4 * i].decode('utf-8', errors='replace').rstrip(),
+        'reason': reason,
+    }
+
+#-------------------------------------------------------------------------------
+
+def check_paired_fastq_files(pair_list, process_count=None):
+    '''
+    Check several paired-end libraries, given as a list of tuples (path 1, path
+    2), in parallel worker processes. Return the list of results in the same order.
+    '''
+
+    return map_in_processes(check_paired_fastq_file, pair_list, process_count)
+
+#-------------------------------------------------------------------------------
+
+def get_pair_check_text_list(result_dict):
+    '''
+    Get the lines of text that summarize the check of a paired-end library.
+    '''
+
+    text_list = []
+    text_list.append('Files: {0} and {1} (checked in {2:.1f} s)'.format(result_dict['path_1'], result_dict['path_2'], result_dict['elapsed_time']))
+    if result_dict['error'] is not None:
+        text_list.append('*** ERROR: The files can not be read: {0}'.format(result_dict['error']))
+    elif result_dict['divergence'] is None:
+        text_list.append('    The files are consistent: {0} read pairs.'.format(result_dict['record_count_1']))
+    else:
+        divergence = result_dict['divergence']
+        text_list.append('*** ERROR: The files are not consistent at the read pair {0}: {1}.'.format(divergence['record_number'], divergence['reason']))
+        text_list.append('    Byte offsets: {0} and {1}'.format(divergence['offset_1'], divergence['offset_2']))
+        if divergence['header_1'] != '' or divergence['header_2'] != '':
+            text_list.append('    Headers: {0} and {1}'.format(divergence['header_1'], divergence['header_2']))
+        text_list.append('    Reads: {0} and {1}'.format(result_dict['record_count_1'], result_dict['record_count_2']))
+    return text_list
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+     print('This file contains the functions of the profiler and the paired-end checker of local FASTQ files used in both console mode and gui mode.')
+     sys.exit(0)
+
+#-------------------------------------------------------------------------------
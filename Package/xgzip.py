@@ -493,12 +493,18 @@ def build_gzip_process_script(cluster_name, dataset_type, current_run_dir):
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
             file_id.write('{0}\n'.format('SEP="#########################################"'))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
+            for line in xlib.get_metrics_function_list(current_run_dir, gzip_option_dict):
+                file_id.write('{0}\n'.format(line))
+            for line in xlib.get_manifest_function_list():
+                file_id.write('{0}\n'.format(line))
+            file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
             file_id.write('{0}\n'.format('function init'))
             file_id.write('{0}\n'.format('{'))
             file_id.write('{0}\n'.format('    INIT_DATETIME=`date --utc +%s`'))
             file_id.write('{0}\n'.format('    FORMATTED_INIT_DATETIME=`date --date="@$INIT_DATETIME" "+%Y-%m-%d %H:%M:%S"`'))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
             file_id.write('{0}\n'.format('    echo "Script started in node $HOSTNAME of cluster {0} at $FORMATTED_INIT_DATETIME UTC."'.format(cluster_name)))
+            file_id.write('{0}\n'.format('    write_manifest result {0} running'.format(current_run_dir)))
             file_id.write('{0}\n'.format('}'))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
             file_id.write('{0}\n'.format('function run_gzip_process'))
@@ -509,32 +515,41 @@ def build_gzip_process_script(cluster_name, dataset_type, current_run_dir):
                     file_id.write('{0}\n'.format('    echo "$SEP"'))
                     file_id.write('{0}\n'.format('    echo "Compressing/decompressing {0}/{1}/{2} ..."'.format(dataset_dir, dataset_subdirectory_list[i], file_name_list[i])))
                     file_id.write('{0}\n'.format('    /usr/bin/time \\'))
-                    file_id.write('{0}\n'.format('        --format="Elapsed real time (s): %e\\nCPU time in kernel mode (s): %S\\nCPU time in user mode (s): %U\\nPercentage of CPU: %P\\nMaximum resident set size(Kb): %M\\nAverage total memory use (Kb):%K" \\'))
+                    file_id.write('{0}\n'.format('        --output=$TIME_FILE --format="%e %S %U %P %M %K" \\'))
                     if action == 'compress':
                         file_id.write('{0}\n'.format('        gzip {0}/{1}/{2}'.format(dataset_dir, dataset_subdirectory_list[i], file_name_list[i])))
                     elif action == 'decompress':
                         file_id.write('{0}\n'.format('        gzip --decompress {0}/{1}/{2}'.format(dataset_dir, dataset_subdirectory_list[i], file_name_list[i])))
                     file_id.write('{0}\n'.format('    RC=$?'))
+                    file_id.write('{0}\n'.format('    write_metrics gzip $RC'))
                     file_id.write('{0}\n'.format('    if [ $RC -ne 0 ]; then manage_error gzip $RC; fi'))
+                file_id.write('{0}\n'.format('    write_manifest {0} {1} updated'.format(dataset_type_2, dataset_dir)))
             elif dataset_type_2 == 'whole-result':
                 file_id.write('{0}\n'.format('    cd {0}'.format(current_run_dir)))
                 file_id.write('{0}\n'.format('    echo "$SEP"'))
                 file_id.write('{0}\n'.format('    echo "Compressing/decompressing {0} ..."'.format(dataset_dir)))
                 file_id.write('{0}\n'.format('    /usr/bin/time \\'))
-                file_id.write('{0}\n'.format('        --format="Elapsed real time (s): %e\\nCPU time in kernel mode (s): %S\\nCPU time in user mode (s): %U\\nPercentage of CPU: %P\\nMaximum resident set size(Kb): %M\\nAverage total memory use (Kb):%K" \\'))
+                file_id.write('{0}\n'.format('        --output=$TIME_FILE --format="%e %S %U %P %M %K" \\'))
                 if action == 'compress':
                     file_id.write('{0}\n'.format('        tar --create --gzip --verbose --file={0}.tar.gz {0}'.format(dataset_dir)))
                 elif action == 'decompress':
                     file_id.write('{0}\n'.format('        tar --extract --gzip --verbose --file={0} --directory=/'.format(dataset_dir)))
                 file_id.write('{0}\n'.format('    RC=$?'))
+                file_id.write('{0}\n'.format('    write_metrics tar $RC'))
                 file_id.write('{0}\n'.format('    if [ $RC -ne 0 ]; then manage_error tar $RC; fi'))
                 file_id.write('{0}\n'.format('    echo "$SEP"'))
                 file_id.write('{0}\n'.format('    echo "Removing {0} ..."'.format(dataset_dir)))
                 file_id.write('{0}\n'.format('    /usr/bin/time \\'))
-                file_id.write('{0}\n'.format('        --format="Elapsed real time (s): %e\\nCPU time in kernel mode (s): %S\\nCPU time in user mode (s): %U\\nPercentage of CPU: %P\\nMaximum resident set size(Kb): %M\\nAverage total memory use (Kb):%K" \\'))
+                file_id.write('{0}\n'.format('        --output=$TIME_FILE --format="%e %S %U %P %M %K" \\'))
                 file_id.write('{0}\n'.format('        rm -rf {0}'.format(dataset_dir)))
                 file_id.write('{0}\n'.format('    RC=$?'))
+                file_id.write('{0}\n'.format('    write_metrics rm $RC'))
                 file_id.write('{0}\n'.format('    if [ $RC -ne 0 ]; then manage_error rm $RC; fi'))
+                if action == 'compress':
+                    file_id.write('{0}\n'.format('    write_manifest result {0}.tar.gz compressed'.format(dataset_dir)))
+                elif action == 'decompress':
+                    file_id.write('{0}\n'.format('    write_manifest result {0} decompressed'.format(dataset_dir[:-len('.tar.gz')])))
+                file_id.write('{0}\n'.format('    write_manifest result {0} removed'.format(dataset_dir)))
             file_id.write('{0}\n'.format('}'))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
             file_id.write('{0}\n'.format('function end'))
@@ -545,6 +560,7 @@ def build_gzip_process_script(cluster_name, dataset_type, current_run_dir):
             file_id.write('{0}\n'.format('    echo "$SEP"'))
             file_id.write('{0}\n'.format('    echo "Script ended OK at $FORMATTED_END_DATETIME UTC with a run duration of $DURATION s ($FORMATTED_DURATION)."'))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
+            file_id.write('{0}\n'.format('    write_manifest result {0} ended'.format(current_run_dir)))
             file_id.write('{0}\n'.format('    RECIPIENT={0}'.format(xconfiguration.get_contact_data())))
             file_id.write('{0}\n'.format('    SUBJECT="{0}: {1} process"'.format(xlib.get_project_name(), xlib.get_gzip_name())))
             file_id.write('{0}\n'.format('    MESSAGE="The {0} process in node $HOSTNAME of cluster {0} ended OK at $FORMATTED_END_DATETIME with a run duration of $DURATION s ($FORMATTED_DURATION). Please review its log.<br/><br/>Regards,<br/>GI Genetica, Fisiologia e Historia Forestal<br/>Dpto. Sistemas y Recursos Naturales<br/>ETSI Montes, Forestal y del Medio Natural<br/>Universidad Politecnica de Madrid<br/>https://github.com/ggfhf/"'.format(xlib.get_gzip_name(), cluster_name)))
@@ -561,6 +577,7 @@ def build_gzip_process_script(cluster_name, dataset_type, current_run_dir):
             file_id.write('{0}\n'.format('    echo "ERROR: $1 returned error $2"'))
             file_id.write('{0}\n'.format('    echo "Script ended WRONG at $FORMATTED_END_DATETIME UTC with a run duration of $DURATION s ($FORMATTED_DURATION)."'))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
+            file_id.write('{0}\n'.format('    write_manifest result {0} failed'.format(current_run_dir)))
             file_id.write('{0}\n'.format('    RECIPIENT={0}'.format(xconfiguration.get_contact_data())))
             file_id.write('{0}\n'.format('    SUBJECT="{0}: {1} process"'.format(xlib.get_project_name(), xlib.get_gzip_name())))
             file_id.write('{0}\n'.format('    MESSAGE="The {0} process in node $HOSTNAME of cluster {0} ended WRONG at $FORMATTED_END_DATETIME with a run duration of $DURATION s ($FORMATTED_DURATION). Please review its log.<br/><br/>Regards,<br/>GI Genetica, Fisiologia e Historia Forestal<br/>Dpto. Sistemas y Recursos Naturales<br/>ETSI Montes, Forestal y del Medio Natural<br/>Universidad Politecnica de Madrid<br/>https://github.com/ggfhf/"'.format(xlib.get_gzip_name(), cluster_name)))
@@ -27,13 +27,18 @@ software package used in both console mode and gui mode.
 
 import configparser
 import datetime
+import importlib
+import importlib.util
 import os
 import re
 import subprocess
 import sys
-import tkinter
+import time
+import types
+import weakref
 
 import xconfiguration
+import xlogcatalog
 
 #-------------------------------------------------------------------------------
     
@@ -136,12 +141,197 @@ def get_all_applications_selected_code():
 
 #-------------------------------------------------------------------------------
 
+# registry of the bioinfo applications and utilities: code used to identify its processes and result
+# datasets, name used to title, code of its Bioconda package, and module, run function and config file
+# function of its process
+app_registry_dict = {
+    'bedtools': {'code': 'bedtools', 'name': 'BEDtools', 'bioconda_code': 'bedtools', 'module': None, 'run_function': None, 'config_function': None},
+    'bioconda': {'code': 'bioconda', 'name': 'Bioconda', 'bioconda_code': None, 'module': None, 'run_function': None, 'config_function': None},
+    'blastplus': {'code': 'blast', 'name': 'BLAST+', 'bioconda_code': 'blast', 'module': None, 'run_function': None, 'config_function': None},
+    'bowtie2': {'code': 'bowtie2', 'name': 'Bowtie2', 'bioconda_code': 'bowtie2', 'module': None, 'run_function': None, 'config_function': None},
+    'busco': {'code': 'busco', 'name': 'BUSCO', 'bioconda_code': 'busco', 'module': 'xbusco', 'run_function': 'run_busco_process', 'config_function': 'get_busco_config_file'},
+    'cd_hit': {'code': 'cdhit', 'name': 'CD-HIT', 'bioconda_code': 'cd-hit', 'module': None, 'run_function': None, 'config_function': None},
+    'cd_hit_est': {'code': 'cdhitest', 'name': 'CD-HIT-EST', 'bioconda_code': None, 'module': 'xcdhit', 'run_function': 'run_cd_hit_est_process', 'config_function': 'get_cd_hit_est_config_file'},
+    'conda': {'code': 'conda', 'name': 'Conda', 'bioconda_code': None, 'module': None, 'run_function': None, 'config_function': None},
+    'detonate': {'code': 'detonate', 'name': 'DETONATE', 'bioconda_code': 'detonate', 'module': None, 'run_function': None, 'config_function': None},
+    'emboss': {'code': 'emboss', 'name': 'EMBOSS', 'bioconda_code': 'emboss', 'module': None, 'run_function': None, 'config_function': None},
+    'fastqc': {'code': 'fastqc', 'name': 'FastQC', 'bioconda_code': 'fastqc', 'module': 'xfastqc', 'run_function': 'run_fastqc_process', 'config_function': 'get_fastqc_config_file'},
+    'gmap_gsnap': {'code': 'gmap_gsnap', 'name': 'GMAP-GSNAP', 'bioconda_code': 'gmap', 'module': None, 'run_function': None, 'config_function': None},
+    'gmap': {'code': 'gmap', 'name': 'GMAP', 'bioconda_code': None, 'module': 'xgmap', 'run_function': 'run_gmap_process', 'config_function': 'get_gmap_config_file'},
+    'gzip': {'code': 'gzip', 'name': 'gzip', 'bioconda_code': None, 'module': None, 'run_function': None, 'config_function': None},
+    'insilico_read_normalization': {'code': 'insreadnor', 'name': 'insilico_read_normalization', 'bioconda_code': None, 'module': 'xtrinity', 'run_function': 'run_insilico_read_normalization_process', 'config_function': 'get_insilico_read_normalization_config_file'},
+    'miniconda3': {'code': 'miniconda3', 'name': 'Miniconda3', 'bioconda_code': None, 'module': None, 'run_function': None, 'config_function': None},
+    'ngshelper': {'code': 'ngshelper', 'name': 'NGShelper', 'bioconda_code': None, 'module': None, 'run_function': None, 'config_function': None},
+    'quast': {'code': 'quast', 'name': 'QUAST', 'bioconda_code': 'quast', 'module': 'xquast', 'run_function': 'run_quast_process', 'config_function': 'get_quast_config_file'},
+    'r': {'code': 'r', 'name': 'R', 'bioconda_code': None, 'module': None, 'run_function': None, 'config_function': None},
+    'ref_eval': {'code': 'refeval', 'name': 'REF-EVAL', 'bioconda_code': None, 'module': 'xdetonate', 'run_function': 'run_ref_eval_process', 'config_function': 'get_ref_eval_config_file'},
+    'rnaquast': {'code': 'rnaquast', 'name': 'rnaQUAST', 'bioconda_code': None, 'module': 'xrnaquast', 'run_function': 'run_rnaquast_process', 'config_function': 'get_rnaquast_config_file'},
+    'rsem': {'code': 'rsem', 'name': 'RSEM', 'bioconda_code': 'rsem', 'module': None, 'run_function': None, 'config_function': None},
+    'rsem_eval': {'code': 'rsemeval', 'name': 'RSEM-EVAL', 'bioconda_code': None, 'module': 'xdetonate', 'run_function': 'run_rsem_eval_process', 'config_function': 'get_rsem_eval_config_file'},
+    'samtools': {'code': 'samtools', 'name': 'SAMtools', 'bioconda_code': 'samtools', 'module': None, 'run_function': None, 'config_function': None},
+    'soapdenovotrans': {'code': 'sdnt', 'name': 'SOAPdenovo-Trans', 'bioconda_code': 'soapdenovo-trans', 'module': 'xsoapdenovotrans', 'run_function': 'run_soapdenovotrans_process', 'config_function': 'get_soapdenovotrans_config_file'},
+    'star': {'code': 'star', 'name': 'STAR', 'bioconda_code': 'star', 'module': 'xstar', 'run_function': 'run_star_process', 'config_function': 'get_star_config_file'},
+    'transabyss': {'code': 'transabyss', 'name': 'Trans-ABySS', 'bioconda_code': 'transabyss', 'module': 'xtransabyss', 'run_function': 'run_transabyss_process', 'config_function': 'get_transabyss_config_file'},
+    'transcript_filter': {'code': 'transfil', 'name': 'transcript-filter', 'bioconda_code': None, 'module': 'xngshelper', 'run_function': 'run_transcript_filter_process', 'config_function': 'get_transcript_filter_config_file'},
+    'transcriptome_blastx': {'code': 'transbastx', 'name': 'transcriptome-blastx', 'bioconda_code': None, 'module': 'xngshelper', 'run_function': 'run_transcriptome_blastx_process', 'config_function': 'get_transcriptome_blastx_config_file'},
+    'transrate': {'code': 'transrate', 'name': 'Transrate', 'bioconda_code': None, 'module': 'xtransrate', 'run_function': 'run_transrate_process', 'config_function': 'get_transrate_config_file'},
+    'trimmomatic': {'code': 'trimmo', 'name': 'Trimmomatic', 'bioconda_code': 'trimmomatic', 'module': 'xtrimmomatic', 'run_function': 'run_trimmomatic_process', 'config_function': 'get_trimmomatic_config_file'},
+    'trinity': {'code': 'trinity', 'name': 'Trinity', 'bioconda_code': 'trinity', 'module': 'xtrinity', 'run_function': 'run_trinity_process', 'config_function': 'get_trinity_config_file'},
+    }
+
+# application data by code and trie of the application codes, built when they are first used
+app_code_dict = None
+app_code_trie = None
+
+# application modules imported when they are first used
+app_module_dict = {}
+
+# options dictionaries of the configuration files already parsed by path: modification key
+# (modification time and size), text, time of the parsing and options dictionary
+option_dict_cache = {}
+
+#-------------------------------------------------------------------------------
+
+def get_app_data(app_code):
+    '''
+    Get the registry data of an application from its code.
+    '''
+
+    global app_code_dict
+
+    # build the dictionary of the application data by code
+    if app_code_dict is None:
+        app_code_dict = {app_data['code']: app_data for app_data in app_registry_dict.values()}
+
+    # return the application data
+    return app_code_dict[app_code]
+
+#-------------------------------------------------------------------------------
+
+def get_runnable_app_code_list():
+    '''
+    Get the code list of the applications with a process that can be run in a cluster.
+    '''
+
+    return sorted([app_data['code'] for app_data in app_registry_dict.values() if app_data['run_function'] is not None])
+
+#-------------------------------------------------------------------------------
+
+def get_app_module(app_code):
+    '''
+    Get the module of the process of an application importing it when it is first used.
+    '''
+
+    module_name = get_app_data(app_code)['module']
+    if module_name not in app_module_dict:
+        app_module_dict[module_name] = importlib.import_module(module_name)
+    return app_module_dict[module_name]
+
+#-------------------------------------------------------------------------------
+
+def get_app_run_function(app_code):
+    '''
+    Get the function that runs the process of an application.
+    '''
+
+    return getattr(get_app_module(app_code), get_app_data(app_code)['run_function'])
+
+#-------------------------------------------------------------------------------
+
+def get_app_config_file(app_code):
+    '''
+    Get the path of the config file of the process of an application.
+    '''
+
+    return getattr(get_app_module(app_code), get_app_data(app_code)['config_function'])()
+
+#-------------------------------------------------------------------------------
+
+def import_lazy_module(module_name):
+    '''
+    Import a module deferring the execution of its code until one of its attributes is first used.
+    '''
+
+    # return the module when it is already imported
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    # create the module with a lazy loader and register it
+    spec = importlib.util.find_spec(module_name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    loader.exec_module(module)
+
+    # return the module
+    return module
+
+#-------------------------------------------------------------------------------
+
+def get_app_code_trie():
+    '''
+    Get the trie of the application codes. Each node is a dictionary by character
+    and the key '' of a node holds the data of the application whose code ends in it.
+    '''
+
+    global app_code_trie
+
+    # build the trie
+    if app_code_trie is None:
+        trie = {}
+        for app_data in app_registry_dict.values():
+            node = trie
+            for character in app_data['code']:
+                node = node.setdefault(character, {})
+            node[''] = app_data
+        app_code_trie = trie
+
+    # return the trie
+    return app_code_trie
+
+#-------------------------------------------------------------------------------
+
+def parse_dataset_id(dataset_id):
+    '''
+    Parse a dataset identification like code-yymmdd-hhmmss[.tar.gz] and get the data of
+    the application with the longest code followed by a hyphen, the date and the time.
+    The application data is None when the code is not registered.
+    '''
+
+    # search the longest application code followed by a hyphen
+    app_data = None
+    separator_position = -1
+    node = get_app_code_trie()
+    for position, character in enumerate(dataset_id):
+        if character == '-' and '' in node:
+            app_data = node['']
+            separator_position = position
+        node = node.get(character)
+        if node is None:
+            break
+
+    # get the date and time
+    date = ''
+    time = ''
+    if app_data is not None:
+        run_id = dataset_id[separator_position + 1:]
+        if run_id.endswith('.tar.gz'):
+            run_id = run_id[:-len('.tar.gz')]
+        if '-' in run_id:
+            (date, time) = run_id.rsplit('-', 1)
+
+    # return the application data, date and time
+    return (app_data, date, time)
+
+#-------------------------------------------------------------------------------
+
 def get_bedtools_code():
     '''
     Get the BEDTools code used to identify its processes.
     '''
 
-    return 'bedtools'
+    return app_registry_dict['bedtools']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -150,7 +340,7 @@ def get_bedtools_name():
     Get the BEDTools name used to title.
     '''
 
-    return 'BEDtools'
+    return app_registry_dict['bedtools']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -159,7 +349,7 @@ def get_bedtools_bioconda_code():
     Get the BEDTools code used to identify the Bioconda package.
     '''
 
-    return 'bedtools'
+    return app_registry_dict['bedtools']['bioconda_code']
 
 #-------------------------------------------------------------------------------
 
@@ -168,7 +358,7 @@ def get_bioconda_code():
     Get the Bioconda code used to identify its processes.
     '''
 
-    return 'bioconda'
+    return app_registry_dict['bioconda']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -177,7 +367,7 @@ def get_bioconda_name():
     Get the Bioconda name used to title.
     '''
 
-    return 'Bioconda'
+    return app_registry_dict['bioconda']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -186,7 +376,7 @@ def get_blastplus_code():
     Get the BLAST+ code used to identify its processes.
     '''
 
-    return 'blast'
+    return app_registry_dict['blastplus']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -195,7 +385,7 @@ def get_blastplus_name():
     Get the BLAST+ name used to title.
     '''
 
-    return 'BLAST+'
+    return app_registry_dict['blastplus']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -204,7 +394,7 @@ def get_blastplus_bioconda_code():
     Get the BLAST+ code used to identify the Bioconda package.
     '''
 
-    return 'blast'
+    return app_registry_dict['blastplus']['bioconda_code']
 
 #-------------------------------------------------------------------------------
 
@@ -213,7 +403,7 @@ def get_bowtie2_code():
     Get the Bowtie2 code used to identify its processes.
     '''
 
-    return 'bowtie2'
+    return app_registry_dict['bowtie2']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -222,7 +412,7 @@ def get_bowtie2_name():
     Get the Bowtie2 name used to title.
     '''
 
-    return 'Bowtie2'
+    return app_registry_dict['bowtie2']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -231,7 +421,7 @@ def get_bowtie2_bioconda_code():
     Get the Bowtie2 code used to identify the Bioconda package.
     '''
 
-    return 'bowtie2'
+    return app_registry_dict['bowtie2']['bioconda_code']
 
 #-------------------------------------------------------------------------------
 
@@ -240,7 +430,7 @@ def get_busco_code():
     Get the BUSCO code used to identify its processes.
     '''
 
-    return 'busco'
+    return app_registry_dict['busco']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -249,7 +439,7 @@ def get_busco_name():
     Get the BUSCO name used to title.
     '''
 
-    return 'BUSCO'
+    return app_registry_dict['busco']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -258,7 +448,7 @@ def get_busco_bioconda_code():
     Get the BUSCO code used to identify the Bioconda package.
     '''
 
-    return 'busco'
+    return app_registry_dict['busco']['bioconda_code']
 
 #-------------------------------------------------------------------------------
 
@@ -267,7 +457,7 @@ def get_cd_hit_code():
     Get the CD-HIT code used to identify its processes.
     '''
 
-    return 'cdhit'
+    return app_registry_dict['cd_hit']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -276,7 +466,7 @@ def get_cd_hit_name():
     Get the CD-HIT name used to title.
     '''
 
-    return 'CD-HIT'
+    return app_registry_dict['cd_hit']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -285,7 +475,7 @@ def get_cd_hit_bioconda_code():
     Get the CD-HIT code used to identify the Bioconda package.
     '''
 
-    return 'cd-hit'
+    return app_registry_dict['cd_hit']['bioconda_code']
 
 #-------------------------------------------------------------------------------
 
@@ -294,7 +484,7 @@ def get_cd_hit_est_code():
     Get the CD-HIT-EST code used to identify its processes.
     '''
 
-    return 'cdhitest'
+    return app_registry_dict['cd_hit_est']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -303,7 +493,7 @@ def get_cd_hit_est_name():
     Get the CD-HIT-EST name used to title.
     '''
 
-    return 'CD-HIT-EST'
+    return app_registry_dict['cd_hit_est']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -312,7 +502,7 @@ def get_conda_code():
     Get the Conda code used to identify its processes.
     '''
 
-    return 'conda'
+    return app_registry_dict['conda']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -321,7 +511,7 @@ def get_conda_name():
     Get the Conda name used to title.
     '''
 
-    return 'Conda'
+    return app_registry_dict['conda']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -330,7 +520,7 @@ def get_detonate_code():
     Get the DETONATE code used to identify its processes.
     '''
 
-    return 'detonate'
+    return app_registry_dict['detonate']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -339,7 +529,7 @@ def get_detonate_name():
     Get the DETONATE name used to title.
     '''
 
-    return 'DETONATE'
+    return app_registry_dict['detonate']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -348,7 +538,7 @@ def get_detonate_bioconda_code():
     Get the DETONATE code used to identify the Bioconda package.
     '''
 
-    return 'detonate'
+    return app_registry_dict['detonate']['bioconda_code']
 
 #-------------------------------------------------------------------------------
 
@@ -357,7 +547,7 @@ def get_emboss_code():
     Get the EMBOSS code used to identify its processes.
     '''
 
-    return 'emboss'
+    return app_registry_dict['emboss']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -366,7 +556,7 @@ def get_emboss_name():
     Get the EMBOSS name used to title.
     '''
 
-    return 'EMBOSS'
+    return app_registry_dict['emboss']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -375,7 +565,7 @@ def get_emboss_bioconda_code():
     Get the EMBOSS code used to identify the Bioconda package
     '''
 
-    return 'emboss'
+    return app_registry_dict['emboss']['bioconda_code']
 
 #-------------------------------------------------------------------------------
 
@@ -384,7 +574,7 @@ def get_fastqc_code():
     Get the FastQC code used to identify its processes.
     '''
 
-    return 'fastqc'
+    return app_registry_dict['fastqc']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -393,7 +583,7 @@ def get_fastqc_name():
     Get the FastQC name used to title.
     '''
 
-    return 'FastQC'
+    return app_registry_dict['fastqc']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -402,7 +592,7 @@ def get_fastqc_bioconda_code():
     Get the FastQC code used to identify the Bioconda package.
     '''
 
-    return 'fastqc'
+    return app_registry_dict['fastqc']['bioconda_code']
 
 #-------------------------------------------------------------------------------
 
@@ -411,7 +601,7 @@ def get_gmap_gsnap_code():
     Get the GMAP-GSNAP code used to identify its processes.
     '''
 
-    return 'gmap_gsnap'
+    return app_registry_dict['gmap_gsnap']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -420,7 +610,7 @@ def get_gmap_gsnap_name():
     Get the GMAP-GSNAP name used to title.
     '''
 
-    return 'GMAP-GSNAP'
+    return app_registry_dict['gmap_gsnap']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -429,7 +619,7 @@ def get_gmap_gsnap_bioconda_code():
     Get the GMAP-GSNAP code used to identify the Bioconda package.
     '''
 
-    return 'gmap'
+    return app_registry_dict['gmap_gsnap']['bioconda_code']
 
 #-------------------------------------------------------------------------------
 
@@ -438,7 +628,7 @@ def get_gmap_code():
     Get the GMAP code used to identify its processes.
     '''
 
-    return 'gmap'
+    return app_registry_dict['gmap']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -447,7 +637,7 @@ def get_gmap_name():
     Get the GMAP name used to title.
     '''
 
-    return 'GMAP'
+    return app_registry_dict['gmap']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -456,7 +646,7 @@ def get_gzip_code():
     Get the gzip code used to identify its processes.
     '''
 
-    return 'gzip'
+    return app_registry_dict['gzip']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -465,7 +655,7 @@ def get_gzip_name():
     Get the gzip name used to title.
     '''
 
-    return 'gzip'
+    return app_registry_dict['gzip']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -475,7 +665,7 @@ def get_insilico_read_normalization_code():
     processes.
     '''
 
-    return 'insreadnor'
+    return app_registry_dict['insilico_read_normalization']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -484,7 +674,7 @@ def get_insilico_read_normalization_name():
     Get the insilico_read_normalization (Trinity package) name used to title.
     '''
 
-    return 'insilico_read_normalization'
+    return app_registry_dict['insilico_read_normalization']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -493,7 +683,7 @@ def get_miniconda3_code():
     Get the Miniconda3 code used to identify its processes.
     '''
 
-    return 'miniconda3'
+    return app_registry_dict['miniconda3']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -502,7 +692,7 @@ def get_miniconda3_name():
     Get the Miniconda3 name used to title.
     '''
 
-    return 'Miniconda3'
+    return app_registry_dict['miniconda3']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -511,7 +701,7 @@ def get_ngshelper_code():
     Get the NGShelper code used to identify its processes.
     '''
 
-    return 'ngshelper'
+    return app_registry_dict['ngshelper']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -520,7 +710,7 @@ def get_ngshelper_name():
     Get the NGShelper name used to title.
     '''
 
-    return 'NGShelper'
+    return app_registry_dict['ngshelper']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -529,7 +719,7 @@ def get_quast_code():
     Get the QUAST code used to identify process.
     '''
 
-    return 'quast'
+    return app_registry_dict['quast']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -538,7 +728,7 @@ def get_quast_name():
     Get the QUAST name used to title.
     '''
 
-    return 'QUAST'
+    return app_registry_dict['quast']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -547,7 +737,7 @@ def get_quast_bioconda_code():
     Get the QUAST code used to identify the Bioconda package.
     '''
 
-    return 'quast'
+    return app_registry_dict['quast']['bioconda_code']
 
 #-------------------------------------------------------------------------------
 
@@ -556,7 +746,7 @@ def get_r_code():
     Get the R code used to identify its processes.
     '''
 
-    return 'r'
+    return app_registry_dict['r']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -565,7 +755,7 @@ def get_r_name():
     Get the R name used to title.
     '''
 
-    return 'R'
+    return app_registry_dict['r']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -574,7 +764,7 @@ def get_ref_eval_code():
     Get the REF-EVAL (DETONATE package) code used to identify its processes.
     '''
 
-    return 'refeval'
+    return app_registry_dict['ref_eval']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -583,7 +773,7 @@ def get_ref_eval_name():
     Get the REF-EVAL (DETONATE package) name used to title.
     '''
 
-    return 'REF-EVAL'
+    return app_registry_dict['ref_eval']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -592,7 +782,7 @@ def get_rnaquast_code():
     Get the rnaQUAST code used to identify its processes.
     '''
 
-    return 'rnaquast'
+    return app_registry_dict['rnaquast']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -601,7 +791,7 @@ def get_rnaquast_name():
     Get the rnaQUAST name used to title.
     '''
 
-    return 'rnaQUAST'
+    return app_registry_dict['rnaquast']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -610,7 +800,7 @@ def get_rsem_code():
     Get the RSEM code used to identify its processes.
     '''
 
-    return 'rsem'
+    return app_registry_dict['rsem']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -619,7 +809,7 @@ def get_rsem_name():
     Get the RSEM name used to title.
     '''
 
-    return 'RSEM'
+    return app_registry_dict['rsem']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -628,7 +818,7 @@ def get_rsem_bioconda_code():
     Get the RSEM code used to identify the Bioconda package.
     '''
 
-    return 'rsem'
+    return app_registry_dict['rsem']['bioconda_code']
 
 #-------------------------------------------------------------------------------
 
@@ -637,7 +827,7 @@ def get_rsem_eval_code():
     Get the RSEM-EVAL (DETONATE package) code used to identify its processes.
     '''
 
-    return 'rsemeval'
+    return app_registry_dict['rsem_eval']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -646,7 +836,7 @@ def get_rsem_eval_name():
     Get the RSEM-EVAL (DETONATE package) name used to title.
     '''
 
-    return 'RSEM-EVAL'
+    return app_registry_dict['rsem_eval']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -655,7 +845,7 @@ def get_samtools_code():
     Get the BEDTools code used to identify its processes.
     '''
 
-    return 'samtools'
+    return app_registry_dict['samtools']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -664,7 +854,7 @@ def get_samtools_name():
     Get the BEDTools name used to title.
     '''
 
-    return 'SAMtools'
+    return app_registry_dict['samtools']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -673,7 +863,7 @@ def get_samtools_bioconda_code():
     Get the BEDTools code used to identify the Bioconda package.
     '''
 
-    return 'samtools'
+    return app_registry_dict['samtools']['bioconda_code']
 
 #-------------------------------------------------------------------------------
 
@@ -682,7 +872,7 @@ def get_soapdenovotrans_code():
     Get the SOAPdenovo-Trans code used to identify its processes.
     '''
 
-    return 'sdnt'
+    return app_registry_dict['soapdenovotrans']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -691,7 +881,7 @@ def get_soapdenovotrans_name():
     Get the SOAPdenovo-Trans name used to title.
     '''
 
-    return 'SOAPdenovo-Trans'
+    return app_registry_dict['soapdenovotrans']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -700,7 +890,7 @@ def get_soapdenovotrans_bioconda_code():
     Get the SOAPdenovo-Trans code used to identify the Bioconda package.
     '''
 
-    return 'soapdenovo-trans'
+    return app_registry_dict['soapdenovotrans']['bioconda_code']
 
 #-------------------------------------------------------------------------------
 
@@ -709,7 +899,7 @@ def get_star_code():
     Get the STAR code used to identify its processes.
     '''
 
-    return 'star'
+    return app_registry_dict['star']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -718,7 +908,7 @@ def get_star_name():
     Get the STAR name used to title.
     '''
 
-    return 'STAR'
+    return app_registry_dict['star']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -727,7 +917,7 @@ def get_star_bioconda_code():
     Get the STAR code used to identify the Bioconda package.
     '''
 
-    return 'star'
+    return app_registry_dict['star']['bioconda_code']
 
 #-------------------------------------------------------------------------------
 
@@ -736,7 +926,7 @@ def get_transabyss_code():
     Get the Trans-ABySS code used to identify its processes.
     '''
 
-    return 'transabyss'
+    return app_registry_dict['transabyss']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -745,7 +935,7 @@ def get_transabyss_name():
     Get the Trans-ABySS name used to title.
     '''
 
-    return 'Trans-ABySS'
+    return app_registry_dict['transabyss']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -754,7 +944,7 @@ def get_transabyss_bioconda_code():
     Get the Trans-ABySS code used to the Bioconda package.
     '''
 
-    return 'transabyss'
+    return app_registry_dict['transabyss']['bioconda_code']
 
 #-------------------------------------------------------------------------------
 
@@ -764,7 +954,7 @@ def get_transcript_filter_code():
     processes.
     '''
 
-    return 'transfil'
+    return app_registry_dict['transcript_filter']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -773,7 +963,7 @@ def get_transcript_filter_name():
     Get the transcripts-filter (NGShelper package) name used to title.
     '''
 
-    return 'transcript-filter'
+    return app_registry_dict['transcript_filter']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -783,7 +973,7 @@ def get_transcriptome_blastx_code():
     processes.
     '''
 
-    return 'transbastx'
+    return app_registry_dict['transcriptome_blastx']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -792,7 +982,7 @@ def get_transcriptome_blastx_name():
     Get the transcriptome-blastx (NGShelper package) name used to title.
     '''
 
-    return 'transcriptome-blastx'
+    return app_registry_dict['transcriptome_blastx']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -801,7 +991,7 @@ def get_transrate_code():
     Get the Transrate  code used to identify its processes.
     '''
 
-    return 'transrate'
+    return app_registry_dict['transrate']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -810,7 +1000,7 @@ def get_transrate_name():
     Get the FastQC name used to title.
     '''
 
-    return 'Transrate'
+    return app_registry_dict['transrate']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -819,7 +1009,7 @@ def get_trimmomatic_code():
     Get the Trimmomatic code used to identify its processes.
     '''
 
-    return 'trimmo'
+    return app_registry_dict['trimmomatic']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -828,7 +1018,7 @@ def get_trimmomatic_name():
     Get the FastQC name used to title.
     '''
 
-    return 'Trimmomatic'
+    return app_registry_dict['trimmomatic']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -837,7 +1027,7 @@ def get_trimmomatic_bioconda_code():
     Get the Trimmomatic code used to the Bioconda package.
     '''
 
-    return 'trimmomatic'
+    return app_registry_dict['trimmomatic']['bioconda_code']
 
 #-------------------------------------------------------------------------------
 
@@ -846,7 +1036,7 @@ def get_trinity_code():
     Get the Trinity code used to identify its processes.
     '''
 
-    return 'trinity'
+    return app_registry_dict['trinity']['code']
 
 #-------------------------------------------------------------------------------
 
@@ -855,7 +1045,7 @@ def get_trinity_name():
     Get the Trinity name used to title.
     '''
 
-    return 'Trinity'
+    return app_registry_dict['trinity']['name']
 
 #-------------------------------------------------------------------------------
 
@@ -864,7 +1054,7 @@ def get_trinity_bioconda_code():
     Get the Trinity code used to the Bioconda package.
     '''
 
-    return 'trinity'
+    return app_registry_dict['trinity']['bioconda_code']
 
 #-------------------------------------------------------------------------------
 
@@ -969,24 +1159,7 @@ def get_local_process_dict():
     local_process_dict['resize_volume']= {'text': 'Resize volume'}
     local_process_dict['restart_cluster']= {'text': 'Restart cluster'}
     local_process_dict['review_volume_links']= {'text': 'Review volumes linked to cluster templates'}
-    local_process_dict['run_busco_process']= {'text': 'Run {0} process'.format(get_busco_name())}
-    local_process_dict['run_cd_hit_est_process']= {'text': 'Run {0} process'.format(get_cd_hit_est_name())}
-    local_process_dict['run_fastqc_process']= {'text': 'Run {0} process'.format(get_fastqc_name())}
-    local_process_dict['run_gmap_process']= {'text': 'Run {0} process'.format(get_gmap_name())}
     local_process_dict['run_gzip_process']= {'text': 'Run compression/decompression process'}
-    local_process_dict['run_insilico_read_normalization_process']= {'text': 'Run {0} process'.format(get_insilico_read_normalization_name())}
-    local_process_dict['run_quast_process']= {'text': 'Run {0} process'.format(get_quast_name())}
-    local_process_dict['run_ref_eval_process']= {'text': 'Run {0} process'.format(get_ref_eval_name())}
-    local_process_dict['run_rnaquast_process']= {'text': 'Run {0} process'.format(get_rnaquast_name())}
-    local_process_dict['run_rsem_eval_process']= {'text': 'Run {0} process'.format(get_rsem_eval_name())}
-    local_process_dict['run_soapdenovotrans_process']= {'text': 'Run {0} process'.format(get_soapdenovotrans_name())}
-    local_process_dict['run_star_process']= {'text': 'Run {0} process'.format(get_star_name())}
-    local_process_dict['run_transabyss_process']= {'text': 'Run {0} process'.format(get_transabyss_name())}
-    local_process_dict['run_transcript_filter_process']= {'text': 'Run {0} process'.format(get_transcript_filter_name())}
-    local_process_dict['run_transcriptome_blastx_process']= {'text': 'Run {0} process'.format(get_transcriptome_blastx_name())}
-    local_process_dict['run_transrate_process']= {'text': 'Run {0} process'.format(get_transrate_name())}
-    local_process_dict['run_trimmomatic_process']= {'text': 'Run {0} process'.format(get_trimmomatic_name())}
-    local_process_dict['run_trinity_process']= {'text': 'Run {0} process'.format(get_trinity_name())}
     local_process_dict['setup_bioconda_package_list']= {'text': 'Set up Bioconda package list'}
     local_process_dict['setup_conda_package_list']= {'text': 'Set up Conda package list'}
     local_process_dict['setup_miniconda3']= {'text': 'Set up {0}'.format(get_miniconda3_name())}
@@ -1004,6 +1177,11 @@ def get_local_process_dict():
     local_process_dict['upload_read_dataset']= {'text': 'Upload read dataset to a cluster'}
     local_process_dict['upload_reference_dataset']= {'text': 'Upload reference dataset to a cluster'}
 
+    # add the processes of the registered applications
+    for app_data in app_registry_dict.values():
+        if app_data['run_function'] is not None:
+            local_process_dict[app_data['run_function']]= {'text': 'Run {0} process'.format(app_data['name'])}
+
     # return the local process dictionary
     return local_process_dict
 
@@ -1208,6 +1386,28 @@ def get_cluster_current_run_dir(experiment_id, process):
 
 #-------------------------------------------------------------------------------
 
+def get_cluster_cache_dir():
+    '''
+    Get the cache directory in the cluster.
+    '''
+
+    return '{0}/.cache'.format(get_cluster_result_dir())
+
+#-------------------------------------------------------------------------------
+
+def get_cluster_rsem_reference_cache_dir():
+    '''
+    Get the directory of the prepared RSEM/Bowtie2 references in the cluster.
+    '''
+
+    # set the directory of the prepared references in the cluster
+    cluster_rsem_reference_cache_dir = '{0}/rsem-references'.format(get_cluster_cache_dir())
+
+    # return the directory of the prepared references in the cluster
+    return cluster_rsem_reference_cache_dir
+
+#-------------------------------------------------------------------------------
+
 def get_mounting_point_list():
     '''
     Get the available mounting point list.
@@ -1226,6 +1426,391 @@ def get_cluster_log_file():
 
 #-------------------------------------------------------------------------------
 
+def get_cluster_fingerprint_file():
+    '''
+    Get the fingerprint file name of an experiment run in the cluster.
+    '''
+
+    return 'fingerprint.txt'
+
+#-------------------------------------------------------------------------------
+
+def get_cluster_job_id_file():
+    '''
+    Get the file name of the batch job identification of an experiment run in the cluster.
+    '''
+
+    return 'job-id.txt'
+
+#-------------------------------------------------------------------------------
+
+def get_cluster_metrics_file():
+    '''
+    Get the metrics file name of an experiment run in the cluster.
+    '''
+
+    return 'metrics.jsonl'
+
+#-------------------------------------------------------------------------------
+
+def get_cluster_manifest_file():
+    '''
+    Get the manifest file name of the datasets of a volume in the cluster.
+    '''
+
+    return '.manifest.jsonl'
+
+#-------------------------------------------------------------------------------
+
+def get_cluster_manifest_path(dataset_type):
+    '''
+    Get the manifest file path of the datasets of a type (read, reference, database or result) in the cluster.
+    '''
+
+    # set the volume directory of the dataset type
+    if dataset_type == 'read':
+        volume_dir = get_cluster_read_dir()
+    elif dataset_type == 'reference':
+        volume_dir = get_cluster_reference_dir()
+    elif dataset_type == 'database':
+        volume_dir = get_cluster_database_dir()
+    elif dataset_type == 'result':
+        volume_dir = get_cluster_result_dir()
+
+    # return the manifest file path
+    return '{0}/{1}'.format(volume_dir, get_cluster_manifest_file())
+
+#-------------------------------------------------------------------------------
+
+def get_input_dataset_dir_list(option_dict):
+    '''
+    Get the directories in the cluster of the input datasets identified in the options dictionary of a config file.
+    '''
+
+    # initialize the input dataset directory list
+    input_dir_list = []
+
+    # get the directory of each dataset identified in the section "identification"
+    identification_dict = option_dict.get('identification', {})
+    experiment_id = identification_dict.get('experiment_id', '')
+    for key in sorted(identification_dict.keys()):
+        dataset_id = identification_dict[key]
+        if dataset_id.upper() == 'NONE':
+            continue
+        if key == 'read_dataset_id':
+            input_dir_list.append(get_cluster_experiment_read_dataset_dir(experiment_id, dataset_id))
+        elif key in ['assembly_dataset_id', 'result_dataset_id', 'rsem_eval_dataset_id']:
+            input_dir_list.append(get_cluster_experiment_result_dataset_dir(experiment_id, dataset_id))
+        elif key == 'reference_dataset_id':
+            input_dir_list.append(get_cluster_reference_dataset_dir(dataset_id))
+        elif key == 'database_dataset_id':
+            input_dir_list.append(get_cluster_database_dataset_dir(dataset_id))
+
+    # return the input dataset directory list
+    return input_dir_list
+
+#-------------------------------------------------------------------------------
+
+def get_input_read_file_list(option_dict):
+    '''
+    Get the paths in the cluster of the read files selected in the library sections of the options dictionary of a config file.
+    '''
+
+    # initialize the input read file list
+    input_file_list = []
+
+    # get the read files of each section "library" or "library-n"
+    identification_dict = option_dict.get('identification', {})
+    experiment_id = identification_dict.get('experiment_id', '')
+    read_dataset_id = identification_dict.get('read_dataset_id', 'NONE')
+    if read_dataset_id.upper() != 'NONE':
+        for section in sorted(option_dict.keys()):
+            if re.match('^library(-[0-9]+)?$', section):
+                for key in ['read_file_1', 'read_file_2']:
+                    read_file = option_dict[section].get(key, 'NONE')
+                    if read_file.upper() != 'NONE':
+                        input_file_list.append(get_cluster_read_file(experiment_id, read_dataset_id, read_file))
+
+    # return the input read file list
+    return input_file_list
+
+#-------------------------------------------------------------------------------
+
+def get_metrics_function_list(current_run_dir, option_dict):
+    '''
+    Get the lines of the process script function that prints the resources measured by /usr/bin/time in the log
+    and appends them as a JSON record to the metrics file of the run directory.
+    Each step has to be run with /usr/bin/time --output=$TIME_FILE --format="%e %S %U %P %M %K" and followed by
+    "write_metrics <tool> $RC", which removes the temporary file once the metrics are appended.
+    '''
+
+    # get the selected read files, which are the input measured by xmetrics.get_input_size_kb, or otherwise the input dataset directories
+    input_file_list = get_input_read_file_list(option_dict)
+    input_dirs = ' '.join(input_file_list if input_file_list != [] else get_input_dataset_dir_list(option_dict))
+
+    # initialize the line list
+    line_list = []
+
+    # set the metrics variables
+    line_list.append('TIME_FILE=`mktemp`')
+    line_list.append('METRICS_FILE={0}/{1}'.format(current_run_dir, get_cluster_metrics_file()))
+    line_list.append('INPUT_KB=')
+    line_list.append('NODE_TYPE=')
+    line_list.append('#-------------------------------------------------------------------------------')
+
+    # build the function to print a value as a JSON number, or null when it is not numeric (e.g. "?" of /usr/bin/time)
+    line_list.append('function json_number')
+    line_list.append('{')
+    line_list.append('    if [[ "$1" =~ ^[0-9]+(\\.[0-9]+)?$ ]]; then echo $1; else echo null; fi')
+    line_list.append('}')
+    line_list.append('#-------------------------------------------------------------------------------')
+
+    # build the function to write the metrics of a step
+    line_list.append('function write_metrics')
+    line_list.append('{')
+    line_list.append('    read WALL_TIME SYSTEM_TIME USER_TIME CPU_PERCENTAGE MAX_RSS AVERAGE_MEMORY <<< `tail --lines=1 $TIME_FILE 2>/dev/null`')
+    line_list.append('    echo "$SEP"')
+    line_list.append('    echo "Elapsed real time (s): $WALL_TIME"')
+    line_list.append('    echo "CPU time in kernel mode (s): $SYSTEM_TIME"')
+    line_list.append('    echo "CPU time in user mode (s): $USER_TIME"')
+    line_list.append('    echo "Percentage of CPU: $CPU_PERCENTAGE"')
+    line_list.append('    echo "Maximum resident set size(Kb): $MAX_RSS"')
+    line_list.append('    echo "Average total memory use (Kb):$AVERAGE_MEMORY"')
+    if input_dirs != '':
+        line_list.append('    if [ "$INPUT_KB" = "" ]; then INPUT_KB=`du --summarize --total --dereference --block-size=1K {0} 2>/dev/null | tail --lines=1 | cut --fields=1`; fi'.format(input_dirs))
+    line_list.append('    if [ "$NODE_TYPE" = "" ]; then NODE_TYPE=`curl --silent --max-time 2 http://169.254.169.254/latest/meta-data/instance-type || echo unknown`; fi')
+    line_list.append('    printf \'{"run_id": "%s", "tool": "%s", "rc": %s, "end_datetime": "%s", "node": "%s", "node_type": "%s", "wall_time": %s, "system_time": %s, "user_time": %s, "cpu_percentage": %s, "max_rss_kb": %s, "average_memory_kb": %s, "input_kb": %s}\\n\' \\')
+    line_list.append('        {0} "$1" `json_number $2` "`date --utc "+%Y-%m-%d %H:%M:%S"`" $HOSTNAME $NODE_TYPE `json_number $WALL_TIME` `json_number $SYSTEM_TIME` `json_number $USER_TIME` `json_number ${{CPU_PERCENTAGE%\\%}}` `json_number $MAX_RSS` `json_number $AVERAGE_MEMORY` `json_number $INPUT_KB` \\'.format(os.path.basename(current_run_dir)))
+    line_list.append('        >> $METRICS_FILE')
+    line_list.append('    rm -f $TIME_FILE')
+    line_list.append('}')
+
+    # return the line list
+    return line_list
+
+#-------------------------------------------------------------------------------
+
+def get_manifest_function_list():
+    '''
+    Get the lines of the process script function that appends a JSON record with the state of a dataset
+    to the manifest file of its volume.
+    The function is called as "write_manifest <dataset type> <dataset path> <status> [nosize]".
+    '''
+
+    # initialize the line list
+    line_list = []
+
+    # build the function to write the manifest record of a dataset
+    line_list.append('function write_manifest')
+    line_list.append('{')
+    line_list.append('    DATASET_TYPE=$1')
+    line_list.append('    DATASET_PATH=$2')
+    line_list.append('    DATASET_STATUS=$3')
+    line_list.append('    DATASET_ID=`basename $DATASET_PATH`')
+    line_list.append('    if [ "$DATASET_TYPE" = "reference" ] || [ "$DATASET_TYPE" = "database" ]; then')
+    line_list.append('        VOLUME_DIR=`dirname $DATASET_PATH`')
+    line_list.append('        EXPERIMENT_ID=')
+    line_list.append('        DATASET_APP=')
+    line_list.append('    else')
+    line_list.append('        VOLUME_DIR=$(dirname $(dirname $DATASET_PATH))')
+    line_list.append('        EXPERIMENT_ID=$(basename $(dirname $DATASET_PATH))')
+    line_list.append('        DATASET_APP=${DATASET_ID%%-*}')
+    line_list.append('    fi')
+    line_list.append('    DATASET_SIZE=')
+    line_list.append('    if [ ! -e $DATASET_PATH ]; then')
+    line_list.append('        DATASET_STATUS=removed')
+    line_list.append('    elif [ "$4" != "nosize" ]; then')
+    line_list.append('        DATASET_SIZE=`du --summarize --dereference --block-size=1K $DATASET_PATH 2>/dev/null | cut --fields=1`')
+    line_list.append('    fi')
+    line_list.append('    DATASET_COMPRESSED=false')
+    line_list.append('    if [[ $DATASET_ID == *.tar.gz ]] || ls $DATASET_PATH/*.gz > /dev/null 2>&1; then DATASET_COMPRESSED=true; fi')
+    line_list.append('    NOW=`date --utc "+%Y-%m-%d %H:%M:%S"`')
+    line_list.append('    if [ "$DATASET_STATUS" = "running" ]; then')
+    line_list.append('        DATASET_START="\\"$NOW\\""')
+    line_list.append('        DATASET_END=null')
+    line_list.append('    else')
+    line_list.append('        DATASET_START=null')
+    line_list.append('        DATASET_END="\\"$NOW\\""')
+    line_list.append('    fi')
+    line_list.append('    RECORD=`printf \'{"dataset_type": "%s", "experiment_id": "%s", "dataset_id": "%s", "app": "%s", "status": "%s", "start": %s, "end": %s, "size_kb": %s, "compressed": %s}\' \\')
+    line_list.append('        $DATASET_TYPE "$EXPERIMENT_ID" $DATASET_ID "$DATASET_APP" "$DATASET_STATUS" "$DATASET_START" "$DATASET_END" ${DATASET_SIZE:-null} $DATASET_COMPRESSED`')
+    line_list.append('    # the record is appended with only one write holding an exclusive lock of the manifest, which is shared by the nodes through NFS')
+    line_list.append('    (flock 9; printf "%s\\n" "$RECORD" >&9) 9>>$VOLUME_DIR/{0}'.format(get_cluster_manifest_file()))
+    line_list.append('}')
+
+    # return the line list
+    return line_list
+
+#-------------------------------------------------------------------------------
+
+def get_paired_read_check_function_list(read_file_pair_list):
+    '''
+    Get the lines of the process script functions that check the files of the paired-end libraries before running
+    the process: both files of a library are read in lockstep verifying that they have the same number of complete
+    reads and that their read names correspond ("/1" and "/2" suffixes are ignored and the mate numbers of the Casava 1.8
+    headers are verified in every pair), as xfastq.check_paired_fastq_file does with the local files. A missing file or
+    a library without any read is an error.
+    The function "check_read_pairs" calls "manage_error" at the first library with a divergence.
+    '''
+
+    # initialize the line list
+    line_list = []
+
+    # build the function to check a paired-end library
+    line_list.append('function check_paired_reads')
+    line_list.append('{')
+    line_list.append('    echo "$SEP"')
+    line_list.append('    echo "Checking the paired-end files $1 and $2 ..."')
+    line_list.append('    for FILE in $1 $2; do')
+    line_list.append('        if [ ! -f $FILE ]; then echo "*** ERROR: The file $FILE does not exist."; return 1; fi')
+    line_list.append('    done')
+    line_list.append('    paste <(gzip --decompress --force --stdout $1 | paste - - - -) <(gzip --decompress --force --stdout $2 | paste - - - -) | LC_ALL=C awk \'')
+    line_list.append('        BEGIN { FS = "\\t" }')
+    line_list.append('        { header_1 = $1; header_2 = $5 }')
+    line_list.append('        $1 == "" || $5 == "" { reason = ($1 == "" ? "the file 1 ends before the other one" : "the file 2 ends before the other one"); exit 1 }')
+    line_list.append('        substr($3, 1, 1) != "+" || substr($7, 1, 1) != "+" || length($2) != length($4) || length($6) != length($8) { reason = "a record is truncated or invalid"; exit 1 }')
+    line_list.append('        split($1, field_1_list, " ") > 1 && split($5, field_2_list, " ") > 1 && field_1_list[2] ~ /^[0-9]:[YN]:/ && field_2_list[2] ~ /^[0-9]:[YN]:/ && (substr(field_1_list[2], 1, 1) != "1" || substr(field_2_list[2], 1, 1) != "2") { reason = "the mate numbers of the headers are not 1 and 2"; exit 1 }')
+    line_list.append('        {')
+    line_list.append('            split($1, field_1_list, " "); name_1 = substr(field_1_list[1], 2); sub(/\\/1$/, "", name_1)')
+    line_list.append('            split($5, field_2_list, " "); name_2 = substr(field_2_list[1], 2); sub(/\\/2$/, "", name_2)')
+    line_list.append('            if (name_1 != name_2) { reason = "the read names are different"; exit 1 }')
+    line_list.append('            offset_1 += length($1) + length($2) + length($3) + length($4) + 4')
+    line_list.append('            offset_2 += length($5) + length($6) + length($7) + length($8) + 4')
+    line_list.append('        }')
+    line_list.append('        END {')
+    line_list.append('            if (reason == "" && NR == 0) { print "*** ERROR: The files have not any read."; exit 1 }')
+    line_list.append('            if (reason == "") { printf "The files are consistent: %d read pairs.\\n", NR; exit 0 }')
+    line_list.append('            printf "*** ERROR: The files are not consistent at the read pair %d: %s.\\n", NR, reason')
+    line_list.append('            printf "    Byte offsets: %d and %d\\n", offset_1, offset_2')
+    line_list.append('            printf "    Headers: %s and %s\\n", header_1, header_2')
+    line_list.append('            exit 1')
+    line_list.append('        }\'')
+    line_list.append('}')
+
+    # build the function to check every paired-end library
+    line_list.append('function check_read_pairs')
+    line_list.append('{')
+    for (read_file_1, read_file_2) in read_file_pair_list:
+        line_list.append('    check_paired_reads {0} {1}'.format(read_file_1, read_file_2))
+        line_list.append('    RC=$?')
+        line_list.append('    if [ $RC -ne 0 ]; then manage_error check_paired_reads $RC; fi')
+    if read_file_pair_list == []:
+        line_list.append('    :')
+    line_list.append('}')
+
+    # return the line list
+    return line_list
+
+#-------------------------------------------------------------------------------
+
+def get_cluster_intermediate_file_archive():
+    '''
+    Get the archive file name of the intermediate files of an experiment run staged in a scratch directory.
+    '''
+
+    return 'intermediate-files.tar.gz'
+
+#-------------------------------------------------------------------------------
+
+def get_scratch_staging_function_list(scratch_dir, current_run_dir, read_dir, read_file_list, output_pattern_list, archive, space_factor=4):
+    '''
+    Get the lines of the process script functions that stage the read files in a node-local scratch directory,
+    run the process there and copy the output files back to the run directory.
+    The process script has to use $READ_DIR and $WORK_DIR instead of the read and run directories.
+    The run directory is copied to the working directory, so a resumed run finds its checkpoints.
+    '''
+
+    # set the run identification and the read files in the cluster
+    run_id = os.path.basename(current_run_dir)
+    read_files = ' '.join(['{0}/{1}'.format(read_dir, os.path.basename(read_file)) for read_file in read_file_list])
+
+    # initialize the line list
+    line_list = []
+
+    # set the staging variables
+    line_list.append('STAGING_DIR={0}/{1}'.format(scratch_dir, run_id))
+    line_list.append('READ_DIR={0}'.format(read_dir))
+    line_list.append('WORK_DIR={0}'.format(current_run_dir))
+    line_list.append('#-------------------------------------------------------------------------------')
+
+    # build the function to stage in the read files when there is enough space in the scratch directory
+    line_list.append('function stage_in')
+    line_list.append('{')
+    line_list.append('    echo "$SEP"')
+    line_list.append('    echo "Staging the read files in the scratch directory {0} of node $HOSTNAME ..."'.format(scratch_dir))
+    line_list.append('    if [ ! -d {0} ] || [ ! -w {0} ]; then'.format(scratch_dir))
+    line_list.append('        echo "WARNING: The scratch directory is not available. The process is run in the run directory."')
+    line_list.append('        return')
+    line_list.append('    fi')
+    line_list.append('    READ_KB=`du --summarize --total --dereference --block-size=1K {0} | tail --lines=1 | cut --fields=1`'.format(read_files))
+    line_list.append('    REQUIRED_KB=`expr $READ_KB \\* {0}`'.format(space_factor))
+    line_list.append('    AVAILABLE_KB=`df --output=avail --block-size=1K {0} | tail --lines=1 | tr --delete " "`'.format(scratch_dir))
+    line_list.append('    if [ $AVAILABLE_KB -lt $REQUIRED_KB ]; then')
+    line_list.append('        echo "WARNING: The scratch directory has $AVAILABLE_KB KiB available and $REQUIRED_KB KiB are estimated. The process is run in the run directory."')
+    line_list.append('        return')
+    line_list.append('    fi')
+    line_list.append('    trap clean_scratch EXIT')
+    line_list.append('    mkdir --parents $STAGING_DIR/reads $STAGING_DIR/{0}'.format(run_id))
+    line_list.append('    cp {0} $STAGING_DIR/reads'.format(read_files))
+    line_list.append('    RC=$?')
+    line_list.append('    if [ $RC -ne 0 ]; then manage_error cp $RC; fi')
+    line_list.append('    cp --recursive {0}/. $STAGING_DIR/{1}'.format(current_run_dir, run_id))
+    line_list.append('    RC=$?')
+    line_list.append('    if [ $RC -ne 0 ]; then manage_error cp $RC; fi')
+    line_list.append('    READ_DIR=$STAGING_DIR/reads')
+    line_list.append('    WORK_DIR=$STAGING_DIR/{0}'.format(run_id))
+    line_list.append('    echo "The read files are staged in $READ_DIR and the working directory is $WORK_DIR."')
+    line_list.append('}')
+    line_list.append('#-------------------------------------------------------------------------------')
+
+    # build the function to copy the output files to the run directory and, optionally, archive the intermediate files
+    line_list.append('function stage_out')
+    line_list.append('{')
+    line_list.append('    if [ "$WORK_DIR" = "{0}" ]; then return; fi'.format(current_run_dir))
+    line_list.append('    echo "$SEP"')
+    line_list.append('    echo "Copying the output files to the run directory {0} ..."'.format(current_run_dir))
+    line_list.append('    cd $WORK_DIR')
+    line_list.append('    for FILE in {0}; do'.format(' '.join(output_pattern_list)))
+    line_list.append('        if [ -e $FILE ]; then')
+    line_list.append('            cp --recursive $FILE {0}'.format(current_run_dir))
+    line_list.append('            RC=$?')
+    line_list.append('            if [ $RC -ne 0 ]; then manage_error cp $RC; fi')
+    line_list.append('        fi')
+    line_list.append('    done')
+    line_list.append('    echo "The output files are copied."')
+    if archive:
+        line_list.append('    echo "$SEP"')
+        line_list.append('    echo "Archiving the intermediate files in {0}/{1} ..."'.format(current_run_dir, get_cluster_intermediate_file_archive()))
+        line_list.append('    tar --create --gzip --file={0}/{1} {2} .'.format(current_run_dir, get_cluster_intermediate_file_archive(), ' '.join(['--exclude="./{0}"'.format(pattern) for pattern in output_pattern_list])))
+        line_list.append('    RC=$?')
+        line_list.append('    if [ $RC -ne 0 ]; then manage_error tar $RC; fi')
+        line_list.append('    echo "The intermediate files are archived."')
+    line_list.append('    cd {0}'.format(current_run_dir))
+    line_list.append('}')
+    line_list.append('#-------------------------------------------------------------------------------')
+
+    # build the function to remove the scratch files when the script ends; when it ends WRONG, the working
+    # directory is copied before to the run directory to keep the checkpoints which a resumed run needs
+    line_list.append('function clean_scratch')
+    line_list.append('{')
+    line_list.append('    EXIT_RC=$?')
+    line_list.append('    if [ $EXIT_RC -ne 0 ] && [ "$WORK_DIR" != "{0}" ]; then'.format(current_run_dir))
+    line_list.append('        echo "Copying the working directory to the run directory {0} to be able to resume the process ..."'.format(current_run_dir))
+    line_list.append('        cp --recursive $WORK_DIR/. {0}'.format(current_run_dir))
+    line_list.append('        if [ $? -ne 0 ]; then')
+    line_list.append('            echo "WARNING: The working directory could not be copied. It is kept in $WORK_DIR of node $HOSTNAME."')
+    line_list.append('            exit $EXIT_RC')
+    line_list.append('        fi')
+    line_list.append('    fi')
+    line_list.append('    if [ -d $STAGING_DIR ]; then rm --recursive --force $STAGING_DIR; fi')
+    line_list.append('    exit $EXIT_RC')
+    line_list.append('}')
+
+    # return the line list
+    return line_list
+
+#-------------------------------------------------------------------------------
+
 def change_extension(path, new_extension):
     '''Change the file extension.'''
 
@@ -1398,36 +1983,73 @@ def is_email_address_valid(email):
 
 def get_option_dict(config_file):
     '''
-    Get a dictionary with the options retrieved from a configuration file.
-    '''
-
-    # initialize the options dictionary
-    option_dict = {}
-
-    # create class to parse the configuration files
+    Get a read-only dictionary with the options retrieved from a configuration
+    file. The file is parsed again only when it changes, so the validation and
+    the script building of a process share the same parse.
+    '''
+
+    # get the modification key of the configuration file
+    try:
+        stat_result = os.stat(config_file)
+        config_key = (stat_result.st_mtime_ns, stat_result.st_size)
+    except OSError:
+        return types.MappingProxyType({})
+
+    # return the options dictionary of the last parse when the file has not changed; the text is
+    # compared when the file was modified close to the parse because its modification time could be the same
+    (cached_key, cached_text, parse_time, option_dict) = option_dict_cache.get(config_file, (None, None, None, None))
+    if config_key == cached_key:
+        if abs(parse_time - stat_result.st_mtime) > 2:
+            return option_dict
+        config_text = read_config_text(config_file)
+        if config_text == cached_text:
+            return option_dict
+
+    # read and parse the configuration file
+    parse_time = time.time()
+    config_text = read_config_text(config_file)
     config = configparser.ConfigParser()
+    config.read_string(config_text, source=config_file)
 
-    # read the configuration file
-    config.read(config_file)
-
-    # build the dictionary
+    # build the dictionary removing the comments and spaces of the values
+    option_dict = {}
     for section in config.sections():
-        # get the keys dictionary
-        keys_dict = option_dict.get(section, {})
-        # for each key in the section
-        for key in config[section]:
-            # get the value of the key
-            value = config.get(section, key, fallback='')
-            # add a new enter in the keys dictionary
-            keys_dict[key] = get_option_value(value)
-        # update the section with its keys dictionary
-        option_dict[section] = keys_dict
+        option_dict[section] = types.MappingProxyType({key: get_option_value(config.get(section, key, fallback='')) for key in config[section]})
+    option_dict = types.MappingProxyType(option_dict)
+
+    # keep the options dictionary
+    option_dict_cache[config_file] = (config_key, config_text, parse_time, option_dict)
 
     # return the options dictionary
     return option_dict
 
 #-------------------------------------------------------------------------------
 
+def read_config_text(config_file):
+    '''
+    Read the text of a configuration file.
+    '''
+
+    try:
+        with open(config_file, mode='r', encoding='utf-8') as file_id:
+            config_text = file_id.read()
+    except (OSError, UnicodeDecodeError):
+        config_text = ''
+
+    return config_text
+
+#-------------------------------------------------------------------------------
+
+def get_mutable_option_dict(option_dict):
+    '''
+    Get a new dictionary with the sections and options of a read-only options
+    dictionary.
+    '''
+
+    return {section: dict(key_dict) for section, key_dict in option_dict.items()}
+
+#-------------------------------------------------------------------------------
+
 def get_option_value(option):
     '''
     Remove comments ans spaces from an option retrieve from a configuration file.
@@ -1520,48 +2142,42 @@ def split_literal_to_string_list(literal):
 
 def pair_files(file_name_list, specific_chars_1, specific_chars_2):
     '''
-    ...
+    Pair the file names which are equal except the specific characters of the file
+    1 and the file 2, e.g. "lib_10_1.fq" and "lib_10_2.fq" with "_1" and "_2". The
+    rightmost occurrence of the specific characters in a name tells its file. Return
+    the sorted lists of the files 1 and 2 of the pairs and the list of every file
+    which can not be paired.
     '''
 
     # initialize the file lists
-    file_name_1_list = []
-    file_name_2_list = []
+    file_name_1_dict = {}
+    file_name_2_dict = {}
     unpaired_file_name_list = []
 
-    # for each file name, append it to the corresponding list
+    # for each file name, append it to the corresponding dictionary by its name without the rightmost specific characters
     for file_name in file_name_list:
-        if file_name.find(specific_chars_1) >= 0:
-            file_name_1_list.append(file_name)
-        elif  file_name.find(specific_chars_2) >= 0:
-            file_name_2_list.append(file_name)
+        position_1 = file_name.rfind(specific_chars_1)
+        position_2 = file_name.rfind(specific_chars_2)
+        if position_1 >= 0 and (position_1 > position_2 or position_1 == position_2 and len(specific_chars_1) >= len(specific_chars_2)):
+            short_file_name = file_name[:position_1] + file_name[position_1 + len(specific_chars_1):]
+            file_name_1_dict.setdefault(short_file_name, []).append(file_name)
+        elif position_2 >= 0:
+            short_file_name = file_name[:position_2] + file_name[position_2 + len(specific_chars_2):]
+            file_name_2_dict.setdefault(short_file_name, []).append(file_name)
         else:
             unpaired_file_name_list.append(file_name)
-    file_name_1_list.sort()
-    file_name_2_list.sort()
 
-    # verify the file pairing
+    # verify the file pairing: a name is paired when it is the only one of its file with its short name and the other file has one too
     review_file_name_1_list = []
     review_file_name_2_list = []
-    index_1 = 0
-    index_2 = 0
-    while index_1 < len(file_name_1_list) or index_2 < len(file_name_2_list):
-        if index_1 < len(file_name_1_list):
-            file_name_1 = file_name_1_list[index_1]
-            short_file_name_1 = file_name_1.replace(specific_chars_1, '')
-        if index_2 < len(file_name_2_list):
-            file_name_2 = file_name_2_list[index_2]
-            short_file_name_2 = file_name_2.replace(specific_chars_2, '')
-        if short_file_name_1 == short_file_name_2:
-            review_file_name_1_list.append(file_name_1)
-            index_1 += 1
-            review_file_name_2_list.append(file_name_2)
-            index_2 += 1
-        elif short_file_name_1 < short_file_name_2:
-            unpaired_file_name_list.append(file_name_1)
-            index_1 += 1
-        elif short_file_name_1 > short_file_name_2:
-            unpaired_file_name_list.append(file_name_2)
-            index_2 += 1
+    for short_file_name in sorted(file_name_1_dict.keys() | file_name_2_dict.keys()):
+        name_1_list = file_name_1_dict.get(short_file_name, [])
+        name_2_list = file_name_2_dict.get(short_file_name, [])
+        if len(name_1_list) == 1 and len(name_2_list) == 1:
+            review_file_name_1_list.append(name_1_list[0])
+            review_file_name_2_list.append(name_2_list[0])
+        else:
+            unpaired_file_name_list.extend(sorted(name_1_list + name_2_list))
 
     # return the file lists
     return (review_file_name_1_list, review_file_name_2_list, unpaired_file_name_list)
@@ -1614,14 +2230,22 @@ class DevStdOut(object):
 
     #---------------
 
-    def __init__(self, calling_function=None, print_stdout=True):
+    FSYNC_INTERVAL = 5    # seconds between two synchronizations of the log file with the disk
+
+    #---------------
+
+    def __init__(self, calling_function=None, print_stdout=True, cluster_name=None, catalog=True):
         '''
         Execute actions correspending to the creation of a "DevStdOut" instance.
+        The log is registered in the log catalog when "catalog" is True.
         '''
 
         # save initial parameters in instance variables
         self.calling_function = calling_function
         self.print_stdout = print_stdout
+        self.cluster_name = cluster_name
+        self.catalog = catalog
+        self.last_fsync_time = time.time()
 
         # get the local log file
         self.log_file = get_log_file(self.calling_function)
@@ -1633,6 +2257,10 @@ class DevStdOut(object):
             self.log_file_id = open(self.log_file, mode='w', encoding='iso-8859-1')
         except:
             print('*** ERROR: The file {0} can not be created'.format(self.log_file))
+        else:
+            if self.catalog:
+                xlogcatalog.register_log(self.log_file, self.cluster_name)
+            self.finalizer = weakref.finalize(self, close_log_file, self.log_file_id, self.log_file, self.catalog)
 
     #---------------
 
@@ -1645,10 +2273,12 @@ class DevStdOut(object):
         if self.print_stdout:
             sys.stdout.write(message)
 
-        # write in the log file
+        # write in the log file and synchronize it with the disk periodically
         self.log_file_id.write(message)
         self.log_file_id.flush()
-        os.fsync(self.log_file_id.fileno())
+        if time.time() - self.last_fsync_time >= self.FSYNC_INTERVAL:
+            os.fsync(self.log_file_id.fileno())
+            self.last_fsync_time = time.time()
 
     #---------------
 
@@ -1661,18 +2291,36 @@ class DevStdOut(object):
 
     #---------------
 
-    def __del__(self):
+    def close(self):
         '''
-        Execute actions correspending to the object removal.
+        Synchronize the local log file with the disk, close it and index it in
+        the log catalog. When it is not called, the log file is closed when the
+        instance is removed or, at the latest, by the exit handlers of the
+        interpreter, before its modules are torn down.
         '''
 
-        # close the local log file
-        self.log_file_id.close()
+        if hasattr(self, 'finalizer'):
+            self.finalizer()
 
     #---------------
 
 #-------------------------------------------------------------------------------
 
+def close_log_file(log_file_id, log_file, catalog):
+    '''
+    Synchronize a log file of a DevStdOut instance with the disk, close it and
+    index it in the log catalog when it is registered there.
+    '''
+
+    if not log_file_id.closed:
+        log_file_id.flush()
+        os.fsync(log_file_id.fileno())
+        log_file_id.close()
+        if catalog:
+            xlogcatalog.close_log(log_file)
+
+#-------------------------------------------------------------------------------
+
 class DevNull(object):
     '''
     This class is used when it is necessary do not write a output
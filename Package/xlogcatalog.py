@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#-------------------------------------------------------------------------------
+
+'''
+This software has been developed by:
+
+    GI Genética, Fisiología e Historia Forestal
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politécnica de Madrid
+    http://gfhforestal.com/
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+'''
+This file contains functions related to the catalog of the submission logs of
+the local computer used in both console mode and gui mode.
+
+The catalog is a SQLite database in the log directory with a row per log (process,
+start and end times, cluster and outcome) and a full-text index of the log
+contents. A log is registered when it is created and indexed when its process
+ends; the logs created or changed out of the application are indexed when the
+catalog is synchronized with the log directory.
+'''
+
+#-------------------------------------------------------------------------------
+
+import datetime
+import os
+import sqlite3
+import sys
+import threading
+
+import xconfiguration
+import xlib
+
+#-------------------------------------------------------------------------------
+
+# logs being written by this application, which are not indexed when the catalog is synchronized
+open_log_file_set = set()
+open_log_file_lock = threading.Lock()
+
+# full-text index module of the catalog: fts5, fts4 or None when SQLite has not any
+fts_module = None
+
+# processes whose logs are not submission logs, so they are not in the catalog (the errors of the batch job watcher)
+UNCATALOGED_PROCESS_ID_LIST = ['watcher']
+
+#-------------------------------------------------------------------------------
+
+def get_log_catalog_file():
+    '''
+    Get the path of the local catalog of the submission logs.
+    '''
+
+    return '{0}/catalog.db'.format(xlib.get_log_dir())
+
+#-------------------------------------------------------------------------------
+
+def open_log_catalog():
+    '''
+    Open the local catalog of the submission logs creating it when it does not exist.
+    '''
+
+    global fts_module
+
+    # create the log directory
+    if not os.path.exists(xlib.get_log_dir()):
+        os.makedirs(xlib.get_log_dir())
+
+    # open the catalog and create the log table
+    connection = sqlite3.connect(get_log_catalog_file(), timeout=10)
+    connection.execute('''
+        CREATE TABLE IF NOT EXISTS log (
+            log_id INTEGER PRIMARY KEY,
+            run_id TEXT UNIQUE NOT NULL,
+            environment TEXT,
+            process_id TEXT,
+            start_datetime TEXT,
+            end_datetime TEXT,
+            cluster_name TEXT,
+            outcome TEXT,
+            size INTEGER,
+            mtime_ns INTEGER
+        )''')
+    connection.execute('CREATE INDEX IF NOT EXISTS log_process ON log (environment, process_id, start_datetime)')
+
+    # create the table of the log contents, whose rowid is the log identification, with the best full-text index available
+    for sql in ['CREATE VIRTUAL TABLE IF NOT EXISTS log_text USING fts5(content)', 'CREATE VIRTUAL TABLE IF NOT EXISTS log_text USING fts4(content)', 'CREATE TABLE IF NOT EXISTS log_text (content TEXT)']:
+        try:
+            connection.execute(sql)
+        except sqlite3.OperationalError:
+            continue
+        break
+    fts_module = get_fts_module(connection)
+
+    # return the connection
+    return connection
+
+#-------------------------------------------------------------------------------
+
+def get_fts_module(connection):
+    '''
+    Get the module of the full-text index of an open catalog.
+    '''
+
+    row = connection.execute("SELECT sql FROM sqlite_master WHERE name = 'log_text'").fetchone()
+    sql = row[0].lower() if row is not None and row[0] is not None else ''
+    if 'using fts5' in sql:
+        return 'fts5'
+    elif 'using fts4' in sql:
+        return 'fts4'
+    else:
+        return None
+
+#-------------------------------------------------------------------------------
+
+def parse_log_file_name(log_file):
+    '''
+    Get the environment, process identification and start date and time of a log
+    from its file name "environment-process_id-yymmdd-hhmmss.txt", or None when
+    the name has not this format or the log is not cataloged.
+    '''
+
+    name = os.path.basename(log_file)
+    if not name.endswith('.txt'):
+        return None
+    try:
+        (environment, process_id, yymmdd, hhmmss) = name[:-4].rsplit('-', 3)
+        start_datetime = datetime.datetime.strptime('{0}{1}'.format(yymmdd, hhmmss), '%y%m%d%H%M%S').strftime('%Y-%m-%d %H:%M:%S')
+    except ValueError:
+        return None
+    if process_id in UNCATALOGED_PROCESS_ID_LIST:
+        return None
+    return (environment, process_id, start_datetime)
+
+#-------------------------------------------------------------------------------
+
+def get_log_outcome(content):
+    '''
+    Get the outcome of a finished process from its log content.
+    '''
+
+    if '*** ERROR' in content:
+        return 'error'
+    elif 'WARNING' in content:
+        return 'warning'
+    else:
+        return 'ok'
+
+#-------------------------------------------------------------------------------
+
+def register_log(log_file, cluster_name=None):
+    '''
+    Register in the catalog a log which is being created. The errors are ignored
+    because the catalog is rebuilt from the log directory when it is synchronized.
+    '''
+
+    # the log is not indexed when the catalog is synchronized until it is closed
+    with open_log_file_lock:
+        open_log_file_set.add(os.path.abspath(log_file))
+
+    # insert the row of the log
+    data = parse_log_file_name(log_file)
+    if data is None:
+        return
+    (environment, process_id, start_datetime) = data
+    try:
+        connection = open_log_catalog()
+        with connection:
+            save_log_row(connection, (os.path.basename(log_file), environment, process_id, start_datetime, None, cluster_name, 'running', 0, 0))
+        connection.close()
+    except sqlite3.Error:
+        pass
+
+#-------------------------------------------------------------------------------
+
+def close_log(log_file):
+    '''
+    Index a log once its process has ended. The errors are ignored because the
+    log is indexed again when the catalog is synchronized.
+    '''
+
+    with open_log_file_lock:
+        open_log_file_set.discard(os.path.abspath(log_file))
+    try:
+        connection = open_log_catalog()
+        with connection:
+            index_log(connection, log_file)
+        connection.close()
+    except (sqlite3.Error, OSError):
+        pass
+
+#-------------------------------------------------------------------------------
+
+def index_log(connection, log_file, stat_result=None):
+    '''
+    Index the data and the content of a log keeping the cluster name registered.
+    '''
+
+    # get the data of the file name
+    data = parse_log_file_name(log_file)
+    if data is None:
+        return
+    (environment, process_id, start_datetime) = data
+    run_id = os.path.basename(log_file)
+
+    # read the content
+    if stat_result is None:
+        stat_result = os.stat(log_file)
+    with open(log_file, mode='r', encoding='iso-8859-1') as file_id:
+        content = file_id.read()
+    end_datetime = datetime.datetime.fromtimestamp(stat_result.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
+
+    # keep the cluster name registered when the log was created
+    row = connection.execute('SELECT cluster_name FROM log WHERE run_id = ?', (run_id,)).fetchone()
+    cluster_name = row[0] if row is not None else None
+
+    # save the row and replace the content
+    log_id = save_log_row(connection, (run_id, environment, process_id, start_datetime, end_datetime, cluster_name, get_log_outcome(content), stat_result.st_size, stat_result.st_mtime_ns))
+    connection.execute('DELETE FROM log_text WHERE rowid = ?', (log_id,))
+    connection.execute('INSERT INTO log_text (rowid, content) VALUES (?,?)', (log_id, content))
+
+#-------------------------------------------------------------------------------
+
+def save_log_row(connection, row):
+    '''
+    Insert or update the row of a log keeping its identification. Return the
+    log identification.
+    '''
+
+    result = connection.execute('SELECT log_id FROM log WHERE run_id = ?', (row[0],)).fetchone()
+    if result is None:
+        return connection.execute('INSERT INTO log (run_id, environment, process_id, start_datetime, end_datetime, cluster_name, outcome, size, mtime_ns) VALUES (?,?,?,?,?,?,?,?,?)', row).lastrowid
+    else:
+        connection.execute('UPDATE log SET environment = ?, process_id = ?, start_datetime = ?, end_datetime = ?, cluster_name = ?, outcome = ?, size = ?, mtime_ns = ? WHERE log_id = ?', row[1:] + (result[0],))
+        return result[0]
+
+#-------------------------------------------------------------------------------
+
+def sync_log_catalog():
+    '''
+    Synchronize the catalog with the log directory: index the logs that are not
+    in the catalog or have changed and remove the rows of the deleted logs.
+    '''
+
+    # initialize the control variable, the error list and the number of logs indexed
+    OK = True
+    error_list = []
+    indexed_count = 0
+
+    # get the size and modification time of the logs of the directory
+    stat_dict = {}
+    if os.path.isdir(xlib.get_log_dir()):
+        with os.scandir(xlib.get_log_dir()) as entry_iterator:
+            for entry in entry_iterator:
+                if parse_log_file_name(entry.name) is not None and entry.is_file():
+                    stat_dict[entry.name] = entry.stat()
+
+    # get the logs being written by this application
+    with open_log_file_lock:
+        open_run_id_set = {os.path.basename(log_file) for log_file in open_log_file_set}
+
+    # update the catalog
+    try:
+        connection = open_log_catalog()
+        with connection:
+            catalog_dict = {run_id: (log_id, size, mtime_ns) for (log_id, run_id, size, mtime_ns) in connection.execute('SELECT log_id, run_id, size, mtime_ns FROM log')}
+            for run_id in catalog_dict.keys() - stat_dict.keys():
+                connection.execute('DELETE FROM log WHERE log_id = ?', (catalog_dict[run_id][0],))
+                connection.execute('DELETE FROM log_text WHERE rowid = ?', (catalog_dict[run_id][0],))
+            for run_id, stat_result in stat_dict.items():
+                if run_id in open_run_id_set or catalog_dict.get(run_id, (None, None, None))[1:] == (stat_result.st_size, stat_result.st_mtime_ns):
+                    continue
+                try:
+                    index_log(connection, '{0}/{1}'.format(xlib.get_log_dir(), run_id), stat_result)
+                    indexed_count += 1
+                except OSError:
+                    pass
+        connection.close()
+    except sqlite3.Error as e:
+        error_list.append('*** ERROR: The log catalog {0} can not be updated: {1}.\n'.format(get_log_catalog_file(), e))
+        OK = False
+
+    # return the control variable, the error list and the number of logs indexed
+    return (OK, error_list, indexed_count)
+
+#-------------------------------------------------------------------------------
+
+def get_log_record_list(process_id='all', search_text=''):
+    '''
+    Get the records of the logs of the current environment of a process (or of
+    every process) whose content contains a text, ordered from the newest one.
+    '''
+
+    # initialize the control variable, the error list and the record list
+    OK = True
+    error_list = []
+    record_list = []
+
+    # open the catalog
+    try:
+        connection = open_log_catalog()
+    except sqlite3.Error as e:
+        error_list.append('*** ERROR: The log catalog {0} can not be opened: {1}.\n'.format(get_log_catalog_file(), e))
+        return (False, error_list, record_list)
+
+    # build the query
+    sql = 'SELECT run_id, process_id, start_datetime, end_datetime, cluster_name, outcome FROM log WHERE environment = ?'
+    parameter_list = [xconfiguration.environment]
+    if process_id != 'all':
+        sql += ' AND process_id = ?'
+        parameter_list.append(process_id)
+
+    # search the text in the logs as a phrase
+    if search_text.strip() != '':
+        if fts_module == 'fts5':
+            sql += ' AND log_id IN (SELECT rowid FROM log_text WHERE log_text MATCH ?)'
+            parameter_list.append('"{0}"'.format(search_text.strip().replace('"', '""')))
+        elif fts_module == 'fts4':
+            sql += ' AND log_id IN (SELECT rowid FROM log_text WHERE log_text MATCH ?)'
+            parameter_list.append('"{0}"'.format(search_text.strip().replace('"', ' ')))
+        else:
+            sql += ' AND log_id IN (SELECT rowid FROM log_text WHERE content LIKE ?)'
+            parameter_list.append('%{0}%'.format(search_text.strip()))
+    sql += ' ORDER BY start_datetime DESC, run_id'
+
+    # get the records
+    try:
+        for (run_id, process_id, start_datetime, end_datetime, cluster_name, outcome) in connection.execute(sql, parameter_list):
+            record_list.append({'run_id': run_id, 'process_id': process_id, 'start_datetime': start_datetime, 'end_datetime': end_datetime, 'cluster_name': cluster_name, 'outcome': outcome})
+    except sqlite3.Error as e:
+        error_list.append('*** ERROR: The log catalog {0} can not be read: {1}.\n'.format(get_log_catalog_file(), e))
+        OK = False
+    connection.close()
+
+    # return the control variable, the error list and the record list
+    return (OK, error_list, record_list)
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+     print('This file contains functions related to the catalog of the submission logs of the local computer used in both console mode and gui mode.')
+     sys.exit(0)
+
+#-------------------------------------------------------------------------------
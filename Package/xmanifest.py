@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#-------------------------------------------------------------------------------
+
+'''
+This software has been developed by:
+
+    GI Genética, Fisiología e Historia Forestal
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politécnica de Madrid
+    http://gfhforestal.com/
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+'''
+This file contains functions related to the manifest of the datasets of the
+cluster volumes used in both console mode and gui mode.
+
+Every process script, upload and removal appends a JSON record to the manifest
+file of the volume of the dataset. A local copy of each manifest is kept in the
+temporal directory and it is synchronized reading only the bytes appended since
+the last synchronization. The dataset listings fall back to the directory of the
+datasets when the manifest is missing or it is older than the directory.
+'''
+
+#-------------------------------------------------------------------------------
+
+import glob
+import hashlib
+import json
+import os
+import sys
+
+import xlib
+import xssh
+
+#-------------------------------------------------------------------------------
+
+# records of the local manifest copies already read and their sizes per local manifest file
+manifest_record_dict = {}
+
+#-------------------------------------------------------------------------------
+
+def get_manifest_dataset_type_list():
+    '''
+    Get the list of dataset types with manifest.
+    '''
+
+    return ['read', 'reference', 'database', 'result']
+
+#-------------------------------------------------------------------------------
+
+def get_local_manifest_dir():
+    '''
+    Get the directory of the local manifest copies.
+    '''
+
+    return '{0}/manifests'.format(xlib.get_temp_dir())
+
+#-------------------------------------------------------------------------------
+
+def get_local_manifest_file(cluster_name, dataset_type, manifest_id):
+    '''
+    Get the path of the local manifest copy of a dataset type of a cluster. The
+    manifest identification is built with the file system identification of the
+    volume and the inode of the manifest, so a copy is not reused when the cluster
+    mounts other volume or the manifest is created again.
+    '''
+
+    return '{0}/{1}-{2}-{3}.jsonl'.format(get_local_manifest_dir(), cluster_name, dataset_type, manifest_id)
+
+#-------------------------------------------------------------------------------
+
+def get_dataset_path_pattern(dataset_type):
+    '''
+    Get the path pattern of the datasets of a type in the cluster.
+    '''
+
+    if dataset_type == 'read':
+        dataset_path_pattern = '{0}/*/*'.format(xlib.get_cluster_read_dir())
+    elif dataset_type == 'reference':
+        dataset_path_pattern = '{0}/*'.format(xlib.get_cluster_reference_dir())
+    elif dataset_type == 'database':
+        dataset_path_pattern = '{0}/*'.format(xlib.get_cluster_database_dir())
+    elif dataset_type == 'result':
+        dataset_path_pattern = '{0}/*/*'.format(xlib.get_cluster_result_dir())
+
+    return dataset_path_pattern
+
+#-------------------------------------------------------------------------------
+
+def write_manifest_record(ssh_client, dataset_type, dataset_path, status):
+    '''
+    Append a record with the state of a dataset to the manifest of its volume.
+    '''
+
+    # initialize the control variable and the error list
+    OK = True
+    error_list = []
+
+    # write the record
+    command = '\n'.join(xlib.get_manifest_function_list() + ['write_manifest {0} {1} "{2}"'.format(dataset_type, dataset_path, status)])
+    (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+    if not OK:
+        error_list.append('*** ERROR: The manifest record of {0} has not been written.\n'.format(dataset_path))
+        for line in stderr:
+            error_list.append('{0}\n'.format(line))
+
+    # return the control variable and the error list
+    return (OK, error_list)
+
+#-------------------------------------------------------------------------------
+
+def get_removal_command(dataset_type, dataset_path_pattern):
+    '''
+    Get the command that removes the datasets matching a path pattern and records
+    their removal in the manifest of their volume.
+    '''
+
+    line_list = xlib.get_manifest_function_list()
+    line_list.append('for DATASET_PATH in {0}; do'.format(dataset_path_pattern))
+    line_list.append('    [ -e $DATASET_PATH ] || continue')
+    line_list.append('    rm -fr $DATASET_PATH')
+    line_list.append('    write_manifest {0} $DATASET_PATH removed'.format(dataset_type))
+    line_list.append('done')
+
+    return '\n'.join(line_list)
+
+#-------------------------------------------------------------------------------
+
+def build_manifest(ssh_client, dataset_type):
+    '''
+    Build the manifest of a volume without it from the datasets found in the volume.
+    The sizes are not computed in order to index the datasets quickly.
+    '''
+
+    # initialize the control variable and the error list
+    OK = True
+    error_list = []
+
+    # index the datasets of the volume
+    line_list = xlib.get_manifest_function_list()
+    line_list.append('touch {0}'.format(xlib.get_cluster_manifest_path(dataset_type)))
+    line_list.append('for DATASET_PATH in {0}; do'.format(get_dataset_path_pattern(dataset_type)))
+    line_list.append('    [ -e $DATASET_PATH ] || continue')
+    line_list.append('    [[ $DATASET_PATH == */lost+found* ]] && continue')
+    line_list.append('    write_manifest {0} $DATASET_PATH indexed nosize'.format(dataset_type))
+    line_list.append('done')
+    (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, '\n'.join(line_list))
+    if not OK:
+        error_list.append('*** ERROR: The manifest {0} has not been built.\n'.format(xlib.get_cluster_manifest_path(dataset_type)))
+        for line in stderr:
+            error_list.append('{0}\n'.format(line))
+
+    # return the control variable and the error list
+    return (OK, error_list)
+
+#-------------------------------------------------------------------------------
+
+def sync_manifest(cluster_name, dataset_type, ssh_client, listing_dir=None):
+    '''
+    Synchronize the local copy of the manifest of a dataset type of a cluster and
+    get its record list. The manifest is built when the volume has not it yet.
+    The local copy is kept per volume and only the bytes appended to the manifest
+    are read when the local copy is still its prefix. When a listing directory is
+    passed, it is also verified that the directory has not been changed after the
+    last manifest record.
+    '''
+
+    # initialize the control variable and the error list
+    OK = True
+    error_list = []
+
+    # initialize the record list and the manifest state
+    record_list = []
+    is_current = True
+
+    # create the directory of the local manifest copies
+    if not os.path.isdir(get_local_manifest_dir()):
+        os.makedirs(get_local_manifest_dir())
+
+    # get the identification, size and hash of the last local copy
+    (manifest_id, local_manifest_file) = get_last_local_manifest(cluster_name, dataset_type)
+    local_size = 0
+    local_md5 = hashlib.md5()
+    if local_manifest_file is not None:
+        with open(local_manifest_file, mode='rb') as file_id:
+            for block in iter(lambda: file_id.read(65536), b''):
+                local_size += len(block)
+                local_md5.update(block)
+
+    # get the bytes of the manifest appended after the local copy when the manifest is of the same volume and the local
+    # copy is its prefix, or otherwise the whole manifest; the manifest is read with a shared lock to get whole records
+    cluster_manifest_path = xlib.get_cluster_manifest_path(dataset_type)
+    line_list = []
+    line_list.append('MANIFEST={0}'.format(cluster_manifest_path))
+    line_list.append('if [ -f $MANIFEST ]; then')
+    line_list.append('    exec 9<$MANIFEST')
+    line_list.append('    flock --shared 9')
+    line_list.append('    ID=`stat --file-system --format=%i $MANIFEST`-`stat --format=%i $MANIFEST`')
+    line_list.append('    SIZE=`stat --format=%s $MANIFEST`')
+    line_list.append('    echo MANIFEST_ID=$ID')
+    if listing_dir is not None:
+        line_list.append('    if [ {0} -nt $MANIFEST ]; then echo MANIFEST_CURRENT=NO; else echo MANIFEST_CURRENT=YES; fi'.format(listing_dir))
+    line_list.append('    if [ "$ID" = "{0}" ] && [ $SIZE -ge {1} ] && [ "`head --bytes={1} $MANIFEST | md5sum | cut --delimiter=\' \' --fields=1`" = "{2}" ]; then'.format(manifest_id, local_size, local_md5.hexdigest()))
+    line_list.append('        echo MANIFEST_MODE=APPEND')
+    line_list.append('        tail --bytes=+{0} $MANIFEST | head --bytes=$(($SIZE - {1}))'.format(local_size + 1, local_size))
+    line_list.append('    else')
+    line_list.append('        echo MANIFEST_MODE=FULL')
+    line_list.append('        head --bytes=$SIZE $MANIFEST')
+    line_list.append('    fi')
+    line_list.append('    flock --unlock 9')
+    line_list.append('else')
+    line_list.append('    echo MANIFEST_ID=NONE')
+    line_list.append('fi')
+    command = '\n'.join(line_list)
+    (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+    if not OK or stdout == [] or not stdout[0].startswith('MANIFEST_ID='):
+        error_list.append('*** ERROR: Wrong command ---> {0}\n'.format(command))
+        OK = False
+
+    # build the manifest when the volume has not it and read it again
+    if OK and stdout[0] == 'MANIFEST_ID=NONE':
+        (OK, error_list) = build_manifest(ssh_client, dataset_type)
+        if OK:
+            (OK, error_list, record_list, is_current) = sync_manifest(cluster_name, dataset_type, ssh_client, listing_dir)
+        return (OK, error_list, record_list, is_current)
+
+    # get the manifest state and the appended bytes
+    if OK:
+        cluster_manifest_id = stdout[0][len('MANIFEST_ID='):]
+        line_number = 1
+        if listing_dir is not None:
+            is_current = stdout[line_number] == 'MANIFEST_CURRENT=YES'
+            line_number += 1
+        open_mode = 'a' if stdout[line_number] == 'MANIFEST_MODE=APPEND' else 'w'
+        record_line_list = stdout[line_number + 1:]
+
+    # update the local copy; when the whole manifest is got, the local copies of other volumes of the cluster are replaced
+    if OK:
+        new_local_manifest_file = get_local_manifest_file(cluster_name, dataset_type, cluster_manifest_id)
+        if open_mode == 'w':
+            for old_local_manifest_file in get_local_manifest_file_list(cluster_name, dataset_type):
+                os.remove(old_local_manifest_file)
+                manifest_record_dict.pop(old_local_manifest_file, None)
+        try:
+            with open(new_local_manifest_file, mode=open_mode, encoding='utf-8', newline='\n') as file_id:
+                for line in record_line_list:
+                    file_id.write('{0}\n'.format(line))
+        except OSError as e:
+            error_list.append('*** ERROR: The file {0} can not be written: {1}\n'.format(new_local_manifest_file, e))
+            OK = False
+
+    # get the record list
+    if OK:
+        record_list = get_local_manifest_record_list(new_local_manifest_file)
+
+    # return the control variable, error list, record list and manifest state
+    return (OK, error_list, record_list, is_current)
+
+#-------------------------------------------------------------------------------
+
+def get_local_manifest_file_list(cluster_name, dataset_type):
+    '''
+    Get the local manifest copies of a dataset type of a cluster.
+    '''
+
+    return glob.glob(get_local_manifest_file(cluster_name, dataset_type, '*'))
+
+#-------------------------------------------------------------------------------
+
+def get_last_local_manifest(cluster_name, dataset_type):
+    '''
+    Get the manifest identification and the path of the last updated local
+    manifest copy of a dataset type of a cluster, or (None, None) if there is not
+    any copy.
+    '''
+
+    # get the last updated local copy
+    local_manifest_file_list = get_local_manifest_file_list(cluster_name, dataset_type)
+    if local_manifest_file_list == []:
+        return (None, None)
+    local_manifest_file = max(local_manifest_file_list, key=os.path.getmtime)
+
+    # get its manifest identification from its name
+    prefix = get_local_manifest_file(cluster_name, dataset_type, '')[:-len('.jsonl')]
+    manifest_id = local_manifest_file[len(prefix):-len('.jsonl')]
+
+    # return the manifest identification and the path of the local copy
+    return (manifest_id, local_manifest_file)
+
+#-------------------------------------------------------------------------------
+
+def get_local_manifest_record_list(local_manifest_file):
+    '''
+    Get the record list of a local copy of a manifest reading only the lines
+    appended since the last reading.
+    '''
+
+    # get the records already read
+    (read_size, record_list) = manifest_record_dict.get(local_manifest_file, (0, []))
+
+    # read the appended lines
+    if os.path.isfile(local_manifest_file) and os.path.getsize(local_manifest_file) > read_size:
+        with open(local_manifest_file, mode='rb') as file_id:
+            file_id.seek(read_size)
+            for line in file_id:
+                try:
+                    record_list.append(json.loads(line.decode('utf-8')))
+                except ValueError:
+                    pass
+            read_size = file_id.tell()
+        manifest_record_dict[local_manifest_file] = (read_size, record_list)
+
+    # return the record list
+    return record_list
+
+#-------------------------------------------------------------------------------
+
+def get_dataset_record_dict(record_list, experiment_id=None):
+    '''
+    Get a dictionary with the current state of the datasets from the records of
+    a manifest merging the records of each dataset in order. The removed datasets
+    are not included.
+    '''
+
+    # initialize the dictionary of the dataset records
+    dataset_record_dict = {}
+
+    # merge the records of each dataset
+    for record in record_list:
+        if experiment_id is not None and record.get('experiment_id', '') != experiment_id:
+            continue
+        dataset_id = record.get('dataset_id', '')
+        if dataset_id in ['', 'lost+found']:
+            continue
+        if record.get('status', '') == 'removed':
+            dataset_record_dict.pop(dataset_id, None)
+            continue
+        dataset_record = dataset_record_dict.get(dataset_id, {})
+        for key, value in record.items():
+            if value is not None:
+                dataset_record[key] = value
+        dataset_record_dict[dataset_id] = dataset_record
+
+    # return the dictionary of the dataset records
+    return dataset_record_dict
+
+#-------------------------------------------------------------------------------
+
+def get_listing_dir(dataset_type, experiment_id=None):
+    '''
+    Get the cluster directory whose entries are the datasets of a type, those of
+    an experiment in the read and result cases.
+    '''
+
+    volume_dir = os.path.dirname(xlib.get_cluster_manifest_path(dataset_type))
+    if dataset_type in ['read', 'result'] and experiment_id is not None:
+        listing_dir = '{0}/{1}'.format(volume_dir, experiment_id)
+    else:
+        listing_dir = volume_dir
+
+    return listing_dir
+
+#-------------------------------------------------------------------------------
+
+def get_listing_dataset_dict(ssh_client, dataset_type, experiment_id=None):
+    '''
+    Get a dictionary with the datasets of a type listing their cluster directory
+    and the records of the manifest merged when they are got.
+    '''
+
+    # list the directory of the datasets
+    (OK, error_list, entry_list) = xssh.list_cluster_dir(ssh_client, get_listing_dir(dataset_type, experiment_id))
+
+    # build the dictionary of the dataset records
+    dataset_record_dict = {}
+    if OK:
+        for entry in entry_list:
+            dataset_record_dict[entry['name']] = {'dataset_type': dataset_type, 'experiment_id': experiment_id if dataset_type in ['read', 'result'] else '', 'dataset_id': entry['name'], 'status': 'listed'}
+
+    # return the control variable, error list and dictionary of the dataset records
+    return (OK, error_list, dataset_record_dict)
+
+#-------------------------------------------------------------------------------
+
+def get_manifest_dataset_dict(cluster_name, dataset_type, ssh_client, experiment_id=None):
+    '''
+    Get a dictionary with the current state of the datasets of a type of a cluster
+    after synchronizing the local copy of its manifest. The datasets are listed
+    from their directory when the manifest can not be got or built, or when the
+    directory has been changed after its last record.
+    '''
+
+    # synchronize the local manifest copy
+    (OK, error_list, record_list, is_current) = sync_manifest(cluster_name, dataset_type, ssh_client, get_listing_dir(dataset_type, experiment_id))
+    manifest_dataset_dict = get_dataset_record_dict(record_list, experiment_id) if OK else {}
+
+    # get the dictionary of the dataset records from the manifest or, when it is missing or out of date, from the directory
+    if OK and is_current:
+        dataset_record_dict = manifest_dataset_dict
+    else:
+        (OK, error_list, dataset_record_dict) = get_listing_dataset_dict(ssh_client, dataset_type, experiment_id)
+        for dataset_id, dataset_record in dataset_record_dict.items():
+            dataset_record.update(manifest_dataset_dict.get(dataset_id, {}))
+
+    # return the control variable, error list and dictionary of the dataset records
+    return (OK, error_list, dataset_record_dict)
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+     print('This file contains functions related to the manifest of the datasets of the cluster volumes used in both console mode and gui mode.')
+     sys.exit(0)
+
+#-------------------------------------------------------------------------------
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#-------------------------------------------------------------------------------
+
+'''
+This software has been developed by:
+
+    GI Genética, Fisiología e Historia Forestal
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politécnica de Madrid
+    http://gfhforestal.com/
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+'''
+This file contains functions related to the resource metrics of the process steps
+used in both console mode and gui mode.
+'''
+
+#-------------------------------------------------------------------------------
+
+import json
+import math
+import os
+import sqlite3
+import sys
+
+import xconfiguration
+import xlib
+import xssh
+
+#-------------------------------------------------------------------------------
+
+def get_metrics_store_file():
+    '''
+    Get the path of the local metrics store.
+    '''
+
+    return '{0}/metrics.db'.format(xlib.get_log_dir())
+
+#-------------------------------------------------------------------------------
+
+def open_metrics_store():
+    '''
+    Open the local metrics store creating it when it does not exist.
+    '''
+
+    # create the log directory
+    if not os.path.exists(xlib.get_log_dir()):
+        os.makedirs(xlib.get_log_dir())
+
+    # open the store and create the metrics table
+    connection = sqlite3.connect(get_metrics_store_file())
+    connection.execute('''
+        CREATE TABLE IF NOT EXISTS metrics (
+            cluster_name TEXT,
+            experiment_id TEXT NOT NULL,
+            result_dataset_id TEXT NOT NULL,
+            line_number INTEGER NOT NULL,
+            tool TEXT,
+            rc INTEGER,
+            end_datetime TEXT,
+            node TEXT,
+            node_type TEXT,
+            wall_time REAL,
+            system_time REAL,
+            user_time REAL,
+            cpu_percentage REAL,
+            max_rss_kb INTEGER,
+            average_memory_kb INTEGER,
+            input_kb INTEGER,
+            PRIMARY KEY (experiment_id, result_dataset_id, line_number)
+        )''')
+    connection.execute('CREATE INDEX IF NOT EXISTS metrics_tool ON metrics (tool, node_type)')
+
+    # return the connection
+    return connection
+
+#-------------------------------------------------------------------------------
+
+def collect_metrics_files(cluster_name, experiment_id=None, passed_connection=False, ssh_client=None):
+    '''
+    Collect the metrics files of the runs of an experiment (or of every experiment
+    when experiment_id is None) and store their records in the local metrics store.
+    '''
+
+    # initialize the control variable, the error list and the record count
+    OK = True
+    error_list = []
+    record_count = 0
+
+    # set the directory and depth to search the metrics files
+    if experiment_id is None:
+        search_dir = xlib.get_cluster_result_dir()
+        depth = 3
+    else:
+        search_dir = xlib.get_cluster_experiment_result_dir(experiment_id)
+        depth = 2
+
+    # create the SSH client connection
+    if not passed_connection:
+        (OK, error_list, ssh_client) = xssh.create_ssh_client_connection(cluster_name, 'master')
+
+    # get the records of all metrics files with only one command
+    if OK:
+        command = '[ -d {0} ] && find {0} -mindepth {1} -maxdepth {1} -name {2} -exec awk \'{{print FILENAME "\\t" FNR "\\t" $0}}\' {{}} + ; echo RC=0'.format(search_dir, depth, xlib.get_cluster_metrics_file())
+        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+        if not OK:
+            error_list.append('*** ERROR: Wrong command ---> {0}\n'.format(command))
+
+    # store the records in the local metrics store
+    if OK:
+        connection = open_metrics_store()
+        with connection:
+            for line in stdout:
+                line = line.rstrip('\n')
+                if line == 'RC=0':
+                    continue
+                try:
+                    (path, line_number, record) = line.split('\t', 2)
+                    path_part_list = path.split('/')
+                    run_experiment_id = path_part_list[-3]
+                    result_dataset_id = path_part_list[-2]
+                    record_dict = json.loads(record)
+                except (ValueError, IndexError) as e:
+                    error_list.append('*** WARNING: The metrics record "{0}" can not be parsed: {1}\n'.format(line, e))
+                    continue
+                connection.execute('INSERT OR REPLACE INTO metrics VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)', (cluster_name, run_experiment_id, result_dataset_id, int(line_number), record_dict.get('tool'), record_dict.get('rc'), record_dict.get('end_datetime'), record_dict.get('node'), record_dict.get('node_type'), record_dict.get('wall_time'), record_dict.get('system_time'), record_dict.get('user_time'), record_dict.get('cpu_percentage'), record_dict.get('max_rss_kb'), record_dict.get('average_memory_kb'), record_dict.get('input_kb')))
+                record_count += 1
+        connection.close()
+
+    # close the SSH client connection
+    if OK and not passed_connection:
+        xssh.close_ssh_client_connection(ssh_client)
+
+    # return the control variable, error list and record count
+    return (OK, error_list, record_count)
+
+#-------------------------------------------------------------------------------
+
+def collect_metrics(cluster_name, log, function=None):
+    '''
+    Collect the metrics of every run in the cluster into the local metrics store.
+    '''
+
+    # initialize the control variable
+    OK = True
+
+    # warn that the log window must not be closed
+    if not isinstance(log, xlib.DevStdOut):
+        log.write('This process might take several minutes. Do not close this window, please wait!\n')
+
+    # collect the metrics files
+    log.write('{0}\n'.format(xlib.get_separator()))
+    log.write('Collecting the metrics files of the cluster {0} ...\n'.format(cluster_name))
+    (OK, error_list, record_count) = collect_metrics_files(cluster_name)
+    for error in error_list:
+        log.write(error)
+    if OK:
+        log.write('{0} records have been stored in {1}.\n'.format(record_count, get_metrics_store_file()))
+
+    # warn that the log window can be closed
+    if not isinstance(log, xlib.DevStdOut):
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('You can close this window now.\n')
+
+    # execute final function
+    if function is not None:
+        function()
+
+    # return the control variable
+    return OK
+
+#-------------------------------------------------------------------------------
+
+def get_run_metrics_dict(experiment_id):
+    '''
+    Get a dictionary with the step count, total wall time and maximum RSS
+    of each run of an experiment from the local metrics store.
+    '''
+
+    # initialize the dictionary of the run metrics
+    run_metrics_dict = {}
+
+    # query the local metrics store
+    if os.path.isfile(get_metrics_store_file()):
+        connection = open_metrics_store()
+        cursor = connection.execute('SELECT result_dataset_id, COUNT(*), SUM(wall_time), MAX(max_rss_kb) FROM metrics WHERE experiment_id = ? GROUP BY result_dataset_id', (experiment_id,))
+        for (result_dataset_id, step_count, wall_time, max_rss_kb) in cursor:
+            run_metrics_dict[result_dataset_id] = {'step_count': step_count, 'wall_time': wall_time, 'max_rss_kb': max_rss_kb}
+        connection.close()
+
+    # return the dictionary of the run metrics
+    return run_metrics_dict
+
+#-------------------------------------------------------------------------------
+
+def get_metrics_summary(experiment_id=None):
+    '''
+    Get a list with the resource usage of the steps aggregated by tool and node type.
+    '''
+
+    # initialize the summary list
+    summary_list = []
+
+    # query the local metrics store
+    if os.path.isfile(get_metrics_store_file()):
+        connection = open_metrics_store()
+        query = 'SELECT tool, node_type, COUNT(*), AVG(wall_time), MAX(wall_time), AVG(max_rss_kb), MAX(max_rss_kb), AVG(cpu_percentage), SUM(rc <> 0) FROM metrics'
+        if experiment_id is None:
+            cursor = connection.execute('{0} GROUP BY tool, node_type ORDER BY tool, node_type'.format(query))
+        else:
+            cursor = connection.execute('{0} WHERE experiment_id = ? GROUP BY tool, node_type ORDER BY tool, node_type'.format(query), (experiment_id,))
+        for row in cursor:
+            summary_list.append({'tool': row[0], 'node_type': row[1], 'step_count': row[2], 'avg_wall_time': row[3], 'max_wall_time': row[4], 'avg_max_rss_kb': row[5], 'max_rss_kb': row[6], 'avg_cpu_percentage': row[7], 'error_count': row[8]})
+        connection.close()
+
+    # return the summary list
+    return summary_list
+
+#-------------------------------------------------------------------------------
+
+def get_input_size_kb(ssh_client, cluster_dir, file_list):
+    '''
+    Get the total size in KiB of a file list of a cluster directory, measured as the input_kb of the metrics records
+    (see xlib.get_metrics_function_list).
+    '''
+
+    # initialize the input size
+    input_kb = None
+
+    # get the total size of the files
+    command = 'cd {0}; du --summarize --total --dereference --block-size=1K {1} | tail --lines=1'.format(cluster_dir, ' '.join([os.path.basename(file) for file in file_list]))
+    (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+    if OK and stdout != []:
+        try:
+            input_kb = int(stdout[len(stdout) - 1].split()[0])
+        except:
+            input_kb = None
+
+    # return the input size
+    return input_kb
+
+#-------------------------------------------------------------------------------
+
+def recommend_resources(app_code, tool_list, input_kb, neighbour_number=5):
+    '''
+    Recommend the thread number, the memory and the cluster template of a run of
+    an application from the most similar past runs by input size, scaling their
+    maximum RSS linearly with the input size.
+
+    The result is a dictionary with the keys ncpu, max_memory (GiB), bfly_heap_space_max
+    (GiB), template_name, run_number, confidence (0 to 1) and confidence_level, or None
+    when there are not any successful past runs of the application.
+    '''
+
+    # verify there is input size and local metrics store
+    if input_kb is None or input_kb <= 0 or not os.path.isfile(get_metrics_store_file()):
+        return None
+
+    # get the successful past runs of the application with their maximum values of the steps
+    connection = open_metrics_store()
+    query = 'SELECT experiment_id, result_dataset_id, MAX(input_kb), MAX(max_rss_kb), MAX(cpu_percentage), MAX(rc) FROM metrics WHERE result_dataset_id LIKE ? AND ({0}) GROUP BY experiment_id, result_dataset_id'.format(' OR '.join(['tool LIKE ?'] * len(tool_list)))
+    run_list = []
+    for (experiment_id, result_dataset_id, run_input_kb, max_rss_kb, cpu_percentage, rc) in connection.execute(query, ['{0}-%'.format(app_code)] + tool_list):
+        if rc == 0 and run_input_kb is not None and run_input_kb > 0 and max_rss_kb is not None:
+            run_list.append({'distance': abs(math.log(input_kb / run_input_kb)), 'scale': input_kb / run_input_kb, 'max_rss_kb': max_rss_kb, 'cores': (cpu_percentage or 100) / 100})
+    connection.close()
+    if run_list == []:
+        return None
+
+    # select the nearest runs
+    run_list.sort(key=lambda run: run['distance'])
+    run_list = run_list[:neighbour_number]
+
+    # estimate the memory with a 20 % margin and the used cores with a 25 % margin
+    memory_kb_list = [run['max_rss_kb'] * run['scale'] for run in run_list]
+    memory_gib = max(1, math.ceil(max(memory_kb_list) * 1.2 / 1048576))
+    cores = max(1, math.ceil(max([run['cores'] for run in run_list]) * 1.25))
+
+    # select the smallest template with enough memory and cores leaving 10 % of memory to the system
+    template_list = []
+    for template_name, template_data in xconfiguration.get_template_dict().items():
+        if template_name == xlib.get_volume_creator_name():
+            continue
+        try:
+            template_list.append((float(template_data['memory']), int(template_data['vcpu']), template_name))
+        except:
+            continue
+    template_list.sort()
+    selected_template = None
+    for template in template_list:
+        if template[0] * 0.9 >= memory_gib and template[1] >= cores:
+            selected_template = template
+            break
+    if selected_template is None and template_list != []:
+        selected_template = template_list[len(template_list) - 1]
+
+    # fit the thread number and the memory to the selected template
+    if selected_template is not None:
+        ncpu = min(cores, selected_template[1])
+        max_memory = min(memory_gib, max(1, int(selected_template[0] * 0.9)))
+        template_name = selected_template[2]
+    else:
+        ncpu = cores
+        max_memory = memory_gib
+        template_name = None
+    bfly_heap_space_max = max(1, min(4, int(max_memory * 0.8 / ncpu)))
+
+    # estimate the confidence from the input size closeness, the number of runs and the memory dispersion
+    closeness = sum([math.exp(-run['distance']) for run in run_list]) / len(run_list)
+    coverage = min(1, len(run_list) / 3)
+    mean_memory_kb = sum(memory_kb_list) / len(memory_kb_list)
+    dispersion = math.sqrt(sum([(memory_kb - mean_memory_kb) ** 2 for memory_kb in memory_kb_list]) / len(memory_kb_list)) / mean_memory_kb if mean_memory_kb > 0 else 0
+    confidence = closeness * coverage / (1 + dispersion)
+    if max_memory < memory_gib:
+        confidence /= 2
+    if confidence >= 0.7:
+        confidence_level = 'high'
+    elif confidence >= 0.4:
+        confidence_level = 'medium'
+    else:
+        confidence_level = 'low'
+
+    # return the recommendation
+    return {'ncpu': ncpu, 'max_memory': max_memory, 'bfly_heap_space_max': bfly_heap_space_max, 'template_name': template_name, 'run_number': len(run_list), 'confidence': round(confidence, 2), 'confidence_level': confidence_level}
+
+#-------------------------------------------------------------------------------
+
+def get_recommendation_text(recommendation):
+    '''
+    Get the text that describes a resource recommendation.
+    '''
+
+    if recommendation is None:
+        return 'There are not enough past runs to recommend resources; the default values are used.'
+    return 'Resources recommended from {0} past runs (confidence {1} - {2}): {3} threads, {4} GiB of memory, template {5}.'.format(recommendation['run_number'], recommendation['confidence_level'], recommendation['confidence'], recommendation['ncpu'], recommendation['max_memory'], recommendation['template_name'])
+
+#-------------------------------------------------------------------------------
+
+def format_wall_time(wall_time):
+    '''
+    Format a wall time in seconds as HH:MM:SS.
+    '''
+
+    if wall_time is None:
+        return '-'
+    wall_time = int(round(wall_time))
+    return '{0:02d}:{1:02d}:{2:02d}'.format(wall_time // 3600, wall_time % 3600 // 60, wall_time % 60)
+
+#-------------------------------------------------------------------------------
+
+def format_memory(memory_kb):
+    '''
+    Format a memory size in KiB as MiB or GiB.
+    '''
+
+    if memory_kb is None:
+        return '-'
+    if memory_kb >= 1048576:
+        return '{0:.1f} GiB'.format(memory_kb / 1048576)
+    return '{0:.0f} MiB'.format(memory_kb / 1024)
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+     print('This file contains functions related to the resource metrics of the process steps used in both console mode and gui mode.')
+     sys.exit(0)
+
+#-------------------------------------------------------------------------------
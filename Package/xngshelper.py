@@ -35,6 +35,7 @@ import xcluster
 import xconfiguration
 import xec2
 import xlib
+import xresult
 import xssh
 
 #-------------------------------------------------------------------------------
@@ -724,6 +725,17 @@ def run_transcript_filter_process(cluster_name, log, function=None):
     if OK:
         log.write('Process requirements are OK.\n')
 
+    # calculate the run fingerprint
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Calculating the run fingerprint ...\n')
+        (OK, error_list, fingerprint) = xresult.get_run_fingerprint(xlib.get_transcript_filter_code(), get_transcript_filter_config_file(), ssh_client)
+        if OK:
+            log.write('The run fingerprint is {0}.\n'.format(fingerprint))
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
     # determine the run directory in the cluster
     if OK:
         log.write('{0}\n'.format(xlib.get_separator()))
@@ -736,6 +748,17 @@ def run_transcript_filter_process(cluster_name, log, function=None):
         else:
             log.write('*** ERROR: Wrong command ---> {0}\n'.format(command))
 
+    # save the run fingerprint in the run directory
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Saving the run fingerprint ...\n')
+        (OK, error_list) = xresult.save_run_fingerprint(ssh_client, current_run_dir, fingerprint)
+        if OK:
+            log.write('The run fingerprint is saved.\n')
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
     # build the transcript-filter process script
     if OK:
         log.write('{0}\n'.format(xlib.get_separator()))
@@ -1064,12 +1087,18 @@ def build_transcript_filter_process_script(cluster_name, current_run_dir, sftp_c
                 file_id.write('{0}\n'.format('export PATH=$PYTHON3_PATH:$NGSHELPER_PATH:$PATH'))
                 file_id.write('{0}\n'.format('SEP="#########################################"'))
                 file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
+                for line in xlib.get_metrics_function_list(current_run_dir, transcript_filter_option_dict):
+                    file_id.write('{0}\n'.format(line))
+                for line in xlib.get_manifest_function_list():
+                    file_id.write('{0}\n'.format(line))
+                file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
                 file_id.write('{0}\n'.format('function init'))
                 file_id.write('{0}\n'.format('{'))
                 file_id.write('{0}\n'.format('    INIT_DATETIME=`date --utc +%s`'))
                 file_id.write('{0}\n'.format('    FORMATTED_INIT_DATETIME=`date --date="@$INIT_DATETIME" "+%Y-%m-%d %H:%M:%S"`'))
                 file_id.write('{0}\n'.format('    echo "$SEP"'))
                 file_id.write('{0}\n'.format('    echo "Script started in node $HOSTNAME of cluster {0} at $FORMATTED_INIT_DATETIME UTC."'.format(cluster_name)))
+                file_id.write('{0}\n'.format('    write_manifest result {0} running'.format(current_run_dir)))
                 file_id.write('{0}\n'.format('}'))
                 file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
                 file_id.write('{0}\n'.format('function run_transcript_filter_process'))
@@ -1078,7 +1107,7 @@ def build_transcript_filter_process_script(cluster_name, current_run_dir, sftp_c
                 file_id.write('{0}\n'.format('    echo "$SEP"'))
                 file_id.write('{0}\n'.format('    echo "Filtering the transcripts ..."'))
                 file_id.write('{0}\n'.format('    /usr/bin/time \\'))
-                file_id.write('{0}\n'.format('        --format="$SEP\\nElapsed real time (s): %e\\nCPU time in kernel mode (s): %S\\nCPU time in user mode (s): %U\\nPercentage of CPU: %P\\nMaximum resident set size(Kb): %M\\nAverage total memory use (Kb):%K" \\'))
+                file_id.write('{0}\n'.format('        --output=$TIME_FILE --format="%e %S %U %P %M %K" \\'))
                 file_id.write('{0}\n'.format('        transcript-filter.py \\'))
                 file_id.write('{0}\n'.format('            --assembler={0} \\'.format(xlib.get_project_code())))
                 file_id.write('{0}\n'.format('            --transcriptome={0} \\'.format(transcriptome_file)))
@@ -1090,6 +1119,7 @@ def build_transcript_filter_process_script(cluster_name, current_run_dir, sftp_c
                 file_id.write('{0}\n'.format('            --TPM={0} \\'.format(tpm)))
                 file_id.write('{0}\n'.format('            --verbose=n'))
                 file_id.write('{0}\n'.format('    RC=$?'))
+                file_id.write('{0}\n'.format('    write_metrics transcript-filter.py $RC'))
                 file_id.write('{0}\n'.format('    if [ $RC -ne 0 ]; then manage_error transcript-filter.py $RC; fi'))
                 file_id.write('{0}\n'.format('}'))
                 file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
@@ -1101,6 +1131,7 @@ def build_transcript_filter_process_script(cluster_name, current_run_dir, sftp_c
                 file_id.write('{0}\n'.format('    echo "$SEP"'))
                 file_id.write('{0}\n'.format('    echo "Script ended OK at $FORMATTED_END_DATETIME UTC with a run duration of $DURATION s ($FORMATTED_DURATION)."'))
                 file_id.write('{0}\n'.format('    echo "$SEP"'))
+                file_id.write('{0}\n'.format('    write_manifest result {0} ended'.format(current_run_dir)))
                 file_id.write('{0}\n'.format('    RECIPIENT={0}'.format(xconfiguration.get_contact_data())))
                 file_id.write('{0}\n'.format('    SUBJECT="{0}: {1} process"'.format(xlib.get_project_name(), xlib.get_transcript_filter_name())))
                 file_id.write('{0}\n'.format('    MESSAGE="The {0} process in node $HOSTNAME of cluster {1} ended OK at $FORMATTED_END_DATETIME with a run duration of $DURATION s ($FORMATTED_DURATION). Please review its log.<br/><br/>Regards,<br/>GI Genetica, Fisiologia e Historia Forestal<br/>Dpto. Sistemas y Recursos Naturales<br/>ETSI Montes, Forestal y del Medio Natural<br/>Universidad Politecnica de Madrid<br/>https://github.com/ggfhf/"'.format(xlib.get_transcript_filter_name(), cluster_name)))
@@ -1117,6 +1148,7 @@ def build_transcript_filter_process_script(cluster_name, current_run_dir, sftp_c
                 file_id.write('{0}\n'.format('    echo "ERROR: $1 returned error $2"'))
                 file_id.write('{0}\n'.format('    echo "Script ended WRONG at $FORMATTED_END_DATETIME UTC with a run duration of $DURATION s ($FORMATTED_DURATION)."'))
                 file_id.write('{0}\n'.format('    echo "$SEP"'))
+                file_id.write('{0}\n'.format('    write_manifest result {0} failed'.format(current_run_dir)))
                 file_id.write('{0}\n'.format('    RECIPIENT={0}'.format(xconfiguration.get_contact_data())))
                 file_id.write('{0}\n'.format('    SUBJECT="{0}: {1} process"'.format(xlib.get_project_name(), xlib.get_transcript_filter_name())))
                 file_id.write('{0}\n'.format('    MESSAGE="The {0} process in node $HOSTNAME of cluster {1} ended WRONG at $FORMATTED_END_DATETIME with a run duration of $DURATION s ($FORMATTED_DURATION). Please review its log.<br/><br/>Regards,<br/>GI Genetica, Fisiologia e Historia Forestal<br/>Dpto. Sistemas y Recursos Naturales<br/>ETSI Montes, Forestal y del Medio Natural<br/>Universidad Politecnica de Madrid<br/>https://github.com/ggfhf/"'.format(xlib.get_transcript_filter_name(), cluster_name)))
@@ -1369,6 +1401,17 @@ def run_transcriptome_blastx_process(cluster_name, log, function=None):
     if OK:
         log.write('Process requirements are OK.\n')
 
+    # calculate the run fingerprint
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Calculating the run fingerprint ...\n')
+        (OK, error_list, fingerprint) = xresult.get_run_fingerprint(xlib.get_transcriptome_blastx_code(), get_transcriptome_blastx_config_file(), ssh_client)
+        if OK:
+            log.write('The run fingerprint is {0}.\n'.format(fingerprint))
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
     # determine the run directory in the cluster
     if OK:
         log.write('{0}\n'.format(xlib.get_separator()))
@@ -1381,6 +1424,17 @@ def run_transcriptome_blastx_process(cluster_name, log, function=None):
         else:
             log.write('*** ERROR: Wrong command ---> {0}\n'.format(command))
 
+    # save the run fingerprint in the run directory
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Saving the run fingerprint ...\n')
+        (OK, error_list) = xresult.save_run_fingerprint(ssh_client, current_run_dir, fingerprint)
+        if OK:
+            log.write('The run fingerprint is saved.\n')
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
     # build the transcriptome-blastx process script
     if OK:
         log.write('{0}\n'.format(xlib.get_separator()))
@@ -1728,12 +1782,18 @@ def build_transcriptome_blastx_process_script(cluster_name, current_run_dir):
                 file_id.write('{0}\n'.format('export PATH=$PYTHON3_PATH:$NGSHELPER_PATH:$BLASTPLUS_PATH:$PATH'))
                 file_id.write('{0}\n'.format('SEP="#########################################"'))
                 file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
+                for line in xlib.get_metrics_function_list(current_run_dir, transcriptome_blastx_option_dict):
+                    file_id.write('{0}\n'.format(line))
+                for line in xlib.get_manifest_function_list():
+                    file_id.write('{0}\n'.format(line))
+                file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
                 file_id.write('{0}\n'.format('function init'))
                 file_id.write('{0}\n'.format('{'))
                 file_id.write('{0}\n'.format('    INIT_DATETIME=`date --utc +%s`'))
                 file_id.write('{0}\n'.format('    FORMATTED_INIT_DATETIME=`date --date="@$INIT_DATETIME" "+%Y-%m-%d %H:%M:%S"`'))
                 file_id.write('{0}\n'.format('    echo "$SEP"'))
                 file_id.write('{0}\n'.format('    echo "Script started in node $HOSTNAME of cluster {0} at $FORMATTED_INIT_DATETIME UTC."'.format(cluster_name)))
+                file_id.write('{0}\n'.format('    write_manifest result {0} running'.format(current_run_dir)))
                 file_id.write('{0}\n'.format('}'))
                 file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
                 file_id.write('{0}\n'.format('function run_transcriptome_blastx_process'))
@@ -1742,7 +1802,7 @@ def build_transcriptome_blastx_process_script(cluster_name, current_run_dir):
                 file_id.write('{0}\n'.format('    echo "$SEP"'))
                 file_id.write('{0}\n'.format('    echo "Running the transcriptome blastx process ..."'))
                 file_id.write('{0}\n'.format('    /usr/bin/time \\'))
-                file_id.write('{0}\n'.format('        --format="$SEP\\nElapsed real time (s): %e\\nCPU time in kernel mode (s): %S\\nCPU time in user mode (s): %U\\nPercentage of CPU: %P\\nMaximum resident set size(Kb): %M\\nAverage total memory use (Kb):%K" \\'))
+                file_id.write('{0}\n'.format('        --output=$TIME_FILE --format="%e %S %U %P %M %K" \\'))
                 file_id.write('{0}\n'.format('        transcriptome-blastx.py \\'))
                 file_id.write('{0}\n'.format('            --machine_type="ngscloud" \\'))
                 file_id.write('{0}\n'.format('            --node_number={0} \\'.format(node_number)))
@@ -1758,6 +1818,7 @@ def build_transcriptome_blastx_process_script(cluster_name, current_run_dir):
                 file_id.write('{0}\n'.format('            --email={0} \\'.format(xconfiguration.get_contact_data())))
                 file_id.write('{0}\n'.format('            --verbose="n"'))
                 file_id.write('{0}\n'.format('    RC=$?'))
+                file_id.write('{0}\n'.format('    write_metrics transcriptome-blastx.py $RC'))
                 file_id.write('{0}\n'.format('    if [ $RC -ne 0 ]; then manage_error transcriptome-blastx.py $RC; fi'))
                 file_id.write('{0}\n'.format('}'))
                 file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
@@ -1769,6 +1830,7 @@ def build_transcriptome_blastx_process_script(cluster_name, current_run_dir):
                 file_id.write('{0}\n'.format('    echo "$SEP"'))
                 file_id.write('{0}\n'.format('    echo "Script ended OK at $FORMATTED_END_DATETIME UTC with a run duration of $DURATION s ($FORMATTED_DURATION)."'))
                 file_id.write('{0}\n'.format('    echo "$SEP"'))
+                file_id.write('{0}\n'.format('    write_manifest result {0} ended'.format(current_run_dir)))
                 file_id.write('{0}\n'.format('    RECIPIENT={0}'.format(xconfiguration.get_contact_data())))
                 file_id.write('{0}\n'.format('    SUBJECT="{0}: {1} process"'.format(xlib.get_project_name(), xlib.get_transcriptome_blastx_name())))
                 file_id.write('{0}\n'.format('    MESSAGE="The {0} process in node $HOSTNAME of cluster {1} ended OK at $FORMATTED_END_DATETIME with a run duration of $DURATION s ($FORMATTED_DURATION). Please review its log.<br/><br/>Regards,<br/>GI Genetica, Fisiologia e Historia Forestal<br/>Dpto. Sistemas y Recursos Naturales<br/>ETSI Montes, Forestal y del Medio Natural<br/>Universidad Politecnica de Madrid<br/>https://github.com/ggfhf/"'.format(xlib.get_transcript_filter_name(), cluster_name)))
@@ -1785,6 +1847,7 @@ def build_transcriptome_blastx_process_script(cluster_name, current_run_dir):
                 file_id.write('{0}\n'.format('    echo "ERROR: $1 returned error $2"'))
                 file_id.write('{0}\n'.format('    echo "Script ended WRONG at $FORMATTED_END_DATETIME UTC with a run duration of $DURATION s ($FORMATTED_DURATION)."'))
                 file_id.write('{0}\n'.format('    echo "$SEP"'))
+                file_id.write('{0}\n'.format('    write_manifest result {0} failed'.format(current_run_dir)))
                 file_id.write('{0}\n'.format('    RECIPIENT={0}'.format(xconfiguration.get_contact_data())))
                 file_id.write('{0}\n'.format('    SUBJECT="{0}: {1} process"'.format(xlib.get_project_name(), xlib.get_transcriptome_blastx_name())))
                 file_id.write('{0}\n'.format('    MESSAGE="The {0} process in node $HOSTNAME of cluster {1} ended WRONG at $FORMATTED_END_DATETIME with a run duration of $DURATION s ($FORMATTED_DURATION). Please review its log.<br/><br/>Regards,<br/>GI Genetica, Fisiologia e Historia Forestal<br/>Dpto. Sistemas y Recursos Naturales<br/>ETSI Montes, Forestal y del Medio Natural<br/>Universidad Politecnica de Madrid<br/>https://github.com/ggfhf/"'.format(xlib.get_transcript_filter_name(), cluster_name)))
@@ -33,8 +33,12 @@ import sys
 import xconfiguration
 import xec2
 import xlib
+import xmanifest
 import xssh
 
+# the FASTQ profiler imports NumPy, which is only needed when the files are profiled or checked
+xfastq = xlib.import_lazy_module('xfastq')
+
 #-------------------------------------------------------------------------------
 
 def create_read_transfer_config_file(experiment_id='exp001', local_dir='./data', selected_file_list=['rnaseq-1.fastq']):
@@ -97,13 +101,26 @@ def upload_read_dataset(cluster_name, log, function=None):
     # get and validate the read transfer config file
     log.write('{0}\n'.format(xlib.get_separator()))
     log.write('The read transfer config file is been validating ...\n')
-    if validate_read_transfer_config_file(strict=True):
+    (OK, error_list) = validate_read_transfer_config_file(strict=True)
+    if OK:
         log.write('The config file is OK.\n')
     else:
+        for error in error_list:
+            log.write('{0}\n'.format(error))
         log.write('*** ERROR: The read transfer config file is not valid.\n')
         log.write('Please correct this file or recreate the config files.\n')
         OK = False
 
+    # profile the local read files before uploading them
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        OK = profile_read_files(log)
+
+    # check the local paired-end read files before uploading them
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        OK = check_read_pairs(log)
+
     # create the SSH client connection
     if OK:
         (OK, error_list, ssh_client) = xssh.create_ssh_client_connection(cluster_name, 'master')
@@ -184,6 +201,12 @@ def upload_read_dataset(cluster_name, log, function=None):
                         log.write('{0}\n'.format(error))
                     break
 
+    # record the read dataset in the manifest of the volume
+    if OK:
+        (OK, error_list) = xmanifest.write_manifest_record(ssh_client, 'read', cluster_experiment_reads_dir, 'uploaded')
+        for error in error_list:
+            log.write('{0}\n'.format(error))
+
     # close the SSH transport connection
     if OK:
         xssh.close_ssh_transport_connection(ssh_transport)
@@ -206,6 +229,111 @@ def upload_read_dataset(cluster_name, log, function=None):
 
 #-------------------------------------------------------------------------------
 
+def profile_read_files(log):
+    '''
+    Profile the local FASTQ files of the read transfer config file and write
+    their profiles in the log. Return False when a file has errors, e.g. it is
+    truncated, because uploading it would be useless.
+    '''
+
+    # initialize the control variable
+    OK = True
+
+    # get the local paths of the FASTQ files
+    fastq_file_list = get_fastq_file_list()
+
+    # verify the profiler can be used
+    log.write('The local FASTQ files are being profiled ...\n')
+    if fastq_file_list == []:
+        log.write('There is not any FASTQ file to profile.\n')
+        return OK
+    if not xfastq.is_profiler_available():
+        log.write('WARNING: The files are not profiled because NumPy is not installed.\n')
+        return OK
+
+    # profile the files and write their profiles
+    profile_list = xfastq.profile_fastq_files(fastq_file_list)
+    for profile_dict in profile_list:
+        for text in xfastq.get_profile_text_list(profile_dict):
+            log.write('{0}\n'.format(text))
+
+    # write the problems
+    for (is_error, text) in xfastq.get_profile_problem_list(profile_list):
+        if is_error:
+            log.write('*** ERROR: {0}\n'.format(text))
+            OK = False
+        else:
+            log.write('WARNING: {0}\n'.format(text))
+    if OK:
+        log.write('The files are OK.\n')
+    else:
+        log.write('Please correct the files or remove them from the read transfer config file.\n')
+
+    # return the control variable
+    return OK
+
+#-------------------------------------------------------------------------------
+
+def check_read_pairs(log):
+    '''
+    Check the local paired-end FASTQ files of the read transfer config file,
+    paired by their names ending in "_1"/"_2" or "_R1"/"_R2", and write the
+    results in the log. Return False when the files of a library do not
+    correspond, because the processes using them would fail.
+    '''
+
+    # initialize the control variable
+    OK = True
+
+    # pair the FASTQ files by their names
+    fastq_file_dict = {os.path.basename(local_path): local_path for local_path in get_fastq_file_list()}
+    pair_list = []
+    unpaired_file_name_list = sorted(fastq_file_dict.keys())
+    for (specific_chars_1, specific_chars_2) in [('_1', '_2'), ('_R1', '_R2')]:
+        (file_name_1_list, file_name_2_list, unpaired_file_name_list) = xlib.pair_files(unpaired_file_name_list, specific_chars_1, specific_chars_2)
+        for (file_name_1, file_name_2) in zip(file_name_1_list, file_name_2_list):
+            pair_list.append((fastq_file_dict[file_name_1], fastq_file_dict[file_name_2]))
+
+    # check the libraries and write their results
+    log.write('The local paired-end files are being checked ...\n')
+    for file_name in unpaired_file_name_list:
+        log.write('WARNING: The file {0} can not be paired, so it is not checked.\n'.format(fastq_file_dict[file_name]))
+    if pair_list == []:
+        log.write('There is not any paired-end library to check.\n')
+        return OK
+    for result_dict in xfastq.check_paired_fastq_files(pair_list):
+        for text in xfastq.get_pair_check_text_list(result_dict):
+            log.write('{0}\n'.format(text))
+        if result_dict['error'] is not None or result_dict['divergence'] is not None:
+            OK = False
+    if OK:
+        log.write('The paired-end files are OK.\n')
+    else:
+        log.write('Please correct the files or remove them from the read transfer config file.\n')
+
+    # return the control variable
+    return OK
+
+#-------------------------------------------------------------------------------
+
+def get_fastq_file_list():
+    '''
+    Get the local paths of the FASTQ files (plain or compressed with gzip) of
+    the read transfer config file.
+    '''
+
+    read_transfer_options_dict = xlib.get_option_dict(get_read_transfer_config_file())
+    fastq_file_list = []
+    for section in sorted(read_transfer_options_dict.keys()):
+        if re.match('^file-[0-9]+$', section):
+            local_path = read_transfer_options_dict[section]['local_path']
+            name = local_path[:-3] if local_path.endswith('.gz') else local_path
+            if os.path.splitext(name)[1].lower() in ['.fastq', '.fq']:
+                fastq_file_list.append(local_path)
+    return fastq_file_list
+
+#-------------------------------------------------------------------------------
+
 def validate_read_transfer_config_file(strict):
     '''
     Validate the read transfer config file.
@@ -323,28 +451,18 @@ def get_read_dataset_dict(cluster_name, experiment_id, passed_connection=False,
 
     # get the dictionary of the read datasets
     if OK:
-        command = 'ls {0}/{1}'.format(cluster_read_dir, experiment_id)
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+        (OK, error_list, dataset_record_dict) = xmanifest.get_manifest_dataset_dict(cluster_name, 'read', ssh_client, experiment_id)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    read_dataset_id = line
-                    if read_dataset_id == xlib.get_uploaded_read_dataset_name():
-                        read_dataset_name = ' uploaded reads'
-                    elif read_dataset_id.startswith(xlib.get_insilico_read_normalization_code()):
-                        mo = re.match('{0}-(.+)-(.+)'.format(xlib.get_insilico_read_normalization_code()), read_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        read_dataset_name = '{0} ({1} {2})'.format(xlib.get_insilico_read_normalization_name(), date, time)
-                    elif read_dataset_id.startswith(xlib.get_trimmomatic_code()):
-                        mo = re.match('{0}-(.+)-(.+)'.format(xlib.get_trimmomatic_code()), read_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        read_dataset_name = '{0} ({1} {2})'.format(xlib.get_trimmomatic_name(), date, time)
+            for read_dataset_id in sorted(dataset_record_dict.keys()):
+                if read_dataset_id == xlib.get_uploaded_read_dataset_name():
+                    read_dataset_name = ' uploaded reads'
+                else:
+                    (app_data, date, time) = xlib.parse_dataset_id(read_dataset_id)
+                    if app_data is not None and date != '':
+                        read_dataset_name = '{0} ({1} {2})'.format(app_data['name'], date, time)
                     else:
                         read_dataset_name = 'xxx'
-                    read_dataset_dict[read_dataset_id] = {'read_dataset_id': read_dataset_id, 'read_dataset_name': read_dataset_name}
+                read_dataset_dict[read_dataset_id] = {'read_dataset_id': read_dataset_id, 'read_dataset_name': read_dataset_name}
 
     # close the SSH client connection
     if OK and not passed_connection:
@@ -33,6 +33,7 @@ import sys
 import xconfiguration
 import xec2
 import xlib
+import xmanifest
 import xssh
 
 #-------------------------------------------------------------------------------
@@ -175,6 +176,12 @@ def upload_reference_dataset(cluster_name, log, function=None):
                         log.write('{0}\n'.format(error))
                     break
 
+    # record the reference dataset in the manifest of the volume
+    if OK:
+        (OK, error_list) = xmanifest.write_manifest_record(ssh_client, 'reference', cluster_reference_dir, 'uploaded')
+        for error in error_list:
+            log.write('{0}\n'.format(error))
+
     # close the SSH transport connection
     if OK:
         xssh.close_ssh_transport_connection(ssh_transport)
@@ -314,15 +321,11 @@ def get_reference_dataset_dict(cluster_name, passed_connection=False, ssh_client
 
     # build the dictionary of the reference datasets
     if OK:
-        command = 'ls {0}'.format(cluster_reference_dir)
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+        (OK, error_list, dataset_record_dict) = xmanifest.get_manifest_dataset_dict(cluster_name, 'reference', ssh_client)
         if OK:
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    reference_dataset_id = line
-                    reference_dataset_name = reference_dataset_id
-                    reference_dataset_dict[reference_dataset_id] = {'reference_dataset_id': reference_dataset_id, 'reference_dataset_name': reference_dataset_name}
+            for reference_dataset_id in sorted(dataset_record_dict.keys()):
+                reference_dataset_name = reference_dataset_id
+                reference_dataset_dict[reference_dataset_id] = {'reference_dataset_id': reference_dataset_id, 'reference_dataset_name': reference_dataset_name}
 
     # close the SSH client connection
     if OK and not passed_connection:
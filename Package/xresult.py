@@ -25,15 +25,21 @@ and gui mode.
 
 #-------------------------------------------------------------------------------
 
+import hashlib
+import json
 import os
 import pathlib
 import re
 import subprocess
 import sys
 
+import xassessment
+import xcluster
 import xconfiguration
 import xec2
+import xfasta
 import xlib
+import xmanifest
 import xssh
 
 #-------------------------------------------------------------------------------
@@ -148,6 +154,9 @@ def download_result_dataset(cluster_name, log, function=None):
         # download files when the status is uncompressed
         if status == 'uncompressed':
 
+            # initialize the assembly dataset assessed by the run, which is got at its first assessment file
+            assembly_dataset_id = None
+
             # for each section "file-n"
             for section in sections_list:
 
@@ -176,6 +185,17 @@ def download_result_dataset(cluster_name, log, function=None):
                             log.write('{0}\n'.format(error))
                         break
 
+                    # get the statistics and the index of a FASTA file, e.g. an assembly
+                    if xfasta.is_fasta_file_name(file_name):
+                        write_fasta_stats(local_path, log)
+                        write_fasta_index(local_path, log)
+
+                    # load the metrics of an assessment file into the local assessment store by the assessed assembly dataset
+                    if xassessment.get_assessment_tool(file_name) is not None:
+                        if assembly_dataset_id is None:
+                            assembly_dataset_id = get_assessed_dataset_id(sftp_client, experiment_id, result_dataset_id, log)
+                        load_assessment_file(experiment_id, assembly_dataset_id, result_dataset_id, local_path, log)
+
         # download files when the status is compressed
         elif status == 'compressed':
 
@@ -193,6 +213,10 @@ def download_result_dataset(cluster_name, log, function=None):
                 for error in error_list:
                     log.write('{0}\n'.format(error))
 
+            # warn that the files of a compressed result dataset are not processed
+            if OK:
+                log.write('WARNING: The result dataset is compressed, so the statistics and the index of its FASTA files are not got and its assessment metrics are not loaded into the local assessment store.\n')
+
     # close the SSH transport connection
     if OK:
         xssh.close_ssh_transport_connection(ssh_transport)
@@ -215,6 +239,84 @@ def download_result_dataset(cluster_name, log, function=None):
 
 #-------------------------------------------------------------------------------
 
+def write_fasta_stats(local_path, log):
+    '''
+    Get the statistics of a downloaded FASTA file, save them in a JSON file
+    beside it and write their summary in the log. The download is not affected
+    by the errors.
+    '''
+
+    log.write('The statistics of the file are being calculated ...\n')
+    if not xfasta.is_engine_available():
+        log.write('WARNING: The statistics are not calculated because NumPy is not installed.\n')
+        return
+    (OK, error_list, stats_dict) = xfasta.write_fasta_stats(local_path)
+    if OK:
+        for text in xfasta.get_stats_text_list(stats_dict):
+            log.write('{0}\n'.format(text))
+        log.write('The statistics have been saved in {0}.\n'.format(xfasta.get_fasta_stats_file(local_path)))
+    else:
+        for error in error_list:
+            log.write('{0}\n'.format(error))
+
+#-------------------------------------------------------------------------------
+
+def write_fasta_index(local_path, log):
+    '''
+    Build the index of a downloaded FASTA file and save it in a .fai file beside
+    it. The download is not affected by the errors.
+    '''
+
+    (OK, error_list, index_dict) = xfasta.write_fasta_index(local_path)
+    if OK:
+        log.write('The index of {0} sequences has been saved in {1}.\n'.format(len(index_dict), xfasta.get_fasta_index_file(local_path)))
+    else:
+        for error in error_list:
+            log.write('{0}\n'.format(error))
+
+#-------------------------------------------------------------------------------
+
+def get_assessed_dataset_id(sftp_client, experiment_id, result_dataset_id, log):
+    '''
+    Get the assembly dataset assessed by a run from the copy of its config file
+    saved in its run directory. The runs without the copy are their own assembly
+    dataset.
+    '''
+
+    # download the copy of the config file named by the application code of the run
+    app_code = result_dataset_id.rsplit('-', 2)[0]
+    current_run_dir = xlib.get_cluster_experiment_result_dataset_dir(experiment_id, result_dataset_id)
+    (OK, error_list, local_path) = get_run_config_snapshot(sftp_client, current_run_dir, '{0}-config.txt'.format(app_code))
+
+    # get the assembly dataset identification
+    assembly_dataset_id = None
+    if OK:
+        assembly_dataset_id = xlib.get_option_dict(local_path).get('identification', {}).get('assembly_dataset_id')
+    if assembly_dataset_id is None:
+        log.write('WARNING: The assembly dataset assessed by {0} is unknown, so its metrics are stored by the run.\n'.format(result_dataset_id))
+        assembly_dataset_id = result_dataset_id
+
+    # return the assembly dataset identification
+    return assembly_dataset_id
+
+#-------------------------------------------------------------------------------
+
+def load_assessment_file(experiment_id, assembly_dataset_id, result_dataset_id, local_path, log):
+    '''
+    Load the metrics of a downloaded assessment file of the run result_dataset_id
+    into the local assessment store by the assembly dataset it assesses. The
+    download is not affected by the errors.
+    '''
+
+    (OK, error_list, metric_count) = xassessment.load_assessment_file(experiment_id, assembly_dataset_id, local_path, result_dataset_id)
+    if OK:
+        log.write('{0} assessment metrics of the assembly dataset {1} have been stored in {2}.\n'.format(metric_count, assembly_dataset_id, xassessment.get_assessment_store_file()))
+    else:
+        for error in error_list:
+            log.write('{0}\n'.format(error))
+
+#-------------------------------------------------------------------------------
+
 def validate_result_transfer_config_file(strict):
     '''
     Validate the result transfer config file of a run.
@@ -363,102 +465,17 @@ def get_result_dataset_dict(cluster_name, experiment_id, status, passed_connecti
 
     # get the dictionary of the result datasets
     if OK:
-        if status == 'uncompressed':
-            command = 'cd  {0}/{1}; for list in `ls`; do ls -ld $list | grep -v ^- > /dev/null && echo $list; done;'.format(cluster_result_dir, experiment_id)
-        elif status == 'compressed':
-            command = 'cd {0}/{1}; for list in `ls`; do ls -ld $list | grep -v ^d > /dev/null && echo $list; done;'.format(cluster_result_dir, experiment_id)
-        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+        (OK, error_list, dataset_record_dict) = xmanifest.get_manifest_dataset_dict(cluster_name, 'result', ssh_client, experiment_id)
         if OK:
             if status == 'uncompressed':
-                input_pattern = '{0}-(.+)-(.+)'
                 output_pattern = '{0} ({1} {2})'
             elif status == 'compressed':
-                input_pattern = '{0}-(.+)-(.+).tar.gz'
                 output_pattern = '{0} ({1} {2}) [compressed]'
-            for line in stdout:
-                line = line.rstrip('\n')
-                if line != 'lost+found':
-                    result_dataset_id = line
-                    if result_dataset_id.startswith(xlib.get_cd_hit_est_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_cd_hit_est_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_cd_hit_est_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_fastqc_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_fastqc_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_fastqc_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_gzip_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_gzip_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_gzip_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_insilico_read_normalization_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_insilico_read_normalization_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_insilico_read_normalization_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_quast_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_quast_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_quast_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_ref_eval_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_ref_eval_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_ref_eval_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_rnaquast_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_rnaquast_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_rnaquast_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_rsem_eval_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_rsem_eval_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_rsem_eval_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_soapdenovotrans_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_soapdenovotrans_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_soapdenovotrans_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_star_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_star_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_star_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_transabyss_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_transabyss_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_transabyss_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_transcript_filter_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_transcript_filter_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_transcript_filter_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_transcriptome_blastx_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_transcriptome_blastx_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_transcriptome_blastx_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_transrate_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_transrate_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_transrate_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_trimmomatic_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_trimmomatic_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_trimmomatic_name(), date, time)
-                    elif result_dataset_id.startswith(xlib.get_trinity_code()+'-'):
-                        mo = re.match(input_pattern.format(xlib.get_trinity_code()), result_dataset_id)
-                        date = mo.group(1)
-                        time = mo.group(2)
-                        result_dataset_name = output_pattern.format(xlib.get_trinity_name(), date, time)
+            for result_dataset_id in sorted(dataset_record_dict.keys()):
+                if result_dataset_id.endswith('.tar.gz') == (status == 'compressed'):
+                    (app_data, date, time) = xlib.parse_dataset_id(result_dataset_id)
+                    if app_data is not None and date != '':
+                        result_dataset_name = output_pattern.format(app_data['name'], date, time)
                     else:
                         result_dataset_name = result_dataset_id
                     result_dataset_dict[result_dataset_id] = {'result_dataset_id': result_dataset_id, 'result_dataset_name': result_dataset_name}
@@ -522,6 +539,266 @@ def get_result_dataset_id(cluster_name, experiment_id, result_dataset_name, stat
 
 #-------------------------------------------------------------------------------
 
+def get_run_fingerprint(app_code, config_file, ssh_client):
+    '''
+    Get the fingerprint of a run from its effective options, the signature of its input datasets and the version of the application.
+    '''
+
+    # initialize the control variable, the error list and the fingerprint
+    OK = True
+    error_list = []
+    fingerprint = None
+
+    # get the option dictionary
+    option_dict = xlib.get_option_dict(config_file)
+
+    # get the directories of the input datasets
+    input_dir_list = xlib.get_input_dataset_dir_list(option_dict)
+
+    # get the signature of the input dataset files (path, size and modification time)
+    input_signature_list = []
+    if input_dir_list != []:
+        command = 'find {0} -maxdepth 1 -type f -printf "%p %s %T@\\n" 2>/dev/null | sort'.format(' '.join(input_dir_list))
+        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+        if OK:
+            input_signature_list = stdout
+        else:
+            error_list.append('*** ERROR: Wrong command ---> {0}'.format(command))
+
+    # get the version of the application (package list of its environment)
+    if OK:
+        command = get_app_version_command(app_code)
+        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+        if OK:
+            version_list = stdout
+        else:
+            error_list.append('*** ERROR: Wrong command ---> {0}'.format(command))
+
+    # calculate the fingerprint
+    if OK:
+        fingerprint_data = json.dumps({'app_code': app_code, 'option_dict': xlib.get_mutable_option_dict(option_dict), 'input_signature_list': input_signature_list, 'version_list': version_list}, sort_keys=True)
+        fingerprint = hashlib.sha256(fingerprint_data.encode('utf-8')).hexdigest()
+
+    # return the control variable, the error list and the fingerprint
+    return (OK, error_list, fingerprint)
+
+#-------------------------------------------------------------------------------
+
+def get_app_version_command(app_code):
+    '''
+    Get the command to list the installed version of an application in the cluster.
+    '''
+
+    # set the Bioconda environment or the application directory
+    bioconda_code = None
+    app_name = None
+    if app_code == xlib.get_busco_code():
+        bioconda_code = xlib.get_busco_bioconda_code()
+    elif app_code == xlib.get_cd_hit_est_code():
+        bioconda_code = xlib.get_cd_hit_bioconda_code()
+    elif app_code == xlib.get_fastqc_code():
+        bioconda_code = xlib.get_fastqc_bioconda_code()
+    elif app_code == xlib.get_gmap_code():
+        bioconda_code = xlib.get_gmap_gsnap_bioconda_code()
+    elif app_code == xlib.get_insilico_read_normalization_code():
+        bioconda_code = xlib.get_trinity_bioconda_code()
+    elif app_code == xlib.get_quast_code():
+        bioconda_code = xlib.get_quast_bioconda_code()
+    elif app_code in [xlib.get_ref_eval_code(), xlib.get_rsem_eval_code()]:
+        bioconda_code = xlib.get_detonate_bioconda_code()
+    elif app_code == xlib.get_rnaquast_code():
+        app_name = xlib.get_rnaquast_name()
+    elif app_code == xlib.get_soapdenovotrans_code():
+        bioconda_code = xlib.get_soapdenovotrans_bioconda_code()
+    elif app_code == xlib.get_star_code():
+        bioconda_code = xlib.get_star_bioconda_code()
+    elif app_code == xlib.get_transabyss_code():
+        bioconda_code = xlib.get_transabyss_bioconda_code()
+    elif app_code in [xlib.get_transcript_filter_code(), xlib.get_transcriptome_blastx_code()]:
+        app_name = xlib.get_ngshelper_name()
+    elif app_code == xlib.get_transrate_code():
+        app_name = xlib.get_transrate_name()
+    elif app_code == xlib.get_trimmomatic_code():
+        bioconda_code = xlib.get_trimmomatic_bioconda_code()
+    elif app_code == xlib.get_trinity_code():
+        bioconda_code = xlib.get_trinity_bioconda_code()
+
+    # set the command
+    if bioconda_code is not None:
+        command = 'ls {0}/{1}/envs/{2}/conda-meta 2>/dev/null; echo RC=0'.format(xlib.get_cluster_app_dir(), xlib.get_miniconda3_name(), bioconda_code)
+    elif app_name is not None:
+        command = 'find {0}/{1} -maxdepth 1 -printf "%f %s %T@\\n" 2>/dev/null | sort; echo RC=0'.format(xlib.get_cluster_app_dir(), app_name)
+    else:
+        command = 'echo RC=0'
+
+    # return the command
+    return command
+
+#-------------------------------------------------------------------------------
+
+def save_run_fingerprint(ssh_client, current_run_dir, fingerprint):
+    '''
+    Save the fingerprint of a run in its run directory in the cluster.
+    '''
+
+    # initialize the control variable and the error list
+    OK = True
+    error_list = []
+
+    # write the fingerprint file
+    command = 'echo {0} > {1}/{2}'.format(fingerprint, current_run_dir, xlib.get_cluster_fingerprint_file())
+    (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+    if not OK:
+        error_list.append('*** ERROR: Wrong command ---> {0}'.format(command))
+
+    # return the control variable and the error list
+    return (OK, error_list)
+
+#-------------------------------------------------------------------------------
+
+def save_run_config_snapshot(sftp_client, current_run_dir, config_file):
+    '''
+    Save a copy of the config file of a run in its run directory in the cluster,
+    so the run can be resumed with the options it was started with.
+    '''
+
+    cluster_path = '{0}/{1}'.format(current_run_dir, os.path.basename(config_file))
+    return xssh.put_file(sftp_client, config_file, cluster_path)
+
+#-------------------------------------------------------------------------------
+
+def get_run_config_snapshot(sftp_client, current_run_dir, config_file):
+    '''
+    Download the copy of the config file saved in the run directory of a run in
+    the cluster and get its local path.
+    '''
+
+    # set the cluster path and the local path
+    cluster_path = '{0}/{1}'.format(current_run_dir, os.path.basename(config_file))
+    local_path = '{0}/{1}-{2}'.format(xlib.get_temp_dir(), os.path.basename(current_run_dir), os.path.basename(config_file))
+    if not os.path.exists(xlib.get_temp_dir()):
+        os.makedirs(xlib.get_temp_dir())
+
+    # download the copy of the config file
+    (OK, error_list) = xssh.get_file(sftp_client, cluster_path, local_path)
+    if not OK:
+        error_list.append('*** ERROR: The run directory {0} has not a copy of its config file, so the run can not be resumed.'.format(current_run_dir))
+
+    # return the control variable, the error list and the local path
+    return (OK, error_list, local_path)
+
+#-------------------------------------------------------------------------------
+
+def save_run_job_id(ssh_client, current_run_dir, qsub_line_list):
+    '''
+    Save the batch job identification got from the qsub output of a run in its
+    run directory in the cluster.
+    '''
+
+    # initialize the control variable and the error list
+    OK = True
+    error_list = []
+
+    # get the job identification, e.g. from "Your job 123 ("name") has been submitted"
+    job_id = None
+    for line in qsub_line_list:
+        mo = re.match(r'^Your job(?:-array)? (\d+)', line)
+        if mo:
+            job_id = mo.group(1)
+    if job_id is None:
+        error_list.append('*** ERROR: The batch job identification can not be got from the qsub output.')
+        OK = False
+
+    # write the job identification file
+    if OK:
+        command = 'echo {0} > {1}/{2}'.format(job_id, current_run_dir, xlib.get_cluster_job_id_file())
+        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+        if not OK:
+            error_list.append('*** ERROR: Wrong command ---> {0}'.format(command))
+
+    # return the control variable and the error list
+    return (OK, error_list)
+
+#-------------------------------------------------------------------------------
+
+def get_run_active_batch_job(ssh_client, current_run_dir):
+    '''
+    Get the batch job of a run when it is still queued or running in the cluster,
+    or None when it has ended. It is an error when the job of the run is unknown.
+    '''
+
+    # initialize the control variable, the error list and the batch job
+    OK = True
+    error_list = []
+    batch_job = None
+
+    # read the job identification
+    command = 'cat {0}/{1} 2> /dev/null; echo RC=$?'.format(current_run_dir, xlib.get_cluster_job_id_file())
+    (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+    if OK:
+        job_id = stdout[0].strip() if len(stdout) > 1 else ''
+        if not job_id.isdigit():
+            error_list.append('*** ERROR: The batch job of the run directory {0} is unknown, so it can not be verified that it has ended.'.format(current_run_dir))
+            OK = False
+    else:
+        error_list.append('*** ERROR: Wrong command ---> {0}'.format(command))
+
+    # look for the job in the queued and running jobs
+    if OK:
+        (OK, error_list, batch_job_dict) = xcluster.get_batch_job_dict(ssh_client)
+        if OK:
+            for cluster_batch_job in batch_job_dict.values():
+                if cluster_batch_job['job_number'] == job_id:
+                    batch_job = cluster_batch_job
+                    break
+
+    # return the control variable, the error list and the batch job
+    return (OK, error_list, batch_job)
+
+#-------------------------------------------------------------------------------
+
+def search_identical_result_dataset_list(cluster_name, app_code, config_file, passed_connection=False, ssh_client=None):
+    '''
+    Search the result datasets of the experiment which ended OK and were run with identical inputs, options and application version.
+    '''
+
+    # initialize the control variable, the error list and the result dataset list
+    OK = True
+    error_list = []
+    result_dataset_id_list = []
+
+    # get the experiment identification
+    experiment_id = xlib.get_option_dict(config_file).get('identification', {}).get('experiment_id', '')
+
+    # create the SSH client connection
+    if not passed_connection:
+        (OK, error_list, ssh_client) = xssh.create_ssh_client_connection(cluster_name, 'master')
+
+    # get the fingerprint of the run
+    if OK:
+        (OK, error_list, fingerprint) = get_run_fingerprint(app_code, config_file, ssh_client)
+
+    # search the result datasets with the same fingerprint whose process ended OK
+    if OK:
+        command = 'cd {0}; for file in `grep --files-with-matches --line-regexp {1} */{2} 2>/dev/null`; do grep --quiet "Script ended OK" `dirname $file`/{3} && dirname $file; done; echo RC=0'.format(xlib.get_cluster_experiment_result_dir(experiment_id), fingerprint, xlib.get_cluster_fingerprint_file(), xlib.get_cluster_log_file())
+        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+        if OK:
+            for line in stdout:
+                if line != 'RC=0':
+                    result_dataset_id_list.append(line)
+            result_dataset_id_list.sort()
+        else:
+            error_list.append('*** ERROR: Wrong command ---> {0}'.format(command))
+
+    # close the SSH client connection
+    if OK and not passed_connection:
+        xssh.close_ssh_client_connection(ssh_client)
+
+    # return the control variable, the error list and the result dataset list
+    return (OK, error_list, result_dataset_id_list)
+
+#-------------------------------------------------------------------------------
+
 def get_result_transfer_config_file():
     '''
     Get the transfer config file path of the results of a run.
@@ -35,11 +35,13 @@ import xcluster
 import xconfiguration
 import xec2
 import xlib
+import xmetrics
+import xresult
 import xssh
 
 #-------------------------------------------------------------------------------
 
-def create_soapdenovotrans_config_file(experiment_id='exp001', read_dataset_id=xlib.get_uploaded_read_dataset_name(), read_type = 'PE', file_1_list=['rnaseq-a_1.fastq'], file_2_list=['rnaseq-a_2.fastq']):
+def create_soapdenovotrans_config_file(experiment_id='exp001', read_dataset_id=xlib.get_uploaded_read_dataset_name(), read_type = 'PE', file_1_list=['rnaseq-a_1.fastq'], file_2_list=['rnaseq-a_2.fastq'], recommendation=None):
     '''
     Create SOAPdenovo-Trans config file with the default options. It is necessary
     update the options in each run.
@@ -49,6 +51,9 @@ def create_soapdenovotrans_config_file(experiment_id='exp001', read_dataset_id=x
     OK = True
     error_list = []
 
+    # set the resources to the recommended values or to the default ones
+    ncpu = recommendation['ncpu'] if recommendation is not None else 8
+
     # get the SOAPdenovo-Trans config file path
     soapdenovotrans_config_file = get_soapdenovotrans_config_file()
 
@@ -72,6 +77,9 @@ def create_soapdenovotrans_config_file(experiment_id='exp001', read_dataset_id=x
             file_id.write('{0}\n'.format('#'))
             file_id.write('{0}\n'.format('# WARNING: The files have to be decompressed.'))
             file_id.write('{0}\n'.format(''))
+            if recommendation is not None:
+                file_id.write('{0}\n'.format('# {0}'.format(xmetrics.get_recommendation_text(recommendation))))
+                file_id.write('{0}\n'.format(''))
             file_id.write('{0}\n'.format('# This section has the information that identifies the experiment.'))
             file_id.write('{0}\n'.format('[identification]'))
             file_id.write('{0:<50} {1}\n'.format('experiment_id = {0}'.format(experiment_id), '# experiment identification'))
@@ -85,7 +93,7 @@ def create_soapdenovotrans_config_file(experiment_id='exp001', read_dataset_id=x
             file_id.write('{0:<50} {1}\n'.format('scaffold = NO', '# scaffold structure exists: YES or NO'))
             file_id.write('{0:<50} {1}\n'.format('fill = NO', '# fill gaps in scaffolds: YES or NO'))
             file_id.write('{0:<50} {1}\n'.format('kmer = 25', '# value or values list of K-MER size (minimum: 13; maximum: 31/127)'))
-            file_id.write('{0:<50} {1}\n'.format('ncpu = 8', '# number of cpu for use'))
+            file_id.write('{0:<50} {1}\n'.format('ncpu = {0}'.format(ncpu), '# number of cpu for use'))
             file_id.write('{0:<50} {1}\n'.format('kmer_freq_cutoff = 0', '# kmers with frequency no larger than the value will be deleted'))
             file_id.write('{0:<50} {1}\n'.format('edge_cov_cutoff = 2', '# kmers with coverage no larger than the value will be deleted'))
             file_id.write('{0:<50} {1}\n'.format('merge_level = 1', '# strength of merging similar sequences during contiging (minimum: 0; maximum: 3)'))
@@ -126,6 +134,21 @@ def create_soapdenovotrans_config_file(experiment_id='exp001', read_dataset_id=x
 
 #-------------------------------------------------------------------------------
 
+def recommend_soapdenovotrans_resources(ssh_client, experiment_id, read_dataset_id, file_list):
+    '''
+    Recommend the resources of a SOAPdenovo-Trans run of the selected read files from the
+    metrics of past runs.
+    '''
+
+    # get the input size
+    cluster_read_dir = '{0}/{1}/{2}'.format(xlib.get_cluster_read_dir(), experiment_id, read_dataset_id)
+    input_kb = xmetrics.get_input_size_kb(ssh_client, cluster_read_dir, file_list)
+
+    # return the recommendation
+    return xmetrics.recommend_resources(xlib.get_soapdenovotrans_code(), ['SOAPdenovo-Trans-%'], input_kb)
+
+#-------------------------------------------------------------------------------
+
 def run_soapdenovotrans_process(cluster_name, log, function=None):
     '''
     Run an experiment corresponding to the options in SOAPdenovo-Trans config file.
@@ -228,6 +251,17 @@ def run_soapdenovotrans_process(cluster_name, log, function=None):
     if OK:
         log.write('Process requirements are OK.\n')
 
+    # calculate the run fingerprint
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Calculating the run fingerprint ...\n')
+        (OK, error_list, fingerprint) = xresult.get_run_fingerprint(soapdenovotrans_code, soapdenovotrans_config_file, ssh_client)
+        if OK:
+            log.write('The run fingerprint is {0}.\n'.format(fingerprint))
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
     # build the process configuration file
     if OK:
         log.write('{0}\n'.format(xlib.get_separator()))
@@ -264,6 +298,28 @@ def run_soapdenovotrans_process(cluster_name, log, function=None):
                 log.write('*** ERROR: Wrong command ---> {0}\n'.format(command))
             i += 1
 
+            # save the run fingerprint in the run directory
+            log.write('{0}\n'.format(xlib.get_separator()))
+            log.write('Saving the run fingerprint ...\n')
+            (OK, error_list) = xresult.save_run_fingerprint(ssh_client, current_run_dir, fingerprint)
+            if OK:
+                log.write('The run fingerprint is saved.\n')
+            else:
+                for error in error_list:
+                    log.write('{0}\n'.format(error))
+                break
+
+            # save a copy of the config file in the run directory
+            log.write('{0}\n'.format(xlib.get_separator()))
+            log.write('Saving a copy of the config file in the run directory ...\n')
+            (OK, error_list) = xresult.save_run_config_snapshot(sftp_client, current_run_dir, get_soapdenovotrans_config_file())
+            if OK:
+                log.write('The copy of the config file is saved.\n')
+            else:
+                for error in error_list:
+                    log.write('{0}\n'.format(error))
+                break
+
             # build the SOAPdenovo-Trans process script
             log.write('{0}\n'.format(xlib.get_separator()))
             log.write('Building the process script {0} ...\n'.format(soapdenovotrans_process_script))
@@ -352,6 +408,282 @@ def run_soapdenovotrans_process(cluster_name, log, function=None):
             else:
                 log.write('*** ERROR: Wrong command ---> {0}\n'.format(command))
 
+            # save the batch job identification in the run directory
+            if OK:
+                (is_saved, error_list) = xresult.save_run_job_id(ssh_client, current_run_dir, stdout)
+                if not is_saved:
+                    for error in error_list:
+                        log.write('{0}\n'.format(error))
+                    log.write('*** WARNING: The run will not be able to be resumed.\n')
+
+    # close the SSH transport connection
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Closing the SSH transport connection ...\n')
+        xssh.close_ssh_transport_connection(ssh_transport)
+        log.write('The connection is closed.\n')
+
+    # close the SSH client connection
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Closing the SSH client connection ...\n')
+        xssh.close_ssh_client_connection(ssh_client)
+        log.write('The connection is closed.\n')
+
+    # warn that the log window can be closed
+    if not isinstance(log, xlib.DevStdOut):
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('You can close this window now.\n')
+
+    # execute final function
+    if function is not None:
+        function()
+
+    # return the control variable
+    return OK
+
+#-------------------------------------------------------------------------------
+
+def resume_soapdenovotrans_process(cluster_name, experiment_id, result_dataset_id, log, function=None):
+    '''
+    Resume a failed SOAPdenovo-Trans run in its run directory reusing the files already calculated.
+    '''
+
+    # initialize the control variable
+    OK = True
+
+    # get the SOAPdenovo-Trans name
+    soapdenovotrans_name = xlib.get_soapdenovotrans_name()
+
+    # get the SOAPdenovo-Trans config file
+    soapdenovotrans_config_file = get_soapdenovotrans_config_file()
+
+    # get the SOAPdenovo-Trans process script path in the local computer
+    soapdenovotrans_process_script = get_soapdenovotrans_process_script()
+
+    # get the SOAPdenovo-Trans process starter path in the local computer
+    soapdenovotrans_process_starter = get_soapdenovotrans_process_starter()
+
+    # get the SOAPdenovo-Trans process config file path in the local computer
+    soapdenovotrans_process_config_file = get_soapdenovotrans_process_config_file()
+
+    # get the run directory in the cluster
+    current_run_dir = xlib.get_cluster_experiment_result_dataset_dir(experiment_id, result_dataset_id)
+
+    # warn that the log window must not be closed
+    if not isinstance(log, xlib.DevStdOut):
+        log.write('This process might take several minutes. Do not close this window, please wait!\n')
+
+    # create the SSH client connection
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Connecting the SSH client ...\n')
+        (OK, error_list, ssh_client) = xssh.create_ssh_client_connection(cluster_name, 'master')
+        if OK:
+            log.write('The SSH client is connected.\n')
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
+    # create the SSH transport connection
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Connecting the SSH transport ...\n')
+        (OK, error_list, ssh_transport) = xssh.create_ssh_transport_connection(cluster_name, 'master')
+        if OK:
+            log.write('The SSH transport is connected.\n')
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
+    # create the SFTP client 
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Connecting the SFTP client ...\n')
+        sftp_client = xssh.create_sftp_client(ssh_transport)
+        log.write('The SFTP client is connected.\n')
+
+    # warn that the requirements are being verified 
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Verifying process requirements ...\n')
+
+    # verify the master is running
+    if OK:
+        (master_state_code, master_state_name) = xec2.get_node_state(cluster_name, 'master')
+        if master_state_code != 16:
+            log.write('*** ERROR: The cluster {0} is not running. Its state is {1} ({2}).\n'.format(cluster_name, master_state_code, master_state_name))
+            OK = False
+
+    # verify the SOAPdenovo-Trans is set up
+    if OK:
+        (OK, error_list, is_setup) = xbioinfoapp.is_setup_bioconda_package(xlib.get_soapdenovotrans_bioconda_code(), cluster_name, True, ssh_client)
+        if OK:
+            if not is_setup:
+                log.write('*** ERROR: {0} is not setup.\n'.format(soapdenovotrans_name))
+                OK = False
+        else:
+            log.write('*** ERROR: The verification of {0} setup could not be performed.\n'.format(soapdenovotrans_name))
+
+    # verify the run directory exists and its process has not ended OK
+    if OK:
+        command = '[ -d {0} ] && (grep --quiet "Script ended OK" {0}/{1} && echo RC=2 || echo RC=0) || echo RC=1'.format(current_run_dir, xlib.get_cluster_log_file())
+        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+        if OK:
+            if stdout[len(stdout) - 1] == 'RC=1':
+                log.write('*** ERROR: The run directory {0} does not exist.\n'.format(current_run_dir))
+                OK = False
+            elif stdout[len(stdout) - 1] == 'RC=2':
+                log.write('*** ERROR: The process of the run directory {0} already ended OK.\n'.format(current_run_dir))
+                OK = False
+        else:
+            log.write('*** ERROR: Wrong command ---> {0}\n'.format(command))
+
+    # verify the batch job of the run is not queued or running
+    if OK:
+        (OK, error_list, batch_job) = xresult.get_run_active_batch_job(ssh_client, current_run_dir)
+        if OK:
+            if batch_job is not None:
+                log.write('*** ERROR: The batch job {0} of the run is still {1}.\n'.format(batch_job['job_id'], batch_job['state_name']))
+                OK = False
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
+    # get the copy of the config file which the run was started with
+    if OK:
+        (OK, error_list, snapshot_config_file) = xresult.get_run_config_snapshot(sftp_client, current_run_dir, soapdenovotrans_config_file)
+        if OK:
+            if xlib.get_option_dict(snapshot_config_file)['identification']['experiment_id'] != experiment_id:
+                log.write('*** ERROR: The experiment identification of the config file of the run is not {0}.\n'.format(experiment_id))
+                OK = False
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
+    # get the kmer value used in the run
+    if OK:
+        command = 'grep --only-matching --max-count=1 -- "-K [0-9]*" {0}/{1}'.format(current_run_dir, os.path.basename(soapdenovotrans_process_script))
+        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+        if OK and stdout != []:
+            kmer_value = int(stdout[0].split()[-1])
+        else:
+            log.write('*** ERROR: The kmer value of the run could not be determined.\n')
+            OK = False
+
+    # warn that the requirements are OK 
+    if OK:
+        log.write('Process requirements are OK.\n')
+
+    # build the process configuration file
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Building the process config file {0} ...\n'.format(soapdenovotrans_process_config_file))
+        (OK, error_list) = build_soapdenovotrans_process_config_file(config_file=snapshot_config_file)
+        if OK:
+            log.write('The file is built.\n')
+        else:
+            log.write('*** ERROR: The file could not be built.\n')
+
+    # build the SOAPdenovo-Trans process script
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Building the process script {0} ...\n'.format(soapdenovotrans_process_script))
+        (OK, error_list) = build_soapdenovotrans_process_script(cluster_name, current_run_dir, kmer_value, resumed=True, config_file=snapshot_config_file)
+        if OK:
+            log.write('The file is built.\n')
+        else:
+            log.write('*** ERROR: The file could not be built.\n')
+
+    # upload the process configuration file to the cluster
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Uploading the process config file {0} to the directory {1} of the master ...\n'.format(soapdenovotrans_process_config_file, current_run_dir))
+        cluster_path = '{0}/{1}'.format(current_run_dir, os.path.basename(soapdenovotrans_process_config_file))
+        (OK, error_list) = xssh.put_file(sftp_client, soapdenovotrans_process_config_file, cluster_path)
+        if OK:
+            log.write('The file is uploaded.\n')
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
+    # upload the process script to the cluster
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Uploading the process script {0} to the directory {1} of the master ...\n'.format(soapdenovotrans_process_script, current_run_dir))
+        cluster_path = '{0}/{1}'.format(current_run_dir, os.path.basename(soapdenovotrans_process_script))
+        (OK, error_list) = xssh.put_file(sftp_client, soapdenovotrans_process_script, cluster_path)
+        if OK:
+            log.write('The file is uploaded.\n')
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
+    # set run permision to the process script in the cluster
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Setting on the run permision of {0}/{1} ...\n'.format(current_run_dir, os.path.basename(soapdenovotrans_process_script)))
+        command = 'chmod u+x {0}/{1}'.format(current_run_dir, os.path.basename(soapdenovotrans_process_script))
+        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+        if OK:
+            log.write('The run permision is set on.\n')
+        else:
+            log.write('*** ERROR: Wrong command ---> {0}\n'.format(command))
+
+    # build the process starter
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Building the process starter {0} ...\n'.format(soapdenovotrans_process_starter))
+        (OK, error_list) = build_soapdenovotrans_process_starter(current_run_dir, resumed=True)
+        if OK:
+            log.write('The file is built.\n')
+        else:
+            log.write('***ERROR: The file could not be built.\n')
+
+    # upload the process starter to the cluster
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Uploading the process starter {0} to the directory {1} of the master ...\n'.format(soapdenovotrans_process_starter, current_run_dir))
+        cluster_path = '{0}/{1}'.format(current_run_dir, os.path.basename(soapdenovotrans_process_starter))
+        (OK, error_list) = xssh.put_file(sftp_client, soapdenovotrans_process_starter, cluster_path)
+        if OK:
+            log.write('The file is uploaded.\n')
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
+    # set run permision to the process starter in the cluster
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Setting on the run permision of {0}/{1} ...\n'.format(current_run_dir, os.path.basename(soapdenovotrans_process_starter)))
+        command = 'chmod u+x {0}/{1}'.format(current_run_dir, os.path.basename(soapdenovotrans_process_starter))
+        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+        if OK:
+            log.write('The run permision is set on.\n')
+        else:
+            log.write('*** ERROR: Wrong command ---> {0}\n'.format(command))
+
+    # submit the process
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Resubmitting the process script {0}/{1} ...\n'.format(current_run_dir, os.path.basename(soapdenovotrans_process_starter)))
+        sge_env = xcluster.get_sge_env()
+        command = '{0}; qsub -V -b n -cwd {1}/{2}'.format(sge_env, current_run_dir, os.path.basename(soapdenovotrans_process_starter))
+        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+        if OK:
+            for line in stdout:
+                log.write('{0}\n'.format(line))
+        else:
+            log.write('*** ERROR: Wrong command ---> {0}\n'.format(command))
+
+    # save the batch job identification in the run directory
+    if OK:
+        (is_saved, error_list) = xresult.save_run_job_id(ssh_client, current_run_dir, stdout)
+        if not is_saved:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+            log.write('*** WARNING: The run will not be able to be resumed again.\n')
+
     # close the SSH transport connection
     if OK:
         log.write('{0}\n'.format(xlib.get_separator()))
@@ -742,7 +1074,7 @@ def validate_soapdenovotrans_config_file(strict):
 
 #-------------------------------------------------------------------------------
 
-def build_soapdenovotrans_process_script(cluster_name, current_run_dir, kmer_value):
+def build_soapdenovotrans_process_script(cluster_name, current_run_dir, kmer_value, resumed=False, config_file=None):
     '''
     Build the current SOAPdenovo-Trans process script.
     '''
@@ -751,8 +1083,8 @@ def build_soapdenovotrans_process_script(cluster_name, current_run_dir, kmer_val
     OK = True
     error_list = []
 
-    # get the SOAPdenovo-Trans config file path
-    soapdenovotrans_config_file = get_soapdenovotrans_config_file()
+    # get the SOAPdenovo-Trans config file path (the copy saved in the run directory when the run is resumed)
+    soapdenovotrans_config_file = get_soapdenovotrans_config_file() if config_file is None else config_file
 
     # get the options dictionary
     soapdenovotrans_options_dict = xlib.get_option_dict(soapdenovotrans_config_file)
@@ -778,6 +1110,9 @@ def build_soapdenovotrans_process_script(cluster_name, current_run_dir, kmer_val
     # get the SOAPdenovo-Trans process script name
     soapdenovotrans_process_script = get_soapdenovotrans_process_script()
 
+    # set the output prefix
+    output_prefix = '{0}-{1}'.format(experiment_id, os.path.basename(current_run_dir))
+
     # write the SOAPdenovo-Trans process script
     try:
         if not os.path.exists(os.path.dirname(soapdenovotrans_process_script)):
@@ -791,41 +1126,54 @@ def build_soapdenovotrans_process_script(cluster_name, current_run_dir, kmer_val
             file_id.write('{0}\n'.format('cd {0}/{1}/bin'.format(xlib.get_cluster_app_dir(), xlib.get_miniconda3_name())))
             file_id.write('{0}\n'.format('source activate {0}'.format(xlib.get_soapdenovotrans_bioconda_code())))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
+            for line in xlib.get_metrics_function_list(current_run_dir, soapdenovotrans_options_dict):
+                file_id.write('{0}\n'.format(line))
+            for line in xlib.get_manifest_function_list():
+                file_id.write('{0}\n'.format(line))
+            file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
             file_id.write('{0}\n'.format('function init'))
             file_id.write('{0}\n'.format('{'))
             file_id.write('{0}\n'.format('    INIT_DATETIME=`date --utc +%s`'))
             file_id.write('{0}\n'.format('    FORMATTED_INIT_DATETIME=`date --date="@$INIT_DATETIME" "+%Y-%m-%d %H:%M:%S"`'))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
-            file_id.write('{0}\n'.format('    echo "Script started in node $HOSTNAME of cluster {0} at $FORMATTED_INIT_DATETIME UTC."'.format(cluster_name)))
+            if resumed:
+                file_id.write('{0}\n'.format('    echo "Script resumed in node $HOSTNAME of cluster {0} at $FORMATTED_INIT_DATETIME UTC."'.format(cluster_name)))
+            else:
+                file_id.write('{0}\n'.format('    echo "Script started in node $HOSTNAME of cluster {0} at $FORMATTED_INIT_DATETIME UTC."'.format(cluster_name)))
+            file_id.write('{0}\n'.format('    write_manifest result {0} running'.format(current_run_dir)))
             file_id.write('{0}\n'.format('}'))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
             file_id.write('{0}\n'.format('function run_soapdenovotrans_process'))
             file_id.write('{0}\n'.format('{'))
             file_id.write('{0}\n'.format('    cd {0}'.format(current_run_dir)))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
-            file_id.write('{0}\n'.format('    /usr/bin/time \\'))
-            file_id.write('{0}\n'.format('        --format="$SEP\\nElapsed real time (s): %e\\nCPU time in kernel mode (s): %S\\nCPU time in user mode (s): %U\\nPercentage of CPU: %P\\nMaximum resident set size(Kb): %M\\nAverage total memory use (Kb):%K" \\'))
-            file_id.write('{0}\n'.format('        SOAPdenovo-Trans-{0}mer all \\'.format(version)))
-            file_id.write('{0}\n'.format('            -s {0}/{1} \\'.format(current_run_dir, os.path.basename(soapdenovotrans_process_config_file))))
-            file_id.write('{0}\n'.format('            -o {0}-{1} \\'.format(experiment_id, os.path.basename(current_run_dir))))
-            if rpkm == 'YES':
-                file_id.write('{0}\n'.format('            -R \\'))
-            if srkgf == 'YES':
-                file_id.write('{0}\n'.format('            -f \\'))
-            if scaffold == 'YES':
-                file_id.write('{0}\n'.format('            -S \\'))
-            if fill == 'YES':
-                file_id.write('{0}\n'.format('            -F \\'))
-            file_id.write('{0}\n'.format('            -K {0} \\'.format(kmer_value)))
-            file_id.write('{0}\n'.format('            -p {0} \\'.format(ncpu)))
-            file_id.write('{0}\n'.format('            -d {0} \\'.format(kmer_freq_cutoff)))
-            file_id.write('{0}\n'.format('            -e {0} \\'.format(edge_cov_cutoff)))
-            file_id.write('{0}\n'.format('            -M {0} \\'.format(merge_level)))
-            file_id.write('{0}\n'.format('            -L {0} \\'.format(min_contig_len)))
-            file_id.write('{0}\n'.format('            -t {0} \\'.format(locus_max_output)))
-            file_id.write('{0}\n'.format('            -G {0}'.format(gap_len_diff)))
-            file_id.write('{0}\n'.format('    RC=$?'))
-            file_id.write('{0}\n'.format('    if [ $RC -ne 0 ]; then manage_error SOAPdenovo-Trans-{0}mer $RC; fi'.format(version)))
+            step_list = []
+            step_list.append(['pregraph', ['-s {0}/{1}'.format(current_run_dir, os.path.basename(soapdenovotrans_process_config_file)), '-o {0}'.format(output_prefix), '-K {0}'.format(kmer_value), '-p {0}'.format(ncpu), '-d {0}'.format(kmer_freq_cutoff)] + (['-R'] if rpkm == 'YES' else [])])
+            step_list.append(['contig', ['-g {0}'.format(output_prefix), '-M {0}'.format(merge_level), '-e {0}'.format(edge_cov_cutoff), '-p {0}'.format(ncpu)] + (['-R'] if rpkm == 'YES' else [])])
+            step_list.append(['map', ['-s {0}/{1}'.format(current_run_dir, os.path.basename(soapdenovotrans_process_config_file)), '-g {0}'.format(output_prefix), '-p {0}'.format(ncpu)] + (['-f'] if srkgf == 'YES' else [])])
+            step_list.append(['scaff', ['-g {0}'.format(output_prefix), '-p {0}'.format(ncpu), '-L {0}'.format(min_contig_len), '-t {0}'.format(locus_max_output), '-G {0}'.format(gap_len_diff)] + (['-S'] if scaffold == 'YES' else []) + (['-F'] if fill == 'YES' else [])])
+            marker_file_list = ['{0}.{1}.complete'.format(output_prefix, step) for (step, step_option_list) in step_list]
+            # each step is run separately and it leaves a completion marker when it ends OK, so a resumed run skips only the completed steps
+            for i in range(len(step_list)):
+                (step, step_option_list) = step_list[i]
+                file_id.write('{0}\n'.format('    if [ -f {0} ]; then'.format(marker_file_list[i])))
+                file_id.write('{0}\n'.format('        echo "The step {0} is already done ({1} exists)."'.format(step, marker_file_list[i])))
+                file_id.write('{0}\n'.format('    else'))
+                if i < len(step_list) - 1:
+                    file_id.write('{0}\n'.format('        rm -f {0}'.format(' '.join(marker_file_list[i + 1:]))))
+                file_id.write('{0}\n'.format('        echo "$SEP"'))
+                file_id.write('{0}\n'.format('        echo "Running the step {0} ..."'.format(step)))
+                file_id.write('{0}\n'.format('        /usr/bin/time \\'))
+                file_id.write('{0}\n'.format('            --output=$TIME_FILE --format="%e %S %U %P %M %K" \\'))
+                file_id.write('{0}\n'.format('            SOAPdenovo-Trans-{0}mer {1} \\'.format(version, step)))
+                for k in range(len(step_option_list) - 1):
+                    file_id.write('{0}\n'.format('                {0} \\'.format(step_option_list[k])))
+                file_id.write('{0}\n'.format('                {0}'.format(step_option_list[-1])))
+                file_id.write('{0}\n'.format('        RC=$?'))
+                file_id.write('{0}\n'.format('        write_metrics "SOAPdenovo-Trans-{0}mer {1}" $RC'.format(version, step)))
+                file_id.write('{0}\n'.format('        if [ $RC -ne 0 ]; then manage_error "SOAPdenovo-Trans-{0}mer {1}" $RC; fi'.format(version, step)))
+                file_id.write('{0}\n'.format('        touch {0}'.format(marker_file_list[i])))
+                file_id.write('{0}\n'.format('    fi'))
             file_id.write('{0}\n'.format('}'))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
             file_id.write('{0}\n'.format('function end'))
@@ -836,6 +1184,7 @@ def build_soapdenovotrans_process_script(cluster_name, current_run_dir, kmer_val
             file_id.write('{0}\n'.format('    echo "$SEP"'))
             file_id.write('{0}\n'.format('    echo "Script ended OK at $FORMATTED_END_DATETIME UTC with a run duration of $DURATION s ($FORMATTED_DURATION)."'))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
+            file_id.write('{0}\n'.format('    write_manifest result {0} ended'.format(current_run_dir)))
             file_id.write('{0}\n'.format('    RECIPIENT={0}'.format(xconfiguration.get_contact_data())))
             file_id.write('{0}\n'.format('    SUBJECT="{0}: {1} process"'.format(xlib.get_project_name(), xlib.get_soapdenovotrans_name())))
             file_id.write('{0}\n'.format('    MESSAGE="The {0} process in node $HOSTNAME of cluster {1} ended OK at $FORMATTED_END_DATETIME with a run duration of $DURATION s ($FORMATTED_DURATION). Please review its log.<br/><br/>Regards,<br/>GI Genetica, Fisiologia e Historia Forestal<br/>Dpto. Sistemas y Recursos Naturales<br/>ETSI Montes, Forestal y del Medio Natural<br/>Universidad Politecnica de Madrid<br/>https://github.com/ggfhf/"'.format(xlib.get_soapdenovotrans_name(), cluster_name)))
@@ -852,6 +1201,7 @@ def build_soapdenovotrans_process_script(cluster_name, current_run_dir, kmer_val
             file_id.write('{0}\n'.format('    echo "ERROR: $1 returned error $2"'))
             file_id.write('{0}\n'.format('    echo "Script ended WRONG at $FORMATTED_END_DATETIME UTC with a run duration of $DURATION s ($FORMATTED_DURATION)."'))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
+            file_id.write('{0}\n'.format('    write_manifest result {0} failed'.format(current_run_dir)))
             file_id.write('{0}\n'.format('    RECIPIENT={0}'.format(xconfiguration.get_contact_data())))
             file_id.write('{0}\n'.format('    SUBJECT="{0}: {1} process"'.format(xlib.get_project_name(), xlib.get_soapdenovotrans_name())))
             file_id.write('{0}\n'.format('    MESSAGE="The {0} process in node $HOSTNAME of cluster {1} ended WRONG at $FORMATTED_END_DATETIME with a run duration of $DURATION s ($FORMATTED_DURATION). Please review its log.<br/><br/>Regards,<br/>GI Genetica, Fisiologia e Historia Forestal<br/>Dpto. Sistemas y Recursos Naturales<br/>ETSI Montes, Forestal y del Medio Natural<br/>Universidad Politecnica de Madrid<br/>https://github.com/ggfhf/"'.format(xlib.get_soapdenovotrans_name(), cluster_name)))
@@ -880,7 +1230,7 @@ def build_soapdenovotrans_process_script(cluster_name, current_run_dir, kmer_val
 
 #-------------------------------------------------------------------------------
 
-def build_soapdenovotrans_process_starter(current_run_dir):
+def build_soapdenovotrans_process_starter(current_run_dir, resumed=False):
     '''
     Build the starter of the current SOAPdenovo-Trans process.
     '''
@@ -905,7 +1255,10 @@ def build_soapdenovotrans_process_starter(current_run_dir):
         with open(soapdenovotrans_process_starter, mode='w', encoding='utf8', newline='\n') as file_id:
             file_id.write('{0}\n'.format('#!/bin/bash'))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
-            file_id.write('{0}\n'.format('{0}/{1} &>{0}/{2}'.format(current_run_dir, os.path.basename(soapdenovotrans_process_script), log_file)))
+            if resumed:
+                file_id.write('{0}\n'.format('{0}/{1} &>>{0}/{2}'.format(current_run_dir, os.path.basename(soapdenovotrans_process_script), log_file)))
+            else:
+                file_id.write('{0}\n'.format('{0}/{1} &>{0}/{2}'.format(current_run_dir, os.path.basename(soapdenovotrans_process_script), log_file)))
     except:
         error_list.append('*** ERROR: The file {0} can not be created'.format(soapdenovotrans_process_starter))
         OK = False
@@ -915,7 +1268,7 @@ def build_soapdenovotrans_process_starter(current_run_dir):
 
 #-------------------------------------------------------------------------------
 
-def build_soapdenovotrans_process_config_file():
+def build_soapdenovotrans_process_config_file(config_file=None):
     '''
     Build the SOAPdenovo-Trans process config file to the current SOPAdenovo-Trans experiment.
     '''
@@ -924,8 +1277,8 @@ def build_soapdenovotrans_process_config_file():
     OK = True
     error_list = []
 
-    # get the SOAPdenovo-Trans config file path
-    soapdenovotrans_config_file = get_soapdenovotrans_config_file()
+    # get the SOAPdenovo-Trans config file path (the copy saved in the run directory when the run is resumed)
+    soapdenovotrans_config_file = get_soapdenovotrans_config_file() if config_file is None else config_file
 
     # get the SOAPdenovo-Trans process config file path
     soapdenovotrans_process_config_file = get_soapdenovotrans_process_config_file()
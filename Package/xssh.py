@@ -25,6 +25,9 @@ This file contains the functions related to the SSH used in both console mode an
 
 import io
 import re
+import stat
+import sys
+import threading
 
 import paramiko
 
@@ -33,6 +36,17 @@ import xec2
 
 #-------------------------------------------------------------------------------
 
+# pooled SFTP sessions (SSH transport and SFTP client) of the clusters
+sftp_session_dict = {}
+sftp_session_lock = threading.Lock()
+
+# directory listings got through SFTP by cluster and path: modification time of the directory and entry list;
+# they are got from the threads of the background loader, so they are guarded by their lock
+sftp_listing_dict = {}
+sftp_listing_lock = threading.Lock()
+
+#-------------------------------------------------------------------------------
+
 def create_ssh_client_connection(cluster_name, node_name):
     '''
     '''
@@ -131,6 +145,56 @@ def execute_cluster_command(ssh_client, command):
 
 #-------------------------------------------------------------------------------
 
+def list_cluster_dir(ssh_client, cluster_dir, min_depth=1, max_depth=1, entry_type=None, regex=None, include_hidden=False):
+    '''
+    List the entries of a cluster directory with only one "find -printf" command.
+
+    The depth limits, the entry type ("d" directory or "f" regular file, following
+    the symbolic links) and the regular expression, which is applied to the path
+    with the format ./relative-path like "find -regex", are filtered in the cluster.
+    The hidden entries and the ones inside hidden directories are skipped unless
+    include_hidden is True. Every entry is a dictionary with the keys path (relative
+    to the directory), name, type, size (bytes) and mtime (seconds since the epoch),
+    and the entries are sorted by path.
+    '''
+
+    # initialize the control variable, the error list and the entry list
+    OK = True
+    error_list = []
+    entry_list = []
+
+    # build the find command
+    command = 'cd {0} && find . -mindepth {1}'.format(cluster_dir, min_depth)
+    if max_depth is not None:
+        command += ' -maxdepth {0}'.format(max_depth)
+    if entry_type is not None:
+        command += ' -xtype {0}'.format(entry_type)
+    if regex is not None:
+        command += ' -regex "./{0}"'.format(regex)
+    command += ' -printf "%P\\t%Y\\t%s\\t%T@\\n"'
+
+    # execute the command and build the entry list
+    (OK, stdout, stderr) = execute_cluster_command(ssh_client, command)
+    if OK:
+        for line in stdout:
+            data_list = line.rstrip('\n').split('\t')
+            if len(data_list) != 4:
+                continue
+            (path, entry_type_found, size, mtime) = data_list
+            if path == 'lost+found':
+                continue
+            if not include_hidden and any(name.startswith('.') for name in path.split('/')):
+                continue
+            entry_list.append({'path': path, 'name': path.split('/')[-1], 'type': entry_type_found, 'size': int(size), 'mtime': float(mtime)})
+        entry_list.sort(key=lambda entry: entry['path'])
+    else:
+        error_list.append('*** ERROR: Wrong command ---> {0}'.format(command))
+
+    # return the control variable, error list and entry list
+    return (OK, error_list, entry_list)
+
+#-------------------------------------------------------------------------------
+
 def close_ssh_client_connection(ssh_client):
     '''
     '''
@@ -243,6 +307,161 @@ def get_file(sftp_client, cluster_path, local_path):
 
 #-------------------------------------------------------------------------------
 
+def get_pooled_sftp_client(cluster_name):
+    '''
+    Get the pooled SFTP client of the master node of a cluster creating its SSH
+    transport connection when it does not exist or it is not active.
+    '''
+
+    # initialize the control variable and the error list
+    OK = True
+    error_list = []
+
+    with sftp_session_lock:
+
+        # get the pooled session
+        (ssh_transport, sftp_client) = sftp_session_dict.get(cluster_name, (None, None))
+
+        # create a new session when it is not active
+        if ssh_transport is None or not ssh_transport.is_active():
+            (OK, error_list, ssh_transport) = create_ssh_transport_connection(cluster_name, 'master')
+            if OK:
+                sftp_client = create_sftp_client(ssh_transport)
+                sftp_session_dict[cluster_name] = (ssh_transport, sftp_client)
+            else:
+                sftp_client = None
+
+    # return the control variable, the error list and the SFTP client object
+    return (OK, error_list, sftp_client)
+
+#-------------------------------------------------------------------------------
+
+def release_pooled_sftp_clients():
+    '''
+    Close the pooled SFTP sessions and forget their directory listings.
+    '''
+
+    with sftp_session_lock:
+        for (ssh_transport, sftp_client) in sftp_session_dict.values():
+            try:
+                sftp_client.close()
+                ssh_transport.close()
+            except Exception:
+                pass
+        sftp_session_dict.clear()
+    with sftp_listing_lock:
+        sftp_listing_dict.clear()
+
+#-------------------------------------------------------------------------------
+
+def list_cluster_dir_sftp(cluster_name, cluster_dir):
+    '''
+    List the entries of a cluster directory through the pooled SFTP session of
+    the cluster. The listing is kept and it is got again only when the
+    modification time of the directory changes. Every entry is a dictionary with
+    the keys path (absolute), name, type ("d" directory, "f" regular file or "l"
+    symbolic link), size (bytes) and mtime (seconds since the epoch), and the
+    entries are sorted by type (directories first) and name.
+    '''
+
+    # initialize the entry list
+    entry_list = []
+
+    # get the pooled SFTP client
+    (OK, error_list, sftp_client) = get_pooled_sftp_client(cluster_name)
+
+    # get the modification time of the directory
+    if OK:
+        try:
+            dir_mtime = sftp_client.stat(cluster_dir).st_mtime
+        except IOError:
+            error_list.append('*** ERROR: The cluster directory {0} can not be read.'.format(cluster_dir))
+            OK = False
+
+    # get the kept listing when the directory has not changed, otherwise list it
+    if OK:
+        with sftp_listing_lock:
+            (listing_mtime, entry_list) = sftp_listing_dict.get((cluster_name, cluster_dir), (None, []))
+        if listing_mtime != dir_mtime:
+            entry_list = []
+            try:
+                attr_list = sftp_client.listdir_attr(cluster_dir)
+            except IOError:
+                error_list.append('*** ERROR: The cluster directory {0} can not be listed.'.format(cluster_dir))
+                OK = False
+            else:
+                for attr in attr_list:
+                    if attr.filename == 'lost+found':
+                        continue
+                    if stat.S_ISDIR(attr.st_mode):
+                        entry_type = 'd'
+                    elif stat.S_ISLNK(attr.st_mode):
+                        entry_type = 'l'
+                    else:
+                        entry_type = 'f'
+                    entry_list.append({'path': '{0}/{1}'.format(cluster_dir.rstrip('/'), attr.filename), 'name': attr.filename, 'type': entry_type, 'size': attr.st_size, 'mtime': attr.st_mtime})
+                entry_list.sort(key=lambda entry: (entry['type'] != 'd', entry['name']))
+                with sftp_listing_lock:
+                    sftp_listing_dict[(cluster_name, cluster_dir)] = (dir_mtime, entry_list)
+
+    # return the control variable, error list and entry list
+    return (OK, error_list, entry_list)
+
+#-------------------------------------------------------------------------------
+
+def forget_sftp_listings(cluster_name, cluster_dir):
+    '''
+    Forget the kept listings of a cluster directory and its subdirectories, so
+    they are listed again. The modification time got through SFTP has a resolution
+    of one second, so a change in the same second of the listing is not detected.
+    '''
+
+    with sftp_listing_lock:
+        for (listing_cluster_name, listing_dir) in list(sftp_listing_dict.keys()):
+            if listing_cluster_name == cluster_name and (listing_dir == cluster_dir or listing_dir.startswith('{0}/'.format(cluster_dir.rstrip('/')))):
+                del sftp_listing_dict[(listing_cluster_name, listing_dir)]
+
+#-------------------------------------------------------------------------------
+
+def execute_pooled_cluster_command(cluster_name, command):
+    '''
+    Execute a command in the master node of a cluster through the SSH transport of
+    the pooled SFTP session of the cluster. The command fails when its exit status
+    is not 0, and then its stderr lines are added to the error list.
+    '''
+
+    # initialize the stdout lines list
+    stdout_string_lines_list = []
+
+    # get the pooled SFTP client
+    (OK, error_list, sftp_client) = get_pooled_sftp_client(cluster_name)
+
+    # execute the command in a new channel of the SSH transport
+    if OK:
+        try:
+            channel = sftp_client.get_channel().get_transport().open_session()
+            channel.exec_command(command)
+            stdout_bytes = channel.makefile('rb').read()
+            stderr_bytes = channel.makefile_stderr('rb').read()
+            exit_status = channel.recv_exit_status()
+            channel.close()
+        except (paramiko.SSHException, IOError):
+            error_list.append('*** ERROR: Wrong command ---> {0}'.format(command))
+            OK = False
+
+    # build the string lines lists corresponding to the stdout and the stderr
+    if OK:
+        stdout_string_lines_list = stdout_bytes.decode('utf-8', errors='replace').splitlines()
+        if exit_status != 0:
+            error_list.extend(stderr_bytes.decode('utf-8', errors='replace').splitlines())
+            error_list.append('*** ERROR: Wrong command ---> {0}'.format(command))
+            OK = False
+
+    # return the control variable, the error list and the stdout lines list
+    return (OK, error_list, stdout_string_lines_list)
+
+#-------------------------------------------------------------------------------
+
 def close_ssh_transport_connection(ssh_transport):
     '''
     '''
@@ -34,11 +34,13 @@ import xcluster
 import xconfiguration
 import xec2
 import xlib
+import xmetrics
+import xresult
 import xssh
 
 #-------------------------------------------------------------------------------
 
-def create_star_config_file(experiment_id='exp001', reference_dataset_id='Athaliana', reference_file='Arabidopsis_thaliana.TAIR10.dna.toplevel.fa', gtf_file='Arabidopsis_thaliana.TAIR10.36.gtf', read_dataset_id=xlib.get_uploaded_read_dataset_name(), read_type = 'PE', read_file_1='rnaseq-a_1.fastq', read_file_2='rnaseq-a_2.fastq'):
+def create_star_config_file(experiment_id='exp001', reference_dataset_id='Athaliana', reference_file='Arabidopsis_thaliana.TAIR10.dna.toplevel.fa', gtf_file='Arabidopsis_thaliana.TAIR10.36.gtf', read_dataset_id=xlib.get_uploaded_read_dataset_name(), read_type = 'PE', read_file_1='rnaseq-a_1.fastq', read_file_2='rnaseq-a_2.fastq', recommendation=None):
     '''
     Create STAR config file with the default options. It is necessary
     update the options in each run.
@@ -48,6 +50,10 @@ def create_star_config_file(experiment_id='exp001', reference_dataset_id='Athali
     OK = True
     error_list = []
 
+    # set the resources to the recommended values or to the default ones
+    threads = recommendation['ncpu'] if recommendation is not None else 2
+    max_memory = recommendation['max_memory'] if recommendation is not None else 10
+
     # create the STAR config file and write the default options
     try:
         if not os.path.exists(os.path.dirname(get_star_config_file())):
@@ -72,6 +78,9 @@ def create_star_config_file(experiment_id='exp001', reference_dataset_id='Athali
             file_id.write('{0}\n'.format('#'))
             file_id.write('{0}\n'.format('#    other_parameters = --outSAMattributes=All; --limitGenomeGenerateRAM=48000000000'))
             file_id.write('{0}\n'.format(''))
+            if recommendation is not None:
+                file_id.write('{0}\n'.format('# {0}'.format(xmetrics.get_recommendation_text(recommendation))))
+                file_id.write('{0}\n'.format(''))
             file_id.write('{0}\n'.format('# This section has the information identifies the experiment.'))
             file_id.write('{0}\n'.format('[identification]'))
             file_id.write('{0:<50} {1}\n'.format('experiment_id = {0}'.format(experiment_id), '# experiment identification'))
@@ -82,7 +91,7 @@ def create_star_config_file(experiment_id='exp001', reference_dataset_id='Athali
             file_id.write('{0}\n'.format(''))
             file_id.write('{0}\n'.format('# This section has the information to set the STAR parameters'))
             file_id.write('{0}\n'.format('[STAR parameters]'))
-            file_id.write('{0:<50} {1}\n'.format('threads = 2', '# number of threads for use'))
+            file_id.write('{0:<50} {1}\n'.format('threads = {0}'.format(threads), '# number of threads for use'))
             file_id.write('{0:<50} {1}\n'.format('two_pass_mode = NONE', '# 2-pass mapping mode: NONE (1-pass mapping) or BASIC (basic 2-pass mapping, with all 1st pass junctions inserted into the genome indices on the fly)'))
             file_id.write('{0:<50} {1}\n'.format('two_pass_1_readsn = -1', '# number of reads to process for the 1st step; use -1 to map all reads in the first step'))
             file_id.write('{0:<50} {1}\n'.format('out_filter_multimap_nmax = 20', '# maximun number of multiple alignments allowed for a read'))
@@ -92,7 +101,7 @@ def create_star_config_file(experiment_id='exp001', reference_dataset_id='Athali
             file_id.write('{0}\n'.format(''))
             file_id.write('{0}\n'.format('# This section has the information to set the Genome-guided Trinity parameters'))
             file_id.write('{0}\n'.format('[Genome-guided Trinity parameters]'))
-            file_id.write('{0:<50} {1}\n'.format('max_memory = 10', '# suggested maximum memory in GiB to use by Trinity where limiting can be enabled'))
+            file_id.write('{0:<50} {1}\n'.format('max_memory = {0}'.format(max_memory), '# suggested maximum memory in GiB to use by Trinity where limiting can be enabled'))
             file_id.write('{0:<50} {1}\n'.format('genome_guided_max_intron = 10000', '# maximum allowed intron length'))
             file_id.write('{0:<50} {1}\n'.format('other_parameters = NONE', '# additional parameters to the previous ones or NONE'))
             file_id.write('{0}\n'.format(''))
@@ -114,6 +123,21 @@ def create_star_config_file(experiment_id='exp001', reference_dataset_id='Athali
 
 #-------------------------------------------------------------------------------
 
+def recommend_star_resources(ssh_client, experiment_id, read_dataset_id, file_list):
+    '''
+    Recommend the resources of a STAR run of the selected read files from the
+    metrics of past runs.
+    '''
+
+    # get the input size
+    cluster_read_dir = '{0}/{1}/{2}'.format(xlib.get_cluster_read_dir(), experiment_id, read_dataset_id)
+    input_kb = xmetrics.get_input_size_kb(ssh_client, cluster_read_dir, file_list)
+
+    # return the recommendation
+    return xmetrics.recommend_resources(xlib.get_star_code(), ['STAR', 'Trinity'], input_kb)
+
+#-------------------------------------------------------------------------------
+
 def run_star_process(cluster_name, log, function=None):
     '''
     Run a STAR process.
@@ -197,6 +221,17 @@ def run_star_process(cluster_name, log, function=None):
     if OK:
         log.write('Process requirements are OK.\n')
 
+    # calculate the run fingerprint
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Calculating the run fingerprint ...\n')
+        (OK, error_list, fingerprint) = xresult.get_run_fingerprint(xlib.get_star_code(), get_star_config_file(), ssh_client)
+        if OK:
+            log.write('The run fingerprint is {0}.\n'.format(fingerprint))
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
     # determine the run directory in the cluster
     if OK:
         log.write('{0}\n'.format(xlib.get_separator()))
@@ -209,6 +244,17 @@ def run_star_process(cluster_name, log, function=None):
         else:
             log.write('*** ERROR: Wrong command ---> {0}\n'.format(command))
 
+    # save the run fingerprint in the run directory
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Saving the run fingerprint ...\n')
+        (OK, error_list) = xresult.save_run_fingerprint(ssh_client, current_run_dir, fingerprint)
+        if OK:
+            log.write('The run fingerprint is saved.\n')
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
     # build the STAR process script
     if OK:
         log.write('{0}\n'.format(xlib.get_separator()))
@@ -649,14 +695,24 @@ def build_star_process_script(cluster_name, current_run_dir):
             file_id.write('{0}\n'.format('cd {0}/{1}/bin'.format(xlib.get_cluster_app_dir(), xlib.get_miniconda3_name())))
             file_id.write('{0}\n'.format('source activate {0}'.format(xlib.get_star_bioconda_code())))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
+            for line in xlib.get_metrics_function_list(current_run_dir, star_option_dict):
+                file_id.write('{0}\n'.format(line))
+            for line in xlib.get_manifest_function_list():
+                file_id.write('{0}\n'.format(line))
+            file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
             file_id.write('{0}\n'.format('function init'))
             file_id.write('{0}\n'.format('{'))
             file_id.write('{0}\n'.format('    INIT_DATETIME=`date --utc +%s`'))
             file_id.write('{0}\n'.format('    FORMATTED_INIT_DATETIME=`date --date="@$INIT_DATETIME" "+%Y-%m-%d %H:%M:%S"`'))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
             file_id.write('{0}\n'.format('    echo "Script started in node $HOSTNAME of cluster {0} at $FORMATTED_INIT_DATETIME UTC."'.format(cluster_name)))
+            file_id.write('{0}\n'.format('    write_manifest result {0} running'.format(current_run_dir)))
             file_id.write('{0}\n'.format('}'))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
+            if read_type.upper() == 'PE':
+                for line in xlib.get_paired_read_check_function_list([(read_file_1, read_file_2)]):
+                    file_id.write('{0}\n'.format(line))
+                file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
             file_id.write('{0}\n'.format('function create_star_indexes'))
             file_id.write('{0}\n'.format('{'))
             file_id.write('{0}\n'.format('    cd {0}'.format(current_run_dir)))
@@ -665,13 +721,14 @@ def build_star_process_script(cluster_name, current_run_dir):
             file_id.write('{0}\n'.format('    rm -rf {0}'.format(star_indexes_dir)))
             file_id.write('{0}\n'.format('    mkdir --parents {0}'.format(star_indexes_dir)))
             file_id.write('{0}\n'.format('    /usr/bin/time \\'))
-            file_id.write('{0}\n'.format('        --format="$SEP\\nElapsed real time (s): %e\\nCPU time in kernel mode (s): %S\\nCPU time in user mode (s): %U\\nPercentage of CPU: %P\\nMaximum resident set size(Kb): %M\\nAverage total memory use (Kb):%K" \\'))
+            file_id.write('{0}\n'.format('        --output=$TIME_FILE --format="%e %S %U %P %M %K" \\'))
             file_id.write('{0}\n'.format('        STAR \\'))
             file_id.write('{0}\n'.format('            --runMode genomeGenerate \\'))
             file_id.write('{0}\n'.format('            --runThreadN {0} \\'.format(threads)))
             file_id.write('{0}\n'.format('            --genomeDir {0} \\'.format(star_indexes_dir)))
             file_id.write('{0}\n'.format('            --genomeFastaFiles {0}'.format(reference_file)))
             file_id.write('{0}\n'.format('    RC=$?'))
+            file_id.write('{0}\n'.format('    write_metrics STAR $RC'))
             file_id.write('{0}\n'.format('    if [ $RC -ne 0 ]; then manage_error STAR $RC; fi'))
             file_id.write('{0}\n'.format('}'))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
@@ -683,7 +740,7 @@ def build_star_process_script(cluster_name, current_run_dir):
             file_id.write('{0}\n'.format('    echo "$SEP"'))
             file_id.write('{0}\n'.format('    echo "Assembling reads ..."'))
             file_id.write('{0}\n'.format('    /usr/bin/time \\'))
-            file_id.write('{0}\n'.format('        --format="$SEP\\nElapsed real time (s): %e\\nCPU time in kernel mode (s): %S\\nCPU time in user mode (s): %U\\nPercentage of CPU: %P\\nMaximum resident set size(Kb): %M\\nAverage total memory use (Kb):%K" \\'))
+            file_id.write('{0}\n'.format('        --output=$TIME_FILE --format="%e %S %U %P %M %K" \\'))
             file_id.write('{0}\n'.format('        STAR \\'))
             file_id.write('{0}\n'.format('            --runMode alignReads \\'))
             file_id.write('{0}\n'.format('            --runThreadN {0} \\'.format(threads)))
@@ -735,6 +792,7 @@ def build_star_process_script(cluster_name, current_run_dir):
                             file_id.write('{0}\n'.format('            --{0}'.format(parameter_name)))
                     i += 1
             file_id.write('{0}\n'.format('    RC=$?'))
+            file_id.write('{0}\n'.format('    write_metrics STAR $RC'))
             file_id.write('{0}\n'.format('    if [ $RC -ne 0 ]; then manage_error STAR $RC; fi'))
             file_id.write('{0}\n'.format('}'))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
@@ -744,7 +802,7 @@ def build_star_process_script(cluster_name, current_run_dir):
             file_id.write('{0}\n'.format('    echo "$SEP"'))
             file_id.write('{0}\n'.format('    echo "Converting starAligned.sortedByCoord.out.bam to FASTA format ..."'))
             file_id.write('{0}\n'.format('    /usr/bin/time \\'))
-            file_id.write('{0}\n'.format('        --format="$SEP\\nElapsed real time (s): %e\\nCPU time in kernel mode (s): %S\\nCPU time in user mode (s): %U\\nPercentage of CPU: %P\\nMaximum resident set size(Kb): %M\\nAverage total memory use (Kb):%K" \\'))
+            file_id.write('{0}\n'.format('        --output=$TIME_FILE --format="%e %S %U %P %M %K" \\'))
             file_id.write('{0}\n'.format('        Trinity \\'))
             file_id.write('{0}\n'.format('            --CPU {0} \\'.format(threads)))
             file_id.write('{0}\n'.format('            --max_memory {0}G \\'.format(max_memory)))
@@ -774,6 +832,7 @@ def build_star_process_script(cluster_name, current_run_dir):
                             file_id.write('{0}\n'.format('            --{0}'.format(parameter_name)))
                     i += 1
             file_id.write('{0}\n'.format('    RC=$?'))
+            file_id.write('{0}\n'.format('    write_metrics Trinity $RC'))
             file_id.write('{0}\n'.format('    if [ $RC -ne 0 ]; then manage_error Trinity $RC; fi'))
             file_id.write('{0}\n'.format('}'))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
@@ -795,6 +854,7 @@ def build_star_process_script(cluster_name, current_run_dir):
             file_id.write('{0}\n'.format('    echo "$SEP"'))
             file_id.write('{0}\n'.format('    echo "Script ended OK at $FORMATTED_END_DATETIME UTC with a run duration of $DURATION s ($FORMATTED_DURATION)."'))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
+            file_id.write('{0}\n'.format('    write_manifest result {0} ended'.format(current_run_dir)))
             file_id.write('{0}\n'.format('    RECIPIENT={0}'.format(xconfiguration.get_contact_data())))
             file_id.write('{0}\n'.format('    SUBJECT="{0}: {1} process"'.format(xlib.get_project_name(), xlib.get_star_name())))
             file_id.write('{0}\n'.format('    MESSAGE="The {0} process in node $HOSTNAME of cluster {1} ended OK at $FORMATTED_END_DATETIME with a run duration of $DURATION s ($FORMATTED_DURATION). Please review its log.<br/><br/>Regards,<br/>GI Genetica, Fisiologia e Historia Forestal<br/>Dpto. Sistemas y Recursos Naturales<br/>ETSI Montes, Forestal y del Medio Natural<br/>Universidad Politecnica de Madrid<br/>https://github.com/ggfhf/"'.format(xlib.get_star_name(), cluster_name)))
@@ -811,6 +871,7 @@ def build_star_process_script(cluster_name, current_run_dir):
             file_id.write('{0}\n'.format('    echo "ERROR: $1 returned error $2"'))
             file_id.write('{0}\n'.format('    echo "Script ended WRONG at $FORMATTED_END_DATETIME UTC with a run duration of $DURATION s ($FORMATTED_DURATION)."'))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
+            file_id.write('{0}\n'.format('    write_manifest result {0} failed'.format(current_run_dir)))
             file_id.write('{0}\n'.format('    RECIPIENT={0}'.format(xconfiguration.get_contact_data())))
             file_id.write('{0}\n'.format('    SUBJECT="{0}: {1} process"'.format(xlib.get_project_name(), xlib.get_star_name())))
             file_id.write('{0}\n'.format('    MESSAGE="The {0} process in node $HOSTNAME of cluster {1} ended WRONG at $FORMATTED_END_DATETIME with a run duration of $DURATION s ($FORMATTED_DURATION). Please review its log.<br/><br/>Regards,<br/>GI Genetica, Fisiologia e Historia Forestal<br/>Dpto. Sistemas y Recursos Naturales<br/>ETSI Montes, Forestal y del Medio Natural<br/>Universidad Politecnica de Madrid<br/>https://github.com/ggfhf/"'.format(xlib.get_star_name(), cluster_name)))
@@ -828,6 +889,8 @@ def build_star_process_script(cluster_name, current_run_dir):
             file_id.write('{0}\n'.format('}'))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
             file_id.write('{0}\n'.format('init'))
+            if read_type.upper() == 'PE':
+                file_id.write('{0}\n'.format('check_read_pairs'))
             file_id.write('{0}\n'.format('create_star_indexes'))
             file_id.write('{0}\n'.format('run_star_process'))
             file_id.write('{0}\n'.format('convert_bam_to_fasta'))
@@ -34,6 +34,7 @@ import xcluster
 import xconfiguration
 import xec2
 import xlib
+import xresult
 import xssh
 
 #-------------------------------------------------------------------------------
@@ -195,6 +196,17 @@ def run_trimmomatic_process(cluster_name, log, function=None):
     if OK:
         log.write('Process requirements are OK.\n')
 
+    # calculate the run fingerprint
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Calculating the run fingerprint ...\n')
+        (OK, error_list, fingerprint) = xresult.get_run_fingerprint(xlib.get_trimmomatic_code(), get_trimmomatic_config_file(), ssh_client)
+        if OK:
+            log.write('The run fingerprint is {0}.\n'.format(fingerprint))
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
     # determine the run directory in the cluster
     if OK:
         log.write('{0}\n'.format(xlib.get_separator()))
@@ -207,6 +219,17 @@ def run_trimmomatic_process(cluster_name, log, function=None):
         else:
             log.write('*** ERROR: Wrong command ---> {0}\n'.format(command))
 
+    # save the run fingerprint in the run directory
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Saving the run fingerprint ...\n')
+        (OK, error_list) = xresult.save_run_fingerprint(ssh_client, current_run_dir, fingerprint)
+        if OK:
+            log.write('The run fingerprint is saved.\n')
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
     # build the Trimmomatic process script
     if OK:
         log.write('{0}\n'.format(xlib.get_separator()))
@@ -695,6 +718,13 @@ def build_trimmomatic_process_script(cluster_name, current_run_dir):
     # get the input read directory
     input_read_dir = xlib.get_cluster_experiment_read_dataset_dir(experiment_id, read_dataset_id)
 
+    # build the paired-end library list
+    read_file_pair_list = []
+    if read_type == 'PE':
+        for section in sections_list:
+            if re.match('^library-[0-9]+$', section):
+                read_file_pair_list.append(('{0}/{1}'.format(input_read_dir, trimmomatic_option_dict[section]['read_file_1']), '{0}/{1}'.format(input_read_dir, trimmomatic_option_dict[section]['read_file_2'])))
+
     # get the output read directory
     run_id = os.path.basename(current_run_dir)
     output_read_dir = xlib.get_cluster_experiment_read_dataset_dir(experiment_id, run_id)
@@ -712,14 +742,24 @@ def build_trimmomatic_process_script(cluster_name, current_run_dir):
             file_id.write('{0}\n'.format('cd {0}/{1}/bin'.format(xlib.get_cluster_app_dir(), xlib.get_miniconda3_name())))
             file_id.write('{0}\n'.format('source activate {0}'.format(xlib.get_trimmomatic_bioconda_code())))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
+            for line in xlib.get_metrics_function_list(current_run_dir, trimmomatic_option_dict):
+                file_id.write('{0}\n'.format(line))
+            for line in xlib.get_manifest_function_list():
+                file_id.write('{0}\n'.format(line))
+            file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
             file_id.write('{0}\n'.format('function init'))
             file_id.write('{0}\n'.format('{'))
             file_id.write('{0}\n'.format('    INIT_DATETIME=`date --utc +%s`'))
             file_id.write('{0}\n'.format('    FORMATTED_INIT_DATETIME=`date --date="@$INIT_DATETIME" "+%Y-%m-%d %H:%M:%S"`'))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
             file_id.write('{0}\n'.format('    echo "Script started in node $HOSTNAME of cluster {0} at $FORMATTED_INIT_DATETIME UTC."'.format(cluster_name)))
+            file_id.write('{0}\n'.format('    write_manifest result {0} running'.format(current_run_dir)))
             file_id.write('{0}\n'.format('}'))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
+            if read_type == 'PE':
+                for line in xlib.get_paired_read_check_function_list(read_file_pair_list):
+                    file_id.write('{0}\n'.format(line))
+                file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
             file_id.write('{0}\n'.format('function run_trimmomatic_process'))
             file_id.write('{0}\n'.format('{'))
             file_id.write('{0}\n'.format('    mkdir --parents {0}'.format(output_read_dir)))
@@ -732,7 +772,7 @@ def build_trimmomatic_process_script(cluster_name, current_run_dir):
                     read_file_2 = trimmomatic_option_dict[section]['read_file_2']
                     file_id.write('{0}\n'.format('    echo "$SEP"'))
                     file_id.write('{0}\n'.format('    /usr/bin/time \\'))
-                    file_id.write('{0}\n'.format('        --format="$SEP\\nElapsed real time (s): %e\\nCPU time in kernel mode (s): %S\\nCPU time in user mode (s): %U\\nPercentage of CPU: %P\\nMaximum resident set size(Kb): %M\\nAverage total memory use (Kb):%K" \\'))
+                    file_id.write('{0}\n'.format('        --output=$TIME_FILE --format="%e %S %U %P %M %K" \\'))
                     file_id.write('{0}\n'.format('        trimmomatic \\'))
                     file_id.write('{0}\n'.format('            {0} \\'.format(read_type)))
                     file_id.write('{0}\n'.format('            -threads {0} \\'.format(threads)))
@@ -752,6 +792,7 @@ def build_trimmomatic_process_script(cluster_name, current_run_dir):
                         file_id.write('{0}\n'.format('            {0}/{1} \\'.format(output_read_dir, unpaired_read_file_2)))
                     file_id.write('{0}\n'.format('            {0}'.format(selected_steps)))
                     file_id.write('{0}\n'.format('    RC=$?'))
+                    file_id.write('{0}\n'.format('    write_metrics trimmomatic $RC'))
                     file_id.write('{0}\n'.format('    if [ $RC -ne 0 ]; then manage_error trimmomatic $RC; fi'))
             file_id.write('{0}\n'.format('}'))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
@@ -763,6 +804,8 @@ def build_trimmomatic_process_script(cluster_name, current_run_dir):
             file_id.write('{0}\n'.format('    echo "$SEP"'))
             file_id.write('{0}\n'.format('    echo "Script ended OK at $FORMATTED_END_DATETIME UTC with a run duration of $DURATION s ($FORMATTED_DURATION)."'))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
+            file_id.write('{0}\n'.format('    write_manifest result {0} ended'.format(current_run_dir)))
+            file_id.write('{0}\n'.format('    write_manifest read {0} ended'.format(output_read_dir)))
             file_id.write('{0}\n'.format('    RECIPIENT={0}'.format(xconfiguration.get_contact_data())))
             file_id.write('{0}\n'.format('    SUBJECT="{0}: {1} process"'.format(xlib.get_project_name(), xlib.get_trimmomatic_name())))
             file_id.write('{0}\n'.format('    MESSAGE="The {0} process in node $HOSTNAME of cluster {1} ended OK at $FORMATTED_END_DATETIME with a run duration of $DURATION s ($FORMATTED_DURATION). Please review its log.<br/><br/>Regards,<br/>GI Genetica, Fisiologia e Historia Forestal<br/>Dpto. Sistemas y Recursos Naturales<br/>ETSI Montes, Forestal y del Medio Natural<br/>Universidad Politecnica de Madrid<br/>https://github.com/ggfhf/"'.format(xlib.get_trimmomatic_name(), cluster_name)))
@@ -779,6 +822,7 @@ def build_trimmomatic_process_script(cluster_name, current_run_dir):
             file_id.write('{0}\n'.format('    echo "ERROR: $1 returned error $2"'))
             file_id.write('{0}\n'.format('    echo "Script ended WRONG at $FORMATTED_END_DATETIME UTC with a run duration of $DURATION s ($FORMATTED_DURATION)."'))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
+            file_id.write('{0}\n'.format('    write_manifest result {0} failed'.format(current_run_dir)))
             file_id.write('{0}\n'.format('    RECIPIENT={0}'.format(xconfiguration.get_contact_data())))
             file_id.write('{0}\n'.format('    SUBJECT="{0}: {1} process"'.format(xlib.get_project_name(), xlib.get_trimmomatic_name())))
             file_id.write('{0}\n'.format('    MESSAGE="The {0} process in node $HOSTNAME of cluster {0} ended WRONG at $FORMATTED_END_DATETIME with a run duration of $DURATION s ($FORMATTED_DURATION). Please review its log.<br/><br/>Regards,<br/>GI Genetica, Fisiologia e Historia Forestal<br/>Dpto. Sistemas y Recursos Naturales<br/>ETSI Montes, Forestal y del Medio Natural<br/>Universidad Politecnica de Madrid<br/>https://github.com/ggfhf/"'.format(xlib.get_trimmomatic_name(), cluster_name)))
@@ -796,6 +840,8 @@ def build_trimmomatic_process_script(cluster_name, current_run_dir):
             file_id.write('{0}\n'.format('}'))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
             file_id.write('{0}\n'.format('init'))
+            if read_type == 'PE':
+                file_id.write('{0}\n'.format('check_read_pairs'))
             file_id.write('{0}\n'.format('run_trimmomatic_process'))
             file_id.write('{0}\n'.format('end'))
     except:
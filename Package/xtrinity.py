@@ -35,11 +35,13 @@ import xcluster
 import xconfiguration
 import xec2
 import xlib
+import xmetrics
+import xresult
 import xssh
 
 #-------------------------------------------------------------------------------
 
-def create_trinity_config_file(experiment_id='exp001', read_dataset_id=xlib.get_uploaded_read_dataset_name(), read_type = 'PE', file_1_list=['rnaseq-a_1.fastq'], file_2_list=['rnaseq-a_2.fastq']):
+def create_trinity_config_file(experiment_id='exp001', read_dataset_id=xlib.get_uploaded_read_dataset_name(), read_type = 'PE', file_1_list=['rnaseq-a_1.fastq'], file_2_list=['rnaseq-a_2.fastq'], recommendation=None):
     '''
     Create Trinity config file with the default options. It is necessary
     update the options in each run.
@@ -49,6 +51,11 @@ def create_trinity_config_file(experiment_id='exp001', read_dataset_id=xlib.get_
     OK = True
     error_list = []
 
+    # set the resources to the recommended values or to the default ones
+    ncpu = recommendation['ncpu'] if recommendation is not None else 8
+    max_memory = recommendation['max_memory'] if recommendation is not None else 60
+    bfly_heap_space_max = recommendation['bfly_heap_space_max'] if recommendation is not None else 4
+
     # create the Trinity config file and write the default options
     try:
         if not os.path.exists(os.path.dirname(get_trinity_config_file())):
@@ -75,6 +82,9 @@ def create_trinity_config_file(experiment_id='exp001', read_dataset_id=xlib.get_
             file_id.write('{0}\n'.format('#'))
             file_id.write('{0}\n'.format('#    other_parameters = --inchworm_cpu=8; --genome_guided_max_intron=10000'))
             file_id.write('{0}\n'.format(''))
+            if recommendation is not None:
+                file_id.write('{0}\n'.format('# {0}'.format(xmetrics.get_recommendation_text(recommendation))))
+                file_id.write('{0}\n'.format(''))
             file_id.write('{0}\n'.format('# This section has the information that identifies the experiment.'))
             file_id.write('{0}\n'.format('[identification]'))
             file_id.write('{0:<50} {1}\n'.format('experiment_id = {0}'.format(experiment_id), '# experiment identification'))
@@ -83,12 +93,14 @@ def create_trinity_config_file(experiment_id='exp001', read_dataset_id=xlib.get_
             file_id.write('{0}\n'.format('# This section has the information to set the Trinity parameters'))
             file_id.write('{0}\n'.format('[Trinity parameters]'))
             file_id.write('{0:<50} {1}\n'.format('kmer = 25', '# value or values list of K-MER size (maximum: 32)'))
-            file_id.write('{0:<50} {1}\n'.format('ncpu = 8', '# number of cpu for use'))
-            file_id.write('{0:<50} {1}\n'.format('max_memory = 60', '# suggested maximum memory in GiB to use by Trinity where limiting can be enabled'))
+            file_id.write('{0:<50} {1}\n'.format('ncpu = {0}'.format(ncpu), '# number of cpu for use'))
+            file_id.write('{0:<50} {1}\n'.format('max_memory = {0}'.format(max_memory), '# suggested maximum memory in GiB to use by Trinity where limiting can be enabled'))
             file_id.write('{0:<50} {1}\n'.format('min_kmer_cov = 1', '# minimum count for K-mers to be assembled by Inchworm'))
-            file_id.write('{0:<50} {1}\n'.format('bfly_heap_space_max = 4', '# java maximum heap space setting in GiB'))
+            file_id.write('{0:<50} {1}\n'.format('bfly_heap_space_max = {0}'.format(bfly_heap_space_max), '# java maximum heap space setting in GiB'))
             file_id.write('{0:<50} {1}\n'.format('bfly_calculate_cpu = YES', '# calculate CPUs based on 0.8 of max_memory divided by heap space setting for Butterfly (YES or NO)'))
             file_id.write('{0:<50} {1}\n'.format('normalized_reads = NO', '# use normalized reads (YES or NO)'))
+            file_id.write('{0:<50} {1}\n'.format('scratch_dir = NONE', '# node-local directory (e.g. /mnt) where the reads are staged and the assembly is run, or NONE'))
+            file_id.write('{0:<50} {1}\n'.format('scratch_archive = NO', '# archive the intermediate files of a run in scratch as a gzipped tar file (YES or NO)'))
             file_id.write('{0:<50} {1}\n'.format('other_parameters = NONE', '# additional parameters to the previous ones or NONE'))
             file_id.write('{0}\n'.format(''))
             file_id.write('{0}\n'.format('# This section has the global information of all libraries.'))
@@ -118,6 +130,21 @@ def create_trinity_config_file(experiment_id='exp001', read_dataset_id=xlib.get_
 
 #-------------------------------------------------------------------------------
 
+def recommend_trinity_resources(ssh_client, experiment_id, read_dataset_id, file_list):
+    '''
+    Recommend the resources of a Trinity run of the selected read files from the
+    metrics of past runs.
+    '''
+
+    # get the input size
+    cluster_read_dir = '{0}/{1}/{2}'.format(xlib.get_cluster_read_dir(), experiment_id, read_dataset_id)
+    input_kb = xmetrics.get_input_size_kb(ssh_client, cluster_read_dir, file_list)
+
+    # return the recommendation
+    return xmetrics.recommend_resources(xlib.get_trinity_code(), ['Trinity'], input_kb)
+
+#-------------------------------------------------------------------------------
+
 def run_trinity_process(cluster_name, log, function=None):
     '''
     Run an experiment corresponding to the options in Trinity config file.
@@ -200,6 +227,17 @@ def run_trinity_process(cluster_name, log, function=None):
     if OK:
         log.write('Process requirements are OK.\n')
 
+    # calculate the run fingerprint
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Calculating the run fingerprint ...\n')
+        (OK, error_list, fingerprint) = xresult.get_run_fingerprint(xlib.get_trinity_code(), get_trinity_config_file(), ssh_client)
+        if OK:
+            log.write('The run fingerprint is {0}.\n'.format(fingerprint))
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
     # for each kmer value, build the process, copy it the cluster and run it
     if OK:
 
@@ -226,6 +264,28 @@ def run_trinity_process(cluster_name, log, function=None):
                 log.write('*** ERROR: Wrong command ---> {0}\n'.format(command))
             i += 1
 
+            # save the run fingerprint in the run directory
+            log.write('{0}\n'.format(xlib.get_separator()))
+            log.write('Saving the run fingerprint ...\n')
+            (OK, error_list) = xresult.save_run_fingerprint(ssh_client, current_run_dir, fingerprint)
+            if OK:
+                log.write('The run fingerprint is saved.\n')
+            else:
+                for error in error_list:
+                    log.write('{0}\n'.format(error))
+                break
+
+            # save a copy of the config file in the run directory
+            log.write('{0}\n'.format(xlib.get_separator()))
+            log.write('Saving a copy of the config file in the run directory ...\n')
+            (OK, error_list) = xresult.save_run_config_snapshot(sftp_client, current_run_dir, get_trinity_config_file())
+            if OK:
+                log.write('The copy of the config file is saved.\n')
+            else:
+                for error in error_list:
+                    log.write('{0}\n'.format(error))
+                break
+
             # build the Trinity process script
             log.write('{0}\n'.format(xlib.get_separator()))
             log.write('Building the process script {0} ...\n'.format(get_trinity_process_script()))
@@ -302,6 +362,257 @@ def run_trinity_process(cluster_name, log, function=None):
             else:
                 log.write('*** ERROR: Wrong command ---> {0}\n'.format(command))
 
+            # save the batch job identification in the run directory
+            if OK:
+                (is_saved, error_list) = xresult.save_run_job_id(ssh_client, current_run_dir, stdout)
+                if not is_saved:
+                    for error in error_list:
+                        log.write('{0}\n'.format(error))
+                    log.write('*** WARNING: The run will not be able to be resumed.\n')
+
+    # close the SSH transport connection
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Closing the SSH transport connection ...\n')
+        xssh.close_ssh_transport_connection(ssh_transport)
+        log.write('The connection is closed.\n')
+
+    # close the SSH client connection
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Closing the SSH client connection ...\n')
+        xssh.close_ssh_client_connection(ssh_client)
+        log.write('The connection is closed.\n')
+
+    # warn that the log window can be closed
+    if not isinstance(log, xlib.DevStdOut):
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('You can close this window now.\n')
+
+    # execute final function
+    if function is not None:
+        function()
+
+    # return the control variable
+    return OK
+
+#-------------------------------------------------------------------------------
+
+def resume_trinity_process(cluster_name, experiment_id, result_dataset_id, log, function=None):
+    '''
+    Resume a failed Trinity run in its run directory reusing the files already calculated.
+    '''
+
+    # initialize the control variable
+    OK = True
+
+    # get the Trinity name
+    trinity_name = xlib.get_trinity_name()
+
+    # get the Trinity config file
+    trinity_config_file = get_trinity_config_file()
+
+    # get the Trinity process script path in the local computer
+    trinity_process_script = get_trinity_process_script()
+
+    # get the Trinity process starter path in the local computer
+    trinity_process_starter = get_trinity_process_starter()
+
+    # get the run directory in the cluster
+    current_run_dir = xlib.get_cluster_experiment_result_dataset_dir(experiment_id, result_dataset_id)
+
+    # warn that the log window must not be closed
+    if not isinstance(log, xlib.DevStdOut):
+        log.write('This process might take several minutes. Do not close this window, please wait!\n')
+
+    # create the SSH client connection
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Connecting the SSH client ...\n')
+        (OK, error_list, ssh_client) = xssh.create_ssh_client_connection(cluster_name, 'master')
+        if OK:
+            log.write('The SSH client is connected.\n')
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
+    # create the SSH transport connection
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Connecting the SSH transport ...\n')
+        (OK, error_list, ssh_transport) = xssh.create_ssh_transport_connection(cluster_name, 'master')
+        if OK:
+            log.write('The SSH transport is connected.\n')
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
+    # create the SFTP client 
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Connecting the SFTP client ...\n')
+        sftp_client = xssh.create_sftp_client(ssh_transport)
+        log.write('The SFTP client is connected.\n')
+
+    # warn that the requirements are being verified 
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Verifying process requirements ...\n')
+
+    # verify the master is running
+    if OK:
+        (master_state_code, master_state_name) = xec2.get_node_state(cluster_name, 'master')
+        if master_state_code != 16:
+            log.write('*** ERROR: The cluster {0} is not running. Its state is {1} ({2}).\n'.format(cluster_name, master_state_code, master_state_name))
+            OK = False
+
+    # verify the Trinity is set up
+    if OK:
+        (OK, error_list, is_setup) = xbioinfoapp.is_setup_bioconda_package(xlib.get_trinity_bioconda_code(), cluster_name, True, ssh_client)
+        if OK:
+            if not is_setup:
+                log.write('*** ERROR: {0} is not setup.\n'.format(trinity_name))
+                OK = False
+        else:
+            log.write('*** ERROR: The verification of {0} setup could not be performed.\n'.format(trinity_name))
+
+    # verify the run directory exists and its process has not ended OK
+    if OK:
+        command = '[ -d {0} ] && (grep --quiet "Script ended OK" {0}/{1} && echo RC=2 || echo RC=0) || echo RC=1'.format(current_run_dir, xlib.get_cluster_log_file())
+        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+        if OK:
+            if stdout[len(stdout) - 1] == 'RC=1':
+                log.write('*** ERROR: The run directory {0} does not exist.\n'.format(current_run_dir))
+                OK = False
+            elif stdout[len(stdout) - 1] == 'RC=2':
+                log.write('*** ERROR: The process of the run directory {0} already ended OK.\n'.format(current_run_dir))
+                OK = False
+        else:
+            log.write('*** ERROR: Wrong command ---> {0}\n'.format(command))
+
+    # verify the batch job of the run is not queued or running
+    if OK:
+        (OK, error_list, batch_job) = xresult.get_run_active_batch_job(ssh_client, current_run_dir)
+        if OK:
+            if batch_job is not None:
+                log.write('*** ERROR: The batch job {0} of the run is still {1}.\n'.format(batch_job['job_id'], batch_job['state_name']))
+                OK = False
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
+    # get the copy of the config file which the run was started with
+    if OK:
+        (OK, error_list, snapshot_config_file) = xresult.get_run_config_snapshot(sftp_client, current_run_dir, trinity_config_file)
+        if OK:
+            if xlib.get_option_dict(snapshot_config_file)['identification']['experiment_id'] != experiment_id:
+                log.write('*** ERROR: The experiment identification of the config file of the run is not {0}.\n'.format(experiment_id))
+                OK = False
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
+    # get the kmer value used in the run
+    if OK:
+        command = 'grep --only-matching --max-count=1 -- "--KMER_SIZE [0-9]*" {0}/{1}'.format(current_run_dir, os.path.basename(trinity_process_script))
+        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+        if OK and stdout != []:
+            kmer_value = int(stdout[0].split()[-1])
+        else:
+            log.write('*** ERROR: The kmer value of the run could not be determined.\n')
+            OK = False
+
+    # warn that the requirements are OK 
+    if OK:
+        log.write('Process requirements are OK.\n')
+
+    # build the Trinity process script
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Building the process script {0} ...\n'.format(trinity_process_script))
+        (OK, error_list) = build_trinity_process_script(cluster_name, current_run_dir, kmer_value, resumed=True, config_file=snapshot_config_file)
+        if OK:
+            log.write('The file is built.\n')
+        else:
+            log.write('*** ERROR: The file could not be built.\n')
+
+    # upload the process script to the cluster
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Uploading the process script {0} to the directory {1} of the master ...\n'.format(trinity_process_script, current_run_dir))
+        cluster_path = '{0}/{1}'.format(current_run_dir, os.path.basename(trinity_process_script))
+        (OK, error_list) = xssh.put_file(sftp_client, trinity_process_script, cluster_path)
+        if OK:
+            log.write('The file is uploaded.\n')
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
+    # set run permision to the process script in the cluster
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Setting on the run permision of {0}/{1} ...\n'.format(current_run_dir, os.path.basename(trinity_process_script)))
+        command = 'chmod u+x {0}/{1}'.format(current_run_dir, os.path.basename(trinity_process_script))
+        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+        if OK:
+            log.write('The run permision is set on.\n')
+        else:
+            log.write('*** ERROR: Wrong command ---> {0}\n'.format(command))
+
+    # build the process starter
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Building the process starter {0} ...\n'.format(trinity_process_starter))
+        (OK, error_list) = build_trinity_process_starter(current_run_dir, resumed=True)
+        if OK:
+            log.write('The file is built.\n')
+        else:
+            log.write('***ERROR: The file could not be built.\n')
+
+    # upload the process starter to the cluster
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Uploading the process starter {0} to the directory {1} of the master ...\n'.format(trinity_process_starter, current_run_dir))
+        cluster_path = '{0}/{1}'.format(current_run_dir, os.path.basename(trinity_process_starter))
+        (OK, error_list) = xssh.put_file(sftp_client, trinity_process_starter, cluster_path)
+        if OK:
+            log.write('The file is uploaded.\n')
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
+    # set run permision to the process starter in the cluster
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Setting on the run permision of {0}/{1} ...\n'.format(current_run_dir, os.path.basename(trinity_process_starter)))
+        command = 'chmod u+x {0}/{1}'.format(current_run_dir, os.path.basename(trinity_process_starter))
+        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+        if OK:
+            log.write('The run permision is set on.\n')
+        else:
+            log.write('*** ERROR: Wrong command ---> {0}\n'.format(command))
+
+    # submit the process
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Resubmitting the process script {0}/{1} ...\n'.format(current_run_dir, os.path.basename(trinity_process_starter)))
+        sge_env = xcluster.get_sge_env()
+        command = '{0}; qsub -V -b n -cwd {1}/{2}'.format(sge_env, current_run_dir, os.path.basename(trinity_process_starter))
+        (OK, stdout, stderr) = xssh.execute_cluster_command(ssh_client, command)
+        if OK:
+            for line in stdout:
+                log.write('{0}\n'.format(line))
+        else:
+            log.write('*** ERROR: Wrong command ---> {0}\n'.format(command))
+
+    # save the batch job identification in the run directory
+    if OK:
+        (is_saved, error_list) = xresult.save_run_job_id(ssh_client, current_run_dir, stdout)
+        if not is_saved:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+            log.write('*** WARNING: The run will not be able to be resumed again.\n')
+
     # close the SSH transport connection
     if OK:
         log.write('{0}\n'.format(xlib.get_separator()))
@@ -471,6 +782,24 @@ def validate_trinity_config_file(strict):
                 error_list.append('*** ERROR: the key "normalized_reads" value in the section "Trinity parameters" must be YES or NO.')
                 OK = False
 
+            # check section "Trinity parameters" - key "scratch_dir"
+            scratch_dir = trinity_option_dict.get('Trinity parameters', {}).get('scratch_dir', not_found)
+            if scratch_dir == not_found:
+                error_list.append('*** ERROR: the key "scratch_dir" is not found in the section "Trinity parameters".')
+                OK = False
+            elif scratch_dir.upper() != 'NONE' and not scratch_dir.startswith('/'):
+                error_list.append('*** ERROR: the key "scratch_dir" value in the section "Trinity parameters" must be NONE or an absolute path.')
+                OK = False
+
+            # check section "Trinity parameters" - key "scratch_archive"
+            scratch_archive = trinity_option_dict.get('Trinity parameters', {}).get('scratch_archive', not_found).upper()
+            if scratch_archive == not_found:
+                error_list.append('*** ERROR: the key "scratch_archive" is not found in the section "Trinity parameters".')
+                OK = False
+            elif scratch_archive not in ['YES', 'NO']:
+                error_list.append('*** ERROR: the key "scratch_archive" value in the section "Trinity parameters" must be YES or NO.')
+                OK = False
+
             # check section "Trinity parameters" - key "other_parameters"
             not_allowed_parameters_list = ['seqType', 'left', 'right', 'single', 'KMER_SIZE', 'CPU', 'max_memory', 'bflyHeapSpaceMax', 'bflyCalculateCPU', 'no_normalize_reads', 'output']
             other_parameters = trinity_option_dict.get('Trinity parameters', {}).get('other_parameters', not_found)
@@ -561,7 +890,7 @@ def validate_trinity_config_file(strict):
 
 #-------------------------------------------------------------------------------
 
-def build_trinity_process_script(cluster_name, current_run_dir, kmer_value):
+def build_trinity_process_script(cluster_name, current_run_dir, kmer_value, resumed=False, config_file=None):
     '''
     Build the current Trinity process script.
     '''
@@ -570,8 +899,12 @@ def build_trinity_process_script(cluster_name, current_run_dir, kmer_value):
     OK = True
     error_list = []
 
+    # get the config file path (the copy saved in the run directory when the run is resumed)
+    if config_file is None:
+        config_file = get_trinity_config_file()
+
     # get the option dictionary
-    trinity_option_dict = xlib.get_option_dict(get_trinity_config_file())
+    trinity_option_dict = xlib.get_option_dict(config_file)
 
     # get the options
     experiment_id = trinity_option_dict['identification']['experiment_id']
@@ -582,9 +915,15 @@ def build_trinity_process_script(cluster_name, current_run_dir, kmer_value):
     bfly_calculate_cpu = trinity_option_dict['Trinity parameters']['bfly_calculate_cpu']
     normalized_reads = trinity_option_dict['Trinity parameters']['normalized_reads']
     other_parameters = trinity_option_dict['Trinity parameters']['other_parameters']
+    scratch_dir = trinity_option_dict['Trinity parameters']['scratch_dir']
+    scratch_archive = trinity_option_dict['Trinity parameters']['scratch_archive']
     format = 'fq' if trinity_option_dict['library']['format'].upper() == 'FASTQ' else 'fa'
     read_type = trinity_option_dict['library']['read_type']
 
+    # set the staging of the reads and the working directory in the node-local scratch
+    staged = scratch_dir.upper() != 'NONE'
+    work_dir = '$WORK_DIR' if staged else current_run_dir
+
     # get the sections list
     sections_list = []
     for section in trinity_option_dict.keys():
@@ -594,15 +933,20 @@ def build_trinity_process_script(cluster_name, current_run_dir, kmer_value):
     # build library files
     files1 = ''
     files2 = ''
+    read_file_list = []
+    read_file_pair_list = []
     for section in sections_list:
         # if the section identification is like library-n
         if re.match('^library-[0-9]+$', section):
             read_file_1 = trinity_option_dict[section]['read_file_1']
-            read_file_1 = xlib.get_cluster_read_file(experiment_id, read_dataset_id, read_file_1)
+            read_file_list.append(read_file_1)
+            read_file_1 = '$READ_DIR/{0}'.format(os.path.basename(read_file_1)) if staged else xlib.get_cluster_read_file(experiment_id, read_dataset_id, read_file_1)
             files1 += read_file_1 + ','
             if read_type.upper() == 'PE':
                 read_file_2 = trinity_option_dict[section]['read_file_2']
-                read_file_2 = xlib.get_cluster_read_file(experiment_id, read_dataset_id, read_file_2)
+                read_file_list.append(read_file_2)
+                read_file_pair_list.append((xlib.get_cluster_read_file(experiment_id, read_dataset_id, read_file_list[-2]), xlib.get_cluster_read_file(experiment_id, read_dataset_id, read_file_list[-1])))
+                read_file_2 = '$READ_DIR/{0}'.format(os.path.basename(read_file_2)) if staged else xlib.get_cluster_read_file(experiment_id, read_dataset_id, read_file_2)
                 files2 += read_file_2 + ','
     files1 = files1[:len(files1) - 1]
     if read_type.upper() == 'PE':
@@ -621,22 +965,39 @@ def build_trinity_process_script(cluster_name, current_run_dir, kmer_value):
             file_id.write('{0}\n'.format('cd {0}/{1}/bin'.format(xlib.get_cluster_app_dir(), xlib.get_miniconda3_name())))
             file_id.write('{0}\n'.format('source activate {0}'.format(xlib.get_trinity_bioconda_code())))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
+            for line in xlib.get_metrics_function_list(current_run_dir, trinity_option_dict):
+                file_id.write('{0}\n'.format(line))
+            for line in xlib.get_manifest_function_list():
+                file_id.write('{0}\n'.format(line))
+            file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
             file_id.write('{0}\n'.format('function init'))
             file_id.write('{0}\n'.format('{'))
             file_id.write('{0}\n'.format('    INIT_DATETIME=`date --utc +%s`'))
             file_id.write('{0}\n'.format('    FORMATTED_INIT_DATETIME=`date --date="@$INIT_DATETIME" "+%Y-%m-%d %H:%M:%S"`'))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
-            file_id.write('{0}\n'.format('    echo "Script started in node $HOSTNAME of cluster {0} at $FORMATTED_INIT_DATETIME UTC."'.format(cluster_name)))
+            if resumed:
+                file_id.write('{0}\n'.format('    echo "Script resumed in node $HOSTNAME of cluster {0} at $FORMATTED_INIT_DATETIME UTC."'.format(cluster_name)))
+            else:
+                file_id.write('{0}\n'.format('    echo "Script started in node $HOSTNAME of cluster {0} at $FORMATTED_INIT_DATETIME UTC."'.format(cluster_name)))
+            file_id.write('{0}\n'.format('    write_manifest result {0} running'.format(current_run_dir)))
             file_id.write('{0}\n'.format('}'))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
+            if read_type.upper() == 'PE':
+                for line in xlib.get_paired_read_check_function_list(read_file_pair_list):
+                    file_id.write('{0}\n'.format(line))
+                file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
+            if staged:
+                for line in xlib.get_scratch_staging_function_list(scratch_dir, current_run_dir, xlib.get_cluster_experiment_read_dataset_dir(experiment_id, read_dataset_id), read_file_list, ['Trinity.fasta', 'Trinity.fasta.gene_trans_map', 'Trinity.timing'], scratch_archive.upper() == 'YES'):
+                    file_id.write('{0}\n'.format(line))
+                file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
             file_id.write('{0}\n'.format('function run_trinity_process'))
             file_id.write('{0}\n'.format('{'))
-            file_id.write('{0}\n'.format('    cd {0}'.format(current_run_dir)))
+            file_id.write('{0}\n'.format('    cd {0}'.format(work_dir)))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
             file_id.write('{0}\n'.format('    Trinity --version'))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
             file_id.write('{0}\n'.format('    /usr/bin/time \\'))
-            file_id.write('{0}\n'.format('        --format="$SEP\\nElapsed real time (s): %e\\nCPU time in kernel mode (s): %S\\nCPU time in user mode (s): %U\\nPercentage of CPU: %P\\nMaximum resident set size(Kb): %M\\nAverage total memory use (Kb):%K" \\'))
+            file_id.write('{0}\n'.format('        --output=$TIME_FILE --format="%e %S %U %P %M %K" \\'))
             file_id.write('{0}\n'.format('        Trinity \\'))
             file_id.write('{0}\n'.format('            --seqType {0} \\'.format(format)))
             if read_type.upper() == 'PE':
@@ -653,9 +1014,9 @@ def build_trinity_process_script(cluster_name, current_run_dir, kmer_value):
             if normalized_reads.upper() == 'NO':
                 file_id.write('{0}\n'.format('            --no_normalize_reads \\'))
             if other_parameters.upper() == 'NONE':
-                file_id.write('{0}\n'.format('            --output {0}'.format(current_run_dir)))
+                file_id.write('{0}\n'.format('            --output {0}'.format(work_dir)))
             else:
-                file_id.write('{0}\n'.format('            --output {0} \\'.format(current_run_dir)))
+                file_id.write('{0}\n'.format('            --output {0} \\'.format(work_dir)))
                 parameter_list = [x.strip() for x in other_parameters.split(';')]
                 for i in range(len(parameter_list)):
                     if parameter_list[i].find('=') > 0:
@@ -677,6 +1038,7 @@ def build_trinity_process_script(cluster_name, current_run_dir, kmer_value):
                             file_id.write('{0}\n'.format('            --{0}'.format(parameter_name)))
                     i += 1
             file_id.write('{0}\n'.format('    RC=$?'))
+            file_id.write('{0}\n'.format('    write_metrics Trinity $RC'))
             file_id.write('{0}\n'.format('    if [ $RC -ne 0 ]; then manage_error Trinity $RC; fi'))
             file_id.write('{0}\n'.format('}'))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
@@ -688,6 +1050,7 @@ def build_trinity_process_script(cluster_name, current_run_dir, kmer_value):
             file_id.write('{0}\n'.format('    echo "$SEP"'))
             file_id.write('{0}\n'.format('    echo "Script ended OK at $FORMATTED_END_DATETIME UTC with a run duration of $DURATION s ($FORMATTED_DURATION)."'))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
+            file_id.write('{0}\n'.format('    write_manifest result {0} ended'.format(current_run_dir)))
             file_id.write('{0}\n'.format('    RECIPIENT={0}'.format(xconfiguration.get_contact_data())))
             file_id.write('{0}\n'.format('    SUBJECT="{0}: {1} process"'.format(xlib.get_project_name(), xlib.get_trinity_name())))
             file_id.write('{0}\n'.format('    MESSAGE="The {0} process in node $HOSTNAME of cluster {1} ended OK at $FORMATTED_END_DATETIME with a run duration of $DURATION s ($FORMATTED_DURATION). Please review its log.<br/><br/>Regards,<br/>GI Genetica, Fisiologia e Historia Forestal<br/>Dpto. Sistemas y Recursos Naturales<br/>ETSI Montes, Forestal y del Medio Natural<br/>Universidad Politecnica de Madrid<br/>https://github.com/ggfhf/"'.format(xlib.get_trinity_name(), cluster_name)))
@@ -704,6 +1067,7 @@ def build_trinity_process_script(cluster_name, current_run_dir, kmer_value):
             file_id.write('{0}\n'.format('    echo "ERROR: $1 returned error $2"'))
             file_id.write('{0}\n'.format('    echo "Script ended WRONG at $FORMATTED_END_DATETIME UTC with a run duration of $DURATION s ($FORMATTED_DURATION)."'))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
+            file_id.write('{0}\n'.format('    write_manifest result {0} failed'.format(current_run_dir)))
             file_id.write('{0}\n'.format('    RECIPIENT={0}'.format(xconfiguration.get_contact_data())))
             file_id.write('{0}\n'.format('    SUBJECT="{0}: {1} process"'.format(xlib.get_project_name(), xlib.get_trinity_name())))
             file_id.write('{0}\n'.format('    MESSAGE="The {0} process in node $HOSTNAME of cluster {1} ended WRONG at $FORMATTED_END_DATETIME with a run duration of $DURATION s ($FORMATTED_DURATION). Please review its log.<br/><br/>Regards,<br/>GI Genetica, Fisiologia e Historia Forestal<br/>Dpto. Sistemas y Recursos Naturales<br/>ETSI Montes, Forestal y del Medio Natural<br/>Universidad Politecnica de Madrid<br/>https://github.com/ggfhf/"'.format(xlib.get_trinity_name(), cluster_name)))
@@ -721,7 +1085,13 @@ def build_trinity_process_script(cluster_name, current_run_dir, kmer_value):
             file_id.write('{0}\n'.format('}'))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
             file_id.write('{0}\n'.format('init'))
+            if read_type.upper() == 'PE':
+                file_id.write('{0}\n'.format('check_read_pairs'))
+            if staged:
+                file_id.write('{0}\n'.format('stage_in'))
             file_id.write('{0}\n'.format('run_trinity_process'))
+            if staged:
+                file_id.write('{0}\n'.format('stage_out'))
             file_id.write('{0}\n'.format('end'))
     except:
         error_list.append('*** ERROR: The file {0} can not be created'.format(get_trinity_process_script()))
@@ -732,7 +1102,7 @@ def build_trinity_process_script(cluster_name, current_run_dir, kmer_value):
 
 #-------------------------------------------------------------------------------
 
-def build_trinity_process_starter(current_run_dir):
+def build_trinity_process_starter(current_run_dir, resumed=False):
     '''
     Build the starter of the current Trinity process.
     '''
@@ -748,7 +1118,10 @@ def build_trinity_process_starter(current_run_dir):
         with open(get_trinity_process_starter(), mode='w', encoding='utf8', newline='\n') as file_id:
             file_id.write('{0}\n'.format('#!/bin/bash'))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
-            file_id.write('{0}\n'.format('{0}/{1} &>{0}/{2}'.format(current_run_dir, os.path.basename(get_trinity_process_script()), xlib.get_cluster_log_file())))
+            if resumed:
+                file_id.write('{0}\n'.format('{0}/{1} &>>{0}/{2}'.format(current_run_dir, os.path.basename(get_trinity_process_script()), xlib.get_cluster_log_file())))
+            else:
+                file_id.write('{0}\n'.format('{0}/{1} &>{0}/{2}'.format(current_run_dir, os.path.basename(get_trinity_process_script()), xlib.get_cluster_log_file())))
     except:
         error_list.append('*** ERROR: The file {0} can not be created'.format(get_trinity_process_starter()))
         OK = False
@@ -966,6 +1339,17 @@ def run_insilico_read_normalization_process(cluster_name, log, function=None):
     if OK:
         log.write('Process requirements are OK.\n')
 
+    # calculate the run fingerprint
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Calculating the run fingerprint ...\n')
+        (OK, error_list, fingerprint) = xresult.get_run_fingerprint(xlib.get_insilico_read_normalization_code(), get_insilico_read_normalization_config_file(), ssh_client)
+        if OK:
+            log.write('The run fingerprint is {0}.\n'.format(fingerprint))
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
     # determine the run directory in the cluster
     if OK:
         log.write('{0}\n'.format(xlib.get_separator()))
@@ -978,6 +1362,17 @@ def run_insilico_read_normalization_process(cluster_name, log, function=None):
         else:
             log.write('*** ERROR: Wrong command ---> {0}\n'.format(command))
 
+    # save the run fingerprint in the run directory
+    if OK:
+        log.write('{0}\n'.format(xlib.get_separator()))
+        log.write('Saving the run fingerprint ...\n')
+        (OK, error_list) = xresult.save_run_fingerprint(ssh_client, current_run_dir, fingerprint)
+        if OK:
+            log.write('The run fingerprint is saved.\n')
+        else:
+            for error in error_list:
+                log.write('{0}\n'.format(error))
+
     # build the insilico_read_normalization process script
     if OK:
         log.write('{0}\n'.format(xlib.get_separator()))
@@ -1350,12 +1745,18 @@ def build_insilico_read_normalization_process_script(cluster_name, current_run_d
             file_id.write('{0}\n'.format('cd {0}/{1}/bin'.format(xlib.get_cluster_app_dir(), xlib.get_miniconda3_name())))
             file_id.write('{0}\n'.format('source activate {0}'.format(xlib.get_trinity_bioconda_code())))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
+            for line in xlib.get_metrics_function_list(current_run_dir, insilico_read_normalization_option_dict):
+                file_id.write('{0}\n'.format(line))
+            for line in xlib.get_manifest_function_list():
+                file_id.write('{0}\n'.format(line))
+            file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
             file_id.write('{0}\n'.format('function init'))
             file_id.write('{0}\n'.format('{'))
             file_id.write('{0}\n'.format('    INIT_DATETIME=`date --utc +%s`'))
             file_id.write('{0}\n'.format('    FORMATTED_INIT_DATETIME=`date --date="@$INIT_DATETIME" "+%Y-%m-%d %H:%M:%S"`'))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
             file_id.write('{0}\n'.format('    echo "Script started in node $HOSTNAME of cluster {0} at $FORMATTED_INIT_DATETIME UTC."'.format(cluster_name)))
+            file_id.write('{0}\n'.format('    write_manifest result {0} running'.format(current_run_dir)))
             file_id.write('{0}\n'.format('}'))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
             file_id.write('{0}\n'.format('function run_insilico_read_normalization_process'))
@@ -1365,7 +1766,7 @@ def build_insilico_read_normalization_process_script(cluster_name, current_run_d
             file_id.write('{0}\n'.format('    Trinity --version'))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
             file_id.write('{0}\n'.format('    /usr/bin/time \\'))
-            file_id.write('{0}\n'.format('        --format="$SEP\\nElapsed real time (s): %e\\nCPU time in kernel mode (s): %S\\nCPU time in user mode (s): %U\\nPercentage of CPU: %P\\nMaximum resident set size(Kb): %M\\nAverage total memory use (Kb):%K" \\'))
+            file_id.write('{0}\n'.format('        --output=$TIME_FILE --format="%e %S %U %P %M %K" \\'))
             file_id.write('{0}\n'.format('        insilico_read_normalization.pl \\'))
             file_id.write('{0}\n'.format('            --seqType {0} \\'.format(format)))
             if read_type.upper() == 'PE':
@@ -1413,6 +1814,7 @@ def build_insilico_read_normalization_process_script(cluster_name, current_run_d
                             file_id.write('{0}\n'.format('            --{0}'.format(parameter_name)))
                     i += 1
             file_id.write('{0}\n'.format('    RC=$?'))
+            file_id.write('{0}\n'.format('    write_metrics insilico_read_normalization.pl $RC'))
             file_id.write('{0}\n'.format('    if [ $RC -ne 0 ]; then manage_error insilico_read_normalization.pl $RC; fi'))
             file_id.write('{0}\n'.format('}'))
             file_id.write('{0}\n'.format('#-------------------------------------------------------------------------------'))
@@ -1424,6 +1826,8 @@ def build_insilico_read_normalization_process_script(cluster_name, current_run_d
             file_id.write('{0}\n'.format('    echo "$SEP"'))
             file_id.write('{0}\n'.format('    echo "Script ended OK at $FORMATTED_END_DATETIME UTC with a run duration of $DURATION s ($FORMATTED_DURATION)."'))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
+            file_id.write('{0}\n'.format('    write_manifest result {0} ended'.format(current_run_dir)))
+            file_id.write('{0}\n'.format('    write_manifest read {0} ended'.format(normalised_read_dir)))
             file_id.write('{0}\n'.format('    RECIPIENT={0}'.format(xconfiguration.get_contact_data())))
             file_id.write('{0}\n'.format('    SUBJECT="{0}: {1} process"'.format(xlib.get_project_name(), xlib.get_insilico_read_normalization_name())))
             file_id.write('{0}\n'.format('    MESSAGE="The {0} process in node $HOSTNAME of cluster {1} ended OK at $FORMATTED_END_DATETIME with a run duration of $DURATION s ($FORMATTED_DURATION). Please review its log.<br/><br/>Regards,<br/>GI Genetica, Fisiologia e Historia Forestal<br/>Dpto. Sistemas y Recursos Naturales<br/>ETSI Montes, Forestal y del Medio Natural<br/>Universidad Politecnica de Madrid<br/>https://github.com/ggfhf/"'.format(xlib.get_insilico_read_normalization_name(), cluster_name)))
@@ -1440,6 +1844,7 @@ def build_insilico_read_normalization_process_script(cluster_name, current_run_d
             file_id.write('{0}\n'.format('    echo "ERROR: $1 returned error $2"'))
             file_id.write('{0}\n'.format('    echo "Script ended WRONG at $FORMATTED_END_DATETIME UTC with a run duration of $DURATION s ($FORMATTED_DURATION)."'))
             file_id.write('{0}\n'.format('    echo "$SEP"'))
+            file_id.write('{0}\n'.format('    write_manifest result {0} failed'.format(current_run_dir)))
             file_id.write('{0}\n'.format('    RECIPIENT={0}'.format(xconfiguration.get_contact_data())))
             file_id.write('{0}\n'.format('    SUBJECT="{0}: {1} process"'.format(xlib.get_project_name(), xlib.get_insilico_read_normalization_name())))
             file_id.write('{0}\n'.format('    MESSAGE="The {0} process in node $HOSTNAME of cluster {1} ended WRONG at $FORMATTED_END_DATETIME with a run duration of $DURATION s ($FORMATTED_DURATION). Please review its log.<br/><br/>Regards,<br/>GI Genetica, Fisiologia e Historia Forestal<br/>Dpto. Sistemas y Recursos Naturales<br/>ETSI Montes, Forestal y del Medio Natural<br/>Universidad Politecnica de Madrid<br/>https://github.com/ggfhf/"'.format(xlib.get_insilico_read_normalization_name(), cluster_name)))
@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#-------------------------------------------------------------------------------
+
+'''
+This software has been developed by:
+
+    GI Genética, Fisiología e Historia Forestal
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politécnica de Madrid
+    http://gfhforestal.com/
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+'''
+This file contains the functions and classes of the paged file viewer used in
+both console mode and gui mode.
+
+A local file is memory-mapped and a cluster file is read by ranges through the
+pooled SFTP session of the cluster, so only the bytes of the lines in view are
+read. The line index keeps the offset of one line of every block of lines and
+it is built in a background thread; the search is run in a background thread
+too and it reports the matches as they are found.
+'''
+
+#-------------------------------------------------------------------------------
+
+import array
+import bisect
+import mmap
+import os
+import re
+import sys
+import threading
+
+import xssh
+
+#-------------------------------------------------------------------------------
+
+CHUNK_SIZE = 1024 * 1024    # bytes read each time by the line index and the search
+PAGE_SIZE = 64 * 1024       # bytes read each time to get the lines in view
+
+#-------------------------------------------------------------------------------
+
+class LocalFileSource(object):
+    '''
+    This class reads a local file by ranges through a memory map.
+    '''
+
+    #---------------
+
+    def __init__(self, file_path):
+        '''
+        Execute actions correspending to the creation of a "LocalFileSource" instance.
+        '''
+
+        self.file_path = file_path
+        self.file_id = open(file_path, mode='rb')
+        self.size = os.fstat(self.file_id.fileno()).st_size
+        self.map = mmap.mmap(self.file_id.fileno(), 0, access=mmap.ACCESS_READ) if self.size > 0 else None
+
+    #---------------
+
+    def read(self, offset, length):
+        '''
+        Read the bytes of a range.
+        '''
+
+        if self.map is None:
+            return b''
+        return self.map[offset:offset + length]
+
+    #---------------
+
+    def close(self):
+        '''
+        Close the memory map and the file.
+        '''
+
+        if self.map is not None:
+            self.map.close()
+        self.file_id.close()
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+class RemoteFileSource(object):
+    '''
+    This class reads a cluster file by ranges through the pooled SFTP session of
+    the cluster. The reads of the threads are serialized because they share the
+    same file handle.
+    '''
+
+    #---------------
+
+    def __init__(self, cluster_name, file_path, sftp_client):
+        '''
+        Execute actions correspending to the creation of a "RemoteFileSource" instance.
+        '''
+
+        self.cluster_name = cluster_name
+        self.file_path = file_path
+        self.file_id = sftp_client.open(file_path, mode='rb')
+        self.size = self.file_id.stat().st_size
+        self.lock = threading.Lock()
+
+    #---------------
+
+    def read(self, offset, length):
+        '''
+        Read the bytes of a range.
+        '''
+
+        with self.lock:
+            self.file_id.seek(offset)
+            return self.file_id.read(length)
+
+    #---------------
+
+    def close(self):
+        '''
+        Close the file.
+        '''
+
+        with self.lock:
+            self.file_id.close()
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+def open_file_source(file_path, cluster_name=None):
+    '''
+    Open a local file or, when the cluster name is passed, a cluster file to be
+    read by ranges.
+    '''
+
+    # initialize the control variable, the error list and the file source
+    OK = True
+    error_list = []
+    source = None
+
+    # open a local file
+    if cluster_name is None:
+        try:
+            source = LocalFileSource(file_path)
+        except (OSError, ValueError):
+            error_list.append('*** ERROR: The file {0} can not be opened.'.format(file_path))
+            OK = False
+
+    # open a cluster file
+    else:
+        (OK, error_list, sftp_client) = xssh.get_pooled_sftp_client(cluster_name)
+        if OK:
+            try:
+                source = RemoteFileSource(cluster_name, file_path, sftp_client)
+            except IOError:
+                error_list.append('*** ERROR: The cluster file {0} can not be opened.'.format(file_path))
+                OK = False
+
+    # return the control variable, the error list and the file source
+    return (OK, error_list, source)
+
+#-------------------------------------------------------------------------------
+
+def read_lines(source, offset, line_count, max_line_length=10000):
+    '''
+    Read lines from an offset. Return the list of lines (text without the line
+    end, cut to the maximum length) and the offset of the next line.
+    '''
+
+    line_list = []
+    while len(line_list) < line_count and offset < source.size:
+
+        # read the bytes until the end of the line, reading only the start of the long lines
+        data = source.read(offset, PAGE_SIZE)
+        position = 0
+        while len(line_list) < line_count:
+            end = data.find(b'\n', position)
+            if end == -1:
+                break
+            line_list.append(data[position:min(end, position + max_line_length)].decode('utf-8', errors='replace'))
+            position = end + 1
+
+        # when a line is longer than the page or it is the last line without line end, get its start and skip to its end
+        if end == -1 and position == 0:
+            line_list.append(data[:max_line_length].decode('utf-8', errors='replace'))
+            offset = find_next_line_offset(source, offset + len(data))
+        else:
+            offset += position
+
+    # return the lines and the offset of the next line
+    return (line_list, offset)
+
+#-------------------------------------------------------------------------------
+
+def find_next_line_offset(source, offset):
+    '''
+    Find the offset of the line after the line containing an offset.
+    '''
+
+    while offset < source.size:
+        data = source.read(offset, PAGE_SIZE)
+        end = data.find(b'\n')
+        if end > -1:
+            return offset + end + 1
+        offset += len(data)
+    return source.size
+
+#-------------------------------------------------------------------------------
+
+def find_line_start(source, offset):
+    '''
+    Find the offset of the start of the line containing an offset.
+    '''
+
+    while offset > 0:
+        start = max(0, offset - PAGE_SIZE)
+        data = source.read(start, offset - start)
+        position = data.rfind(b'\n')
+        if position > -1:
+            return start + position + 1
+        offset = start
+    return 0
+
+#-------------------------------------------------------------------------------
+
+def find_previous_line_offset(source, offset, line_count):
+    '''
+    Find the offset of the line which is a number of lines before the line
+    starting at an offset.
+    '''
+
+    for i in range(line_count):
+        if offset == 0:
+            break
+        offset = find_line_start(source, offset - 1)
+    return offset
+
+#-------------------------------------------------------------------------------
+
+class LineIndex(object):
+    '''
+    This class builds in a background thread the index of the lines of a file,
+    keeping the offset of the first line of every block of lines.
+    '''
+
+    #---------------
+
+    def __init__(self, source, block_size=1024):
+        '''
+        Execute actions correspending to the creation of a "LineIndex" instance.
+        '''
+
+        self.source = source
+        self.block_size = block_size
+        self.block_offset_list = array.array('Q', [0])
+        self.line_count = 0
+        self.indexed_size = 0
+        self.is_done = False
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.build, daemon=True)
+        self.thread.start()
+
+    #---------------
+
+    def build(self):
+        '''
+        Count the line ends of the file keeping the offset of the first line of
+        every block.
+        '''
+
+        offset = 0
+        while offset < self.source.size and not self.stop_event.is_set():
+            try:
+                data = self.source.read(offset, CHUNK_SIZE)
+            except Exception:
+                break
+            if data == b'':
+                break
+            position = data.find(b'\n')
+            while position > -1:
+                self.line_count += 1
+                if self.line_count % self.block_size == 0:
+                    self.block_offset_list.append(offset + position + 1)
+                position = data.find(b'\n', position + 1)
+            offset += len(data)
+            self.indexed_size = offset
+
+        # count the last line without line end
+        if not self.stop_event.is_set():
+            if self.source.size > 0 and offset >= self.source.size:
+                last_byte = self.source.read(self.source.size - 1, 1)
+                if last_byte != b'\n':
+                    self.line_count += 1
+            self.is_done = True
+
+    #---------------
+
+    def get_line_offset(self, line_number):
+        '''
+        Get the offset of a line (numbered from 1), or None when it has not been
+        indexed yet.
+        '''
+
+        if line_number < 1 or (line_number > self.line_count and not self.is_done):
+            return None
+        line_number = min(line_number, max(1, self.line_count))
+        block = (line_number - 1) // self.block_size
+        if block >= len(self.block_offset_list):
+            return None
+        return skip_lines(self.source, self.block_offset_list[block], (line_number - 1) % self.block_size)
+
+    #---------------
+
+    def get_line_number(self, offset):
+        '''
+        Get the number of the line starting at an offset, or None when it has not
+        been indexed yet.
+        '''
+
+        if offset > self.indexed_size and not self.is_done:
+            return None
+        block = bisect.bisect_right(self.block_offset_list, offset) - 1
+        block_offset = self.block_offset_list[block]
+        line_number = block * self.block_size + 1
+        while block_offset < offset:
+            data = self.source.read(block_offset, min(CHUNK_SIZE, offset - block_offset))
+            if data == b'':
+                break
+            line_number += data.count(b'\n')
+            block_offset += len(data)
+        return line_number
+
+    #---------------
+
+    def stop(self):
+        '''
+        Stop building the index.
+        '''
+
+        self.stop_event.set()
+
+    #---------------
+
+#-------------------------------------------------------------------------------
+
+def skip_lines(source, offset, line_count):
+    '''
+    Skip a number of lines from an offset without decoding them. Return the
+    offset of the next line.
+    '''
+
+    while line_count > 0 and offset < source.size:
+        data = source.read(offset, CHUNK_SIZE)
+        if data == b'':
+            break
+        position = -1
+        while line_count > 0:
+            position = data.find(b'\n', position + 1)
+            if position == -1:
+                break
+            line_count -= 1
+        if line_count == 0:
+            return offset + position + 1
+        offset += len(data)
+    return min(offset, source.size)
+
+#-------------------------------------------------------------------------------
+
+def compile_search_pattern(pattern, ignore_case=False):
+    '''
+    Compile a regular expression to search it in the bytes of the lines of a file
+    and to find its matches in their text. It raises re.error when it is wrong.
+    '''
+
+    return re.compile(pattern.encode('utf-8'), re.MULTILINE | (re.IGNORECASE if ignore_case else 0))
+
+#-------------------------------------------------------------------------------
+
+def get_match_span_list(regex, text):
+    '''
+    Get the character spans of the non-empty matches of a compiled search pattern
+    in a line text.
+    '''
+
+    span_list = []
+    data = text.encode('utf-8')
+    for mo in regex.finditer(data):
+        if mo.end() > mo.start():
+            start = len(data[:mo.start()].decode('utf-8', errors='replace'))
+            span_list.append((start, start + len(data[mo.start():mo.end()].decode('utf-8', errors='replace'))))
+    return span_list
+
+#-------------------------------------------------------------------------------
+
+def search_file(source, regex, report, stop_event, max_match_count=10000):
+    '''
+    Search a compiled search pattern (see compile_search_pattern) in the lines of
+    a file calling the report function with the line number, the line offset and
+    the line text (cut to 200 characters) of every line that matches. The search
+    stops when the stop event is set or after the maximum number of matching
+    lines. Return the number of matching lines.
+    '''
+
+    # search in chunks of whole lines
+    match_count = 0
+    line_number = 1
+    offset = 0
+    while offset < source.size and not stop_event.is_set():
+
+        # read a chunk; a line longer than the chunk is read until its end, so every line is searched whole
+        part_list = [source.read(offset, CHUNK_SIZE)]
+        if part_list[0] == b'':
+            break
+        read_size = len(part_list[0])
+        while part_list[-1].find(b'\n') == -1 and offset + read_size < source.size:
+            part = source.read(offset + read_size, CHUNK_SIZE)
+            if part == b'':
+                break
+            part_list.append(part)
+            read_size += len(part)
+        data = part_list[0] if len(part_list) == 1 else b''.join(part_list)
+
+        # cut the chunk at its last line end, except at the end of the file; the partial line is read with the next chunk
+        end = data.rfind(b'\n')
+        if end > -1 and offset + len(data) < source.size:
+            chunk = data[:end + 1]
+        else:
+            chunk = data
+
+        # report the matching lines; an empty match after the last line end of the chunk is not in any line
+        position = 0
+        last_line_start = -1
+        for mo in regex.finditer(chunk):
+            if mo.start() == len(chunk) and chunk.endswith(b'\n'):
+                break
+            line_start = chunk.rfind(b'\n', 0, mo.start()) + 1
+            if line_start == last_line_start:
+                continue
+            line_number += chunk.count(b'\n', position, line_start)
+            position = line_start
+            last_line_start = line_start
+            line_end = chunk.find(b'\n', line_start)
+            if line_end == -1:
+                line_end = len(chunk)
+            report(line_number, offset + line_start, chunk[line_start:min(line_end, line_start + 200)].decode('utf-8', errors='replace'))
+            match_count += 1
+            if match_count >= max_match_count or stop_event.is_set():
+                return match_count
+
+        # go to the next chunk
+        line_number += chunk.count(b'\n', position)
+        offset += len(chunk)
+
+    # return the number of matching lines
+    return match_count
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+     print('This file contains the functions and classes of the paged file viewer used in both console mode and gui mode.')
+     sys.exit(0)
+
+#-------------------------------------------------------------------------------
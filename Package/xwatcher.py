@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#-------------------------------------------------------------------------------
+
+'''
+This software has been developed by:
+
+    GI Genética, Fisiología e Historia Forestal
+    Dpto. Sistemas y Recursos Naturales
+    ETSI Montes, Forestal y del Medio Natural
+    Universidad Politécnica de Madrid
+    http://gfhforestal.com/
+    https://github.com/ggfhf/
+
+Licence: GNU General Public Licence Version 3.
+'''
+
+#-------------------------------------------------------------------------------
+
+'''
+This file contains the functions of the background watcher of the batch jobs
+of the running clusters used in both console mode and gui mode.
+
+The watcher polls the batch job table of every running cluster through a pooled
+SSH connection per cluster and publishes an event to the subscribers when the
+jobs of a cluster change, so one poll serves every open view.
+'''
+
+#-------------------------------------------------------------------------------
+
+import datetime
+import os
+import sqlite3
+import sys
+import threading
+
+import botocore.exceptions
+import paramiko
+
+import xcluster
+import xconfiguration
+import xec2
+import xlib
+import xssh
+
+#-------------------------------------------------------------------------------
+
+# state of the watcher
+watcher_thread = None
+watcher_stop_event = threading.Event()
+watcher_lock = threading.Lock()
+
+# functions subscribed to the watcher events
+subscriber_list = []
+
+# pooled SSH client connections and last poll numbers published of the watched clusters, shared
+# with the Tk thread and guarded by their lock
+ssh_client_dict = {}
+published_poll_number_dict = {}
+cluster_lock = threading.Lock()
+
+# log file of the errors of the watcher
+watcher_log_file = None
+
+# exceptions that a poll can raise when AWS, the cluster or the network fail
+POLL_EXCEPTION_TUPLE = (botocore.exceptions.BotoCoreError, botocore.exceptions.ClientError, paramiko.SSHException, EOFError, OSError, sqlite3.Error)
+
+#-------------------------------------------------------------------------------
+
+def subscribe(function):
+    '''
+    Subscribe a function to the watcher events. The function is called from the
+    watcher thread with an event dictionary with the keys cluster_name, poll_number,
+    changed_job_dict, removed_job_id_list and state_count_dict.
+    '''
+
+    with watcher_lock:
+        if function not in subscriber_list:
+            subscriber_list.append(function)
+
+#-------------------------------------------------------------------------------
+
+def unsubscribe(function):
+    '''
+    Unsubscribe a function from the watcher events.
+    '''
+
+    with watcher_lock:
+        if function in subscriber_list:
+            subscriber_list.remove(function)
+
+#-------------------------------------------------------------------------------
+
+def start_watcher(interval=None):
+    '''
+    Start the watcher thread if it is not running.
+    '''
+
+    global watcher_thread
+    global watcher_log_file
+
+    # get the poll interval
+    if interval is None:
+        interval = xconfiguration.get_job_watcher_interval()
+
+    # start the thread
+    with watcher_lock:
+        if watcher_thread is None or not watcher_thread.is_alive():
+            watcher_log_file = xlib.get_log_file('watcher')
+            watcher_stop_event.clear()
+            watcher_thread = threading.Thread(target=watch, args=(interval,), daemon=True)
+            watcher_thread.start()
+
+#-------------------------------------------------------------------------------
+
+def stop_watcher():
+    '''
+    Stop the watcher thread and close the pooled connections.
+    '''
+
+    # stop the thread
+    watcher_stop_event.set()
+    if watcher_thread is not None and watcher_thread is not threading.current_thread():
+        watcher_thread.join(timeout=30)
+
+    # close the pooled connections
+    with cluster_lock:
+        cluster_name_list = list(ssh_client_dict.keys())
+    for cluster_name in cluster_name_list:
+        release_ssh_client(cluster_name)
+
+#-------------------------------------------------------------------------------
+
+def is_watcher_running():
+    '''
+    Verify if the watcher thread is running.
+    '''
+
+    return watcher_thread is not None and watcher_thread.is_alive()
+
+#-------------------------------------------------------------------------------
+
+def watch(interval):
+    '''
+    Poll the running clusters until the watcher is stopped.
+    '''
+
+    while not watcher_stop_event.is_set():
+        try:
+            poll_running_clusters()
+        except POLL_EXCEPTION_TUPLE as e:
+            write_log('*** ERROR: The running clusters can not be polled: {0}'.format(e))
+        watcher_stop_event.wait(interval)
+
+#-------------------------------------------------------------------------------
+
+def poll_running_clusters():
+    '''
+    Poll the batch job tables of the running clusters and publish their changes.
+    '''
+
+    # get the running clusters
+    running_cluster_list = xec2.get_running_cluster_list(volume_creator_included=False)
+
+    # release the connections of the clusters that are not running
+    with cluster_lock:
+        cluster_name_list = list(ssh_client_dict.keys())
+    for cluster_name in cluster_name_list:
+        if cluster_name not in running_cluster_list:
+            release_ssh_client(cluster_name)
+            with cluster_lock:
+                published_poll_number_dict.pop(cluster_name, None)
+
+    # poll every running cluster
+    for cluster_name in running_cluster_list:
+        if watcher_stop_event.is_set():
+            break
+        poll_cluster(cluster_name)
+
+#-------------------------------------------------------------------------------
+
+def poll_cluster(cluster_name):
+    '''
+    Poll the batch job table of a cluster and publish its changes.
+    '''
+
+    # get the pooled connection
+    ssh_client = get_ssh_client(cluster_name)
+    if ssh_client is None:
+        return
+
+    # update the batch job table; the connection is released when it fails to be created again next time
+    try:
+        (OK, error_list, poll_number) = xcluster.poll_batch_job_table(cluster_name, ssh_client)
+    except POLL_EXCEPTION_TUPLE as e:
+        (OK, error_list) = (False, ['*** ERROR: {0}'.format(e)])
+    if not OK:
+        for error in error_list:
+            write_log('{0}: {1}'.format(cluster_name, error.strip()))
+        release_ssh_client(cluster_name)
+        return
+
+    # publish the changes since the last published poll
+    with cluster_lock:
+        since_poll_number = published_poll_number_dict.get(cluster_name, 0)
+    (poll_number, changed_job_dict, removed_job_id_list) = xcluster.get_batch_job_changes(cluster_name, since_poll_number)
+    with cluster_lock:
+        published_poll_number_dict[cluster_name] = poll_number
+    if since_poll_number == 0 or changed_job_dict != {} or removed_job_id_list != []:
+        event = {'cluster_name': cluster_name, 'poll_number': poll_number, 'changed_job_dict': changed_job_dict, 'removed_job_id_list': removed_job_id_list, 'state_count_dict': get_state_count_dict(cluster_name)}
+        publish(event)
+
+#-------------------------------------------------------------------------------
+
+def publish(event):
+    '''
+    Call the subscribed functions with an event.
+    '''
+
+    with watcher_lock:
+        function_list = list(subscriber_list)
+    for function in function_list:
+        try:
+            function(event)
+        except Exception as e:
+            write_log('*** ERROR: The subscriber {0} has failed: {1}'.format(getattr(function, '__qualname__', function), e))
+
+#-------------------------------------------------------------------------------
+
+def get_ssh_client(cluster_name):
+    '''
+    Get the pooled SSH client connection of a cluster creating it if necessary.
+    '''
+
+    with cluster_lock:
+        ssh_client = ssh_client_dict.get(cluster_name)
+    if ssh_client is None:
+        (OK, error_list, ssh_client) = xssh.create_ssh_client_connection(cluster_name, 'master')
+        if OK:
+            with cluster_lock:
+                ssh_client_dict[cluster_name] = ssh_client
+        else:
+            for error in error_list:
+                write_log('{0}: {1}'.format(cluster_name, error.strip()))
+            ssh_client = None
+    return ssh_client
+
+#-------------------------------------------------------------------------------
+
+def release_ssh_client(cluster_name):
+    '''
+    Close and forget the pooled SSH client connection of a cluster.
+    '''
+
+    with cluster_lock:
+        ssh_client = ssh_client_dict.pop(cluster_name, None)
+    if ssh_client is not None:
+        try:
+            xssh.close_ssh_client_connection(ssh_client)
+        except (paramiko.SSHException, EOFError, OSError) as e:
+            write_log('{0}: *** WARNING: The SSH client connection can not be closed: {1}'.format(cluster_name, e))
+
+#-------------------------------------------------------------------------------
+
+def get_watched_batch_job_dict(cluster_name):
+    '''
+    Get the dictionary of the batch jobs of a cluster from its table when the
+    watcher is running and it has been polled, otherwise None.
+    '''
+
+    with cluster_lock:
+        is_polled = cluster_name in published_poll_number_dict
+    if not is_watcher_running() or not is_polled:
+        return None
+    (poll_number, batch_job_dict, removed_job_id_list) = xcluster.get_batch_job_changes(cluster_name, 0)
+    return batch_job_dict
+
+#-------------------------------------------------------------------------------
+
+def write_log(message):
+    '''
+    Write a message with its date and time in the log file of the watcher.
+    '''
+
+    if watcher_log_file is None:
+        return
+    try:
+        if not os.path.exists(os.path.dirname(watcher_log_file)):
+            os.makedirs(os.path.dirname(watcher_log_file))
+        with open(watcher_log_file, mode='a', encoding='utf8') as file_id:
+            file_id.write('{0}  {1}\n'.format(datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'), message))
+    except OSError:
+        pass
+
+#-------------------------------------------------------------------------------
+
+def get_state_count_dict(cluster_name):
+    '''
+    Get a dictionary with the number of batch jobs of a cluster per state name.
+    '''
+
+    state_count_dict = {}
+    (poll_number, batch_job_dict, removed_job_id_list) = xcluster.get_batch_job_changes(cluster_name, 0)
+    for job_data in batch_job_dict.values():
+        state_count_dict[job_data['state_name']] = state_count_dict.get(job_data['state_name'], 0) + 1
+    return state_count_dict
+
+#-------------------------------------------------------------------------------
+
+def get_event_text(event):
+    '''
+    Get the text that describes a watcher event.
+    '''
+
+    # describe the current jobs
+    if event['state_count_dict'] == {}:
+        text = '{0}: no batch jobs'.format(event['cluster_name'])
+    else:
+        text = '{0}: {1}'.format(event['cluster_name'], ', '.join(['{0} {1}'.format(count, state_name) for state_name, count in sorted(event['state_count_dict'].items())]))
+
+    # describe the finished jobs
+    if event['removed_job_id_list'] != []:
+        text += ' (finished: {0})'.format(', '.join(sorted(event['removed_job_id_list'])))
+
+    # return the text
+    return text
+
+#-------------------------------------------------------------------------------
+
+if __name__ == '__main__':
+     print('This file contains the functions of the background watcher of the batch jobs used in both console mode and gui mode.')
+     sys.exit(0)
+
+#-------------------------------------------------------------------------------